@@ -1,6 +1,11 @@
+# backend/apps/community/apps.py
+
 from django.apps import AppConfig
 
 
 class CommunityConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.community'
+
+    def ready(self):
+        from . import signals
@@ -0,0 +1,54 @@
+# backend/apps/community/cache.py
+
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.db.models import Count, Max, Sum
+
+from .models import Board
+
+
+# 개요
+"""
+게시판 목록(BoardListView) 응답 캐시
+
+[설계 의도]
+- 게시판 목록은 거의 바뀌지 않지만 커뮤니티 진입 시마다 호출되는 고빈도 엔드포인트
+- 직렬화된 응답(data)을 캐시하여 게시판 조회/Serializer를 건너뜀
+- 직렬화 결과의 해시를 함께 캐시하여 조건부 응답(ETag) 검증자로 사용 (core/utils/http_cache.py)
+
+[상세 고려사항]
+- 캐시 세대(generation)는 DB 집계(게시판 수, posts_count 합계, 최신 updated_at)에서 계산
+  · LocMemCache는 gunicorn 워커마다 따로 존재하므로, 캐시에 둔 세대 번호를
+    쓰기 요청을 처리한 워커에서만 올리면 다른 워커는 TTL까지 이전 목록을 응답함
+  · DB에서 계산한 세대는 모든 워커가 같은 값을 보므로 커밋 직후부터 새 키를 사용
+- 게시글 생성/삭제/이동은 signals.py에서 posts_count와 updated_at을 함께 갱신하고,
+  게시판 수정은 auto_now로 updated_at이 바뀜 → 별도 무효화 호출이 필요 없음
+- 세대 계산은 게시판 테이블(수십 행) 집계 한 번이므로 캐시 적중 시에도 쿼리 1개
+- 이전 세대 키는 참조되지 않다가 TTL로 자연 만료
+"""
+
+BOARD_LIST_CACHE_TIMEOUT = 60 * 5  # 5분
+
+
+def get_board_list_generation():
+    """DB에서 계산한 게시판 목록 세대 (모든 워커에서 같은 값)"""
+    summary = Board.objects.aggregate(
+        boards=Count('id'),
+        posts=Sum('posts_count'),
+        latest=Max('updated_at'),
+    )
+    latest = summary['latest'].timestamp() if summary['latest'] else 0
+    return f"{summary['boards']}-{summary['posts'] or 0}-{latest:.6f}"
+
+
+def get_board_list_cache_key(query_string=''):
+    """현재 세대 + 쿼리스트링 기준 캐시 키"""
+    return f'community:board_list:v{get_board_list_generation()}:{query_string}'
+
+
+def make_board_list_digest(data):
+    """직렬화 결과의 내용 해시 (ETag 재료)"""
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.md5(payload.encode('utf-8')).hexdigest()
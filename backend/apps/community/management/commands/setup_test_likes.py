@@ -1,5 +1,5 @@
 from django.core.management.base import BaseCommand
-from apps.community.models import Post
+from apps.community.models import Post, PostLike
 from apps.accounts.models import User
 
 
@@ -29,13 +29,14 @@ class Command(BaseCommand):
                 for post_id in post_ids:
                     try:
                         post = Post.objects.get(pk=post_id)
-                        # 이미 좋아요를 눌렀는지 확인
-                        if post.likes.filter(pk=user.pk).exists():
+                        # PostLike 직접 생성 (post.likes.add()는 post_save 없이 일괄 INSERT
+                        #   → UserActivityStats.received_likes_count가 갱신되지 않음)
+                        _, created = PostLike.objects.get_or_create(post=post, user=user)
+                        if not created:
                             self.stdout.write(self.style.WARNING(
                                 f'  - Post {post_id} ({post.title[:30]}...) - 이미 좋아요함'
                             ))
                         else:
-                            post.likes.add(user)
                             total_likes += 1
                             self.stdout.write(self.style.SUCCESS(
                                 f'  ✓ Post {post_id} ({post.title[:30]}...) 좋아요 추가'
@@ -0,0 +1,38 @@
+# Generated manually for board posts_count denormalization
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_posts_count(apps, schema_editor):
+    """
+    기존 게시글 수를 posts_count 컬럼에 채워 넣는다.
+    - 게시판 수만큼 UPDATE를 날리지 않고 Subquery 한 번으로 일괄 반영
+    """
+    Board = apps.get_model('community', 'Board')
+    Post = apps.get_model('community', 'Post')
+
+    counts = (
+        Post.objects.filter(board=OuterRef('pk'))
+        .values('board')
+        .annotate(cnt=Count('pk'))
+        .values('cnt')
+    )
+    Board.objects.update(posts_count=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0004_alter_board_slug'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='posts_count',
+            field=models.PositiveIntegerField(default=0, help_text='게시글 수 (비정규화 카운터)'),
+        ),
+        migrations.RunPython(backfill_posts_count, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,8 @@
 # backend/apps/community/models.py
 
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Now
 from django.conf import settings
 
 # Create your models here.
@@ -14,11 +16,18 @@ class Board(models.Model):
     - name은 한글 이름 (예: 인문_소통방)
     - slug는 영문 URL용 (예: humanity_talk) - URL 및 조회 기준으로 사용
     - description은 UI 표시용이므로 선택 입력 허용
+    - posts_count는 게시글 수를 비정규화한 카운터
+      (게시판 목록 조회 시 COUNT 집계를 매번 수행하지 않기 위함,
+       signals.py에서 게시글 생성/삭제/이동 시 F() 증감으로 유지)
+    - updated_at은 게시판 수정과 posts_count 증감 시 함께 갱신
+      (게시판 목록 캐시의 세대를 DB에서 계산하기 위한 행 버전, cache.py)
     """
     name = models.CharField(max_length=50, unique=True, help_text="게시판 이름 (예: 자유게시판)")
     slug = models.SlugField(max_length=50, unique=True, help_text="URL용 영문 식별자 (예: humanity_talk)")
     description = models.CharField(max_length=150, blank=True, help_text="게시판 설명")
+    posts_count = models.PositiveIntegerField(default=0, help_text="게시글 수 (비정규화 카운터)")
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'community_board'
@@ -28,6 +37,24 @@ class Board(models.Model):
     def __str__(self):
         return self.name
 
+    @classmethod
+    def recalculate_posts_count(cls):
+        """
+        [설계의도]
+        - 비정규화 카운터(posts_count)를 실제 게시글 수로 일괄 재계산
+
+        [상세고려사항]
+        - bulk_create 등 시그널을 우회하는 적재 경로(시드 데이터 등) 이후 호출
+        - Subquery 한 번으로 전체 게시판을 갱신 (게시판 수만큼 쿼리하지 않음)
+        """
+        counts = (
+            Post.objects.filter(board=OuterRef('pk'))
+            .values('board')
+            .annotate(cnt=Count('pk'))
+            .values('cnt')
+        )
+        return cls.objects.update(posts_count=Coalesce(Subquery(counts), Value(0)), updated_at=Now())
+
 
 class Post(models.Model):
     """
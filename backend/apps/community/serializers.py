@@ -52,15 +52,15 @@ class BoardSerializer(serializers.ModelSerializer):
       요약 정보로 제공하기 위함
 
     [상세고려사항]
-    - posts_count는 View 단계에서 annotate로 미리 계산된 값을 사용
+    - posts_count는 Board 모델의 비정규화 컬럼을 그대로 사용
     - source='posts.count' 방식은 N+1 문제를 유발하므로 제거
-    - View의 annotate 결과를 그대로 사용하여 성능 최적화
 
     [최적화 내용]
     - 기존: source='posts.count' → 각 Board마다 COUNT 쿼리 실행 (N+1)
-    - 변경: View의 annotate 필드 직접 사용 → 단일 쿼리로 처리
+    - 이후: View의 annotate(Count) → 단일 쿼리지만 요청마다 집계
+    - 변경: 컬럼 직접 사용 → 집계 없이 단순 조회
     """
-    # source='posts.count' 대신 View에서 주입된 annotate 필드 사용
+    # 게시글 생성/삭제 시그널로 유지되는 카운터 (클라이언트 입력 불가)
     posts_count = serializers.IntegerField(read_only=True)
 
     class Meta:
@@ -0,0 +1,57 @@
+# backend/apps/community/signals.py
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Board, Post
+
+
+# 개요
+"""
+1. Board.posts_count 비정규화 카운터 유지
+- 게시글 생성     → 소속 게시판 +1
+- 게시글 삭제     → 소속 게시판 -1
+- 게시판 이동(수정) → 이전 게시판 -1, 새 게시판 +1
+
+[상세 고려사항]
+- 카운터는 F() 표현식으로 DB에서 원자적으로 증감 (동시 요청 경쟁 조건 방지)
+- 증감 시 updated_at도 함께 갱신 → 게시판 목록 캐시 세대가 DB에서 바뀜 (cache.py)
+  (게시글이 다른 게시판으로 이동하면 posts_count 합계는 같으므로 updated_at으로 구분)
+- bulk_create/update() 등 시그널을 우회하는 경로는 반영되지 않으므로
+  시드 데이터 적재 후에는 마이그레이션 0005의 백필 로직과 같은 방식으로 재계산 필요
+"""
+
+
+def _bump_posts_count(board_id, delta):
+    if board_id is None:
+        return
+    Board.objects.filter(pk=board_id).update(
+        posts_count=F('posts_count') + delta,
+        updated_at=timezone.now(),
+    )
+
+
+@receiver(post_init, sender=Post)
+def remember_original_board(sender, instance, **kwargs):
+    # 수정 시 게시판 이동 여부를 판단하기 위해 로드 시점의 board_id 보관
+    instance._original_board_id = instance.board_id
+
+
+@receiver(post_save, sender=Post)
+def update_posts_count_on_save(sender, instance, created, **kwargs):
+    if created:
+        _bump_posts_count(instance.board_id, 1)
+    elif instance._original_board_id != instance.board_id:
+        _bump_posts_count(instance._original_board_id, -1)
+        _bump_posts_count(instance.board_id, 1)
+    else:
+        return
+
+    instance._original_board_id = instance.board_id
+
+
+@receiver(post_delete, sender=Post)
+def update_posts_count_on_delete(sender, instance, **kwargs):
+    _bump_posts_count(instance.board_id, -1)
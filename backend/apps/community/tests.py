@@ -1,3 +1,120 @@
+from importlib import import_module
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.community.models import Board, Post
+
+User = get_user_model()
+
+
+class BoardPostsCountTests(TestCase):
+    """
+    [설계 의도]
+    - 비정규화 카운터(posts_count)가 게시글 생성/삭제/게시판 이동 시그널로 정확히 유지되는지 고정
+    - 마이그레이션 0005의 백필 로직이 실제 게시글 수로 채우는지 확인
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='writer', email='writer@example.com', password='pw-1234!', name='작성자'
+        )
+        cls.free = Board.objects.create(name='자유게시판', slug='free_talk')
+        cls.study = Board.objects.create(name='스터디게시판', slug='study_talk')
+
+    def _post(self, board, title='제목'):
+        return Post.objects.create(author=self.author, board=board, title=title, content='내용')
+
+    def _counts(self):
+        return dict(Board.objects.values_list('slug', 'posts_count'))
+
+    def test_create_and_delete_move_counter(self):
+        first = self._post(self.free)
+        self._post(self.free)
+        self._post(self.study)
+        self.assertEqual(self._counts(), {'free_talk': 2, 'study_talk': 1})
+
+        first.delete()
+        self.assertEqual(self._counts(), {'free_talk': 1, 'study_talk': 1})
+
+    def test_board_move_updates_both_boards(self):
+        post = self._post(self.free)
+
+        post.board = self.study
+        post.save()
+        self.assertEqual(self._counts(), {'free_talk': 0, 'study_talk': 1})
+
+        # 이동 없는 수정은 카운터를 건드리지 않음
+        post.title = '수정된 제목'
+        post.save()
+        self.assertEqual(self._counts(), {'free_talk': 0, 'study_talk': 1})
+
+    def test_backfill_matches_actual_post_count(self):
+        self._post(self.free)
+        self._post(self.free)
+        Post.objects.bulk_create([
+            Post(author=self.author, board=self.study, title='시드', content='내용'),
+        ])  # 시그널 우회
+        Board.objects.update(posts_count=0)
+
+        migration = import_module('apps.community.migrations.0005_board_posts_count')
+        migration.backfill_posts_count(apps, None)
+
+        self.assertEqual(self._counts(), {'free_talk': 2, 'study_talk': 1})
+
+
+class BoardListCacheTests(TestCase):
+    """
+    [설계 의도]
+    - 게시판 목록 캐시 세대가 DB에서 계산되어, 캐시를 직접 무효화하지 않아도
+      (= 다른 워커에서 쓰기가 일어나도) 다음 요청부터 새 posts_count와 새 ETag로 응답하는지 고정
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='writer', email='writer@example.com', password='pw-1234!', name='작성자'
+        )
+        cls.board = Board.objects.create(name='자유게시판', slug='free_talk')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse('community:board-list')
+
+    def _posts_count(self, response):
+        return [board['posts_count'] for board in response.data['results']]
+
+    def test_unchanged_list_returns_not_modified(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+        cached = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(cached.status_code, 304)
+
+    def test_post_change_refreshes_list_without_invalidation(self):
+        first = self.client.get(self.url)
+        self.assertEqual(self._posts_count(first), [0])
+
+        post = Post.objects.create(author=self.author, board=self.board, title='제목', content='내용')
+        created = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(created.status_code, 200)
+        self.assertEqual(self._posts_count(created), [1])
+        self.assertNotEqual(created['ETag'], first['ETag'])
+
+        post.delete()
+        self.assertEqual(self._posts_count(self.client.get(self.url)), [0])
+
+    def test_board_rename_refreshes_list(self):
+        self.client.get(self.url)
+
+        self.board.name = '자유게시판(개편)'
+        self.board.save()
 
-# Create your tests here.
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['results'][0]['name'], '자유게시판(개편)')
@@ -7,6 +7,7 @@ from rest_framework import generics, status # generics : 제네릭 뷰 제공, s
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
 from rest_framework.views import APIView # APIView : 기본 뷰 클래스, 좋아요 및 스크랩 토글에 사용
+from django.core.cache import cache
 
 from .models import Board, Post, Comment, Scrap, PostLike
 from .serializers import (
@@ -14,6 +15,8 @@ from .serializers import (
     CommentSerializer, ScrapSerializer
 )
 from .permissions import IsOwnerOrReadOnly
+from .cache import BOARD_LIST_CACHE_TIMEOUT, get_board_list_cache_key, make_board_list_digest
+from apps.core.utils.http_cache import Validators, conditional_get
         
 
 # 개요
@@ -48,17 +51,45 @@ class BoardListView(generics.ListAPIView):
 
     [상세고려사항]
     - 게시판은 인증 여부와 무관하게 접근 가능
-    - annotate(posts_count)를 통해 게시판별 게시글 수를 한 번의 쿼리로 계산
-    - Serializer가 이 annotate 결과를 직접 사용하도록 설계
+    - posts_count는 Board 테이블의 비정규화 컬럼을 그대로 사용 (signals.py에서 유지)
+    - 직렬화 결과를 DB에서 계산한 세대(게시판 수, posts_count 합계, 최신 updated_at) 키로 캐시 (cache.py)
+      → 어느 워커에서 게시글이 생성/삭제되어도 모든 워커가 다음 요청부터 새 목록을 응답
 
     [최적화 내용]
-    - annotate로 집계한 posts_count를 Serializer에서 그대로 사용
-    - N+1 문제 완전 제거 (Board 10개 → 쿼리 1개)
+    - 기존: annotate(Count('posts')) → 요청마다 게시글 테이블 전체 JOIN + GROUP BY
+    - 변경: 컬럼 조회 → 캐시 적중 시 게시판 테이블 집계 쿼리 1개
+    - ETag는 캐시된 직렬화 결과의 해시 → If-None-Match가 일치하면 본문 없이 304 응답
     """
-    queryset = Board.objects.annotate(posts_count=Count('posts')).all()
+    queryset = Board.objects.order_by('id')
     serializer_class = BoardSerializer
     permission_classes = []
-    # TODO: 캐싱 적용 시 cache_page 데코레이터 또는 get_queryset에서 cache 사용
+
+    def get_cached_payload(self, request):
+        """
+        캐시된 {'data', 'digest'} 반환 (없으면 직렬화 후 적재)
+        - 검증자 계산과 본문 응답이 같은 요청 안에서 한 번만 조회하도록 request에 보관
+        """
+        if not hasattr(request, '_board_list_payload'):
+            cache_key = get_board_list_cache_key(request.query_params.urlencode())
+            payload = cache.get(cache_key)
+
+            if payload is None:
+                data = super().list(request).data
+                payload = {'data': data, 'digest': make_board_list_digest(data)}
+                cache.set(cache_key, payload, BOARD_LIST_CACHE_TIMEOUT)
+
+            request._board_list_payload = payload
+        return request._board_list_payload
+
+    def get_validators(self, request, *args, **kwargs):
+        return Validators(parts=('board-list', self.get_cached_payload(request)['digest']))
+
+    @conditional_get(max_age=30)
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        return Response(self.get_cached_payload(request)['data'])
 
 # =========================
 # 2) Post Views
@@ -408,14 +439,19 @@ class PostLikeView(APIView):
         post = get_object_or_404(Post, pk=post_id)
         user = request.user
 
+        # [상세고려사항]
+        # - post.likes.add()는 중개 모델을 bulk_create로 저장하여 post_save 시그널이 발생하지 않음
+        # - 받은 좋아요 카운터(mypage UserActivityStats)가 시그널로 유지되므로
+        #   PostLike 모델을 직접 생성/삭제
+        like, created = PostLike.objects.get_or_create(post=post, user=user)
+
         # 이미 좋아요를 눌렀다면,
-        if post.likes.filter(pk=user.pk).exists():
-            post.likes.remove(user)
+        if not created:
+            like.delete()
             message = "좋아요를 취소했습니다."
             is_liked = False
         # 아직 좋아요를 누르지 않았다면,
         else:
-            post.likes.add(user)
             message = "좋아요를 눌렀습니다."
             is_liked = True
 
@@ -0,0 +1,205 @@
+# apps/comparisons/ai_models/evaluation.py
+
+"""
+감성분석 모델 평가 지표 (evaluate_model, update_sentiment_model 공용)
+
+[설계 의도]
+- 평가 지표 계산을 커맨드 밖으로 분리해, 전체 평가(evaluate_model)와
+  증분 학습 후 게시 여부 판단(update_sentiment_model)이 같은 기준을 사용하도록 함
+
+[구성]
+1. compute_metrics      | 예측 배열 전체로 지표 계산
+2. MetricsAccumulator   | 청크별 혼동 행렬 누적 → 지표 계산 (스트리밍 평가, 메모리 O(1))
+3. SlicedMetrics        | 슬라이스(리뷰 길이, 강좌 분류 등)별 MetricsAccumulator
+4. length_bucket        | 리뷰 길이 구간
+5. profile_latency      | 배치 크기별 추론 지연 백분위수 + 처리량 곡선
+"""
+
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Sequence
+
+import numpy as np
+from sklearn.metrics import accuracy_score, confusion_matrix, precision_recall_fscore_support
+
+# 라벨 순서 고정 (negative, positive) = (0, 1)
+TARGET_LABELS = ['negative', 'positive']
+
+
+def compute_metrics(y_true, y_pred) -> Dict:
+    """
+    정확도, 클래스별 Precision/Recall/F1, 혼동 행렬
+
+    Returns:
+        {
+            'accuracy': float,
+            'precision' / 'recall' / 'f1': [negative, positive],
+            'support': [negative, positive],
+            'macro_f1': float,
+            'confusion_matrix': 2x2 ndarray (labels=TARGET_LABELS)
+        }
+    """
+    precision, recall, f1, support = precision_recall_fscore_support(
+        y_true, y_pred, average=None, labels=TARGET_LABELS, zero_division=0
+    )
+    return {
+        'accuracy': float(accuracy_score(y_true, y_pred)),
+        'precision': [float(v) for v in precision],
+        'recall': [float(v) for v in recall],
+        'f1': [float(v) for v in f1],
+        'support': [int(v) for v in support],
+        'macro_f1': float(np.mean(f1)),
+        'confusion_matrix': confusion_matrix(y_true, y_pred, labels=TARGET_LABELS),
+    }
+
+
+class MetricsAccumulator:
+    """
+    혼동 행렬 누적기 (스트리밍 평가용)
+
+    - 청크마다 update()로 2x2 혼동 행렬만 더하므로 데이터 크기와 무관하게 메모리 일정
+    - metrics()는 compute_metrics와 같은 구조 반환
+    """
+
+    def __init__(self):
+        self.cm = np.zeros((len(TARGET_LABELS), len(TARGET_LABELS)), dtype=np.int64)
+
+    def update(self, y_true, y_pred):
+        self.cm += confusion_matrix(y_true, y_pred, labels=TARGET_LABELS)
+
+    @property
+    def count(self) -> int:
+        return int(self.cm.sum())
+
+    def metrics(self) -> Dict:
+        cm = self.cm
+        total = cm.sum()
+        tp = np.diag(cm).astype(float)
+        predicted = cm.sum(axis=0).astype(float)
+        support = cm.sum(axis=1)
+
+        precision = np.divide(tp, predicted, out=np.zeros_like(tp), where=predicted > 0)
+        recall = np.divide(tp, support, out=np.zeros_like(tp), where=support > 0)
+        denom = precision + recall
+        f1 = np.divide(2 * precision * recall, denom, out=np.zeros_like(tp), where=denom > 0)
+
+        return {
+            'accuracy': float(tp.sum() / total) if total else 0.0,
+            'precision': [float(v) for v in precision],
+            'recall': [float(v) for v in recall],
+            'f1': [float(v) for v in f1],
+            'support': [int(v) for v in support],
+            'macro_f1': float(np.mean(f1)),
+            'confusion_matrix': cm.copy(),
+        }
+
+    def classification_report(self) -> Dict:
+        """sklearn classification_report(output_dict=True)와 같은 형식"""
+        m = self.metrics()
+        total = sum(m['support'])
+        report = {
+            label: {
+                'precision': m['precision'][i],
+                'recall': m['recall'][i],
+                'f1-score': m['f1'][i],
+                'support': m['support'][i],
+            }
+            for i, label in enumerate(TARGET_LABELS)
+        }
+        report['accuracy'] = m['accuracy']
+        for avg, weights in (('macro avg', [1] * len(TARGET_LABELS)), ('weighted avg', m['support'])):
+            weight_sum = sum(weights) or 1
+            report[avg] = {
+                key: sum(report[label][key] * w for label, w in zip(TARGET_LABELS, weights)) / weight_sum
+                for key in ('precision', 'recall', 'f1-score')
+            }
+            report[avg]['support'] = total
+        return report
+
+
+class SlicedMetrics:
+    """슬라이스 키별 MetricsAccumulator 묶음"""
+
+    def __init__(self):
+        self.slices = defaultdict(MetricsAccumulator)
+
+    def update(self, keys: Sequence, y_true: Sequence, y_pred: Sequence):
+        groups = defaultdict(lambda: ([], []))
+        for key, true, pred in zip(keys, y_true, y_pred):
+            groups[key][0].append(true)
+            groups[key][1].append(pred)
+        for key, (trues, preds) in groups.items():
+            self.slices[key].update(trues, preds)
+
+    def summary(self) -> Dict[str, Dict]:
+        """슬라이스별 {count, accuracy, macro_f1, f1_negative, f1_positive}"""
+        result = {}
+        for key in sorted(self.slices, key=str):
+            acc = self.slices[key]
+            m = acc.metrics()
+            result[str(key)] = {
+                'count': acc.count,
+                'accuracy': m['accuracy'],
+                'macro_f1': m['macro_f1'],
+                'f1_negative': m['f1'][0],
+                'f1_positive': m['f1'][1],
+            }
+        return result
+
+
+# 리뷰 길이(문자 수) 구간 | (상한, 이름), 마지막은 상한 없음
+LENGTH_BUCKETS = [(20, '0-19'), (50, '20-49'), (100, '50-99'), (200, '100-199'), (None, '200+')]
+
+
+def length_bucket(text: str) -> str:
+    length = len(text or '')
+    for upper, name in LENGTH_BUCKETS:
+        if upper is None or length < upper:
+            return name
+    return LENGTH_BUCKETS[-1][1]
+
+
+def profile_latency(analyze_batch: Callable[[List[str]], list], texts: Sequence[str],
+                    batch_sizes: Iterable[int], max_batches: int = 20,
+                    before_each: Callable[[], None] = None) -> List[Dict]:
+    """
+    배치 크기별 추론 지연/처리량 측정
+
+    Args:
+        analyze_batch: 측정 대상 (SentimentProcessor.analyze_batch)
+        texts: 샘플 텍스트 (배치 크기별로 앞에서부터 잘라 사용)
+        max_batches: 배치 크기별 최대 측정 횟수
+        before_each: 배치 크기마다 측정 전에 호출 (예: 토크나이저 캐시 비우기)
+
+    Returns:
+        [{batch_size, batches, p50_ms, p90_ms, p95_ms, p99_ms, mean_ms, docs_per_sec}, ...]
+    """
+    texts = list(texts)
+    curve = []
+    for batch_size in batch_sizes:
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        batches = [batch for batch in batches if len(batch) == batch_size][:max_batches]
+        if not batches:
+            continue
+        analyze_batch(batches[0])  # 워밍업 (첫 호출 지연 제외)
+        if before_each is not None:
+            before_each()
+
+        latencies = []
+        for batch in batches:
+            started_at = time.perf_counter()
+            analyze_batch(batch)
+            latencies.append(time.perf_counter() - started_at)
+
+        latencies_ms = np.array(latencies) * 1000
+        curve.append({
+            'batch_size': batch_size,
+            'batches': len(batches),
+            'p50_ms': float(np.percentile(latencies_ms, 50)),
+            'p90_ms': float(np.percentile(latencies_ms, 90)),
+            'p95_ms': float(np.percentile(latencies_ms, 95)),
+            'p99_ms': float(np.percentile(latencies_ms, 99)),
+            'mean_ms': float(latencies_ms.mean()),
+            'docs_per_sec': float(batch_size * len(batches) / sum(latencies)),
+        })
+    return curve
@@ -1,23 +1,27 @@
 # apps/comparisons/ai_models/processor.py
 
 import os
-import joblib
+import threading
 import time
-import json
-from pathlib import Path
 from typing import Dict, List, Union
 import logging
 
+from .registry import LoadedModel, get_model_registry
+from .tokenizer import get_tokenizer
+
 # SentimentProcessor 메서드 정리
 """
 # 1. 외부 사용
                    - 1.1    analyze                      |  단일 텍스트 감성분석
                    - 1.2    analyze_batch                |  다수 텍스트에 대한 감성분석
                    - 1.3    get_model_info               |  모델 메타데이터 및 로드 상태 조회
+                   - 1.4    reload                       |  현재 버전 모델 즉시 재로드 (동기)
 
 # 2. 내부 사용
-                   - 2.1    _load_model                  |  감성분석 모델 및 메타데이터 로드
+                   - 2.1    _load_model                  |  레지스트리에서 현재 버전 모델 로드 후 참조 교체
                    - 2.2    _default_result              | 분석 실패/빈 입력 시 기본 결과 반환
+                   - 2.3    _current_model               |  요청 시점의 모델 참조 반환 (+ 변경 감지)
+                   - 2.4    _maybe_reload                |  CURRENT 포인터 세대 확인 → 백그라운드 재로드
 
 # 3. 싱글톤 제어
                    - 3.1    __new__                      |  싱글톤 인스턴스 생성 제어
@@ -40,6 +44,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 모델 변경 확인 주기(초) | 요청마다 stat 하지 않도록 제한
+RELOAD_CHECK_INTERVAL = float(os.environ.get('SENTIMENT_MODEL_RELOAD_INTERVAL', 5))
+# 'r'이면 numpy 배열(idf_, coef_ 등)을 메모리 매핑으로 로드 → 워커 간 페이지 캐시 공유
+MMAP_MODE = 'r' if os.environ.get('SENTIMENT_MODEL_MMAP', '').lower() in ('1', 'true', 'yes') else None
+
 
 class SentimentProcessor:
     """
@@ -49,11 +58,20 @@ class SentimentProcessor:
     - 감성분석 모델을 매 요청마다 로드하지 않고
       애플리케이션 전체에서 1회만 메모리에 적재
     - Singleton 패턴을 사용해 성능과 자원 사용 최적화
+
+    [무중단 교체]
+    - 모델은 레지스트리(registry.py)의 CURRENT 포인터가 가리키는 버전을 사용
+    - 요청 처리 중 RELOAD_CHECK_INTERVAL마다 포인터 세대(stat)를 확인하고,
+      바뀌었으면 백그라운드 스레드에서 새 모델을 로드한 뒤 참조만 교체
+    - 요청은 시작 시점의 모델 참조(LoadedModel)를 지역 변수로 잡고 사용
+      → 교체 중에도 진행 중인 요청은 기존 모델로 끝까지 처리 (블로킹 없음)
+    - 새 모델 로드 실패 시 기존 모델 유지
     """
 
     _instance = None # 싱글톤 인스턴스
-    _pipeline = None # 감성분석 파이프라인
-    _metadata = None # 모델 메타데이터(버전, 정확도 등)
+    _model: LoadedModel = None # 현재 모델 (pipeline + metadata + version), 통째로 교체
+    _reload_lock = threading.Lock() # 동시에 하나의 재로드만 수행
+    _last_checked_at = 0.0 # 마지막 세대 확인 시각 (monotonic)
 
     def __new__(cls):
         """
@@ -78,56 +96,85 @@ class SentimentProcessor:
         - 싱글톤이므로 __init__이 여러 번 호출될 수 있어
           모델 로드는 한 번만 수행하도록 조건 처리
         """
-        if self._pipeline is None:
+        if self._model is None:
             # 모델이 로드되지 않은 경우에만 로드 수행
             self._load_model()
 
+    @property
+    def _pipeline(self):
+        return self._model.pipeline if self._model else None
+
+    @property
+    def _metadata(self):
+        return self._model.metadata if self._model else None
+
     def _load_model(self):
         """
         감성분석 모델 및 메타데이터 로드
 
         [역할]
-        - joblib으로 저장된 sklearn Pipeline 로드
-        - 모델 메타데이터(JSON) 함께 로드
+        - 레지스트리의 현재 버전(CURRENT, 없으면 레거시 파일) 로드
+        - 로드가 끝난 뒤 클래스 속성 참조를 한 번에 교체 (원자적 대입)
         """
-        # 현재 파일 기준 경로 설정
-        base_dir = Path(__file__).resolve().parent
-        # 모델 및 메타데이터 경로
-        model_path = base_dir / 'sentiment_pipeline.joblib'
-        metadata_path = base_dir / 'model_metadata.json'
-
-        # 예외 처리
-        if not model_path.exists():
-            logger.error(f"Model file not found: {model_path}")
-            raise FileNotFoundError(
-                f"감성분석 모델 파일을 찾을 수 없습니다!!! : {model_path}\n"
-                f"'python manage.py train_model' 명령으로 모델을 학습해주세요."
-            )
-
-        # 모델 및 메타데이터 로드
         try:
-            logger.info(f"Loading sentiment model from {model_path}")
-            # joblib으로 sklearn Pipeline 로드
-            self._pipeline = joblib.load(model_path)
-
-            # 메타데이터 로드
-            if metadata_path.exists():
-                with open(metadata_path, 'r', encoding='utf-8') as f:
-                    self._metadata = json.load(f)
-                logger.info(
-                    f"모델 로드됨 - Ver: {self._metadata.get('version')}, "
-                    f"정확도: {self._metadata.get('accuracy', 'N/A')}"
-                )
-            else:
-                # 메타데이터 파일이 없을 경우 기본값 {}
-                self._metadata = {}
-                logger.warning("모델 메타데이터를 찾을 수 없습니다")
-
+            model = get_model_registry().load(mmap_mode=MMAP_MODE)
+        except FileNotFoundError as e:
+            logger.error(f"Model file not found: {e}")
+            raise
         except Exception as e:
             # 모델 로딩 중 예외 발생 시
             logger.error(f"모델 로드에 실패했습니다..: {e}")
             raise
 
+        type(self)._model = model
+        type(self)._last_checked_at = time.monotonic()
+        logger.info(
+            f"모델 로드됨 - Ver: {model.version}, "
+            f"정확도: {model.metadata.get('accuracy', 'N/A')}, mmap: {MMAP_MODE or 'off'}"
+        )
+
+    def _current_model(self) -> LoadedModel:
+        """요청 시점의 모델 참조 (변경 감지는 백그라운드로 위임)"""
+        self._maybe_reload()
+        return self._model
+
+    def _maybe_reload(self):
+        """
+        CURRENT 포인터 세대가 바뀌었으면 백그라운드 재로드 시작
+
+        - 확인은 RELOAD_CHECK_INTERVAL마다 stat 1회
+        - 재로드 중이면(락 점유) 중복 시작하지 않음
+        """
+        now = time.monotonic()
+        if now - self._last_checked_at < RELOAD_CHECK_INTERVAL:
+            return
+        type(self)._last_checked_at = now
+
+        if get_model_registry().generation() == self._model.generation:
+            return
+        if self._reload_lock.locked():
+            return
+
+        threading.Thread(target=self._reload_in_background, name='sentiment-model-reload', daemon=True).start()
+
+    def _reload_in_background(self):
+        if not self._reload_lock.acquire(blocking=False):
+            return
+        try:
+            previous = self._model.version
+            self._load_model()
+            logger.info(f"감성분석 모델 교체: {previous} → {self._model.version}")
+        except Exception as e:
+            # 실패 시 기존 모델 유지, 다음 확인 주기에 재시도
+            logger.error(f"감성분석 모델 재로드 실패 (기존 모델 유지): {e}")
+        finally:
+            self._reload_lock.release()
+
+    def reload(self):
+        """현재 버전 모델 즉시 재로드 (동기, 관리 커맨드/테스트용)"""
+        with self._reload_lock:
+            self._load_model()
+
     def analyze(self, text: str) -> Dict[str, Union[str, float]]:
         """
         단일 텍스트 감성분석
@@ -147,13 +194,16 @@ class SentimentProcessor:
         if not text or len(text.strip()) == 0:
             return self._default_result()
 
+        # 요청 시작 시점의 모델 참조 고정 (처리 중 교체되어도 영향 없음)
+        pipeline = self._current_model().pipeline
+
         try:
-            # 예측
-            prediction = self._pipeline.predict([text])[0]
-            probabilities = self._pipeline.predict_proba([text])[0]
+            # 예측 (predict_proba 1회, 라벨은 최대 확률 클래스)
+            probabilities = pipeline.predict_proba([text])[0]
 
             # 학습된 클래스 확인
-            classes = self._pipeline.classes_
+            classes = pipeline.classes_
+            prediction = classes[probabilities.argmax()]
 
             # 확률 매핑
             if classes[0] == 'negative':
@@ -177,15 +227,17 @@ class SentimentProcessor:
             logger.error(f"Sentiment analysis failed for text: {text[:50]}... Error: {e}")
             return self._default_result()
 
-    def analyze_batch(self, texts: List[str]) -> List[Dict[str, Union[str, float]]]:
+    def analyze_batch(self, texts: List[str], model: LoadedModel = None) -> List[Dict[str, Union[str, float]]]:
         """
         [설계 의도]
         - 텍스트를 하나씩 분석하지 않고
           한 번에 predict / predict_proba 호출
         - sklearn의 벡터화 성능 최대 활용
+        - 토크나이징은 Kiwi 배치 모드(멀티스레드) + 캐시 (ai_models/tokenizer.py)
 
         Args:
             texts: 분석할 텍스트 리스트
+            model: 사용할 모델 (기본: 현재 서비스 모델, evaluate_model 지연 측정 시 평가 대상 모델 지정)
 
         Returns:
             감성분석 결과 리스트
@@ -207,11 +259,19 @@ class SentimentProcessor:
         if not valid_texts:
             return [self._default_result() for _ in texts]
 
+        # 요청 시작 시점의 모델 참조 고정
+        pipeline = (model or self._current_model()).pipeline
+
         try:
-            # 배치 예측
-            predictions = self._pipeline.predict(valid_texts)
-            probabilities = self._pipeline.predict_proba(valid_texts)
-            classes = self._pipeline.classes_
+            # Kiwi 배치 모드로 한 번에 토크나이징 → 파이프라인 내부 문서별 호출은 캐시 조회
+            # (캐시 키가 맞도록 TF-IDF와 같은 전처리(lowercase 등)를 거친 텍스트로 적재)
+            preprocess = pipeline.steps[0][1].build_preprocessor()
+            get_tokenizer().tokenize_many([preprocess(text) for text in valid_texts])
+
+            # 배치 예측 (predict_proba 1회, 라벨은 최대 확률 클래스 → TF-IDF 변환 1회)
+            probabilities = pipeline.predict_proba(valid_texts)
+            classes = pipeline.classes_
+            predictions = [classes[probs.argmax()] for probs in probabilities]
 
             # 결과 리스트를 기본값으로 초기화
             results = [self._default_result() for _ in texts]
@@ -261,14 +321,17 @@ class SentimentProcessor:
         현재 로드된 모델 정보 반환
 
         Returns:
+            - version: 레지스트리 버전
             - metadata: 모델 학습 정보
             - is_loaded: 모델 로드 여부
             - classes: 분류 클래스 목록
         """
+        model = self._current_model()
         return {
-            'metadata': self._metadata,
-            'is_loaded': self._pipeline is not None,
-            'classes': list(self._pipeline.classes_) if self._pipeline else []
+            'version': model.version if model else None,
+            'metadata': model.metadata if model else None,
+            'is_loaded': model is not None,
+            'classes': list(model.pipeline.classes_) if model else []
         }
     
     def analyze_with_timing(self, text:str) -> Dict:
@@ -0,0 +1,238 @@
+# apps/comparisons/ai_models/registry.py
+
+"""
+감성분석 모델 레지스트리 (버전별 아티팩트 + 원자적 CURRENT 포인터)
+
+[설계 의도]
+- 기존: train_model이 sentiment_pipeline.joblib 한 파일을 덮어씀
+  → gunicorn 재시작 전까지 새 모델 미반영, 덮어쓰는 도중 읽으면 손상된 파일을 읽을 위험
+- 변경: 학습 결과를 버전 디렉토리에 "새로" 쓰고, CURRENT 포인터만 원자적으로 교체
+  → 실행 중인 워커는 포인터 변경을 감지해 백그라운드에서 새 모델로 교체 (재시작 불필요)
+  → 이전 버전 디렉토리가 남아 있으므로 즉시 롤백 가능
+
+[디렉토리 구조]
+ai_models/
+├── CURRENT                         # 현재 서비스 버전 이름 (한 줄)
+├── versions/
+│   ├── 20251223-140530/
+│   │   ├── sentiment_pipeline.joblib
+│   │   └── model_metadata.json
+│   └── 20251225-093045/ ...
+└── sentiment_pipeline.joblib       # (레거시) CURRENT가 없을 때만 사용
+
+[상세 고려사항]
+- 버전 디렉토리는 불변(immutable): 임시 디렉토리에 모두 쓴 뒤 rename으로 공개
+- CURRENT 교체는 임시 파일 작성 → os.replace (같은 파일시스템에서 원자적)
+- 세대(generation) 확인은 CURRENT 파일의 stat(mtime_ns, size)만 사용 → 요청 경로에서 저렴
+- mmap_mode='r'로 로드하면 TF-IDF idf_, 분류기 coef_ 등 numpy 배열을 파일에서 메모리 매핑
+  → 여러 워커가 OS 페이지 캐시를 공유 (버전 파일이 불변이므로 안전)
+  → 단, vocabulary_(dict)는 Python 객체라 워커별로 적재됨
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import joblib
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY_ROOT = Path(__file__).resolve().parent
+
+MODEL_FILENAME = 'sentiment_pipeline.joblib'
+METADATA_FILENAME = 'model_metadata.json'
+CURRENT_FILENAME = 'CURRENT'
+VERSIONS_DIRNAME = 'versions'
+LEGACY_VERSION = 'legacy'
+
+
+@dataclass(frozen=True)
+class LoadedModel:
+    """로드된 모델 묶음 (참조 교체 단위)"""
+    version: str
+    pipeline: Any
+    metadata: Dict
+    generation: Optional[Tuple]
+
+
+class ModelRegistry:
+    """
+    파일 시스템 기반 모델 레지스트리
+
+    Args:
+        root: 레지스트리 루트 디렉토리 (기본: ai_models/)
+    """
+
+    def __init__(self, root: Path = DEFAULT_REGISTRY_ROOT):
+        self.root = Path(root)
+        self.versions_dir = self.root / VERSIONS_DIRNAME
+        self.current_path = self.root / CURRENT_FILENAME
+
+    # =========================
+    # 조회
+    # =========================
+
+    def current_version(self) -> Optional[str]:
+        """CURRENT 포인터가 가리키는 버전 (없으면 레거시 파일 존재 시 'legacy')"""
+        try:
+            version = self.current_path.read_text(encoding='utf-8').strip()
+        except FileNotFoundError:
+            version = ''
+
+        if version:
+            return version
+        if (self.root / MODEL_FILENAME).exists():
+            return LEGACY_VERSION
+        return None
+
+    def generation(self) -> Optional[Tuple]:
+        """
+        CURRENT 포인터의 세대 값 (stat 1회)
+
+        - 포인터 교체(os.replace) 시 inode/mtime이 바뀌므로 변경 감지에 사용
+        """
+        try:
+            stat = self.current_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def version_dir(self, version: str) -> Path:
+        if version == LEGACY_VERSION:
+            return self.root
+        return self.versions_dir / version
+
+    def model_path(self, version: Optional[str] = None) -> Path:
+        """버전(기본: 현재 버전)의 모델 파일 경로"""
+        version = version or self.current_version()
+        if version is None:
+            raise FileNotFoundError(
+                f"감성분석 모델이 없습니다: {self.root}\n"
+                f"'python manage.py train_model' 명령으로 모델을 학습해주세요."
+            )
+        return self.version_dir(version) / MODEL_FILENAME
+
+    def read_metadata(self, version: str) -> Dict:
+        metadata_path = self.version_dir(version) / METADATA_FILENAME
+        if not metadata_path.exists():
+            return {}
+        with open(metadata_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def list_versions(self) -> List[Dict]:
+        """등록된 버전 목록 (오래된 순) + 메타데이터 요약"""
+        current = self.current_version()
+        versions = []
+        if self.versions_dir.exists():
+            for path in sorted(p for p in self.versions_dir.iterdir() if p.is_dir() and not p.name.startswith('.')):
+                metadata = self.read_metadata(path.name)
+                versions.append({
+                    'version': path.name,
+                    'is_current': path.name == current,
+                    'accuracy': metadata.get('accuracy'),
+                    'trained_at': metadata.get('trained_at'),
+                    'metadata': metadata,
+                })
+        return versions
+
+    # =========================
+    # 로드
+    # =========================
+
+    def load(self, version: Optional[str] = None, mmap_mode: Optional[str] = None) -> LoadedModel:
+        """
+        모델 로드
+
+        Args:
+            version: 로드할 버전 (기본: CURRENT)
+            mmap_mode: 'r'이면 numpy 배열을 메모리 매핑 (워커 간 페이지 캐시 공유)
+        """
+        generation = self.generation()
+        version = version or self.current_version()
+        model_path = self.model_path(version)
+
+        if not model_path.exists():
+            raise FileNotFoundError(
+                f"감성분석 모델 파일을 찾을 수 없습니다!!! : {model_path}\n"
+                f"'python manage.py train_model' 명령으로 모델을 학습해주세요."
+            )
+
+        pipeline = joblib.load(model_path, mmap_mode=mmap_mode)
+        metadata = self.read_metadata(version)
+        metadata.setdefault('version', version)
+
+        return LoadedModel(version=version, pipeline=pipeline, metadata=metadata, generation=generation)
+
+    # =========================
+    # 등록 / 교체
+    # =========================
+
+    def publish(self, pipeline, metadata: Dict, version: Optional[str] = None, activate: bool = True) -> str:
+        """
+        새 버전 등록
+
+        - 임시 디렉토리에 모델/메타데이터를 모두 쓴 뒤 rename으로 공개 (부분 기록 노출 없음)
+        - 압축 없이 저장 (mmap_mode 로드 조건)
+
+        Returns:
+            str: 등록된 버전 이름
+        """
+        version = version or datetime.now().strftime('%Y%m%d-%H%M%S')
+        target_dir = self.versions_dir / version
+        if target_dir.exists():
+            raise FileExistsError(f'이미 존재하는 모델 버전입니다: {version}')
+
+        self.versions_dir.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(prefix=f'.{version}-', dir=self.versions_dir))
+        try:
+            joblib.dump(pipeline, tmp_dir / MODEL_FILENAME)
+
+            metadata = {**metadata, 'version': version}
+            with open(tmp_dir / METADATA_FILENAME, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f, ensure_ascii=False, indent=2)
+
+            os.rename(tmp_dir, target_dir)
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        logger.info(f"모델 버전 등록: {version}")
+        if activate:
+            self.activate(version)
+        return version
+
+    def activate(self, version: str):
+        """CURRENT 포인터를 원자적으로 교체 (롤백에도 사용)"""
+        if version != LEGACY_VERSION and not (self.versions_dir / version / MODEL_FILENAME).exists():
+            raise FileNotFoundError(f'등록되지 않은 모델 버전입니다: {version}')
+
+        fd, tmp_path = tempfile.mkstemp(prefix='.CURRENT-', dir=self.root)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(version + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.current_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        logger.info(f"현재 모델 버전 변경: {version}")
+
+
+_registry_instance = None
+
+
+def get_model_registry() -> ModelRegistry:
+    """ModelRegistry 싱글톤 인스턴스 반환 (기본 루트: ai_models/)"""
+    global _registry_instance
+    if _registry_instance is None:
+        _registry_instance = ModelRegistry()
+    return _registry_instance
@@ -0,0 +1,147 @@
+# apps/comparisons/ai_models/search.py
+
+"""
+감성분석 모델 하이퍼파라미터 탐색 (train_model --search)
+
+[설계 의도]
+- 기존: 고정된 min_df/ngram/C로 파이프라인 1개 학습, cross_val_score가 fold마다 재토크나이징/재벡터화
+- 변경:
+  1. 코퍼스는 한 번만 토크나이징 (tokenizer.tokenize_corpus, 영속 캐시)
+  2. TF-IDF 행렬은 (min_df, ngram) 설정 × fold별로 1회만 생성 후 재사용
+     → C, class_weight 후보는 같은 행렬 위에서 분류기만 다시 학습
+  3. 후보 평가는 joblib Parallel(n_jobs)로 코어 수만큼 병렬 실행
+
+[상세 고려사항]
+- Django 의존성 없음 → joblib(loky) 워커 프로세스에서 가볍게 import
+- fold 분할은 cross_val_score(cv=int) 기본값과 동일한 StratifiedKFold(shuffle 없음)
+- 이미 토큰 리스트이므로 벡터라이저는 identity tokenizer/preprocessor 사용
+  (최종 파이프라인은 원문 입력용 kiwi_tokenizer로 같은 설정을 재학습)
+- min_df가 너무 커서 어휘가 남지 않는 설정은 오류로 기록하고 건너뜀
+"""
+
+import itertools
+import random
+from typing import Dict, List, Optional
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import StratifiedKFold
+
+MAX_FEATURES = 5000
+
+
+def identity(value):
+    """이미 토크나이징된 문서를 그대로 통과 (pickle 가능한 모듈 함수)"""
+    return value
+
+
+def build_candidates(min_dfs, ngrams, Cs, class_weights, mode: str = 'grid',
+                     n_iter: int = 20, random_state: int = 42) -> List[Dict]:
+    """
+    탐색 후보 목록 생성
+
+    Args:
+        mode: 'grid'(전체 조합) | 'random'(전체 조합 중 n_iter개 무작위 추출)
+        class_weights: 'balanced' 또는 None 목록
+    """
+    candidates = [
+        {'min_df': min_df, 'ngram': ngram, 'C': C, 'class_weight': class_weight}
+        for min_df, ngram, C, class_weight in itertools.product(
+            sorted(set(min_dfs)), sorted(set(ngrams)), sorted(set(Cs)), class_weights
+        )
+    ]
+    if mode == 'random' and n_iter < len(candidates):
+        candidates = random.Random(random_state).sample(candidates, n_iter)
+    return candidates
+
+
+def build_fold_matrices(token_docs, y, folds, min_df: int, ngram: int, max_features: int = MAX_FEATURES):
+    """
+    (min_df, ngram) 설정 1개에 대한 fold별 TF-IDF 행렬
+
+    Returns:
+        [(X_train, y_train, X_valid, y_valid), ...] 또는 어휘가 남지 않으면 None
+    """
+    matrices = []
+    for train_idx, valid_idx in folds:
+        vectorizer = TfidfVectorizer(
+            tokenizer=identity,
+            preprocessor=identity,
+            lowercase=False,
+            token_pattern=None,
+            ngram_range=(1, ngram),
+            min_df=min_df,
+            max_features=max_features,
+            sublinear_tf=True,
+        )
+        try:
+            X_train = vectorizer.fit_transform([token_docs[i] for i in train_idx])
+        except ValueError:
+            # After pruning, no terms remain
+            return None
+        X_valid = vectorizer.transform([token_docs[i] for i in valid_idx])
+        matrices.append((X_train, y[train_idx], X_valid, y[valid_idx]))
+    return matrices
+
+
+def score_candidate(fold_matrices, C: float, class_weight: Optional[str]) -> List[float]:
+    """캐시된 fold 행렬 위에서 분류기만 학습/평가 → fold별 정확도"""
+    scores = []
+    for X_train, y_train, X_valid, y_valid in fold_matrices:
+        clf = LogisticRegression(
+            C=C,
+            max_iter=1000,
+            class_weight=class_weight,
+            random_state=42,
+            solver='lbfgs',
+        )
+        clf.fit(X_train, y_train)
+        scores.append(accuracy_score(y_valid, clf.predict(X_valid)))
+    return scores
+
+
+def run_search(token_docs: List[List[str]], labels, candidates: List[Dict],
+               cv: int = 5, n_jobs: int = -1, max_features: int = MAX_FEATURES) -> List[Dict]:
+    """
+    후보 전체 교차 검증 평가
+
+    [처리 흐름]
+    1. fold 분할 1회
+    2. (min_df, ngram) 설정별 TF-IDF 행렬 병렬 생성 (설정 수만큼만)
+    3. 후보별 분류기 학습/평가 병렬 실행
+
+    Returns:
+        cv_mean 내림차순 리더보드 (rank, 파라미터, cv_mean, cv_std, fold_scores / 실패 시 error)
+    """
+    y = np.asarray(labels)
+    folds = list(StratifiedKFold(n_splits=cv).split(np.zeros(len(y)), y))
+
+    feature_configs = sorted({(c['min_df'], c['ngram']) for c in candidates})
+    built = Parallel(n_jobs=n_jobs)(
+        delayed(build_fold_matrices)(token_docs, y, folds, min_df, ngram, max_features)
+        for min_df, ngram in feature_configs
+    )
+    feature_cache = dict(zip(feature_configs, built))
+
+    runnable = [c for c in candidates if feature_cache[(c['min_df'], c['ngram'])] is not None]
+    scores = Parallel(n_jobs=n_jobs)(
+        delayed(score_candidate)(feature_cache[(c['min_df'], c['ngram'])], c['C'], c['class_weight'])
+        for c in runnable
+    )
+
+    leaderboard = [
+        {**c, 'cv_mean': float(np.mean(s)), 'cv_std': float(np.std(s)), 'fold_scores': [float(v) for v in s]}
+        for c, s in zip(runnable, scores)
+    ]
+    leaderboard.sort(key=lambda entry: (-entry['cv_mean'], entry['cv_std']))
+    for rank, entry in enumerate(leaderboard, start=1):
+        entry['rank'] = rank
+
+    leaderboard.extend(
+        {**c, 'error': f"min_df={c['min_df']}에서 남는 어휘가 없습니다"}
+        for c in candidates if feature_cache[(c['min_df'], c['ngram'])] is None
+    )
+    return leaderboard
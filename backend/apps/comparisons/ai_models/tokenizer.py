@@ -0,0 +1,291 @@
+# apps/comparisons/ai_models/tokenizer.py
+
+"""
+감성분석용 Kiwi 토크나이저 (배치 모드 + 메모이제이션)
+
+[설계 의도]
+- TfidfVectorizer는 tokenizer를 문서마다 1번씩 호출 → kiwi.tokenize(text) 단건 호출이 전체 비용의 대부분
+  - 추론: analyze_batch가 predict / predict_proba로 같은 문서를 2번 토크나이징
+  - 학습: cross_val_score의 fold마다 같은 문서를 다시 토크나이징
+- 변경: 문서 묶음을 Kiwi 멀티스레드 배치 모드(kiwi.tokenize(texts), num_workers)로 한 번에 처리하고
+  결과를 텍스트 해시 키로 메모이제이션 → 파이프라인 내부의 문서별 호출은 캐시 조회만 수행
+
+[구성]
+1. KiwiTokenizer      | 배치 토크나이징 + LRU 캐시 (프로세스 전역 1개, get_tokenizer)
+2. kiwi_tokenizer     | TfidfVectorizer(tokenizer=...)에 넣는 함수 (pickle 가능한 모듈 함수)
+3. TokenCache         | 디스크 영속 토큰 캐시 (학습 재실행/하이퍼파라미터 탐색 간 재사용)
+4. tokenize_corpus    | 학습 코퍼스 사전 토크나이징 (영속 캐시 → 배치 토크나이징 → LRU 적재)
+
+[상세 고려사항]
+- 캐시 키는 텍스트 blake2b(16바이트) 해시 → 긴 리뷰 원문을 키로 들고 있지 않음
+- 품사 필터(명사/동사/수식언/어근)와 실패 시 공백 split fallback은 기존 train_model.kiwi_tokenizer와 동일
+- 기존 모델 pickle은 train_model.kiwi_tokenizer를 참조 → train_model에서 이 모듈의 함수를 그대로 노출해 호환
+- 설정(환경변수)
+  - KIWI_NUM_WORKERS: Kiwi 배치 모드 스레드 수 (0: 가용 코어 전체, 기본 0)
+  - KIWI_TOKEN_CACHE_SIZE: LRU 최대 항목 수 (기본 20000)
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NUM_WORKERS = int(os.environ.get('KIWI_NUM_WORKERS', 0))
+DEFAULT_CACHE_SIZE = int(os.environ.get('KIWI_TOKEN_CACHE_SIZE', 20000))
+
+# 의미 있는 품사만 추출 | N: 명사, V: 동사, M: 수식언(형용사 포함), XR: 어근
+POS_PREFIXES = ('N', 'V', 'M', 'XR')
+
+
+def text_key(text: str) -> bytes:
+    """캐시 키 (텍스트 해시)"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+class KiwiTokenizer:
+    """
+    Kiwi 배치 토크나이저 + LRU 캐시
+
+    Args:
+        num_workers: Kiwi 배치 모드 스레드 수 (0: 가용 코어 전체)
+        cache_size: LRU 최대 항목 수 (0이면 캐시 사용 안 함)
+    """
+
+    def __init__(self, num_workers: int = DEFAULT_NUM_WORKERS, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.num_workers = num_workers
+        self.cache_size = cache_size
+        self._kiwi = None
+        self._cache: 'OrderedDict[bytes, List[str]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def kiwi(self):
+        """Kiwi 인스턴스 (최초 사용 시 생성, 형태소 사전 로드 비용 지연)"""
+        if self._kiwi is None:
+            from kiwipiepy import Kiwi
+            self._kiwi = Kiwi(num_workers=self.num_workers)
+        return self._kiwi
+
+    # =========================
+    # 토크나이징
+    # =========================
+
+    @staticmethod
+    def _filter(tokens) -> List[str]:
+        return [t.form for t in tokens if t.tag.startswith(POS_PREFIXES)]
+
+    def _tokenize_uncached(self, texts: List[str]) -> List[List[str]]:
+        """Kiwi 배치 모드로 여러 문서를 한 번에 토크나이징"""
+        try:
+            return [self._filter(tokens) for tokens in self.kiwi.tokenize(texts)]
+        except Exception:
+            # 배치 실패 시 문서별로 재시도 (문제 문서만 fallback)
+            results = []
+            for text in texts:
+                try:
+                    results.append(self._filter(self.kiwi.tokenize(text)))
+                except Exception:
+                    results.append(text.split())  # fallback | 최후의 안전장치
+            return results
+
+    def tokenize(self, text: str) -> List[str]:
+        """단일 문서 토크나이징 (캐시 우선)"""
+        return self.tokenize_many([text])[0]
+
+    def tokenize_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """
+        여러 문서 토크나이징
+
+        - 캐시에 있는 문서는 조회만, 없는 문서는 중복 제거 후 배치 모드 1회 호출
+        - 반환 순서는 입력 순서와 동일
+        """
+        texts = list(texts)
+        keys = [text_key(text) for text in texts]
+        results: List[Optional[List[str]]] = [None] * len(texts)
+        missing: Dict[bytes, str] = {}
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                tokens = self._cache.get(key)
+                if tokens is not None:
+                    self._cache.move_to_end(key)
+                    results[i] = tokens
+                else:
+                    missing.setdefault(key, texts[i])
+            self.hits += len(texts) - sum(1 for r in results if r is None)
+            self.misses += len(missing)
+
+        if missing:
+            computed = dict(zip(missing, self._tokenize_uncached(list(missing.values()))))
+            self.put_many(computed)
+            for i, key in enumerate(keys):
+                if results[i] is None:
+                    results[i] = computed[key]
+
+        return results
+
+    def __call__(self, text: str) -> List[str]:
+        return self.tokenize(text)
+
+    # =========================
+    # 캐시
+    # =========================
+
+    def put_many(self, entries: Dict[bytes, List[str]]):
+        """(키 → 토큰) 캐시 적재 (LRU 초과분은 오래된 것부터 제거)"""
+        if self.cache_size <= 0:
+            return
+        with self._lock:
+            for key, tokens in entries.items():
+                self._cache[key] = tokens
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def ensure_capacity(self, size: int):
+        """학습 코퍼스 전체가 LRU에 들어가도록 용량 확장 (fold 간 재사용 보장)"""
+        with self._lock:
+            self.cache_size = max(self.cache_size, size)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict:
+        return {
+            'size': len(self._cache),
+            'capacity': self.cache_size,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+_tokenizer_instance = None
+
+
+def get_tokenizer() -> KiwiTokenizer:
+    """KiwiTokenizer 싱글톤 인스턴스 반환"""
+    global _tokenizer_instance
+    if _tokenizer_instance is None:
+        _tokenizer_instance = KiwiTokenizer()
+    return _tokenizer_instance
+
+
+def kiwi_tokenizer(text):
+    """
+    TfidfVectorizer(tokenizer=...)용 토크나이징 함수
+
+    - 모듈 수준 함수라 pipeline과 함께 pickle 가능
+    - 공유 토크나이저의 캐시를 사용하므로, 호출 전에 tokenize_many로 묶음을 미리 처리하면
+      파이프라인 내부 호출은 캐시 조회만 수행
+    """
+    return get_tokenizer().tokenize(text)
+
+
+class TokenCache:
+    """
+    디스크 영속 토큰 캐시 (학습용)
+
+    - {텍스트 해시: 토큰} dict를 pickle로 저장
+    - 토크나이저 설정(kiwipiepy 버전, 품사 필터)이 바뀌면 기존 캐시는 무시
+    - 저장은 임시 파일 작성 → os.replace (중단되어도 기존 캐시 보존)
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.signature = self._signature()
+        self.entries: Dict[bytes, List[str]] = {}
+        self._dirty = False
+        self._load()
+
+    @staticmethod
+    def _signature() -> str:
+        try:
+            from kiwipiepy import __version__ as kiwi_version
+        except ImportError:
+            kiwi_version = 'unknown'
+        return f'kiwi-{kiwi_version}|pos={",".join(POS_PREFIXES)}'
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"토큰 캐시 로드 실패, 새로 생성합니다: {self.path} ({e})")
+            return
+        if data.get('signature') == self.signature:
+            self.entries = data.get('entries', {})
+
+    def __len__(self):
+        return len(self.entries)
+
+    def update(self, entries: Dict[bytes, List[str]]):
+        if entries:
+            self.entries.update(entries)
+            self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.tokens-', dir=self.path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({'signature': self.signature, 'entries': self.entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._dirty = False
+
+
+def tokenize_corpus(texts: Iterable[str], cache_path=None, tokenizer: KiwiTokenizer = None) -> List[List[str]]:
+    """
+    학습 코퍼스 사전 토크나이징
+
+    [처리 흐름]
+    1. 영속 캐시(cache_path)에 있는 문서는 재사용
+    2. 나머지는 Kiwi 배치 모드로 한 번에 토크나이징 후 영속 캐시 저장
+    3. 전체 결과를 공유 토크나이저 LRU에 적재 (용량 자동 확장)
+       → 이후 pipeline.fit / cross_val_score의 fold별 kiwi_tokenizer 호출은 캐시 조회만 수행
+
+    Returns:
+        List[List[str]]: 입력 순서대로의 토큰 리스트
+    """
+    tokenizer = tokenizer or get_tokenizer()
+    texts = list(texts)
+    keys = [text_key(text) for text in texts]
+    token_cache = TokenCache(cache_path) if cache_path else None
+
+    known: Dict[bytes, List[str]] = dict(token_cache.entries) if token_cache else {}
+    missing: Dict[bytes, str] = {}
+    for key, text in zip(keys, texts):
+        if key not in known:
+            missing.setdefault(key, text)
+
+    if missing:
+        computed = dict(zip(missing, tokenizer._tokenize_uncached(list(missing.values()))))
+        known.update(computed)
+        if token_cache is not None:
+            token_cache.update(computed)
+            token_cache.save()
+
+    corpus = {key: known[key] for key in keys}
+    tokenizer.ensure_capacity(len(corpus))
+    tokenizer.put_many(corpus)
+
+    logger.info(f"코퍼스 토크나이징: {len(texts)}건 (신규 {len(missing)}건, 캐시 재사용 {len(corpus) - len(missing)}건)")
+    return [corpus[key] for key in keys]
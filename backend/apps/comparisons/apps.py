@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ComparisonsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.comparisons'
+
+    def ready(self):
+        from . import signals
@@ -17,12 +17,20 @@
 - 평가 결과를 콘솔에 요약 출력하고, --verbose 옵션으로
     샘플별 예측 결과도 확인 가능
 - 평가 결과 저장 경로를 유연하게 지정할 수 있도록 옵션 제공
+- 대용량 평가 (--chunk-size): CSV를 청크 단위로 읽고 혼동 행렬만 누적 → 수백만 건도 메모리 일정
+- 슬라이스 지표: 리뷰 길이 구간별, 강좌 대분류별 (category 컬럼 또는 course_id → Course.classfy_name)
+- 지연 측정 (--profile): SentimentProcessor.analyze_batch의 배치 크기별 지연 백분위수/처리량 곡선
+  → 운영 배치 크기 선택 근거 (docs/sec 최대 지점)
+- 실행마다 요약을 evaluation_timeseries.jsonl에 1줄씩 추가 (시계열 모니터링)
 
 [사용 예시]
 python manage.py evaluate_model
 python manage.py evaluate_model --test-data fixtures/new_test.csv
 python manage.py evaluate_model --model-path ai_models/v2.0/model.joblib
+python manage.py evaluate_model --model-version 20251225-093045
 python manage.py evaluate_model --output evaluation_results/custom_eval.json --verbose
+python manage.py evaluate_model --test-data big_test.csv --chunk-size 50000
+python manage.py evaluate_model --profile --profile-batch-sizes 1 8 32 128 512
 
 
 """
@@ -35,18 +43,25 @@ from pathlib import Path
 from datetime import datetime
 from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
-from sklearn.metrics import (
-    accuracy_score,
-    precision_recall_fscore_support,
-    classification_report,
-    confusion_matrix
+
+from apps.comparisons.ai_models.evaluation import (
+    TARGET_LABELS,
+    MetricsAccumulator,
+    SlicedMetrics,
+    length_bucket,
+    profile_latency,
 )
+from apps.comparisons.ai_models.processor import get_sentiment_processor
+from apps.comparisons.ai_models.registry import LoadedModel, ModelRegistry
+from apps.comparisons.ai_models.tokenizer import get_tokenizer
+from apps.courses.models import Course
 
 # 기본 경로 상수
 # 하드 코딩은 지양.
-DEFAULT_MODEL_PATH = Path(settings.BASE_DIR) / "apps" / "comparisons" / "ai_models" / "sentiment_pipeline.joblib"
+DEFAULT_MODEL_DIR = Path(settings.BASE_DIR) / "apps" / "comparisons" / "ai_models"
 DEFAULT_TEST_DATA_PATH = Path(settings.BASE_DIR) / "apps" / "comparisons" / "fixtures" / "sentiment_test_data.csv"
 DEFAULT_OUTPUT_DIR = Path(settings.BASE_DIR) / "apps" / "comparisons" / "evaluation_results"
+TIMESERIES_FILENAME = "evaluation_timeseries.jsonl"
 
 # Numpy 타입을 JSON 직렬화할 수 없으므로 변환 헬퍼
     # Python의 json은 numpy.int64, numpy.float32 같은 타입을 기본적으로 직렬화 못함
@@ -83,9 +98,15 @@ class Command(BaseCommand): # BaseCommand 상속, 장고가 manage.py 커맨드
 
         [옵션 설명]
         --test-data: 테스트 데이터 CSV 파일 경로
-        --model-path: 평가할 모델 파일 경로 (joblib)
+        --model-path: 평가할 모델 파일 경로 (joblib, 기본: 레지스트리 현재 버전)
+        --model-version: 평가할 레지스트리 버전 (--model-path 대신 사용)
         --output: 평가 결과 JSON 저장 경로 (자동 생성)
         --verbose: 상세 출력 여부
+        --chunk-size: 스트리밍 평가 청크 크기 (미지정 시 한 번에 로드)
+        --category-column: 강좌 분류 슬라이스 컬럼 (없으면 course_id로 DB 조회)
+        --profile: 배치 크기별 추론 지연/처리량 측정
+        --profile-batch-sizes: 측정할 배치 크기 목록
+        --profile-samples: 측정에 사용할 샘플 수 (앞에서부터)
         """
         parser.add_argument(
             '--test-data',
@@ -97,8 +118,15 @@ class Command(BaseCommand): # BaseCommand 상속, 장고가 manage.py 커맨드
         parser.add_argument(
             '--model-path',
             type=str,
-            default=str(DEFAULT_MODEL_PATH),
-            help='평가할 모델 파일 경로 (.joblib)'
+            default=None,
+            help='평가할 모델 파일 경로 (.joblib, 기본: 레지스트리 현재 버전)'
+        )
+
+        parser.add_argument(
+            '--model-version',
+            type=str,
+            default=None,
+            help='평가할 모델 레지스트리 버전 (예: 20251225-093045)'
         )
 
         parser.add_argument(
@@ -114,6 +142,41 @@ class Command(BaseCommand): # BaseCommand 상속, 장고가 manage.py 커맨드
             help='상세 출력 (샘플별 예측 결과 표시)'
         )
 
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='스트리밍 평가 청크 크기 (지정 시 CSV를 청크 단위로 읽어 메모리 사용량 일정)'
+        )
+
+        parser.add_argument(
+            '--category-column',
+            type=str,
+            default='category',
+            help='강좌 분류 슬라이스 컬럼 (없고 course_id 컬럼이 있으면 Course.classfy_name 사용)'
+        )
+
+        parser.add_argument(
+            '--profile',
+            action='store_true',
+            help='SentimentProcessor.analyze_batch 배치 크기별 지연/처리량 측정'
+        )
+
+        parser.add_argument(
+            '--profile-batch-sizes',
+            type=int,
+            nargs='+',
+            default=[1, 8, 32, 128, 512],
+            help='지연 측정 배치 크기 목록'
+        )
+
+        parser.add_argument(
+            '--profile-samples',
+            type=int,
+            default=2000,
+            help='지연 측정에 사용할 샘플 수'
+        )
+
     def handle(self, *args, **options):
         """
         평가 메인 로직
@@ -134,7 +197,17 @@ class Command(BaseCommand): # BaseCommand 상속, 장고가 manage.py 커맨드
         # 1. 모델 로드
         # =====================================
 
-        model_path = Path(options['model_path'])
+        model_version = None
+        if options['model_path']:
+            model_path = Path(options['model_path'])
+        else:
+            # 레지스트리 버전(기본: CURRENT)의 모델 파일
+            try:
+                registry = ModelRegistry(DEFAULT_MODEL_DIR)
+                model_version = options['model_version'] or registry.current_version()
+                model_path = registry.model_path(model_version)
+            except FileNotFoundError as e:
+                raise CommandError(str(e))
         self.stdout.write(f'\n[1/5] 모델 로드: {model_path}')
 
         if not model_path.exists():
@@ -155,65 +228,101 @@ class Command(BaseCommand): # BaseCommand 상속, 장고가 manage.py 커맨드
             raise CommandError(f'모델 로드 중 오류 발생: {str(e)}')
 
         # =====================================
-        # 2. 테스트 데이터 로드
+        # 2. 테스트 데이터 로드 (스트리밍)
+        # - --chunk-size 지정 시 청크 단위로 읽어 예측/누적 (전체를 메모리에 올리지 않음)
         # =====================================
 
         test_data_path = Path(options['test_data'])
-        self.stdout.write(f'\n[2/5] 테스트 데이터 로드: {test_data_path}')
+        chunk_size = options['chunk_size']
+        self.stdout.write(
+            f'\n[2/5] 테스트 데이터 로드: {test_data_path}'
+            + (f' (청크 {chunk_size:,}건 스트리밍)' if chunk_size else '')
+        )
 
         if not test_data_path.exists():
             raise CommandError(f'테스트 데이터를 찾을 수 없습니다: {test_data_path}')
 
         try:
-            df = pd.read_csv(test_data_path, encoding='utf-8-sig')
-            self.stdout.write(f'  ✓ 총 {len(df)}개 데이터 로드')
+            reader = pd.read_csv(test_data_path, encoding='utf-8-sig', chunksize=chunk_size)
+            chunks = reader if chunk_size else [reader]
         except Exception as e:
             raise CommandError(f'테스트 데이터 로드 중 오류: {str(e)}')
 
-        # 데이터 검증
-        required_columns = ['content', 'label']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-
-        if missing_columns:
-            raise CommandError(
-                f'필수 컬럼이 없습니다: {missing_columns}\n'
-                f'CSV 파일은 "content"와 "label" 컬럼을 포함해야 합니다.'
-            )
-
-        # 결측치 제거
-        original_len = len(df)
-        df = df.dropna(subset=['content', 'label'])
-
-        if len(df) < original_len:
-            self.stdout.write(
-                self.style.WARNING(
-                    f'  ! 결측치 {original_len - len(df)}개를 제거했습니다.'
-                )
-            )
-
         # =====================================
-        # 3. 예측 수행
+        # 3. 예측 수행 (청크별)
         # =====================================
 
         self.stdout.write(f'\n[3/5] 예측 수행')
 
-        X_test = df['content']
-        y_test = df['label']
+        overall = MetricsAccumulator()
+        by_length = SlicedMetrics()
+        by_category = SlicedMetrics()
+        category_cache = {}          # course_id → classfy_name (DB 조회 1회)
+        profile_samples = []         # 지연 측정용 샘플 (앞에서부터 --profile-samples개)
+        verbose_samples = []         # --verbose 출력용 (처음 5개)
+        dropped = 0
 
-        try:
-            y_pred = pipeline.predict(X_test)
-
-            if hasattr(pipeline, "predict_proba"):
-                y_proba = pipeline.predict_proba(X_test)
-            else:
-                y_proba = None
-                self.stdout.write(self.style.WARNING("  ! 이 모델은 확률 예측(predict_proba)을 지원하지 않습니다."))
-                
-            self.stdout.write(f'  ✓ {len(y_pred)}개 샘플 예측 완료')
+        # 캐시 키를 파이프라인 내부 토크나이저 호출과 맞추기 위한 전처리 (lowercase 등)
+        first_step = pipeline.steps[0][1] if hasattr(pipeline, 'steps') else None
+        preprocess = first_step.build_preprocessor() if hasattr(first_step, 'build_preprocessor') else None
 
+        try:
+            for chunk_index, df in enumerate(chunks):
+                # 데이터 검증 (첫 청크)
+                if chunk_index == 0:
+                    missing_columns = [col for col in ['content', 'label'] if col not in df.columns]
+                    if missing_columns:
+                        raise CommandError(
+                            f'필수 컬럼이 없습니다: {missing_columns}\n'
+                            f'CSV 파일은 "content"와 "label" 컬럼을 포함해야 합니다.'
+                        )
+
+                # 결측치 제거
+                original_len = len(df)
+                df = df.dropna(subset=['content', 'label'])
+                dropped += original_len - len(df)
+                if df.empty:
+                    continue
+
+                X_chunk = df['content'].astype(str).tolist()
+                y_chunk = df['label'].tolist()
+
+                # Kiwi 배치 토크나이징 후 예측 (파이프라인 내부 호출은 캐시 조회)
+                if preprocess is not None:
+                    get_tokenizer().tokenize_many([preprocess(text) for text in X_chunk])
+                y_pred = pipeline.predict(X_chunk)
+
+                # 지표 누적 (전체 / 길이 구간 / 강좌 분류)
+                overall.update(y_chunk, y_pred)
+                by_length.update([length_bucket(text) for text in X_chunk], y_chunk, y_pred)
+                categories = self._chunk_categories(df, options['category_column'], category_cache)
+                if categories is not None:
+                    by_category.update(categories, y_chunk, y_pred)
+
+                if options['profile'] and len(profile_samples) < options['profile_samples']:
+                    profile_samples.extend(X_chunk[:options['profile_samples'] - len(profile_samples)])
+
+                if options['verbose'] and len(verbose_samples) < 5:
+                    take = 5 - len(verbose_samples)
+                    y_proba = pipeline.predict_proba(X_chunk[:take]) if hasattr(pipeline, 'predict_proba') else None
+                    for i in range(min(take, len(X_chunk))):
+                        confidence = max(y_proba[i]) if y_proba is not None else None
+                        verbose_samples.append((X_chunk[i], y_chunk[i], y_pred[i], confidence))
+
+                if chunk_size:
+                    self.stdout.write(f'  ... {overall.count:,}건 처리')
+
+        except CommandError:
+            raise
         except Exception as e:
             raise CommandError(f'예측 중 오류 발생: {str(e)}')
 
+        if dropped:
+            self.stdout.write(self.style.WARNING(f'  ! 결측치 {dropped}개를 제거했습니다.'))
+        if overall.count == 0:
+            raise CommandError('평가할 데이터가 없습니다.')
+        self.stdout.write(f'  ✓ {overall.count:,}개 샘플 예측 완료')
+
         # =====================================
         # 4. 평가 지표 계산
         # - 라벨 순서 고정 (negative, positive) = (0, 1)
@@ -221,25 +330,14 @@ class Command(BaseCommand): # BaseCommand 상속, 장고가 manage.py 커맨드
 
         self.stdout.write(f'\n[4/5] 평가 지표 계산')
 
-        # 순서 고정 # 헷갈리지 않도록 
-        TARGET_LABELS = ['negative', 'positive']
+        metrics = overall.metrics()
+        accuracy = metrics['accuracy']
+        precision, recall, f1, support = metrics['precision'], metrics['recall'], metrics['f1'], metrics['support']
+        cm = metrics['confusion_matrix']
+        report_dict = overall.classification_report()
 
-        # 정확도
-        accuracy = accuracy_score(y_test, y_pred)
         self.stdout.write(f'  ✓ 정확도: {accuracy:.4f} ({accuracy*100:.2f}%)')
 
-        # Precision, Recall, F1 (클래스별)
-        precision, recall, f1, support = precision_recall_fscore_support(
-            y_test, y_pred, average=None, labels=TARGET_LABELS
-        )
-
-        # 분류 리포트
-        report_dict = classification_report(
-            y_test, y_pred,
-            output_dict=True,
-            labels=TARGET_LABELS
-        )
-
         self.stdout.write('\n  클래스별 성능:')
         for i, label in enumerate(TARGET_LABELS):
             self.stdout.write(
@@ -248,32 +346,38 @@ class Command(BaseCommand): # BaseCommand 상속, 장고가 manage.py 커맨드
                 f'Support: {support[i]}'
             )
 
-        # 혼동 행렬
-        cm = confusion_matrix(y_test, y_pred, labels=TARGET_LABELS)
-
         self.stdout.write('\n  Confusion Matrix:')
         self.stdout.write(f'    TN: {cm[0][0]:4d}  |  FP: {cm[0][1]:4d}')
         self.stdout.write(f'    FN: {cm[1][0]:4d}  |  TP: {cm[1][1]:4d}')
 
+        # 슬라이스별 성능
+        slices = {'length': by_length.summary(), 'category': by_category.summary()}
+        for name, title in (('length', '리뷰 길이(문자)'), ('category', '강좌 분류')):
+            if not slices[name]:
+                continue
+            self.stdout.write(f'\n  {title}별 성능:')
+            for key, entry in slices[name].items():
+                self.stdout.write(
+                    f'    {key:12s} - N: {entry["count"]:>7,}, 정확도: {entry["accuracy"]:.4f}, '
+                    f'macro F1: {entry["macro_f1"]:.4f}'
+                )
+
         # Verbose 모드: 예측 샘플 출력
-        if options['verbose']:
+        if verbose_samples:
             self.stdout.write('\n  예측 샘플 (처음 5개):')
-            for i in range(min(5, len(df))):
-                text = X_test.iloc[i][:50] + '...'
-                true_label = y_test.iloc[i]
-                pred_label = y_pred[i]
-
-                conf_str = ""
-                if y_proba is not None:
-                    confidence = max(y_proba[i])
-                    conf_str = f'(신뢰도: {confidence:.2f})'
-
+            for text, true_label, pred_label, confidence in verbose_samples:
+                conf_str = f'(신뢰도: {confidence:.2f})' if confidence is not None else ''
                 match_icon = '✓' if true_label == pred_label else '✗'
                 self.stdout.write(
-                    f'    {match_icon} "{text}"\n'
+                    f'    {match_icon} "{text[:50]}..."\n'
                     f'      실제: {true_label}, 예측: {pred_label} {conf_str}'
                 )
 
+        # 배치 크기별 지연/처리량 (SentimentProcessor.analyze_batch 경유)
+        latency_profile = []
+        if options['profile']:
+            latency_profile = self._profile_latency(pipeline, model_version or str(model_path), profile_samples, options)
+
         # =====================================
         # 5. 결과 저장
         # =====================================
@@ -283,6 +387,7 @@ class Command(BaseCommand): # BaseCommand 상속, 장고가 manage.py 커맨드
         # 출력 경로 결정
         if options['output']:
             output_path = Path(options['output'])
+            output_path.parent.mkdir(parents=True, exist_ok=True)
         else:
             DEFAULT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -292,8 +397,9 @@ class Command(BaseCommand): # BaseCommand 상속, 장고가 manage.py 커맨드
         evaluation_result = {
             'timestamp': datetime.now().isoformat(),
             'model_path': str(model_path),
+            'model_version': model_version,
             'test_data_path': str(test_data_path),
-            'test_size': len(df),
+            'test_size': overall.count,
             'metrics': {
                 'accuracy': float(accuracy),
                 'precision_negative': float(precision[0]),    # negative
@@ -301,7 +407,8 @@ class Command(BaseCommand): # BaseCommand 상속, 장고가 manage.py 커맨드
                 'f1_negative': float(f1[0]),                  # negative
                 'precision_positive': float(precision[1]),    # positive
                 'recall_positive': float(recall[1]),          # positive
-                'f1_positive': float(f1[1])                   # positive
+                'f1_positive': float(f1[1]),                  # positive
+                'macro_f1': metrics['macro_f1'],
             },
             'confusion_matrix': {
                 'TN': int(cm[0][0]),
@@ -309,7 +416,9 @@ class Command(BaseCommand): # BaseCommand 상속, 장고가 manage.py 커맨드
                 'FN': int(cm[1][0]),
                 'TP': int(cm[1][1])
             },
-            'classification_report': report_dict
+            'classification_report': report_dict,
+            'slices': slices,
+            'latency_profile': latency_profile,
         }
 
         # JSON 저장
@@ -318,7 +427,89 @@ class Command(BaseCommand): # BaseCommand 상속, 장고가 manage.py 커맨드
 
         self.stdout.write(f'  ✓ 평가 결과 저장: {output_path}')
 
+        # 시계열 기록 (결과 JSON과 같은 디렉토리, 실행마다 1줄 추가)
+        timeseries_path = output_path.parent / TIMESERIES_FILENAME
+        best = max(latency_profile, key=lambda entry: entry['docs_per_sec']) if latency_profile else None
+        timeseries_entry = {
+            'timestamp': evaluation_result['timestamp'],
+            'model_version': model_version,
+            'model_path': str(model_path),
+            'test_data_path': str(test_data_path),
+            'test_size': overall.count,
+            'accuracy': float(accuracy),
+            'macro_f1': metrics['macro_f1'],
+            'slices': {
+                name: {key: entry['accuracy'] for key, entry in entries.items()}
+                for name, entries in slices.items()
+            },
+            'best_batch_size': best['batch_size'] if best else None,
+            'best_docs_per_sec': best['docs_per_sec'] if best else None,
+            'result_path': str(output_path),
+        }
+        with open(timeseries_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(timeseries_entry, ensure_ascii=False, cls=NumpyEncoder) + '\n')
+
+        self.stdout.write(f'  ✓ 시계열 기록: {timeseries_path}')
+
         # 완료
         self.stdout.write(self.style.SUCCESS('\n' + '=' * 70))
         self.stdout.write(self.style.SUCCESS('평가 완료!'))
-        self.stdout.write(self.style.SUCCESS('=' * 70))
\ No newline at end of file
+        self.stdout.write(self.style.SUCCESS('=' * 70))
+
+    def _chunk_categories(self, df, category_column, cache):
+        """
+        청크의 강좌 분류 슬라이스 키
+
+        - category_column 컬럼이 있으면 그대로 사용
+        - 없고 course_id 컬럼이 있으면 Course.classfy_name 조회 (처음 보는 id만 조회해 캐시)
+        - 둘 다 없으면 None (슬라이스 생략)
+        """
+        if category_column in df.columns:
+            return df[category_column].fillna('미분류').astype(str).tolist()
+        if 'course_id' not in df.columns:
+            return None
+
+        course_ids = pd.to_numeric(df['course_id'], errors='coerce')
+        unknown = {int(cid) for cid in course_ids.dropna().unique()} - cache.keys()
+        if unknown:
+            found = dict(Course.objects.filter(id__in=unknown).values_list('id', 'classfy_name'))
+            for cid in unknown:
+                cache[cid] = found.get(cid) or '미분류'
+        return [cache.get(int(cid), '미분류') if pd.notna(cid) else '미분류' for cid in course_ids]
+
+    def _profile_latency(self, pipeline, model_label, samples, options):
+        """
+        SentimentProcessor.analyze_batch 배치 크기별 지연 백분위수 + 처리량 곡선
+
+        - 평가 대상 모델을 analyze_batch(model=...)로 지정해 서비스와 같은 코드 경로로 측정
+        - 배치 크기마다 토크나이저 캐시를 비워 캐시 적중 효과 제외 (신규 텍스트 기준)
+        """
+        self.stdout.write(f'\n  지연 측정 (샘플 {len(samples):,}건, SentimentProcessor.analyze_batch):')
+        try:
+            processor = get_sentiment_processor()
+        except Exception as e:
+            self.stdout.write(self.style.WARNING(f'  ! 프로세서 초기화 실패로 지연 측정 생략: {e}'))
+            return []
+
+        model = LoadedModel(version=model_label, pipeline=pipeline, metadata={}, generation=None)
+        curve = profile_latency(
+            lambda batch: processor.analyze_batch(batch, model=model),
+            samples,
+            options['profile_batch_sizes'],
+            before_each=get_tokenizer().clear,
+        )
+        if not curve:
+            self.stdout.write(self.style.WARNING('  ! 샘플이 부족해 측정하지 못했습니다.'))
+            return []
+
+        self.stdout.write(f'    {"batch":>6s}  {"p50(ms)":>9s}  {"p95(ms)":>9s}  {"p99(ms)":>9s}  {"docs/sec":>10s}')
+        for entry in curve:
+            self.stdout.write(
+                f'    {entry["batch_size"]:>6d}  {entry["p50_ms"]:>9.2f}  {entry["p95_ms"]:>9.2f}  '
+                f'{entry["p99_ms"]:>9.2f}  {entry["docs_per_sec"]:>10.1f}'
+            )
+        best = max(curve, key=lambda entry: entry['docs_per_sec'])
+        self.stdout.write(self.style.SUCCESS(
+            f'    ✓ 처리량 최대 배치 크기: {best["batch_size"]} ({best["docs_per_sec"]:.1f} docs/sec)'
+        ))
+        return curve
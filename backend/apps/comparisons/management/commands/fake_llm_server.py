@@ -0,0 +1,128 @@
+# apps/comparisons/management/commands/fake_llm_server.py
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+from apps.core.batch.fake import fake_chat_completion
+
+"""
+[설계의도]
+- generate_ai_reviews 배치 엔진(동시성/속도 제한/재시도/체크포인트)을
+  실제 LLM API 비용 없이 검증하기 위한 로컬 chat-completions 호환 서버
+
+[상세 고려사항]
+- POST /v1/chat/completions 에 OpenAI 응답 형식으로 유효한 평가 JSON 반환 (apps/core/batch/fake.py)
+- --latency: 응답 지연(초, ±50% 지터) → 동시 요청 효과 확인
+- --error-rate: 일정 확률로 429(Retry-After 포함) 또는 503 반환 → 재시도 경로 확인
+- --max-rps: 초당 요청 수 초과 시 429 반환 → 토큰 버킷 설정 검증
+- 표준 라이브러리(http.server)만 사용
+
+[사용 예시]
+python manage.py fake_llm_server --port 8765 --latency 0.3 --error-rate 0.1
+python manage.py generate_ai_reviews --api-url http://127.0.0.1:8765/v1/chat/completions --concurrency 8 --rate 20
+"""
+
+
+class Command(BaseCommand):
+    help = '로컬 테스트용 가짜 chat-completions 서버 실행'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', type=str, default='127.0.0.1', help='바인딩 주소')
+        parser.add_argument('--port', type=int, default=8765, help='포트 (기본: 8765)')
+        parser.add_argument('--latency', type=float, default=0.3, help='평균 응답 지연(초)')
+        parser.add_argument('--error-rate', type=float, default=0.0, help='429/503 오류 응답 비율 (0~1)')
+        parser.add_argument('--max-rps', type=float, default=0, help='초당 허용 요청 수 (0이면 제한 없음)')
+
+    def handle(self, *args, **options):
+        handler = _build_handler(
+            latency=options['latency'],
+            error_rate=options['error_rate'],
+            max_rps=options['max_rps'],
+        )
+        server = ThreadingHTTPServer((options['host'], options['port']), handler)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ fake LLM 서버 실행: http://{options["host"]}:{options["port"]}/v1/chat/completions'
+        ))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            stats = handler.stats
+            self.stdout.write(
+                f'\n요청 {stats["requests"]}건 (200: {stats["ok"]}, 429: {stats["429"]}, 503: {stats["503"]})'
+            )
+
+
+def _build_handler(latency, error_rate, max_rps):
+    """옵션을 클로저로 고정한 요청 핸들러 클래스 생성"""
+    lock = threading.Lock()
+    window = {'second': 0, 'count': 0}
+    stats = {'requests': 0, 'ok': 0, '429': 0, '503': 0}
+
+    def over_limit():
+        if max_rps <= 0:
+            return False
+        now = int(time.monotonic())
+        with lock:
+            if window['second'] != now:
+                window['second'], window['count'] = now, 0
+            window['count'] += 1
+            return window['count'] > max_rps
+
+    class FakeChatCompletionsHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            body = self.rfile.read(length)
+
+            with lock:
+                stats['requests'] += 1
+
+            if not self.path.rstrip('/').endswith('/chat/completions'):
+                return self._send(404, {'error': {'message': 'not found'}})
+
+            try:
+                payload = json.loads(body or b'{}')
+            except json.JSONDecodeError:
+                return self._send(400, {'error': {'message': 'invalid json'}})
+
+            if over_limit():
+                return self._send(429, {'error': {'message': 'rate limit'}}, retry_after=1)
+
+            if random.random() < error_rate:
+                if random.random() < 0.5:
+                    return self._send(429, {'error': {'message': 'rate limit'}}, retry_after=1)
+                return self._send(503, {'error': {'message': 'temporarily unavailable'}})
+
+            if latency > 0:
+                time.sleep(latency * random.uniform(0.5, 1.5))
+
+            self._send(200, fake_chat_completion(payload, completion_id=f'chatcmpl-fake-{stats["requests"]}'))
+
+        def _send(self, status_code, data, retry_after=None):
+            with lock:
+                key = 'ok' if status_code == 200 else str(status_code)
+                if key in stats:
+                    stats[key] += 1
+
+            body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+            self.send_response(status_code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            if retry_after is not None:
+                self.send_header('Retry-After', str(retry_after))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # 요청별 로그 생략 (종료 시 통계만 출력)
+
+    FakeChatCompletionsHandler.stats = stats
+    return FakeChatCompletionsHandler
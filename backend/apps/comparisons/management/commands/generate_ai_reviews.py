@@ -2,7 +2,7 @@
 
 import os
 import json
-import time
+import threading
 import requests
 import csv
 from django.core.management.base import BaseCommand, CommandError
@@ -10,31 +10,51 @@ from django.db import transaction
 from django.conf import settings
 from apps.courses.models import Course
 from apps.comparisons.models import CourseAIReview
+from apps.core.batch import (
+    BatchModeCommandMixin, Checkpoint, ProgressReporter, TokenBucket, post_with_retry, run_concurrent,
+)
 
 """
 [설계의도]
 - 모든 강좌(Course)에 대해 LLM 기반의 'AI 평가(CourseAIReview)'를 생성/저장하는 Django management command
 - 테스트/운영 상황에 맞게 처리 범위를 제어(--limit, --course-id)하고,
   재생성 정책을 선택(--force)하며,
-  호출 속도 제한(--delay)으로 API Rate Limit을 피하도록 설계
+  호출 속도 제한(--rate)으로 API Rate Limit을 피하도록 설계
 
 [상세 고려사항]
 - API 키는 코드에 하드코딩하지 않고 환경변수(GMS_KEY)로 주입하여 보안/운영 편의성을 확보
 - 이미 평가가 존재하는 강좌는 기본적으로 스킵(ai_review__isnull=True)하여 비용/시간을 절감
-  (단, --force 옵션이면 update_or_create로 덮어쓰기)
-- 각 강좌별 DB 저장은 transaction.atomic()으로 감싸
-  부분 저장/불완전 저장을 방지하고 원자성을 확보
-- 실패한 강좌는 전체 작업을 중단하지 않고 continue로 넘어가
+  (단, --force 옵션이면 기존 평가를 덮어쓰기)
+- 실패한 강좌는 전체 작업을 중단하지 않고 넘어가
   "대량 처리 배치 작업"에서 흔한 부분 실패 허용 전략 적용
 - LLM 응답은 JSON 모드(response_format=json_object)를 사용하고,
   추가로 json.loads + 필수 필드/점수 범위 검증을 통해 데이터 품질을 방어
 - 생성된 결과를 CSV 파일로 내보낼 수 있는 기능 추가 (--output)
+
+[최적화 내용] (apps/core/batch 배치 엔진 사용)
+- 동시 요청: --concurrency개 요청을 동시에 진행 (응답 대기 시간이 직렬로 누적되지 않음)
+- 속도 제한: 고정 sleep 대신 토큰 버킷(--rate, 초당 요청 수)으로 전체 호출 속도 제한
+- 재시도: 429/5xx/타임아웃은 지수 백오프(Retry-After 우선)로 최대 --max-retries회 재시도
+- 일괄 저장: 결과를 --db-batch-size개씩 모아 bulk_create(update_conflicts=True)로 upsert
+- 체크포인트: 저장 완료된 강좌를 (course_id, PROMPT_VERSION) 키로 기록 → 중단 후 재실행 시 이어서 처리
+- 진행률: 처리량(건/분)과 ETA를 주기적으로 출력
+- 오프라인 배치 모드(--batch): 전체 프롬프트를 JSONL로 작성 → Batch API로 제출 → 결과 파일을 스트리밍 파싱해 일괄 반영
+  (대량 재생성을 동기 호출 경로에서 분리, 어댑터: openai / local)
+
+[로컬 테스트]
+python manage.py fake_llm_server --port 8765 --error-rate 0.1
+python manage.py generate_ai_reviews --api-url http://127.0.0.1:8765/v1/chat/completions --concurrency 8 --rate 20
+python manage.py generate_ai_reviews --force --batch run --batch-adapter local
 """
 
 MODEL_VERSION = 'gpt-4o-mini'
 PROMPT_VERSION = 'v2.1'
 
-class Command(BaseCommand):
+DEFAULT_API_URL = "https://gms.ssafy.io/gmsapi/api.openai.com/v1/chat/completions"
+BATCH_ENDPOINT = '/v1/chat/completions'
+
+
+class Command(BatchModeCommandMixin, BaseCommand):
     help = 'LLM을 사용하여 모든 강좌에 대한 AI 평가 생성'
 
     # 클래스 상수 - 중복 제거 및 유지보수성 향상
@@ -56,9 +76,23 @@ class Command(BaseCommand):
     # 배치 설정
     CSV_BATCH_SIZE = 50  # CSV 중간 저장 간격
 
+    # 프롬프트 생성에 필요한 강좌 필드 (embedding 등 대용량 컬럼 제외, 워커 스레드의 지연 로딩 방지)
+    COURSE_FIELDS = [
+        'id', 'name', 'org_name', 'professor', 'classfy_name', 'middle_classfy_name',
+        'week', 'course_playtime', 'summary',
+    ]
+
+    # upsert 시 갱신할 필드 (created_at은 최초 생성 시각 유지)
+    UPSERT_FIELDS = [
+        'course_summary', 'average_rating',
+        'theory_rating', 'practical_rating', 'difficulty_rating', 'duration_rating',
+        'model_version', 'prompt_version', 'updated_at',
+    ]
+
     # LLM 설정
     LLM_TEMPERATURE = 0.3  # 일관된 평가를 위해 낮은 temperature
     LLM_MAX_TOKENS = 800   # 충분한 응답 생성을 위한 토큰 수
+    LLM_TIMEOUT = 30       # 요청당 타임아웃(초)
 
     # CSV 필드 순서 고정 (헤더 일관성 보장)
     CSV_FIELDNAMES = [
@@ -79,14 +113,19 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         """
         [설계의도]
-        - 배치 작업에서 흔히 필요한 "범위 제어/재실행 정책/속도 제한"을 CLI 옵션으로 제공
+        - 배치 작업에서 흔히 필요한 "범위 제어/재실행 정책/속도 제한/동시성"을 CLI 옵션으로 제공
 
         [상세 고려사항]
         - --limit: 개발/테스트 시 일부만 돌려 빠르게 검증할 수 있도록 함
+          (체크포인트로 건너뛴 강좌를 뺀 뒤 적용 → 재실행 시 다음 N개를 처리)
         - --force: 이미 평가가 있어도 다시 생성(업데이트)할 수 있도록 함
         - --course-id: 특정 강좌 1개만 대상으로 디버깅/테스트 가능
-        - --delay: API rate limit 및 서버 부하 완화를 위해 호출 간 sleep 제어
+        - --rate / --concurrency: 초당 요청 수와 동시 요청 수 제어
+        - --delay: (기존 옵션) --rate 미지정 시 1/delay 초당 요청 수로 환산
+        - --checkpoint / --reset-checkpoint: 재시작 가능한 진행 기록
+        - --api-url: 호출 대상 chat-completions URL (로컬 fake 서버 테스트용)
         - --output: 결과를 CSV 파일로 저장할 파일명 (data/backups/ 하위에 생성)
+        - --batch: 오프라인 배치 모드 단계 (apps/core/batch/command.py)
         """
         # 처리할 강좌 수를 제한
         parser.add_argument(
@@ -108,12 +147,53 @@ class Command(BaseCommand):
             default=None,
             help='특정 강좌만 평가 (테스트용)'
         )
-        # API 호출 간 대기 시간
+        # 호출 속도 제한
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=None,
+            help='초당 최대 API 요청 수 (0이면 제한 없음, 기본: 1/--delay)'
+        )
         parser.add_argument(
             '--delay',
             type=float,
             default=0.5,
-            help='API 호출 간 대기 시간 (초)'
+            help='(호환용) API 호출 간 대기 시간(초), --rate 미지정 시 초당 1/delay 요청으로 환산'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='동시 요청 수 (기본: 4)'
+        )
+        parser.add_argument(
+            '--max-retries',
+            type=int,
+            default=5,
+            help='429/5xx/타임아웃 시 최대 재시도 횟수 (기본: 5)'
+        )
+        parser.add_argument(
+            '--db-batch-size',
+            type=int,
+            default=50,
+            help='DB 일괄 저장 단위 (기본: 50)'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=str,
+            default=None,
+            help=f'체크포인트 파일 경로 (기본: data/checkpoints/ai_reviews_{PROMPT_VERSION}.jsonl)'
+        )
+        parser.add_argument(
+            '--reset-checkpoint',
+            action='store_true',
+            help='체크포인트를 지우고 처음부터 처리'
+        )
+        parser.add_argument(
+            '--api-url',
+            type=str,
+            default=os.environ.get('GMS_CHAT_URL', DEFAULT_API_URL),
+            help='chat-completions API URL (로컬 테스트: fake_llm_server 주소)'
         )
         parser.add_argument(
             '--output',
@@ -121,52 +201,67 @@ class Command(BaseCommand):
             default=None,
             help='결과를 저장할 CSV 파일명 (예: ai_reviews_backup.csv)'
         )
+        # 오프라인 배치 모드 (--batch prepare|submit|collect|run)
+        self.add_batch_arguments(parser)
 
     def handle(self, *args, **options):
         """
         [설계의도]
-        - 커맨드 실행 시 전체 제어 흐름(설정 → 대상 추출 → 반복 처리 → 결과 요약)을 담당하는 엔트리포인트
+        - 커맨드 실행 시 전체 제어 흐름(설정 → 대상 추출 → 동시 처리 → 일괄 저장 → 결과 요약)을 담당하는 엔트리포인트
 
         [상세 고려사항]
-        - stdout에 진행률/성공/실패를 출력해 배치 실행 로그로 활용 가능
-        - 강좌 단위로 try/except 처리하여 일부 실패가 전체를 중단시키지 않도록 함
+        - API 호출/응답 검증은 워커 스레드, DB 저장/체크포인트/출력은 메인 스레드에서 수행
+        - 강좌 단위 실패는 집계만 하고 계속 진행 (체크포인트에 남지 않으므로 재실행 시 재시도)
+        - Ctrl+C로 중단해도 이미 받은 결과는 저장 후 종료
         """
         self.stdout.write(self.style.SUCCESS('=' * 70))
         self.stdout.write(self.style.SUCCESS('강좌 AI 평가 생성 시작'))
         self.stdout.write(self.style.SUCCESS('=' * 70))
 
+        # 오프라인 배치 모드: 요청 파일 작성/제출/결과 반영 후 종료
+        if options['batch']:
+            self._handle_batch(options)
+            return
+
         # =============================================
-        # 1. GMS API 설정
+        # 1. API 설정
         # =============================================
-        gms_url = "https://gms.ssafy.io/gmsapi/api.openai.com/v1/chat/completions"
+        api_url = options['api_url']
         gms_key = os.environ.get("GMS_KEY")
 
-        # 키 없으면 즉시 중단
+        # 실제 GMS 호출인데 키가 없으면 즉시 중단 (로컬 fake 서버는 키 불필요)
         if not gms_key:
-            raise CommandError('GMS_KEY 환경변수가 설정되지 않았습니다.')
+            if api_url == DEFAULT_API_URL:
+                raise CommandError('GMS_KEY 환경변수가 설정되지 않았습니다.')
+            gms_key = 'local-test-key'
+
+        rate = options['rate']
+        if rate is None:
+            rate = 1.0 / options['delay'] if options['delay'] > 0 else 0
+
+        self._api_url = api_url
+        self._api_key = gms_key
+        self._max_retries = options['max_retries']
+        self._rate_limiter = TokenBucket(rate)
+        self._sessions = threading.local()
 
         # =============================================
         # 2. 처리할 강좌 필터링
         # =============================================
-        if options['course_id']:
-            # (A) 특정 강좌만
-            courses = Course.objects.filter(id=options['course_id'])
-            if not courses.exists():
-                raise CommandError(f"ID {options['course_id']} 강좌를 찾을 수 없습니다.")
-        elif options['force']:
-            # (B) 모든 강좌 (재생성)
-            courses = Course.objects.all()
-        else:
-            # (C) AI 평가가 없는 강좌만
-            courses = Course.objects.filter(ai_review__isnull=True)
+        courses = self._get_courses(options)
+
+        # 체크포인트: 같은 PROMPT_VERSION으로 이미 저장된 강좌는 건너뜀
+        checkpoint = self._get_checkpoint(options)
 
-        # 제한 적용
+        courses = list(courses)
+        targets = [course for course in courses if course.id not in checkpoint]
+        skipped_count = len(courses) - len(targets)
         if options['limit']:
-            # QuerySet slicing -> DB 쿼리로 변환되어 효율적
-            courses = courses[:options['limit']]
+            targets = targets[:options['limit']]
+        total_count = len(targets)
 
-        # slicing된 QuerySet의 개수 확인
-        total_count = courses.count()
+        if skipped_count:
+            self.stdout.write(f'체크포인트 기준 완료된 강좌 {skipped_count}개 건너뜀 ({checkpoint.path})')
 
         # 처리할 게 없다면 깔끔하게 종료
         if total_count == 0:
@@ -174,14 +269,17 @@ class Command(BaseCommand):
             return
 
         # 진행 시작 안내
-        self.stdout.write(f'\n총 {total_count}개 강좌 처리 시작\n')
+        self.stdout.write(
+            f'\n총 {total_count}개 강좌 처리 시작 '
+            f'(동시 {options["concurrency"]}개, 초당 {rate or "무제한"}건)\n'
+        )
 
         # =============================================
         # 3. 통계 및 파일 설정 변수
         # =============================================
-        success_count = 0  # 성공적으로 저장까지 완료한 강좌 수
-        error_count = 0    # 처리 중 예외가 발생한 강의 수
-        batch_results = []
+        progress = ProgressReporter(total_count, self.stdout)
+        pending_reviews = []  # DB 저장 대기 중인 CourseAIReview
+        csv_results = []
 
         output_path = None
         if options['output']:
@@ -190,76 +288,188 @@ class Command(BaseCommand):
             os.makedirs(backup_dir, exist_ok=True)
             output_path = os.path.join(backup_dir, options['output'])
 
-        # =============================================
-        # 4. 각 강좌 처리
-        # =============================================
-        for idx, course in enumerate(courses, 1):
-            # 진행률 출력 : 현재 몇 번째 / 몇 개 중에
-            self.stdout.write(f'\n[{idx}/{total_count}] 처리 중: {course.name} (ID: {course.id})')
-
-            try:
-                # LLM 호출하여 AI 평가 생성
-                ai_review_data = self._generate_ai_review(course, gms_url, gms_key)
-
-                # DB 저장 (원자성 보장)
-                with transaction.atomic():
-                    review_data = self._prepare_review_data(ai_review_data)
-                    # 메타데이터
-                    review_data.update({
-                        'model_version': MODEL_VERSION,
-                        'prompt_version': PROMPT_VERSION
-                    })
-
-                    ai_review, created = CourseAIReview.objects.update_or_create(
-                        course=course,
-                        defaults=review_data
-                    )
-
-                # CSV용 데이터 수집
-                if output_path:
-                    csv_data = self._prepare_csv_data(course, ai_review_data)
-                    batch_results.append(csv_data)
-
-                action = '생성' if created else '업데이트'
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'  ✓ {action} 완료 - 종합: {ai_review_data["average_rating"]}/5'
-                    )
-                )
-
-                success_count += 1
-
-                # 중간 저장
-                if output_path and len(batch_results) >= self.CSV_BATCH_SIZE:
-                    self._save_to_csv(output_path, batch_results)
-                    self.stdout.write(self.style.WARNING(f'  💾 중간 저장 완료 ({success_count}개)'))
-                    batch_results = []
-
-                # Rate Limiting (API 부하 방지)
-                if idx < total_count:
-                    time.sleep(options['delay'])
-
-            except Exception as e:
-                error_count += 1
-                self.stdout.write(self.style.ERROR(f'  ✗ 에러 발생: {str(e)}'))
-                continue
+        def flush():
+            """대기 중인 결과를 일괄 저장 → 체크포인트 기록 → CSV 중간 저장"""
+            nonlocal pending_reviews, csv_results
+            if pending_reviews:
+                self._save_reviews(pending_reviews)
+                checkpoint.mark_done(review.course_id for review in pending_reviews)
+                progress.update(succeeded=len(pending_reviews))
+                pending_reviews = []
+            if output_path and len(csv_results) >= self.CSV_BATCH_SIZE:
+                self._save_to_csv(output_path, csv_results)
+                csv_results = []
 
         # =============================================
-        # 5. 남은 잔여 데이터 저장
+        # 4. 동시 처리 + 일괄 저장
         # =============================================
-        if output_path and batch_results:
-            self._save_to_csv(output_path, batch_results)
-            self.stdout.write(self.style.SUCCESS(f'\n✓ 최종 CSV 저장 완료: {output_path}'))
+        interrupted = False
+        try:
+            for course, ai_review_data, error in run_concurrent(
+                targets, self._generate_ai_review, concurrency=options['concurrency']
+            ):
+                if error is not None:
+                    progress.update(failed=1)
+                    self.stdout.write(self.style.ERROR(f'  ✗ [{course.id}] {course.name}: {error}'))
+                    continue
+
+                pending_reviews.append(self._build_review(course.id, ai_review_data))
+                if output_path:
+                    csv_results.append(self._prepare_csv_data(course, ai_review_data))
+
+                if len(pending_reviews) >= options['db_batch_size']:
+                    flush()
+        except KeyboardInterrupt:
+            interrupted = True
+            self.stdout.write(self.style.WARNING('\n중단 요청 - 완료된 결과를 저장합니다.'))
+        finally:
+            # =============================================
+            # 5. 남은 잔여 데이터 저장
+            # =============================================
+            flush()
+            if output_path and csv_results:
+                self._save_to_csv(output_path, csv_results)
+            checkpoint.close()
+            progress.finish()
 
         # 6. 결과 요약
         self.stdout.write('\n' + '=' * 70)
-        self.stdout.write(self.style.SUCCESS('작업 완료'))
+        self.stdout.write(self.style.WARNING('작업 중단') if interrupted else self.style.SUCCESS('작업 완료'))
         self.stdout.write('=' * 70)
-        self.stdout.write(f'✓ 성공: {success_count}개')
-        self.stdout.write(f'✗ 실패: {error_count}개')
+        self.stdout.write(f'✓ 성공: {progress.succeeded}개')
+        self.stdout.write(f'✗ 실패: {progress.failed}개')
+        if skipped_count:
+            self.stdout.write(f'↷ 건너뜀(체크포인트): {skipped_count}개')
         if options['output']:
             self.stdout.write(f'📁 파일: {options["output"]}')
-        self.stdout.write(f'총 처리: {success_count + error_count}개\n')
+        self.stdout.write(f'총 처리: {progress.processed}개')
+        if interrupted or progress.failed:
+            self.stdout.write('재실행하면 체크포인트 이후(실패 포함) 강좌부터 이어서 처리합니다.\n')
+
+    def _get_courses(self, options):
+        """
+        처리 대상 강좌 QuerySet (--course-id / --force 반영)
+
+        - 프롬프트 생성에 필요한 필드만 조회 (COURSE_FIELDS)
+        - --limit은 체크포인트 필터 이후에 호출 측에서 적용
+          (여기서 자르면 이미 완료된 앞쪽 N개만 남아 재실행 시 아무것도 처리하지 않음)
+        """
+        if options['course_id']:
+            # (A) 특정 강좌만
+            courses = Course.objects.filter(id=options['course_id'])
+            if not courses.exists():
+                raise CommandError(f"ID {options['course_id']} 강좌를 찾을 수 없습니다.")
+        elif options['force']:
+            # (B) 모든 강좌 (재생성)
+            courses = Course.objects.all()
+        else:
+            # (C) AI 평가가 없는 강좌만
+            courses = Course.objects.filter(ai_review__isnull=True)
+
+        return courses.only(*self.COURSE_FIELDS).order_by('id')
+
+    def _get_checkpoint(self, options):
+        """(course_id, PROMPT_VERSION) 키 체크포인트 (--reset-checkpoint 시 초기화)"""
+        checkpoint_path = options['checkpoint'] or os.path.join(
+            settings.BASE_DIR.parent, 'data', 'checkpoints', f'ai_reviews_{PROMPT_VERSION}.jsonl'
+        )
+        checkpoint = Checkpoint(checkpoint_path, version=PROMPT_VERSION)
+        if options['reset_checkpoint']:
+            checkpoint.reset()
+        return checkpoint
+
+    def _handle_batch(self, options):
+        """
+        오프라인 배치 모드
+
+        - prepare: 대상 강좌의 프롬프트(_build_prompts)를 chat.completions 요청 JSONL로 작성
+        - collect: 결과 파일을 스트리밍 파싱 → 검증 → db_batch_size 단위 일괄 upsert → 체크포인트 기록
+        """
+        checkpoint = self._get_checkpoint(options)
+
+        def build_requests():
+            written = 0
+            for course in self._get_courses(options).iterator(chunk_size=500):
+                if course.id in checkpoint:
+                    continue
+                if options['limit'] and written >= options['limit']:
+                    break
+                system_prompt, user_prompt = self._build_prompts(course)
+                yield f'course-{course.id}', self._build_request_body(system_prompt, user_prompt)
+                written += 1
+
+        def apply_results(results):
+            succeeded = failed = 0
+            pending = []  # (course_id, ai_review_data)
+
+            def flush():
+                nonlocal succeeded, pending
+                if not pending:
+                    return
+                weeks = dict(
+                    Course.objects.filter(id__in=[course_id for course_id, _ in pending]).values_list('id', 'week')
+                )
+                reviews = []
+                for course_id, ai_review in pending:
+                    if course_id not in weeks:
+                        continue  # 그 사이 삭제된 강좌
+                    self._finalize_review(ai_review, weeks[course_id])
+                    reviews.append(self._build_review(course_id, ai_review))
+                self._save_reviews(reviews)
+                checkpoint.mark_done(review.course_id for review in reviews)
+                succeeded += len(reviews)
+                pending = []
+
+            for custom_id, body, error in results:
+                try:
+                    course_id = int(custom_id.split('-', 1)[1])
+                    if error:
+                        raise Exception(error)
+                    pending.append((course_id, self._parse_and_validate_response(body)))
+                except Exception as e:
+                    failed += 1
+                    self.stdout.write(self.style.ERROR(f'  ✗ [{custom_id}] {e}'))
+                    continue
+
+                if len(pending) >= options['db_batch_size']:
+                    flush()
+
+            flush()
+            checkpoint.close()
+            return succeeded, failed
+
+        self.run_batch_mode(
+            options,
+            name=f'ai_reviews_{PROMPT_VERSION}',
+            endpoint=BATCH_ENDPOINT,
+            build_requests=build_requests,
+            apply_results=apply_results,
+            api_key=os.environ.get('GMS_KEY'),
+        )
+
+    def _build_review(self, course_id, ai_review_data):
+        """AI 평가 데이터 → 저장용 CourseAIReview 인스턴스 (메타데이터 포함)"""
+        review_data = self._prepare_review_data(ai_review_data)
+        review_data.update({
+            'model_version': MODEL_VERSION,
+            'prompt_version': PROMPT_VERSION
+        })
+        return CourseAIReview(course_id=course_id, **review_data)
+
+    def _save_reviews(self, reviews):
+        """
+        CourseAIReview 일괄 upsert
+
+        - course(OneToOne) 충돌 시 평가 필드/메타데이터/updated_at만 갱신
+        - 배치 단위 원자성 보장 (일부만 저장되는 경우 없음)
+        """
+        with transaction.atomic():
+            CourseAIReview.objects.bulk_create(
+                reviews,
+                update_conflicts=True,
+                unique_fields=['course'],
+                update_fields=self.UPSERT_FIELDS,
+            )
 
     def _calculate_duration_rating(self, week):
         """
@@ -357,24 +567,34 @@ class Command(BaseCommand):
                 writer.writeheader()
             writer.writerows(data_list)
 
-    def _generate_ai_review(self, course, gms_url, gms_key):
+    def _generate_ai_review(self, course):
         """
-        LLM을 호출하여 강좌 평가 생성 (메인 로직)
+        LLM을 호출하여 강좌 평가 생성 (메인 로직, 워커 스레드에서 실행)
 
         Args:
-            course: Course 인스턴스
-            gms_url: GMS API URL
-            gms_key: GMS API 키
+            course: Course 인스턴스 (COURSE_FIELDS만 로드, DB 접근 없음)
 
         Returns:
             dict: AI 평가 데이터
         """
         system_prompt, user_prompt = self._build_prompts(course)
-        response_data = self._call_gms_api(gms_url, gms_key, system_prompt, user_prompt)
+        response_data = self._call_gms_api(system_prompt, user_prompt)
         ai_review = self._parse_and_validate_response(response_data)
+        return self._finalize_review(ai_review, course.week)
+
+    def _finalize_review(self, ai_review, week):
+        """
+        LLM 평가에 학습 기간 평점과 종합 평점을 추가 (동기/배치 모드 공용)
 
+        Args:
+            ai_review: 검증된 LLM 평가 데이터
+            week: 강좌 주차 수
+
+        Returns:
+            dict: duration_rating, average_rating이 추가된 평가 데이터
+        """
         # Duration rating을 코드로 직접 계산하여 추가
-        ai_review['duration_rating'] = self._calculate_duration_rating(course.week)
+        ai_review['duration_rating'] = self._calculate_duration_rating(week)
 
         # Duration 포함하여 평균 재계산
         total_rating = sum(ai_review[field] for field in self.RATING_FIELDS)
@@ -446,13 +666,36 @@ class Command(BaseCommand):
 
         return system_prompt, user_prompt
 
-    def _call_gms_api(self, gms_url, gms_key, system_prompt, user_prompt):
+    def _build_request_body(self, system_prompt, user_prompt):
+        """chat.completions 요청 본문 (동기 호출/배치 요청 JSONL 공용)"""
+        return {
+            "model": MODEL_VERSION,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "response_format": {"type": "json_object"},
+            "temperature": self.LLM_TEMPERATURE,
+            "max_tokens": self.LLM_MAX_TOKENS
+        }
+
+    def _get_session(self):
+        """스레드별 requests.Session (커넥션 재사용, 스레드 간 공유 없음)"""
+        session = getattr(self._sessions, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self._api_key}"
+            })
+            self._sessions.session = session
+        return session
+
+    def _call_gms_api(self, system_prompt, user_prompt):
         """
-        GMS API를 호출하여 LLM 응답 받기
+        GMS API를 호출하여 LLM 응답 받기 (토큰 버킷 속도 제한 + 재시도)
 
         Args:
-            gms_url: GMS API URL
-            gms_key: GMS API 키
             system_prompt: 시스템 프롬프트
             user_prompt: 사용자 프롬프트
 
@@ -460,36 +703,17 @@ class Command(BaseCommand):
             dict: API 응답 데이터
 
         Raises:
-            Exception: API 호출 실패 시
+            Exception: API 호출 실패 시 (재시도 소진 포함)
         """
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {gms_key}"
-        }
-
-        data = {
-            "model": MODEL_VERSION,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            "response_format": {"type": "json_object"},
-            "temperature": self.LLM_TEMPERATURE,
-            "max_tokens": self.LLM_MAX_TOKENS
-        }
-
-        response = requests.post(
-            gms_url,
-            headers=headers,
-            data=json.dumps(data),
-            timeout=30
+        response = post_with_retry(
+            self._get_session(),
+            self._api_url,
+            json=self._build_request_body(system_prompt, user_prompt),
+            timeout=self.LLM_TIMEOUT,
+            max_retries=self._max_retries,
+            rate_limiter=self._rate_limiter,
         )
 
-        if response.status_code != 200:
-            raise Exception(
-                f"GMS API 호출 실패 (Status: {response.status_code}): {response.text[:200]}"
-            )
-
         return response.json()
 
     def _parse_and_validate_response(self, response_data):
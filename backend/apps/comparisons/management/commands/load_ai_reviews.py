@@ -2,6 +2,7 @@
 
 import csv
 import os
+import time
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from django.conf import settings
@@ -13,17 +14,34 @@ from apps.comparisons.models import CourseAIReview
 - CSV 백업 파일에서 CourseAIReview 데이터를 DB로 로드하는 Django management command
 - 대량 데이터 복원 시 트랜잭션 처리와 에러 핸들링을 통해 안전성 확보
 
-[상세 고려사항]
+[상세고려사항]
 - CSV 파일은 data/backups/ 디렉토리에 위치
-- 이미 존재하는 AI 리뷰는 update_or_create로 덮어쓰기 (--force 옵션 없이도 항상 upsert)
-- course_id로 Course를 조회하고 존재하지 않으면 스킵
-- 배치 처리 시 부분 실패를 허용하여 전체 작업 중단 방지
-- 진행 상황을 stdout으로 출력하여 모니터링 가능
+- 이미 존재하는 AI 리뷰는 덮어쓰기 (--force 옵션 없이도 항상 upsert)
+- 행 단위 조회/저장 대신 청크 단위 일괄 처리
+  - CSV는 한 번만 순차 읽기 (전체 행 수를 세기 위한 재읽기 없음)
+  - 청크의 course_id를 in_bulk 1회로 확인, 존재하지 않는 강좌는 스킵
+  - bulk_create(update_conflicts=True, unique_fields=['course'])로 INSERT ... ON CONFLICT DO UPDATE 1회
+  → 청크당 쿼리 3회(강좌 확인, 기존 평가 확인, upsert), 전체 재적재가 수 초 내 완료
+- 같은 청크에 같은 course_id가 여러 번 나오면 마지막 행 사용 (ON CONFLICT는 한 문장에서 같은 행을 두 번 갱신 불가)
+- 형식 오류 행은 해당 행만, DB 오류는 해당 청크만 실패 처리 → 전체 작업은 계속 진행
+- 청크마다 누적 처리 건수와 처리량(rows/s)을 출력하여 모니터링 가능
 """
 
+# 저장 메타데이터 (백업 CSV 생성 당시 모델/프롬프트)
+BACKUP_MODEL_VERSION = 'gpt-4o-mini'
+BACKUP_PROMPT_VERSION = 'v2.1'
+
+
 class Command(BaseCommand):
     help = 'CSV 백업 파일에서 CourseAIReview 데이터를 DB로 로드'
 
+    # upsert 시 갱신할 필드 (course, created_at 제외)
+    UPSERT_FIELDS = [
+        'course_summary', 'average_rating',
+        'theory_rating', 'practical_rating', 'difficulty_rating', 'duration_rating',
+        'model_version', 'prompt_version', 'updated_at',
+    ]
+
     def add_arguments(self, parser):
         """
         [설계의도]
@@ -39,8 +57,8 @@ class Command(BaseCommand):
         parser.add_argument(
             '--batch-size',
             type=int,
-            default=100,
-            help='트랜잭션 배치 크기 (기본: 100)'
+            default=1000,
+            help='청크(트랜잭션) 크기 (기본: 1000)'
         )
 
     def handle(self, *args, **options):
@@ -59,123 +77,139 @@ class Command(BaseCommand):
         if not os.path.exists(csv_path):
             raise CommandError(f'CSV 파일을 찾을 수 없습니다: {csv_path}')
 
-        self.stdout.write(f'\n파일: {csv_path}')
-
-        # 2. CSV 파일 읽기 및 처리
-        success_count = 0
-        error_count = 0
-        skip_count = 0
         batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size는 1 이상이어야 합니다.')
 
-        try:
-            with open(csv_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                total_count = sum(1 for _ in open(csv_path, encoding='utf-8-sig')) - 1  # 헤더 제외
+        self.stdout.write(f'\n파일: {csv_path}')
+        self.stdout.write(f'청크 크기: {batch_size}\n')
 
-                self.stdout.write(f'총 {total_count}개 레코드 처리 시작\n')
+        # 2. CSV 스트리밍 + 청크 단위 upsert
+        self.counts = {'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0}
+        self.started_at = time.perf_counter()
+        rows_read = 0
 
-                # 파일 포인터 리셋
-                f.seek(0)
+        try:
+            with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
                 reader = csv.DictReader(f)
-
-                batch = []
-                for idx, row in enumerate(reader, 1):
-                    try:
-                        # course_id로 Course 조회
-                        course_id = int(row['course_id'])
-
-                        try:
-                            course = Course.objects.get(id=course_id)
-                        except Course.DoesNotExist:
-                            skip_count += 1
-                            if idx % 100 == 0:
-                                self.stdout.write(
-                                    self.style.WARNING(
-                                        f'[{idx}/{total_count}] Course {course_id} 없음 - 스킵'
-                                    )
-                                )
-                            continue
-
-                        # CourseAIReview 데이터 준비
-                        ai_review_data = {
-                            'course_summary': row['course_summary'][:1000],  # max_length 제한
-                            'average_rating': float(row['average_rating']),
-                            'theory_rating': int(row['theory_rating']),
-                            'practical_rating': int(row['practical_rating']),
-                            'difficulty_rating': int(row['difficulty_rating']),
-                            'duration_rating': int(row['duration_rating']),
-                            'model_version': 'gpt-4o-mini',
-                            'prompt_version': 'v2.1'
-                        }
-
-                        batch.append((course, ai_review_data))
-
-                        # 배치 처리
-                        if len(batch) >= batch_size:
-                            created, updated = self._process_batch(batch)
-                            success_count += created + updated
-                            self.stdout.write(
-                                self.style.SUCCESS(
-                                    f'[{idx}/{total_count}] 배치 처리 완료 '
-                                    f'(생성: {created}, 업데이트: {updated})'
-                                )
-                            )
-                            batch = []
-
-                    except Exception as e:
-                        error_count += 1
-                        self.stdout.write(
-                            self.style.ERROR(
-                                f'[{idx}/{total_count}] 에러 발생 (Course {row.get("course_id")}): {str(e)}'
-                            )
-                        )
-                        continue
-
-                # 남은 배치 처리
-                if batch:
-                    created, updated = self._process_batch(batch)
-                    success_count += created + updated
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f'[{total_count}/{total_count}] 최종 배치 처리 완료 '
-                            f'(생성: {created}, 업데이트: {updated})'
-                        )
-                    )
-
-        except Exception as e:
+                chunk = []
+                for row in reader:
+                    rows_read += 1
+                    parsed = self._parse_row(row, rows_read)
+                    if parsed is not None:
+                        chunk.append(parsed)
+
+                    if len(chunk) >= batch_size:
+                        self._process_chunk(chunk, rows_read)
+                        chunk = []
+
+                # 남은 청크 처리
+                if chunk:
+                    self._process_chunk(chunk, rows_read)
+
+        except (OSError, csv.Error) as e:
             raise CommandError(f'CSV 파일 읽기 실패: {str(e)}')
 
         # 3. 결과 요약
+        elapsed = time.perf_counter() - self.started_at
+        counts = self.counts
+        success_count = counts['created'] + counts['updated']
+
         self.stdout.write('\n' + '=' * 70)
         self.stdout.write(self.style.SUCCESS('작업 완료'))
         self.stdout.write('=' * 70)
-        self.stdout.write(f'✓ 성공: {success_count}개')
-        self.stdout.write(f'⊘ 스킵: {skip_count}개 (Course 없음)')
-        self.stdout.write(f'✗ 실패: {error_count}개')
-        self.stdout.write(f'총 처리: {success_count + skip_count + error_count}개\n')
+        self.stdout.write(f'✓ 성공: {success_count}개 (생성: {counts["created"]}, 업데이트: {counts["updated"]})')
+        self.stdout.write(f'⊘ 스킵: {counts["skipped"]}개 (Course 없음)')
+        self.stdout.write(f'✗ 실패: {counts["errors"]}개')
+        self.stdout.write(f'총 처리: {rows_read}개')
+        self.stdout.write(
+            self.style.SUCCESS(f'소요 시간: {elapsed:.2f}초 ({self._rate(rows_read, elapsed):,.0f} rows/s)\n')
+        )
 
-    def _process_batch(self, batch):
+    def _parse_row(self, row, line_no):
         """
-        배치 단위로 DB 저장 처리 (트랜잭션)
-
-        Args:
-            batch: [(course, ai_review_data), ...] 리스트
+        CSV 행 → (course_id, ai_review_data)
 
         Returns:
-            tuple: (created_count, updated_count)
+            tuple | None: 형식 오류 시 None (실패 건수에 반영)
+        """
+        try:
+            return int(row['course_id']), {
+                'course_summary': row['course_summary'][:1000],  # max_length 제한
+                'average_rating': float(row['average_rating']),
+                'theory_rating': int(row['theory_rating']),
+                'practical_rating': int(row['practical_rating']),
+                'difficulty_rating': int(row['difficulty_rating']),
+                'duration_rating': int(row['duration_rating']),
+                'model_version': BACKUP_MODEL_VERSION,
+                'prompt_version': BACKUP_PROMPT_VERSION
+            }
+        except (KeyError, TypeError, ValueError) as e:
+            self.counts['errors'] += 1
+            self.stdout.write(
+                self.style.ERROR(
+                    f'[{line_no}] 형식 오류 (Course {row.get("course_id")}): {str(e)}'
+                )
+            )
+            return None
+
+    def _process_chunk(self, chunk, rows_read):
+        """
+        청크 단위 upsert (트랜잭션)
+
+        Args:
+            chunk: [(course_id, ai_review_data), ...] 리스트
+            rows_read: 지금까지 읽은 행 수 (진행 상황 출력용)
         """
-        created_count = 0
-        updated_count = 0
-
-        with transaction.atomic():
-            for course, ai_review_data in batch:
-                _, created = CourseAIReview.objects.update_or_create(
-                    course=course,
-                    defaults=ai_review_data
+        # 같은 course_id는 마지막 행만 사용
+        rows_by_course = dict(chunk)
+
+        try:
+            with transaction.atomic():
+                # 1. 존재하는 강좌만 선별 (in_bulk 1회)
+                existing_courses = Course.objects.only('id').in_bulk(list(rows_by_course))
+
+                # 2. 생성/업데이트 구분용 기존 평가 조회
+                reviewed = set(
+                    CourseAIReview.objects
+                    .filter(course_id__in=list(existing_courses))
+                    .values_list('course_id', flat=True)
                 )
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
 
-        return created_count, updated_count
+                # 3. INSERT ... ON CONFLICT (course_id) DO UPDATE
+                CourseAIReview.objects.bulk_create(
+                    [
+                        CourseAIReview(course_id=course_id, **rows_by_course[course_id])
+                        for course_id in existing_courses
+                    ],
+                    update_conflicts=True,
+                    unique_fields=['course'],
+                    update_fields=self.UPSERT_FIELDS,
+                )
+        except Exception as e:
+            self.counts['errors'] += len(chunk)
+            self.stdout.write(
+                self.style.ERROR(f'[{rows_read}] 청크 저장 실패 ({len(chunk)}개): {str(e)}')
+            )
+            return
+
+        # 행 기준 집계 (청크 내 중복 행은 업데이트로 계산)
+        skipped = sum(1 for course_id, _ in chunk if course_id not in existing_courses)
+        created = len(existing_courses) - len(reviewed)
+        updated = len(chunk) - skipped - created
+        self.counts['created'] += created
+        self.counts['updated'] += updated
+        self.counts['skipped'] += skipped
+
+        elapsed = time.perf_counter() - self.started_at
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'[{rows_read}] 청크 처리 완료 '
+                f'(생성: {created}, 업데이트: {updated}, 스킵: {skipped}) '
+                f'| {self._rate(rows_read, elapsed):,.0f} rows/s'
+            )
+        )
+
+    @staticmethod
+    def _rate(rows, elapsed):
+        return rows / elapsed if elapsed > 0 else 0.0
@@ -0,0 +1,58 @@
+# apps/comparisons/management/commands/precompute_timeline_grid.py
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.comparisons.services import get_feasibility_service, get_timeline_service
+
+"""
+[설계의도]
+- "주 N시간으로 들을 수 있는 강좌" 필터(/api/v1/comparisons/timeline/feasible/)용 행렬 야간 사전 계산
+- 수강신청 중인 강좌 전체 × weekly_hours(1~TIMELINE_GRID_MAX_HOURS)의 타임라인 상태/비율을 한 번에 계산해 파일로 저장
+
+[상세고려사항]
+- 판정 결과는 날짜에 따라 바뀌므로(남은 주차) 하루 한 번, 날짜가 바뀐 직후 실행
+- 웹 워커는 파일 수정 시각이 바뀌면 다시 로드 → 재시작 불필요
+- 실행하지 않은 날에도 API는 동작 (첫 요청에서 즉시 계산 후 메모리에 보관)
+
+[사용 예시]
+python manage.py precompute_timeline_grid
+# cron: 5 0 * * * cd /app && python manage.py precompute_timeline_grid
+"""
+
+
+class Command(BaseCommand):
+    help = '수강신청 중인 강좌 × 주당 학습 시간 타임라인 행렬 사전 계산 (야간 작업)'
+
+    def handle(self, *args, **options):
+        service = get_feasibility_service()
+        timeline_service = get_timeline_service()
+
+        started_at = time.perf_counter()
+        grid = service.build_grid()
+        built_at = time.perf_counter()
+        service.save_grid(grid)
+        saved_at = time.perf_counter()
+
+        self.stdout.write(f'기준일: {grid.as_of.isoformat()}')
+        self.stdout.write(
+            f'강좌 {len(grid)}개 × 주당 학습 시간 {len(grid.weekly_hours)}개 '
+            f'(1~{int(grid.weekly_hours[-1]) if len(grid.weekly_hours) else 0}시간)'
+        )
+
+        # 대표 weekly_hours별 상태 분포 (운영 확인용)
+        for hours in (3, 5, 10, 20):
+            column = hours - 1
+            if column >= len(grid.weekly_hours) or not len(grid):
+                continue
+            counts = [
+                f'{label} {int((grid.status[:, column] == code).sum())}'
+                for code, label in enumerate(timeline_service.STATUS_LABELS)
+            ]
+            self.stdout.write(f'  - 주 {hours}시간: ' + ', '.join(counts))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 저장 완료: {service.path} '
+            f'(계산 {(built_at - started_at) * 1000:.0f}ms, 저장 {(saved_at - built_at) * 1000:.0f}ms)'
+        ))
@@ -0,0 +1,99 @@
+# apps/comparisons/management/commands/run_analysis_jobs.py
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.comparisons.services import get_job_service
+from apps.comparisons.services.job_service import ANALYSIS_JOB_STALE_AFTER
+
+"""
+[설계의도]
+- 비동기 분석 작업(AnalysisJob) 워커
+- ANALYSIS_JOB_RUNNER=worker 설정 시 웹 서버는 작업 등록만 하고, 이 커맨드가 LLM 호출을 수행
+  → 웹 워커는 카탈로그 조회 등 짧은 요청만 처리
+
+[상세 고려사항]
+- 대기 작업은 select_for_update(skip_locked)로 선점 → 워커 컨테이너를 여러 개 띄워도 중복 실행 없음
+- 주기적으로 멈춘 작업(워커 중단) 재등록 및 오래된 완료 작업 삭제
+- 작업 사이마다 close_old_connections로 끊어진 DB 연결 정리
+
+[사용 예시]
+python manage.py run_analysis_jobs                  # 계속 실행 (워커 컨테이너)
+python manage.py run_analysis_jobs --once           # 대기 작업만 처리 후 종료
+"""
+
+# 관리 작업(멈춘 작업 재등록, 오래된 작업 삭제) 실행 주기 (초)
+MAINTENANCE_INTERVAL = 60
+
+
+class Command(BaseCommand):
+    help = '비동기 분석 작업(강좌 비교 분석 / 리뷰 요약) 워커 실행'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='대기 중인 작업을 모두 처리하면 종료'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help='대기 작업이 없을 때 다음 확인까지 대기 시간(초) (기본: 1.0)'
+        )
+        parser.add_argument(
+            '--stale-after',
+            type=int,
+            default=ANALYSIS_JOB_STALE_AFTER,
+            help='running 상태로 이 시간(초) 이상 갱신이 없으면 재등록 (기본: ANALYSIS_JOB_STALE_AFTER, 600)'
+        )
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            default=7,
+            help='완료 작업 보관 기간(일) (기본: 7)'
+        )
+
+    def handle(self, *args, **options):
+        job_service = get_job_service()
+        processed = 0
+        last_maintenance = 0.0
+
+        self.stdout.write('🚀 분석 작업 워커 시작')
+
+        try:
+            while True:
+                close_old_connections()
+
+                if time.monotonic() - last_maintenance >= MAINTENANCE_INTERVAL:
+                    self._maintenance(job_service, options)
+                    last_maintenance = time.monotonic()
+
+                job = job_service.claim_next()
+                if job is None:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                started_at = time.perf_counter()
+                job = job_service.run(job)
+                processed += 1
+                self.stdout.write(
+                    f'  - {job.kind} {job.id}: {job.status} '
+                    f'({job.completed}/{job.total}, {time.perf_counter() - started_at:.1f}초)'
+                )
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING('\n⏹ 워커 중지 요청'))
+
+        self.stdout.write(self.style.SUCCESS(f'✅ 처리한 작업: {processed}건'))
+
+    def _maintenance(self, job_service, options):
+        stale = job_service.requeue_stale(options['stale_after'])
+        purged = job_service.purge(options['retention_days'])
+        if stale['requeued'] or stale['failed'] or purged:
+            self.stdout.write(
+                f'  · 재등록 {stale["requeued"]}건, 실패 처리 {stale["failed"]}건, 삭제 {purged}건'
+            )
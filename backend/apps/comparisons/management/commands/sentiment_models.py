@@ -0,0 +1,55 @@
+# apps/comparisons/management/commands/sentiment_models.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.comparisons.ai_models.registry import get_model_registry
+
+"""
+[설계의도]
+- 감성분석 모델 레지스트리(ai_models/registry.py)의 버전 조회/교체용 커맨드
+- 교체는 CURRENT 포인터만 바꾸므로, 실행 중인 서버는 재시작 없이
+  다음 확인 주기(SENTIMENT_MODEL_RELOAD_INTERVAL, 기본 5초)에 백그라운드 재로드
+
+[사용 예시]
+python manage.py sentiment_models                           # 버전 목록
+python manage.py sentiment_models --activate 20251223-140530  # 교체/롤백
+"""
+
+
+class Command(BaseCommand):
+    help = '감성분석 모델 버전 목록 조회 및 현재 버전 교체(롤백)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--activate',
+            type=str,
+            default=None,
+            metavar='VERSION',
+            help='현재 모델로 지정할 버전 (롤백 포함)'
+        )
+
+    def handle(self, *args, **options):
+        registry = get_model_registry()
+
+        if options['activate']:
+            try:
+                registry.activate(options['activate'])
+            except FileNotFoundError as e:
+                raise CommandError(str(e))
+            self.stdout.write(self.style.SUCCESS(f'✅ 현재 모델 버전 변경: {options["activate"]}'))
+            return
+
+        versions = registry.list_versions()
+        current = registry.current_version()
+
+        if not versions:
+            self.stdout.write(self.style.WARNING(f'등록된 모델 버전이 없습니다. (현재: {current or "없음"})'))
+            return
+
+        self.stdout.write(f'{"":2s}{"버전":20s}{"정확도":>10s}  학습 시각')
+        for entry in versions:
+            marker = '* ' if entry['is_current'] else '  '
+            accuracy = f'{entry["accuracy"]:.4f}' if entry['accuracy'] is not None else '-'
+            self.stdout.write(f'{marker}{entry["version"]:20s}{accuracy:>10s}  {entry["trained_at"] or "-"}')
+
+        self.stdout.write(self.style.SUCCESS(f'\n✅ 총 {len(versions)}개 버전 (현재: {current})'))
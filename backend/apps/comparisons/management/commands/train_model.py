@@ -16,11 +16,17 @@ python manage.py train_model \
   --ngram 2 \
   --C 1.0 \
   --cv 5
+
+# 하이퍼파라미터 탐색 (병렬) → 최고 후보 학습/등록, --promote 시 현재 모델로 교체
+python manage.py train_model --search grid --n-jobs -1 --promote
+python manage.py train_model --search random --search-iter 30 --search-C 0.1 0.3 1 3 10 30
 ```
 
-[출력 파일]
+[출력 파일] ai_models/versions/<버전>/ (모델 레지스트리, ai_models/registry.py)
 - sentiment_pipeline.joblib : 학습된 파이프라인 (전처리 + 모델)
 - model_metadata.json : 모델 메타데이터 (버전, 정확도, 하이퍼파라미터 등) -> mlops 관리 목적
+- 저장 후 CURRENT 포인터 교체 → 실행 중인 서버가 재시작 없이 새 모델로 교체
+  (--no-activate: 등록만 하고 교체는 `python manage.py sentiment_models --activate <버전>`으로)
 
 [#TODO]
 - 모델 성능 모니터링 및 재학습 파이프라인 구축 고려
@@ -30,17 +36,15 @@ python manage.py train_model \
 
 
 import os
-import json
-import joblib
+import time
 import pandas as pd
+from datetime import datetime
 from pathlib import Path
 from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
 from pandas.errors import EmptyDataError
 
 
-# 한국어 형태소 분석기 - 토크나이저로 활용
-from kiwipiepy import Kiwi
 # TF-IDF 벡터라이저
 from sklearn.feature_extraction.text import TfidfVectorizer
 # 선형 분류 모델(로지스틱 회귀)
@@ -52,38 +56,23 @@ from sklearn.model_selection import train_test_split, cross_val_score
 # 평가 지표
 from sklearn.metrics import classification_report, confusion_matrix, accuracy_score
 
+from apps.comparisons.ai_models import search as search_module
+from apps.comparisons.ai_models import tokenizer as tokenizer_module
+from apps.comparisons.ai_models.registry import ModelRegistry
+
 DEFAULT_DATA_PATH = Path(settings.BASE_DIR) / "apps" / "comparisons" / "fixtures" / "sentiment_training_data.csv"
 DEFAULT_MODEL_DIR = Path(settings.BASE_DIR) / "apps" / "comparisons" / "ai_models"
+DEFAULT_TOKEN_CACHE_PATH = Path(settings.BASE_DIR).parent / "data" / "cache" / "sentiment_tokens.pkl"
 
+# class_weight CLI 값 → LogisticRegression 인자
+CLASS_WEIGHTS = {'balanced': 'balanced', 'none': None}
+# 메타데이터에 기록할 리더보드 상위 후보 수
+LEADERBOARD_SIZE = 20
 
-# Kiwi 토크나이저
-# 전역 인스턴스로 생성
-# pickle 이슈 방지 목적
-kiwi = Kiwi()
 
-def kiwi_tokenizer(text):
-    """
-    Kiwi 형태소 분석기를 사용한 토크나이징 함수
-
-    [역할]
-    - 명사(N), 동사(V), 형용사(VA), 어근(XR) 등 의미 있는 품사만 추출
-
-    [품사 필터]
-    - N: 명사
-    - V: 동사
-    - M: 수식언 (형용사 포함)
-    - XR: 어근
-    """
-    try:
-        tokens = kiwi.tokenize(text)
-        return [
-            t.form for t in tokens
-            # 필터링
-            if t.tag.startswith(('N', 'V', 'M', 'XR'))  # 명사, 동사, 수식언, 어근
-        ]
-    except Exception:
-        # fallback: 공백 기준 split | 최후의 안전장치
-        return text.split()  # fallback
+# Kiwi 토크나이저 (배치 모드 + 캐시, ai_models/tokenizer.py)
+# 기존 모델 pickle이 이 모듈의 kiwi_tokenizer를 참조하므로 같은 이름으로 노출 (호환 유지)
+kiwi_tokenizer = tokenizer_module.kiwi_tokenizer
 
 
 class Command(BaseCommand):
@@ -102,7 +91,7 @@ class Command(BaseCommand):
       의미 있는 품사만 필터링하여 노이즈를 줄임
     - 데이터 검증(필수 컬럼/결측/라벨 검증)을 선행하여 학습 중단을 조기에 발생시키고,
       잘못된 데이터로 모델이 저장되는 상황을 방지
-    - 클래스 불균형 가능성을 고려해 class_weight='balanced'를 사용
+    - 클래스 불균형 가능성을 고려해 기본값으로 class_weight='balanced'를 사용 (--class-weight, --search로 변경 가능)
     - 결과 재현성을 위해 random_state를 고정
     """
     help = '감성분석 모델 학습 및 저장'
@@ -122,6 +111,17 @@ class Command(BaseCommand):
         --ngram: N-gram 최대 크기
         --C: LogisticRegression의 정규화 강도
         --cv: 교차 검증 fold 수
+        --class-weight: 클래스 가중치 (balanced | none)
+        --search: 하이퍼파라미터 탐색 모드 (grid | random), 최고 후보로 최종 모델 학습
+        --search-min-df / --search-ngram / --search-C / --search-class-weight: 탐색 후보 값
+        --search-iter: random 모드 후보 수
+        --n-jobs: 탐색 병렬 작업 수 (-1: 전체 코어)
+        --promote: 탐색 결과 최고 모델을 현재 모델로 교체 (기본은 등록만)
+        --kiwi-workers: Kiwi 배치 모드 스레드 수 (0: 가용 코어 전체)
+        --token-cache: 토큰 캐시 파일 경로 (재실행 시 토크나이징 생략)
+        --no-token-cache: 토큰 캐시 파일을 사용하지 않음
+        --model-version: 등록할 버전 이름 (기본: 학습 시각 YYYYmmdd-HHMMSS)
+        --no-activate: 레지스트리에 등록만 하고 현재 모델로 교체하지 않음
         """
         # 학습 데이터 CSV 파일 경로
         parser.add_argument(
@@ -172,6 +172,73 @@ class Command(BaseCommand):
             help='교차 검증 fold 수'
         )
 
+        # 클래스 가중치
+        parser.add_argument(
+            '--class-weight',
+            choices=sorted(CLASS_WEIGHTS),
+            default='balanced',
+            help='LogisticRegression 클래스 가중치'
+        )
+
+        # 하이퍼파라미터 탐색 옵션
+        parser.add_argument(
+            '--search',
+            choices=['grid', 'random'],
+            default=None,
+            help='하이퍼파라미터 탐색 모드 (grid: 전체 조합, random: --search-iter개 추출)'
+        )
+        parser.add_argument('--search-min-df', type=int, nargs='+', default=[2, 3, 5], help='탐색할 min_df 값')
+        parser.add_argument('--search-ngram', type=int, nargs='+', default=[1, 2], help='탐색할 ngram 최대 크기')
+        parser.add_argument(
+            '--search-C', type=float, nargs='+', default=[0.1, 0.3, 1.0, 3.0, 10.0], help='탐색할 C 값'
+        )
+        parser.add_argument(
+            '--search-class-weight',
+            choices=sorted(CLASS_WEIGHTS),
+            nargs='+',
+            default=sorted(CLASS_WEIGHTS),
+            help='탐색할 클래스 가중치'
+        )
+        parser.add_argument('--search-iter', type=int, default=20, help='random 모드 후보 수')
+        parser.add_argument('--n-jobs', type=int, default=-1, help='탐색 병렬 작업 수 (-1: 전체 코어)')
+        parser.add_argument(
+            '--promote',
+            action='store_true',
+            help='탐색 결과 최고 모델을 현재 모델로 교체 (미지정 시 레지스트리에 등록만)'
+        )
+
+        # 토크나이징 옵션
+        parser.add_argument(
+            '--kiwi-workers',
+            type=int,
+            default=tokenizer_module.DEFAULT_NUM_WORKERS,
+            help='Kiwi 배치 모드 스레드 수 (0: 가용 코어 전체)'
+        )
+        parser.add_argument(
+            '--token-cache',
+            type=str,
+            default=str(DEFAULT_TOKEN_CACHE_PATH),
+            help='토큰 캐시 파일 경로'
+        )
+        parser.add_argument(
+            '--no-token-cache',
+            action='store_true',
+            help='토큰 캐시 파일을 사용하지 않음 (메모리 캐시만 사용)'
+        )
+
+        # 모델 레지스트리 등록 옵션
+        parser.add_argument(
+            '--model-version',
+            type=str,
+            default=None,
+            help='등록할 모델 버전 이름 (기본: 학습 시각)'
+        )
+        parser.add_argument(
+            '--no-activate',
+            action='store_true',
+            help='레지스트리에 등록만 하고 CURRENT 포인터는 변경하지 않음'
+        )
+
     def _load_csv_or_fail(self, data_path: Path) -> pd.DataFrame:
         """CSV 존재/빈파일/파싱 불가를 CommandError로 변환"""
         if not data_path.exists():
@@ -185,6 +252,76 @@ class Command(BaseCommand):
         except EmptyDataError:
             raise CommandError(f"CSV 파싱 실패(헤더/컬럼 없음): {data_path}")
     
+    def _pretokenize(self, texts, preprocess, options):
+        """
+        코퍼스 사전 토크나이징 (Kiwi 배치 모드 + 영속 캐시)
+
+        - preprocess: TF-IDF 전처리(lowercase 등) → 캐시 키를 파이프라인 내부 호출과 일치
+        """
+        tokenizer = tokenizer_module.get_tokenizer()
+        tokenizer.num_workers = options['kiwi_workers']
+        token_cache_path = None if options['no_token_cache'] else options['token_cache']
+
+        started_at = time.perf_counter()
+        token_docs = tokenizer_module.tokenize_corpus(
+            [preprocess(text) for text in texts], cache_path=token_cache_path, tokenizer=tokenizer
+        )
+        self.stdout.write(f'  ✓ 토크나이징: {len(token_docs)}개 문서 ({time.perf_counter() - started_at:.1f}초)')
+        return token_docs
+
+    def _run_search(self, X_train, y_train, options):
+        """
+        하이퍼파라미터 탐색 (ai_models/search.py)
+
+        [처리 흐름]
+        1. 학습 데이터 1회 토크나이징
+        2. (min_df, ngram)별 fold TF-IDF 행렬 캐시 → C, class_weight 후보 병렬 교차 검증
+        3. 리더보드 출력, 최고 후보 반환
+        """
+        candidates = search_module.build_candidates(
+            min_dfs=options['search_min_df'],
+            ngrams=options['search_ngram'],
+            Cs=options['search_C'],
+            class_weights=[CLASS_WEIGHTS[name] for name in options['search_class_weight']],
+            mode=options['search'],
+            n_iter=options['search_iter'],
+        )
+        self.stdout.write(
+            f'\n[탐색] {options["search"]} 모드 - 후보 {len(candidates)}개 × {options["cv"]} fold '
+            f'(n_jobs={options["n_jobs"]})'
+        )
+
+        token_docs = self._pretokenize(X_train, TfidfVectorizer().build_preprocessor(), options)
+
+        started_at = time.perf_counter()
+        leaderboard = search_module.run_search(
+            token_docs, y_train.to_numpy(), candidates,
+            cv=options['cv'], n_jobs=options['n_jobs'],
+        )
+        elapsed = time.perf_counter() - started_at
+
+        ranked = [entry for entry in leaderboard if 'rank' in entry]
+        if not ranked:
+            raise CommandError('평가 가능한 후보가 없습니다. --search-min-df 값을 낮춰주세요.')
+
+        self.stdout.write(f'  ✓ 탐색 완료 ({elapsed:.1f}초)\n')
+        self.stdout.write(f'  {"순위":>4s}  {"min_df":>6s}  {"ngram":>5s}  {"C":>7s}  {"weight":>8s}  {"CV 평균":>8s}  {"표준편차":>8s}')
+        for entry in ranked[:10]:
+            self.stdout.write(
+                f'  {entry["rank"]:>4d}  {entry["min_df"]:>6d}  {entry["ngram"]:>5d}  {entry["C"]:>7g}  '
+                f'{entry["class_weight"] or "none":>8s}  {entry["cv_mean"]:>8.4f}  {entry["cv_std"]:>8.4f}'
+            )
+        skipped = len(leaderboard) - len(ranked)
+        if skipped:
+            self.stdout.write(self.style.WARNING(f'  ! 어휘 부족으로 제외된 후보: {skipped}개'))
+
+        return {
+            'best': ranked[0],
+            'leaderboard': leaderboard,
+            'n_candidates': len(candidates),
+            'elapsed_sec': round(elapsed, 2),
+        }
+
     def handle(self, *args, **options):
         """
         메인 단계
@@ -197,9 +334,9 @@ class Command(BaseCommand):
         1. 데이터 로드
         2. 데이터 검증 | 결측지 제거, 라벨 검증
         3. 데이터 분할 (학습/테스트)
-        4. 모델 구축 및 학습 | Kiwi 토크나이저(전역)이용, 파이프라인 구축, 학습
+        4. 모델 구축 및 학습 | 코퍼스 사전 토크나이징(배치 + 캐시), 파이프라인 구축, 학습
         5. 모델 평가 | 테스트데이터예측 -> 정확도, 교차검증, 분류리포트, 혼동행렬
-        6. 모델 저장 | joblib, 메타데이터 JSON
+        6. 모델 저장 | 레지스트리 버전 등록(joblib, 메타데이터 JSON) + CURRENT 교체
         """
         # 시작 안내 출력
         self.stdout.write(self.style.SUCCESS('=' * 60))
@@ -282,6 +419,16 @@ class Command(BaseCommand):
         self.stdout.write(f'  ✓ 학습 데이터: {len(X_train)}개')
         self.stdout.write(f'  ✓ 테스트 데이터: {len(X_test)}개')
 
+        # 3-1. 하이퍼파라미터 탐색 (--search) → 최고 후보 설정으로 이후 단계 진행
+        search_result = None
+        if options['search']:
+            search_result = self._run_search(X_train, y_train, options)
+            best = search_result['best']
+            options.update(min_df=best['min_df'], ngram=best['ngram'], C=best['C'])
+            class_weight = best['class_weight']
+        else:
+            class_weight = CLASS_WEIGHTS[options['class_weight']]
+
         # 4. 모델 구축 및 학습
         self.stdout.write('\n[4/6] 모델 학습')
 
@@ -300,12 +447,16 @@ class Command(BaseCommand):
             ('clf', LogisticRegression(
                 C=options['C'],               # 규제 강도 조절(값이 클수록 규제 약함)
                 max_iter=1000,                # 수렴이 느릴 때 대비
-                class_weight='balanced',      # 클래스 불균형 시 자동 가중치 보정
+                class_weight=class_weight,    # 'balanced': 클래스 불균형 시 자동 가중치 보정
                 random_state=42,              # 재현성
                 solver='lbfgs'                # 다중 클래스도 잘 되는 기본 solver
             ))
         ])
 
+        # 전체 문서를 Kiwi 배치 모드로 1회 토크나이징 → 토크나이저 캐시 적재
+        # (이후 fit / predict / 교차 검증 fold별 kiwi_tokenizer 호출은 캐시 조회만 수행)
+        self._pretokenize(X, pipeline.named_steps['tfidf'].build_preprocessor(), options)
+
         # 학습
         self.stdout.write('  ✓ 학습 진행 중...')
         pipeline.fit(X_train, y_train) # tfidf + clf
@@ -321,15 +472,19 @@ class Command(BaseCommand):
         accuracy = accuracy_score(y_test, y_pred)
         self.stdout.write(f'  ✓ 정확도: {accuracy:.4f} ({accuracy*100:.2f}%)')
 
-        # 교차 검증
-        cv_scores = cross_val_score(
-            pipeline, X_train, y_train,
-            cv=options['cv'],                # fold 수
-            scoring='accuracy'               # accuracy로 평가
-        )
+        # 교차 검증 (탐색 모드는 같은 fold에서 이미 계산한 최고 후보 점수 사용)
+        if search_result:
+            cv_mean, cv_std = search_result['best']['cv_mean'], search_result['best']['cv_std']
+        else:
+            cv_scores = cross_val_score(
+                pipeline, X_train, y_train,
+                cv=options['cv'],                # fold 수
+                scoring='accuracy'               # accuracy로 평가
+            )
+            cv_mean, cv_std = float(cv_scores.mean()), float(cv_scores.std())
         self.stdout.write(
-            f'  ✓ 교차 검증 평균: {cv_scores.mean():.4f} '
-            f'  ✓ 표준편차 : (±{cv_scores.std():.4f})'
+            f'  ✓ 교차 검증 평균: {cv_mean:.4f} '
+            f'  ✓ 표준편차 : (±{cv_std:.4f})'
         )
 
         # 분류 리포트
@@ -360,25 +515,11 @@ class Command(BaseCommand):
         # 6. 모델 저장
         self.stdout.write('\n[6/6] 모델 저장')
 
-        # 저장 경로
-        base_dir = DEFAULT_MODEL_DIR # 상대경로. # apps/comparisons/ai_models
-        base_dir.mkdir(parents=True, exist_ok=True) # 디렉토리 없으면 생성, 상위폴더까지 생성 옵션,
-
-        # 모델 및 메타데이터 경로
-        model_path = base_dir / 'sentiment_pipeline.joblib'
-        metadata_path = base_dir / 'model_metadata.json'
-
-        # 모델 저장
-        # joblib으로 파이프라인 통째로 저장 (tfidf + clf)
-        joblib.dump(pipeline, model_path)
-        self.stdout.write(f'  ✓ 모델 저장: {model_path}')
-
-        # 메타데이터 저장
+        # 메타데이터 ('version'은 레지스트리가 버전 이름으로 기록)
         metadata = {
-            'version': '1.0.0',                       # 버전(수동 관리)
             'accuracy': float(accuracy),              # 테스트 정확도
-            'cv_mean': float(cv_scores.mean()),       # CV 평균
-            'cv_std': float(cv_scores.std()),         # CV 표준편차
+            'cv_mean': cv_mean,                       # CV 평균
+            'cv_std': cv_std,                         # CV 표준편차
             'train_size': len(X_train),               # 학습 데이터 크기
             'test_size': len(X_test),                 # 테스트 데이터 크기
             'classes': list(pipeline.classes_),       # 클래스 순서(중요!)
@@ -386,16 +527,41 @@ class Command(BaseCommand):
                 'min_df': options['min_df'],
                 'ngram_range': (1, options['ngram']),
                 'C': options['C'],
+                'class_weight': class_weight,
                 'max_features': 5000
             },
-            'classification_report': report           # 리포트 전체 저장(추후 분석/모니터링용)
+            'classification_report': report,          # 리포트 전체 저장(추후 분석/모니터링용)
+            'trained_at': datetime.now().isoformat(),
+            'data_path': str(data_path),
         }
-
-        # 메타데이터 JSON으로 저장
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
-
-        self.stdout.write(f'  ✓ 메타데이터 저장: {metadata_path}')
+        if search_result:
+            metadata['search'] = {
+                'mode': options['search'],
+                'cv': options['cv'],
+                'n_candidates': search_result['n_candidates'],
+                'elapsed_sec': search_result['elapsed_sec'],
+                'leaderboard': search_result['leaderboard'][:LEADERBOARD_SIZE],
+            }
+
+        # 탐색 모드는 --promote일 때만 현재 모델 교체
+        activate = options['promote'] if options['search'] else not options['no_activate']
+
+        # 버전 디렉토리에 저장 (임시 디렉토리 → rename) 후 CURRENT 포인터 교체
+        registry = ModelRegistry(DEFAULT_MODEL_DIR) # apps/comparisons/ai_models
+        try:
+            version = registry.publish(
+                pipeline, metadata,
+                version=options['model_version'],
+                activate=activate,
+            )
+        except FileExistsError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(f'  ✓ 모델 등록: {registry.model_path(version)}')
+        if not activate:
+            self.stdout.write(f'  - 현재 모델 유지: {registry.current_version()} (교체: sentiment_models --activate {version})')
+        else:
+            self.stdout.write(f'  ✓ 현재 모델 교체: {version} (실행 중인 서버는 자동 재로드)')
 
         # 완료
         self.stdout.write(self.style.SUCCESS('\n' + '=' * 60))
@@ -0,0 +1,309 @@
+# apps/comparisons/management/commands/update_sentiment_model.py
+
+"""
+수강평(CourseReview) 기반 감성분석 모델 증분 학습
+
+[설계 의도]
+- 기존: 모델 개선은 CSV 전체로 train_model을 다시 돌리는 방법뿐, 서비스에서 쌓인 수강평은 학습에 반영되지 않음
+- 변경: 마지막 학습 이후(워터마크) 새로 작성/수정된 수강평만 읽어 기존 모델을 이어서 학습
+  → 재학습 비용이 전체 데이터가 아니라 "새 데이터" 크기에 비례
+
+[모델]
+- HashingVectorizer(kiwi_tokenizer) + SGDClassifier(loss='log_loss')
+  - HashingVectorizer는 어휘 사전이 없어(stateless) 새 단어가 들어와도 재학습 불필요
+  - SGDClassifier.partial_fit으로 새 데이터만 추가 학습, log_loss라 predict_proba 지원 (SentimentProcessor 호환)
+- 최초 실행(증분 모델 없음): --bootstrap-data CSV로 기본 학습 후 전체 수강평 반영
+
+[처리 흐름]
+1. 기준 모델 선택 | 레지스트리에서 가장 최근 증분 모델(model_type=online_sgd) 로드, 없으면 새로 생성 + CSV 부트스트랩
+2. 새 수강평 조회 | (updated_at, id) > 워터마크, 평점으로 라벨링 (>= 4 긍정, <= 2 부정, 3점 제외)
+3. 증분 학습 | --chunk-size개씩 Kiwi 배치 토크나이징 → partial_fit (--epochs회)
+   - id % --holdout-every == 0 인 수강평은 학습에서 제외하고 평가용으로 사용
+4. 평가 | 테스트 CSV + 제외한 수강평으로 후보 모델과 현재 모델 비교 (evaluation.compute_metrics)
+5. 게시 | 후보 정확도가 현재 모델보다 --min-improvement 이상 높을 때만 새 버전 등록 + CURRENT 교체
+   - 워터마크는 게시된 모델 메타데이터에 함께 기록 → 미게시 시 다음 실행에서 같은 수강평부터 다시 학습
+
+[사용 예시]
+python manage.py update_sentiment_model
+python manage.py update_sentiment_model --dry-run          # 평가만, 게시 안 함
+python manage.py update_sentiment_model --force            # 성능과 무관하게 게시
+"""
+
+import random
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import Pipeline
+
+from apps.comparisons.ai_models import tokenizer as tokenizer_module
+from apps.comparisons.ai_models.evaluation import TARGET_LABELS, compute_metrics
+from apps.comparisons.ai_models.registry import ModelRegistry
+from apps.courses.models import CourseReview
+
+DEFAULT_MODEL_DIR = Path(settings.BASE_DIR) / "apps" / "comparisons" / "ai_models"
+DEFAULT_BOOTSTRAP_DATA_PATH = Path(settings.BASE_DIR) / "apps" / "comparisons" / "fixtures" / "sentiment_training_data.csv"
+DEFAULT_TEST_DATA_PATH = Path(settings.BASE_DIR) / "apps" / "comparisons" / "fixtures" / "sentiment_test_data.csv"
+
+MODEL_TYPE = 'online_sgd'
+N_FEATURES = 2 ** 20
+
+
+def build_online_pipeline(ngram: int = 2, alpha: float = 1e-5) -> Pipeline:
+    """증분 학습용 파이프라인 (HashingVectorizer + SGDClassifier)"""
+    return Pipeline([
+        ('hash', HashingVectorizer(
+            tokenizer=tokenizer_module.kiwi_tokenizer,  # 배치 토크나이저 캐시 공유
+            token_pattern=None,
+            ngram_range=(1, ngram),
+            n_features=N_FEATURES,
+            alternate_sign=False,                       # TF-IDF와 같이 비음수 특징
+            norm='l2',
+        )),
+        ('clf', SGDClassifier(
+            loss='log_loss',                            # predict_proba 지원
+            alpha=alpha,
+            random_state=42,
+        )),
+    ])
+
+
+class Command(BaseCommand):
+    help = '새 수강평으로 감성분석 모델 증분 학습 (더 나을 때만 게시)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000, help='partial_fit 1회당 수강평 수')
+        parser.add_argument('--epochs', type=int, default=3, help='청크별 partial_fit 반복 횟수')
+        parser.add_argument('--positive-min', type=int, default=4, help='긍정으로 볼 최소 평점')
+        parser.add_argument('--negative-max', type=int, default=2, help='부정으로 볼 최대 평점')
+        parser.add_argument(
+            '--holdout-every', type=int, default=10,
+            help='id %% N == 0 인 수강평을 평가용으로 제외 (0이면 제외 안 함)'
+        )
+        parser.add_argument('--test-data', type=str, default=str(DEFAULT_TEST_DATA_PATH), help='평가용 CSV (content, label)')
+        parser.add_argument(
+            '--bootstrap-data', type=str, default=str(DEFAULT_BOOTSTRAP_DATA_PATH),
+            help='증분 모델이 없을 때 기본 학습에 사용할 CSV (content, label)'
+        )
+        parser.add_argument('--ngram', type=int, default=2, help='신규 모델 N-gram 최대 크기')
+        parser.add_argument('--alpha', type=float, default=1e-5, help='신규 모델 SGDClassifier 규제 강도')
+        parser.add_argument(
+            '--min-improvement', type=float, default=0.0,
+            help='게시에 필요한 정확도 향상 폭 (현재 모델 대비, 기본 0 → 더 높기만 하면 게시)'
+        )
+        parser.add_argument('--force', action='store_true', help='성능 비교와 무관하게 게시')
+        parser.add_argument('--dry-run', action='store_true', help='학습/평가만 하고 게시하지 않음')
+
+    def handle(self, *args, **options):
+        registry = ModelRegistry(DEFAULT_MODEL_DIR)
+        started_at = time.perf_counter()
+
+        # 1. 기준 모델
+        base = self._find_base_model(registry)
+        if base:
+            pipeline = base.pipeline
+            watermark = base.metadata.get('watermark')
+            trained_samples = base.metadata.get('trained_samples', 0)
+            self.stdout.write(f'[1/5] 기준 모델: {base.version} (워터마크: {self._format_watermark(watermark)})')
+        else:
+            pipeline = build_online_pipeline(ngram=options['ngram'], alpha=options['alpha'])
+            watermark = None
+            trained_samples = self._bootstrap(pipeline, options)
+            self.stdout.write(f'[1/5] 증분 모델 없음 → CSV 부트스트랩 {trained_samples}건 학습')
+
+        # 2~3. 새 수강평 증분 학습
+        self.stdout.write('[2/5] 새 수강평 조회 및 증분 학습')
+        new_samples, holdout, new_watermark = self._train_on_new_reviews(pipeline, watermark, options)
+        trained_samples += new_samples
+        self.stdout.write(f'  ✓ 학습 {new_samples}건, 평가용 제외 {len(holdout)}건')
+
+        if base and new_samples == 0:
+            self.stdout.write(self.style.SUCCESS('✅ 새 수강평이 없습니다. 모델을 유지합니다.'))
+            return
+        if trained_samples == 0:
+            raise CommandError('학습할 데이터가 없습니다. --bootstrap-data 또는 수강평 데이터를 확인해주세요.')
+
+        # 4. 평가 (후보 vs 현재 모델)
+        self.stdout.write('[3/5] 평가')
+        texts, labels = self._load_eval_set(options['test_data'], holdout)
+        if not texts:
+            raise CommandError('평가 데이터가 없습니다. --test-data를 확인해주세요.')
+
+        candidate_metrics = self._evaluate(pipeline, texts, labels)
+        current_version = registry.current_version()
+        current_metrics = None
+        if current_version:
+            current_metrics = self._evaluate(registry.load().pipeline, texts, labels)
+
+        self.stdout.write(f'  후보 모델  정확도 {candidate_metrics["accuracy"]:.4f}  macro F1 {candidate_metrics["macro_f1"]:.4f}')
+        if current_metrics:
+            self.stdout.write(
+                f'  현재 모델  정확도 {current_metrics["accuracy"]:.4f}  macro F1 {current_metrics["macro_f1"]:.4f} '
+                f'({current_version})'
+            )
+
+        # 5. 게시 판단
+        improved = (
+            current_metrics is None
+            or candidate_metrics['accuracy'] > current_metrics['accuracy'] + options['min_improvement']
+        )
+        self.stdout.write('[4/5] 게시 판단')
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'  - dry-run: 게시하지 않음 (개선 여부: {improved})'))
+            return
+        if not improved and not options['force']:
+            self.stdout.write(self.style.WARNING('  - 현재 모델보다 낫지 않아 게시하지 않습니다. (워터마크 유지)'))
+            return
+
+        metadata = {
+            'model_type': MODEL_TYPE,
+            'base_version': base.version if base else None,
+            'accuracy': candidate_metrics['accuracy'],
+            'macro_f1': candidate_metrics['macro_f1'],
+            'classes': [str(c) for c in pipeline.classes_],
+            'compared_to': {
+                'version': current_version,
+                'accuracy': current_metrics['accuracy'] if current_metrics else None,
+            },
+            'eval_size': len(texts),
+            'new_samples': new_samples,
+            'trained_samples': trained_samples,
+            'watermark': new_watermark or watermark,
+            'hyperparameters': {
+                'ngram_range': list(pipeline.named_steps['hash'].ngram_range),
+                'n_features': pipeline.named_steps['hash'].n_features,
+                'alpha': pipeline.named_steps['clf'].alpha,
+                'epochs': options['epochs'],
+            },
+            'trained_at': datetime.now().isoformat(),
+        }
+        version = registry.publish(pipeline, metadata, activate=True)
+
+        self.stdout.write(f'[5/5] 게시: {version}')
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 증분 학습 완료 - 새 수강평 {new_samples}건, 정확도 {candidate_metrics["accuracy"]:.4f} '
+            f'({time.perf_counter() - started_at:.1f}초)'
+        ))
+
+    # =========================
+    # 기준 모델 / 부트스트랩
+    # =========================
+
+    def _find_base_model(self, registry):
+        """현재 버전이 증분 모델이면 그것을, 아니면 가장 최근 증분 모델 버전을 로드"""
+        candidates = [v['version'] for v in registry.list_versions() if v['metadata'].get('model_type') == MODEL_TYPE]
+        if not candidates:
+            return None
+        current = registry.current_version()
+        version = current if current in candidates else candidates[-1]
+        return registry.load(version)
+
+    def _bootstrap(self, pipeline, options):
+        """증분 모델이 없을 때 CSV로 기본 학습"""
+        path = Path(options['bootstrap_data'])
+        if not path.exists():
+            return 0
+        df = pd.read_csv(path, encoding='utf-8-sig').dropna(subset=['content', 'label'])
+        df = df[df['label'].isin(TARGET_LABELS)]
+        self._partial_fit(pipeline, df['content'].tolist(), df['label'].tolist(), options['epochs'])
+        return len(df)
+
+    # =========================
+    # 증분 학습
+    # =========================
+
+    def _train_on_new_reviews(self, pipeline, watermark, options):
+        """
+        워터마크 이후 수강평을 청크 단위로 스트리밍하며 partial_fit
+
+        Returns:
+            (학습 건수, 평가용 제외 [(text, label)], 새 워터마크)
+        """
+        queryset = CourseReview.objects.exclude(review_text='')
+        if watermark:
+            updated_at = parse_datetime(watermark['updated_at'])
+            queryset = queryset.filter(
+                Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, id__gt=watermark['id'])
+            )
+        rows = (
+            queryset
+            .filter(Q(rating__gte=options['positive_min']) | Q(rating__lte=options['negative_max']))
+            .order_by('updated_at', 'id')
+            .values_list('id', 'review_text', 'rating', 'updated_at')
+        )
+
+        holdout_every = options['holdout_every']
+        trained = 0
+        holdout = []
+        new_watermark = None
+        texts, labels = [], []
+
+        for review_id, text, rating, updated_at in rows.iterator(chunk_size=options['chunk_size']):
+            new_watermark = {'updated_at': updated_at.isoformat(), 'id': review_id}
+            label = 'positive' if rating >= options['positive_min'] else 'negative'
+
+            if holdout_every and review_id % holdout_every == 0:
+                holdout.append((text, label))
+                continue
+
+            texts.append(text)
+            labels.append(label)
+            if len(texts) >= options['chunk_size']:
+                self._partial_fit(pipeline, texts, labels, options['epochs'])
+                trained += len(texts)
+                texts, labels = [], []
+
+        if texts:
+            self._partial_fit(pipeline, texts, labels, options['epochs'])
+            trained += len(texts)
+
+        return trained, holdout, new_watermark
+
+    def _partial_fit(self, pipeline, texts, labels, epochs):
+        """청크 1개 학습 | Kiwi 배치 토크나이징 → 해싱 → partial_fit (에폭마다 순서 섞기)"""
+        vectorizer = pipeline.named_steps['hash']
+        clf = pipeline.named_steps['clf']
+
+        preprocess = vectorizer.build_preprocessor()
+        tokenizer_module.get_tokenizer().tokenize_many([preprocess(text) for text in texts])
+        X = vectorizer.transform(texts)
+
+        order = list(range(len(labels)))
+        rng = random.Random(42)
+        for _ in range(max(epochs, 1)):
+            rng.shuffle(order)
+            clf.partial_fit(X[order], [labels[i] for i in order], classes=TARGET_LABELS)
+
+    # =========================
+    # 평가
+    # =========================
+
+    def _load_eval_set(self, test_data_path, holdout):
+        texts, labels = [], []
+        path = Path(test_data_path)
+        if path.exists():
+            df = pd.read_csv(path, encoding='utf-8-sig').dropna(subset=['content', 'label'])
+            texts.extend(df['content'].tolist())
+            labels.extend(df['label'].tolist())
+        for text, label in holdout:
+            texts.append(text)
+            labels.append(label)
+        return texts, labels
+
+    def _evaluate(self, pipeline, texts, labels):
+        preprocess = pipeline.steps[0][1].build_preprocessor()
+        tokenizer_module.get_tokenizer().tokenize_many([preprocess(text) for text in texts])
+        return compute_metrics(labels, pipeline.predict(texts))
+
+    @staticmethod
+    def _format_watermark(watermark):
+        if not watermark:
+            return '없음'
+        return f'{watermark["updated_at"]} / id {watermark["id"]}'
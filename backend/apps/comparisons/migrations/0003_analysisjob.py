@@ -0,0 +1,42 @@
+import uuid
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comparisons', '0002_alter_courseaireview_average_rating_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalysisJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('comparison', '강좌 비교 분석'), ('review_summary', '강좌 리뷰 요약')], help_text='작업 종류', max_length=30)),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '실행 중'), ('succeeded', '완료'), ('failed', '실패')], default='pending', help_text='작업 상태', max_length=20)),
+                ('payload', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='검증된 요청 데이터')),
+                ('result', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='섹션별 결과 및 최종 결과')),
+                ('error', models.TextField(blank=True, help_text='실패 사유')),
+                ('total', models.PositiveIntegerField(default=0, help_text='전체 섹션 수')),
+                ('completed', models.PositiveIntegerField(default=0, help_text='완료된 섹션 수')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, help_text='실행 시도 횟수')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(blank=True, help_text='작업 요청자', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='analysis_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'AI 분석 작업',
+                'verbose_name_plural': 'AI 분석 작업 목록',
+                'db_table': 'comparison_analysis_job',
+                'indexes': [models.Index(fields=['status', 'created_at'], name='comparison__status_e39bee_idx')],
+            },
+        ),
+    ]
@@ -1,6 +1,10 @@
 from django.db import models
 
 # Create your models here.
+import uuid
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 
@@ -83,4 +87,84 @@ class CourseAIReview(models.Model):
         ]
 
     def __str__(self):
-        return f"{self.course.name} ({self.average_rating})"
\ No newline at end of file
+        return f"{self.course.name} ({self.average_rating})"
+
+
+class AnalysisJob(models.Model):
+    """
+    LLM 기반 분석 작업 (비동기 실행 단위)
+
+    [설계 의도]
+    - 강좌 비교 분석 / 리뷰 요약은 LLM 호출로 수십 초가 걸려 웹 워커를 오래 점유
+    - 요청은 작업만 등록하고 job id를 즉시 반환, 실제 LLM 호출은 별도 실행기(스레드 또는 워커 컨테이너)가 수행
+    - 결과는 폴링(GET) 또는 SSE 스트림으로 조회
+
+    [상세 고려사항]
+    - result['sections']: 강좌별 결과가 끝나는 순서대로 누적 (스트림은 새 섹션만 전송)
+    - result['results']: 작업 완료 시 최종 응답 (동기 API와 같은 형식)
+    - 워커 컨테이너 모드에서는 status=pending 작업을 select_for_update(skip_locked)로 가져감
+    - attempts: 워커 중단으로 running에 멈춘 작업 재시도 횟수
+    """
+
+    KIND_COMPARISON = 'comparison'
+    KIND_REVIEW_SUMMARY = 'review_summary'
+    KIND_CHOICES = [
+        (KIND_COMPARISON, '강좌 비교 분석'),
+        (KIND_REVIEW_SUMMARY, '강좌 리뷰 요약'),
+    ]
+
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_RUNNING, '실행 중'),
+        (STATUS_SUCCEEDED, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+    FINISHED_STATUSES = (STATUS_SUCCEEDED, STATUS_FAILED)
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='analysis_jobs',
+        help_text="작업 요청자"
+    )
+    kind = models.CharField(max_length=30, choices=KIND_CHOICES, help_text="작업 종류")
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        help_text="작업 상태"
+    )
+    payload = models.JSONField(default=dict, encoder=DjangoJSONEncoder, help_text="검증된 요청 데이터")
+    result = models.JSONField(default=dict, encoder=DjangoJSONEncoder, help_text="섹션별 결과 및 최종 결과")
+    error = models.TextField(blank=True, help_text="실패 사유")
+
+    total = models.PositiveIntegerField(default=0, help_text="전체 섹션 수")
+    completed = models.PositiveIntegerField(default=0, help_text="완료된 섹션 수")
+    attempts = models.PositiveSmallIntegerField(default=0, help_text="실행 시도 횟수")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'comparison_analysis_job'
+        verbose_name = 'AI 분석 작업'
+        verbose_name_plural = 'AI 분석 작업 목록'
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.id} ({self.status})"
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in self.FINISHED_STATUSES
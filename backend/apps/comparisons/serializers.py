@@ -26,6 +26,22 @@
 5.1  ComparisonAnalyzeRequestSerializer    | 강좌 비교 분석 요청 검증
 5.2  ComparisonResultSerializer            | 강좌별 비교 분석 결과 직렬화
 5.3  ComparisonAnalyzeResponseSerializer   | 강좌 비교 분석 최종 응답 직렬화
+5.4  PersonalizedCommentRequestSerializer  | 맞춤 코멘트 스트리밍 요청 검증
+
+6. 카탈로그 매칭 Top-K
+6.1  TopMatchQuerySerializer               | Top-K 조회 조건 검증 (선호도 + 개수 + 분류 필터)
+6.2  TopMatchResultSerializer              | 강좌별 매칭 결과 직렬화
+
+7. 비동기 분석 작업
+7.1  AnalysisJobSerializer                 | 작업 상태 + 섹션별 부분 결과 + 최종 결과 직렬화
+
+8. AI 평가 비교 행렬
+8.1  ComparisonMatrixQuerySerializer       | 비교 행렬 조회 조건 검증 (강좌 ID 목록 + 선택 선호도)
+8.2  ComparisonMatrixRowSerializer         | 강좌별 평점/분류 내 백분위/매칭 점수 직렬화
+
+9. 수강 가능 강좌 필터
+9.1  FeasibleCourseQuerySerializer         | 조회 조건 검증 (주당 학습 시간 + 상태 + 분류 + 페이지)
+9.2  FeasibleCourseSerializer              | 강좌 카드 + 타임라인 판정 결과 직렬화
 
 
 [참고사항]
@@ -51,7 +67,7 @@
 
 from rest_framework import serializers
 from apps.courses.models import Course
-from apps.comparisons.models import CourseAIReview
+from apps.comparisons.models import AnalysisJob, CourseAIReview
 
 MIN_COURSE_COMPARISON_COUNT = 1  # 최소 비교 강좌 수
 MAX_COURSE_COMPARISON_COUNT = 4  # 최대 비교 강좌 수
@@ -62,6 +78,16 @@ MAX_WEEKLY_HOURS = 168  # 최대 주당 학습 시간 (24*7)
 MIN_VALUE = 0 # 평가 결정 요인 -> 사용자가 평가한 중요도 최소값
 MAX_VALUE = 5 # 평가 결정 요인 -> 사용자가 평가한 중요도 최대값
 
+DEFAULT_TOP_MATCH_LIMIT = 10  # 카탈로그 매칭 기본 조회 수
+MAX_TOP_MATCH_LIMIT = 50      # 카탈로그 매칭 최대 조회 수
+
+MAX_MATRIX_COURSE_COUNT = 100  # 비교 행렬 1회 최대 조회 강좌 수
+
+DEFAULT_FEASIBLE_LIMIT = 20   # 수강 가능 강좌 기본 조회 수
+MAX_FEASIBLE_LIMIT = 100      # 수강 가능 강좌 최대 조회 수
+FEASIBLE_STATUS_CHOICES = ['적정', '널널', '빠듯']  # TimelineService 상태값 중 필터 가능한 값
+DEFAULT_FEASIBLE_STATUSES = ['적정', '널널']         # 기본: 주당 학습 가능 시간 안에서 소화 가능한 강좌
+
 USER_GOAL_MIN_LENGTH = 10   # 사용자 학습 목표 최소 길이
 USER_GOAL_MAX_LENGTH = 1000  # 사용자 학습 목표 최대 길이
 
@@ -498,5 +524,257 @@ class ComparisonAnalyzeResponseSerializer(serializers.Serializer):
     )
 
 
+# 5.4 PersonalizedCommentRequestSerializer | 맞춤 코멘트 스트리밍 요청 검증
+class PersonalizedCommentRequestSerializer(serializers.Serializer):
+    """
+    [설계 의도]
+    - POST /api/v1/comparisons/courses/{course_id}/comment/stream/ 의 request body 처리
+    - 학습 목표 검증(길이, 금지어)은 강좌 비교 분석 요청과 동일한 규칙 재사용
+    """
+
+    user_goal = serializers.CharField(
+        min_length=USER_GOAL_MIN_LENGTH,
+        max_length=USER_GOAL_MAX_LENGTH,
+        help_text=f"사용자 학습 목표 (최소 {USER_GOAL_MIN_LENGTH}자, 최대 {USER_GOAL_MAX_LENGTH}자)"
+    )
+
+    validate_user_goal = ComparisonAnalyzeRequestSerializer.validate_user_goal
+
+
+# =========================
+# 6. 카탈로그 매칭 Top-K
+# =========================
+
+# 6.1 TopMatchQuerySerializer | Top-K 조회 조건 검증 -> GET /api/v1/comparisons/top-matches/
+class TopMatchQuerySerializer(UserPreferencesSerializer):
+    """
+    [설계 의도]
+    - 카탈로그 전체에서 선호도와 가장 잘 맞는 강좌 조회 조건 검증
+    - 선호도 항목은 UserPreferencesSerializer를 그대로 상속 (비교 분석과 같은 입력 규칙)
 
+    [상세 고려 사항]
+    - GET 쿼리 파라미터로 받음: ?theory=3&practical=4&difficulty=2&duration=3&limit=10
+    - classfy_name: 대분류 (단일), middle_classfy_name: 중분류 (다중, OR 조건)
+    """
 
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=MAX_TOP_MATCH_LIMIT,
+        default=DEFAULT_TOP_MATCH_LIMIT,
+        help_text=f"조회할 강좌 수 (1~{MAX_TOP_MATCH_LIMIT}, 기본 {DEFAULT_TOP_MATCH_LIMIT})"
+    )
+    classfy_name = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        help_text="대분류 필터"
+    )
+    middle_classfy_name = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text="중분류 필터 (다중 값, OR 조건)"
+    )
+
+    def to_internal_value(self, data):
+        # QueryDict의 다중 값(middle_classfy_name)은 getlist로 꺼내야 ListField가 전체 값을 받음
+        if hasattr(data, 'getlist'):
+            values = data.getlist('middle_classfy_name')
+            data = data.dict()
+            if values:
+                data['middle_classfy_name'] = values
+        return super().to_internal_value(data)
+
+
+# 6.2 TopMatchResultSerializer | 강좌별 매칭 결과 직렬화
+class TopMatchResultSerializer(serializers.Serializer):
+    """
+    [설계 의도]
+    - 카탈로그 매칭 결과 1건 (강좌 카드 + AI 평가 + 매칭 점수)
+    - 비교 분석 결과(ComparisonResultSerializer)와 같은 키 구조 → 프론트엔드 카드 컴포넌트 재사용
+    """
+
+    course = SimpleCourseSerializer(read_only=True, help_text="강좌 기본 정보")
+    ai_review = CourseAIReviewSerializer(read_only=True, help_text="AI 리뷰")
+    match_score = serializers.FloatField(read_only=True, help_text="매칭 점수")
+
+
+# =========================
+# 7. 비동기 분석 작업
+# =========================
+
+# 7.1 AnalysisJobSerializer | 작업 상태 조회 -> GET /api/v1/comparisons/jobs/{job_id}/
+class AnalysisJobSerializer(serializers.ModelSerializer):
+    """
+    [설계 의도]
+    - 폴링 응답: 진행률 + 지금까지 끝난 섹션(강좌별 결과) + 완료 시 최종 결과
+
+    [상세 고려 사항]
+    - sections: 끝난 순서대로의 부분 결과 (비교 분석은 ComparisonResultSerializer 형식)
+    - result: 완료 전에는 null, 완료 후 동기 API와 같은 형식
+      (비교 분석: {'results': [...]} 매칭 점수 내림차순 / 리뷰 요약: ReviewSummarySerializer 형식)
+    """
+
+    job_id = serializers.UUIDField(source='id', read_only=True)
+    progress = serializers.SerializerMethodField(help_text="진행률 {completed, total}")
+    sections = serializers.SerializerMethodField(help_text="완료된 섹션별 부분 결과")
+    result = serializers.SerializerMethodField(help_text="최종 결과 (완료 전 null)")
+
+    class Meta:
+        model = AnalysisJob
+        fields = [
+            'job_id', 'kind', 'status', 'progress', 'sections', 'result', 'error',
+            'created_at', 'started_at', 'finished_at',
+        ]
+        read_only_fields = fields
+
+    def get_progress(self, obj):
+        return {'completed': obj.completed, 'total': obj.total}
+
+    def get_sections(self, obj):
+        return (obj.result or {}).get('sections', [])
+
+    def get_result(self, obj):
+        if obj.status != AnalysisJob.STATUS_SUCCEEDED:
+            return None
+        return {key: value for key, value in (obj.result or {}).items() if key != 'sections'}
+
+
+# =========================
+# 8. AI 평가 비교 행렬
+# =========================
+
+# 8.1 ComparisonMatrixQuerySerializer | 비교 행렬 조회 조건 검증 -> GET /api/v1/comparisons/matrix/
+class ComparisonMatrixQuerySerializer(serializers.Serializer):
+    """
+    [설계 의도]
+    - 비교 화면/레이더 차트용 강좌 N개 조회 조건 검증
+    - 선호도 4개 항목을 함께 보내면 매칭 점수도 계산 (항목 규칙은 UserPreferencesSerializer와 동일)
+
+    [상세 고려 사항]
+    - GET 쿼리 파라미터로 받음: ?ids=1,2,3&theory=3&practical=4&difficulty=2&duration=3
+    - ids는 쉼표 구분 / 반복 파라미터(ids=1&ids=2) 모두 허용, 중복 제거 후 요청 순서 유지
+    - 선호도는 4개 모두 보내거나 모두 생략 (일부만 보내면 400)
+    """
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=MAX_MATRIX_COURSE_COUNT,
+        help_text=f"조회할 강좌 ID 목록 (최대 {MAX_MATRIX_COURSE_COUNT}개)"
+    )
+    theory = serializers.IntegerField(min_value=MIN_VALUE, max_value=MAX_VALUE, required=False)
+    practical = serializers.IntegerField(min_value=MIN_VALUE, max_value=MAX_VALUE, required=False)
+    difficulty = serializers.IntegerField(min_value=MIN_VALUE, max_value=MAX_VALUE, required=False)
+    duration = serializers.IntegerField(min_value=MIN_VALUE, max_value=MAX_VALUE, required=False)
+
+    PREFERENCE_FIELDS = ('theory', 'practical', 'difficulty', 'duration')
+
+    def to_internal_value(self, data):
+        # ids=1,2,3 / ids=1&ids=2 모두 리스트로 변환
+        if hasattr(data, 'getlist'):
+            raw_ids = data.getlist('ids')
+            data = data.dict()
+        else:
+            raw_ids = data.get('ids') or []
+            raw_ids = [raw_ids] if isinstance(raw_ids, str) else raw_ids
+            data = dict(data)
+        data['ids'] = [
+            part.strip()
+            for value in raw_ids
+            for part in str(value).split(',')
+            if part.strip()
+        ]
+        return super().to_internal_value(data)
+
+    def validate_ids(self, value):
+        # 중복 제거 (요청 순서 유지)
+        return list(dict.fromkeys(value))
+
+    def validate(self, attrs):
+        given = [field for field in self.PREFERENCE_FIELDS if field in attrs]
+        if given and len(given) != len(self.PREFERENCE_FIELDS):
+            raise serializers.ValidationError(
+                "선호도는 theory, practical, difficulty, duration을 모두 보내거나 모두 생략해주세요."
+            )
+        attrs['user_preferences'] = (
+            {field: attrs.pop(field) for field in self.PREFERENCE_FIELDS} if given else None
+        )
+        return attrs
+
+
+# 8.2 ComparisonMatrixRowSerializer | 강좌별 비교 행렬 직렬화
+class ComparisonMatrixRowSerializer(serializers.Serializer):
+    """
+    [설계 의도]
+    - 레이더 차트에 바로 넣을 수 있도록 평점/백분위를 labels 순서의 배열로 제공
+
+    [상세 고려 사항]
+    - percentiles: 같은 대분류(classfy_name) 안에서의 백분위 (0~100, 높을수록 해당 항목 값이 큼)
+    - match_score: 선호도를 보내지 않으면 null
+    """
+
+    course_id = serializers.IntegerField(read_only=True)
+    category = serializers.CharField(read_only=True, allow_null=True, help_text="대분류")
+    ratings = serializers.ListField(child=serializers.IntegerField(), read_only=True, help_text="labels 순서의 평점 (1~5)")
+    average_rating = serializers.FloatField(read_only=True, help_text="종합 평점")
+    percentiles = serializers.ListField(child=serializers.IntegerField(), read_only=True, help_text="labels 순서의 분류 내 백분위")
+    average_percentile = serializers.IntegerField(read_only=True, help_text="종합 평점의 분류 내 백분위")
+    match_score = serializers.FloatField(read_only=True, allow_null=True, help_text="매칭 점수 (선호도 입력 시)")
+
+
+# =========================
+# 9. 수강 가능 강좌 필터
+# =========================
+
+# 9.1 FeasibleCourseQuerySerializer | 조회 조건 검증 -> GET /api/v1/comparisons/timeline/feasible/
+class FeasibleCourseQuerySerializer(serializers.Serializer):
+    """
+    [설계 의도]
+    - "주 N시간으로 들을 수 있는 강좌" 조회 조건 검증
+
+    [상세 고려 사항]
+    - GET 쿼리 파라미터로 받음: ?weekly_hours=5&status=적정&status=널널&classfy_name=...&limit=20&offset=0
+    - weekly_hours 범위는 비교 분석 요청과 동일 (1~168)
+    - status: 다중 값 (기본 적정/널널)
+    """
+
+    weekly_hours = serializers.IntegerField(
+        min_value=MIN_WEEKLY_HOURS,
+        max_value=MAX_WEEKLY_HOURS,
+        help_text="주당 학습 가능 시간 (1~168)"
+    )
+    status = serializers.ListField(
+        child=serializers.ChoiceField(choices=FEASIBLE_STATUS_CHOICES),
+        required=False,
+        default=DEFAULT_FEASIBLE_STATUSES,
+        help_text="포함할 타임라인 상태 (다중 값, 기본 적정/널널)"
+    )
+    classfy_name = serializers.CharField(required=False, allow_blank=True, help_text="대분류 필터")
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=MAX_FEASIBLE_LIMIT,
+        default=DEFAULT_FEASIBLE_LIMIT,
+        help_text=f"조회할 강좌 수 (1~{MAX_FEASIBLE_LIMIT}, 기본 {DEFAULT_FEASIBLE_LIMIT})"
+    )
+    offset = serializers.IntegerField(min_value=0, default=0, help_text="건너뛸 강좌 수")
+
+    def to_internal_value(self, data):
+        # QueryDict의 다중 값(status)은 getlist로 꺼내야 ListField가 전체 값을 받음
+        if hasattr(data, 'getlist'):
+            values = data.getlist('status')
+            data = data.dict()
+            if values:
+                data['status'] = values
+            else:
+                data.pop('status', None)
+        return super().to_internal_value(data)
+
+
+# 9.2 FeasibleCourseSerializer | 강좌 카드 + 타임라인 판정 결과 직렬화
+class FeasibleCourseSerializer(serializers.Serializer):
+    """
+    [설계 의도]
+    - 비교 분석 결과와 같은 키(course, timeline) → 프론트엔드 카드/타임라인 컴포넌트 재사용
+    """
+
+    course = SimpleCourseSerializer(read_only=True, help_text="강좌 기본 정보")
+    timeline = TimelineResultSerializer(read_only=True, help_text="타임라인 시뮬레이션 결과")
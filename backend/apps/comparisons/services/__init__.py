@@ -13,7 +13,11 @@ from apps.comparisons.services import (
     get_sentiment_service,
     get_timeline_service,
     get_score_service,
-    get_llm_service
+    get_llm_service,
+    get_analysis_service,
+    get_job_service,
+    get_matrix_service,
+    get_feasibility_service,
 )
 """
 
@@ -21,14 +25,26 @@ from .sentiment_service import get_sentiment_service, SentimentService
 from .timeline_service import get_timeline_service, TimelineService
 from .score_service import get_score_service, ScoreService
 from .llm_service import get_llm_service, LLMService
+from .analysis_service import get_analysis_service, ComparisonAnalysisService
+from .job_service import get_job_service, AnalysisJobService
+from .matrix_service import get_matrix_service, ReviewMatrixService
+from .feasibility_service import get_feasibility_service, CourseFeasibilityService
 
 __all__ = [
     'get_sentiment_service',
     'get_timeline_service',
     'get_score_service',
     'get_llm_service',
+    'get_analysis_service',
+    'get_job_service',
+    'get_matrix_service',
+    'get_feasibility_service',
     'SentimentService',
     'TimelineService',
-    'ScoreService'
-    'LLMService'
+    'ScoreService',
+    'LLMService',
+    'ComparisonAnalysisService',
+    'AnalysisJobService',
+    'ReviewMatrixService',
+    'CourseFeasibilityService',
 ]
\ No newline at end of file
@@ -0,0 +1,216 @@
+# backend/apps/comparisons/services/analysis_service.py
+
+
+# 개요
+"""
+강좌 비교 분석 / 리뷰 요약 조합 로직 (동기 API와 비동기 작업 공용)
+- get_targets(course_ids)                                        | 강좌 + AI 평가 조회, 누락 강좌 ID
+- iter_results(targets, weekly_hours, user_preferences, user_goal) | 강좌별 분석 결과를 하나씩 생성
+- analyze_course(course, ai_review, match_score, ...)            | 강좌 1개 분석 (감성/타임라인/LLM 코멘트/리뷰 요약)
+- sort_results(results)                                          | 매칭 점수 내림차순 정렬
+- get_review_summary(course_id)                                  | 리뷰 요약 (실패 시 안내 메시지)
+- personalized_comment_fallback / review_summary_fallback        | LLM 실패 시 안내 메시지 (스트리밍 API 공용)
+"""
+
+"""
+[설계 의도]
+- 기존 ComparisonAnalyzeView.post 내부에 있던 강좌별 분석 흐름을 서비스로 분리
+  → 동기 API(ComparisonAnalyzeView)와 비동기 작업(job_service)이 같은 결과를 만들도록 함
+- iter_results는 강좌 1개가 끝날 때마다 결과를 돌려주므로,
+  비동기 작업은 강좌별 섹션을 끝나는 즉시 저장/스트리밍할 수 있음
+
+[상세 고려 사항]
+- LLM 실패 시 fallback 메시지는 기존 View와 동일 (응답 구조 유지)
+- AI 평가가 없는 강좌는 기존과 같이 분석 대상에서 제외
+"""
+
+import logging
+from typing import Dict, Iterator, List, Tuple
+
+from apps.comparisons.models import CourseAIReview
+from apps.courses.models import Course
+from .llm_service import get_llm_service
+from .score_service import get_score_service
+from .sentiment_service import get_sentiment_service
+from .timeline_service import get_timeline_service
+
+logger = logging.getLogger(__name__)
+
+
+class ComparisonAnalysisService:
+    """
+    강좌 비교 분석 조합 서비스
+
+    [설계 의도]
+    - 점수/감성/타임라인/LLM 서비스를 강좌 단위로 조합하는 역할만 담당
+    """
+
+    def get_targets(self, course_ids: List[int]) -> Tuple[List[Tuple[Course, CourseAIReview]], List[int]]:
+        """
+        분석 대상 조회
+
+        Returns:
+            (targets, missing_ids)
+            - targets: [(course, ai_review), ...] | AI 평가가 있는 강좌만
+            - missing_ids: 존재하지 않는 강좌 ID 목록
+        """
+        # select_related('ai_review'): Course → CourseAIReview(OneToOne) 조인으로 N+1 방지
+        courses = list(Course.objects.filter(id__in=course_ids).select_related('ai_review'))
+        missing_ids = sorted(set(course_ids) - {course.id for course in courses})
+
+        targets = []
+        for course in courses:
+            try:
+                targets.append((course, course.ai_review))
+            except CourseAIReview.DoesNotExist:
+                # NOTE AI 평가가 없는 강좌는 스킵
+                continue
+        return targets, missing_ids
+
+    def iter_results(self, targets, weekly_hours: int, user_preferences: Dict, user_goal: str) -> Iterator[Dict]:
+        """
+        강좌별 분석 결과를 하나씩 생성
+
+        - 매칭 점수는 전체 대상에 대해 한 번에 계산 (평점 행렬 × 선호도 벡터)
+        - 이후 강좌마다 analyze_course 결과를 바로 yield
+        """
+        score_service = get_score_service()
+        match_scores = score_service.calculate_match_scores(
+            [
+                [getattr(ai_review, field) for field in score_service.MATCHING_FIELDS]
+                for _, ai_review in targets
+            ],
+            user_preferences
+        )
+
+        for (course, ai_review), match_score in zip(targets, match_scores):
+            yield self.analyze_course(
+                course=course,
+                ai_review=ai_review,
+                match_score=float(match_score),
+                weekly_hours=weekly_hours,
+                user_goal=user_goal,
+            )
+
+    def analyze_course(self, course, ai_review, match_score: float, weekly_hours: int, user_goal: str) -> Dict:
+        """
+        강좌 1개 분석
+
+        Returns:
+            dict: ComparisonResultSerializer 입력 형식
+        """
+        llm_service = get_llm_service()
+
+        # 1. 감성분석 수행
+        sentiment_result = get_sentiment_service().analyze_course_reviews(course_id=course.id)
+
+        # 2. 타임라인 시뮬레이션
+        timeline_result = get_timeline_service().calculate_timeline(
+            course=course,
+            weekly_hours=weekly_hours
+        )
+
+        # 3. 맞춤 코멘트 생성
+        try:
+            personalized_comment = llm_service.generate_personalized_comment(
+                course=course,
+                ai_review=ai_review,
+                user_goal=user_goal,
+            )
+        # 네트워크 오류, 타임아웃, API 제한 초과, JSON 파싱 오류 등 포괄 처리
+        except Exception as e:
+            logger.warning(
+                f'맞춤 코멘트 생성 실패 (Course {course.id}): {str(e)}',
+                exc_info=True
+            )
+            # 전체 요청을 실패시키지 않고 안내 메시지 제공 (graceful fallback)
+            personalized_comment = self.personalized_comment_fallback(course)
+
+        # 4. 리뷰 요약 생성
+        try:
+            review_summary = llm_service.generate_review_summary(course_id=course.id)
+        except Exception as e:
+            logger.warning(
+                f'리뷰 요약 생성 실패 (Course {course.id}): {str(e)}',
+                exc_info=True
+            )
+            review_summary = {
+                'course_id': course.id,
+                'course_name': course.name,
+                'review_summary': {
+                    'summary': '현재 리뷰 요약을 생성할 수 없습니다. 잠시 후 다시 시도해주세요.',
+                    'pros': [],
+                    'cons': []
+                },
+                'review_count': 0,
+                'reliability': 'low',
+                'warning_message': '리뷰 요약 생성에 실패했습니다.'
+            }
+
+        # 5. 결과 데이터 구성
+        return {
+            'course': course,
+            'ai_review': ai_review,
+            'match_score': match_score,
+            'sentiment': sentiment_result,
+            'timeline': timeline_result,
+            'personalized_comment': personalized_comment,
+            'review_summary': review_summary
+        }
+
+    @staticmethod
+    def sort_results(results: List[Dict]) -> List[Dict]:
+        """매칭 점수 기준 내림차순 정렬 (점수가 높은 강좌가 먼저)"""
+        return sorted(results, key=lambda x: x['match_score'], reverse=True)
+
+    def get_review_summary(self, course_id: int) -> Dict:
+        """
+        리뷰 요약 (CourseReviewSummaryView 응답용)
+
+        - LLM 호출 실패 시 500 대신 안내 메시지 반환
+        """
+        try:
+            return get_llm_service().generate_review_summary(course_id=course_id)
+        except Exception as e:
+            logger.error(
+                f'리뷰 요약 생성 실패 (Course {course_id}): {str(e)}',
+                exc_info=True
+            )
+            return self.review_summary_fallback()
+
+    @staticmethod
+    def personalized_comment_fallback(course) -> Dict:
+        """맞춤 코멘트 생성 실패 시 안내 메시지 (UI에서 강좌 이름은 보여줄 수 있도록 유지)"""
+        return {
+            'course_id': course.id,
+            'course_name': course.name,
+            'recommendation_reason': '현재 개인화 추천을 생성할 수 없습니다. 잠시 후 다시 시도해주세요.',
+            'key_points': []
+        }
+
+    @staticmethod
+    def review_summary_fallback() -> Dict:
+        """리뷰 요약 생성 실패 시 안내 메시지 (CourseReviewSummaryView 응답 형식)"""
+        return {
+            'summary': '일시적으로 리뷰 요약을 제공할 수 없습니다. 잠시 후 다시 시도해주세요.',
+            'review_count': 0,
+            'reliability': 'low',
+            'warning_message': 'LLM 서비스 일시적 오류가 발생했습니다'
+        }
+
+
+# =========================
+# 싱글톤 인스턴스 관리
+# =========================
+
+_analysis_service_instance = None
+
+
+def get_analysis_service() -> ComparisonAnalysisService:
+    """ComparisonAnalysisService 싱글톤 인스턴스 반환"""
+    global _analysis_service_instance
+
+    if _analysis_service_instance is None:
+        _analysis_service_instance = ComparisonAnalysisService()
+
+    return _analysis_service_instance
@@ -0,0 +1,276 @@
+# backend/apps/comparisons/services/feasibility_service.py
+
+
+# 개요
+"""
+"주 N시간으로 들을 수 있는 강좌" 필터 (수강신청 기간 카탈로그 전체)
+- FeasibilityGrid                                  | 강좌 × weekly_hours 상태/비율 행렬 스냅샷 (.npz 저장/로드)
+- CourseFeasibilityService.build_grid(today)       | 수강신청 중인 강좌 전체 행렬 계산 (TimelineService 벡터화 API)
+- CourseFeasibilityService.save_grid(grid)         | 야간 사전 계산 결과 저장 (precompute_timeline_grid 커맨드)
+- CourseFeasibilityService.get_grid()              | 오늘자 행렬 조회 (파일 → 없으면 즉시 계산)
+- CourseFeasibilityService.feasible_courses(...)   | weekly_hours 기준 수강 가능 강좌 필터/정렬/페이지
+- get_feasibility_service()                        | 싱글톤 인스턴스 반환
+"""
+
+"""
+[설계 의도]
+- 타임라인 판정은 강좌 1개 × weekly_hours 1개 단위 → 카탈로그 전체 필터에는 사용할 수 없음
+- 판정 결과는 "오늘 날짜"와 강좌 정보에만 의존 → 하루 한 번 전체 행렬을 미리 계산해 두고
+  요청은 weekly_hours 열 하나를 읽어 마스킹/정렬만 수행
+
+[상세 고려 사항]
+- 대상: 수강신청 기간인 강좌 (enrollment_start <= 오늘 <= enrollment_end, 날짜가 없으면 제한 없음으로 간주)
+- 행렬: weekly_hours 1~TIMELINE_GRID_MAX_HOURS 열 (status int8, ratio float64 반올림 전 값)
+  - 범위를 벗어난 weekly_hours는 같은 열 데이터(min_hours_per_week)로 즉시 계산
+- 저장: TIMELINE_GRID_PATH (.npz), 임시 파일에 쓴 뒤 os.replace로 교체 → 읽는 쪽은 항상 완성된 파일만 봄
+- 로드: 파일 수정 시각이 바뀌면 다시 로드 (gunicorn 워커별 메모리)
+- 기준일(as_of)이 오늘이 아니면(야간 작업 누락 등) DB에서 즉시 계산해 메모리에만 보관
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.courses.models import Course
+from .timeline_service import get_timeline_service
+
+logger = logging.getLogger(__name__)
+
+# =========================
+# 행렬 설정 상수
+# =========================
+
+TIMELINE_GRID_PATH = Path(os.environ.get(
+    'TIMELINE_GRID_PATH',
+    Path(settings.BASE_DIR).parent / 'data' / 'cache' / 'timeline_grid.npz'
+))
+TIMELINE_GRID_MAX_HOURS = int(os.environ.get('TIMELINE_GRID_MAX_HOURS', 40))  # 사전 계산 weekly_hours 상한
+
+
+class FeasibilityGrid:
+    """
+    강좌 × weekly_hours 타임라인 행렬 (읽기 전용)
+
+    Attributes:
+        as_of: 기준일 (date)
+        course_ids: (N,) int64
+        categories: (N,) str | 대분류 (없으면 빈 문자열)
+        weekly_hours: (H,) int64
+        min_hours_per_week / total_weeks / remaining_weeks: (N,)
+        ratio: (N×H) float64 (반올림 전, 응답 시 round), status: (N×H) int8
+    """
+
+    ARRAYS = (
+        'course_ids', 'categories', 'weekly_hours',
+        'min_hours_per_week', 'total_weeks', 'remaining_weeks', 'ratio', 'status',
+    )
+
+    def __init__(self, as_of, **arrays):
+        self.as_of = as_of
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+
+    def __len__(self):
+        return len(self.course_ids)
+
+    def save(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp.npz')
+        np.savez_compressed(
+            tmp_path,
+            as_of=np.array(self.as_of.isoformat()),
+            **{name: getattr(self, name) for name in self.ARRAYS}
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> 'FeasibilityGrid':
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                as_of=date.fromisoformat(str(data['as_of'])),
+                **{name: data[name] for name in cls.ARRAYS}
+            )
+
+
+class CourseFeasibilityService:
+    """
+    수강 가능 강좌 필터 서비스
+
+    [설계 의도]
+    - 판정 규칙은 TimelineService와 공용 (비교 분석 화면의 타임라인과 같은 결과)
+    """
+
+    def __init__(self, path: Path = TIMELINE_GRID_PATH, max_hours: int = TIMELINE_GRID_MAX_HOURS):
+        self.path = Path(path)
+        self.max_hours = max_hours
+        self._grid: Optional[FeasibilityGrid] = None
+        self._loaded_mtime: Optional[float] = None
+        self._lock = threading.Lock()
+
+    # =========================
+    # 행렬 생성 / 저장 / 조회
+    # =========================
+
+    @staticmethod
+    def open_enrollment_queryset(today):
+        """수강신청 기간인 강좌 (시작/종료일이 없으면 해당 조건은 제한 없음)"""
+        return Course.objects.filter(
+            Q(enrollment_start__isnull=True) | Q(enrollment_start__lte=today),
+            Q(enrollment_end__isnull=True) | Q(enrollment_end__gte=today),
+        )
+
+    def build_grid(self, today=None) -> FeasibilityGrid:
+        """
+        수강신청 중인 강좌 전체 × weekly_hours(1~max_hours) 행렬 계산
+
+        - values_list 1회 조회 + TimelineService 벡터화 계산 1회
+        """
+        today = today or timezone.now().date()
+        timeline_service = get_timeline_service()
+
+        rows = list(
+            self.open_enrollment_queryset(today)
+            .order_by('id')
+            .values_list('id', 'course_playtime', 'week', 'study_end', 'classfy_name')
+        )
+        columns = timeline_service.timeline_columns([row[1:4] for row in rows], today=today)
+        grid = timeline_service.timeline_grid(columns, np.arange(1, self.max_hours + 1))
+
+        return FeasibilityGrid(
+            as_of=today,
+            course_ids=np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows)),
+            categories=np.array([row[4] or '' for row in rows], dtype=str),
+            **{name: grid[name] for name in FeasibilityGrid.ARRAYS if name in grid}
+        )
+
+    def save_grid(self, grid: FeasibilityGrid):
+        grid.save(self.path)
+        with self._lock:
+            self._grid = grid
+            self._loaded_mtime = self.path.stat().st_mtime
+
+    def get_grid(self) -> FeasibilityGrid:
+        """
+        오늘자 행렬 조회
+
+        1. 저장 파일이 바뀌었으면 다시 로드
+        2. 메모리 행렬의 기준일이 오늘이 아니면 즉시 계산 (다음 야간 작업 전까지 메모리에만 보관)
+        """
+        today = timezone.now().date()
+        with self._lock:
+            self._reload_if_changed()
+            if self._grid is None or self._grid.as_of != today:
+                started_at = time.perf_counter()
+                self._grid = self.build_grid(today)
+                logger.info(
+                    f'타임라인 행렬 즉시 계산: {len(self._grid)}개 강좌, '
+                    f'{(time.perf_counter() - started_at) * 1000:.1f}ms'
+                )
+            return self._grid
+
+    def _reload_if_changed(self):
+        try:
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            return
+        if mtime == self._loaded_mtime:
+            return
+        try:
+            self._grid = FeasibilityGrid.load(self.path)
+            self._loaded_mtime = mtime
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f'타임라인 행렬 파일 로드 실패 ({self.path}): {str(e)}')
+            self._loaded_mtime = mtime
+
+    # =========================
+    # 필터
+    # =========================
+
+    def feasible_courses(
+        self,
+        weekly_hours: int,
+        statuses: Sequence[str],
+        classfy_name: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Dict:
+        """
+        weekly_hours 기준 수강 가능 강좌
+
+        Args:
+            weekly_hours: 주당 학습 가능 시간
+            statuses: 포함할 상태값 (예: ['적정', '널널'])
+            classfy_name: 대분류 필터 (선택)
+
+        Returns:
+            dict: {
+                'as_of': 기준일, 'count': 조건에 맞는 강좌 수,
+                'results': [{'course': Course, 'timeline': dict}, ...]  # 학습 강도(ratio) 오름차순
+            }
+        """
+        timeline_service = get_timeline_service()
+        grid = self.get_grid()
+
+        # 1. weekly_hours 열 선택 (사전 계산 범위 밖이면 같은 규칙으로 열 1개만 계산)
+        columns = {
+            'min_hours_per_week': grid.min_hours_per_week,
+            'total_weeks': grid.total_weeks,
+            'remaining_weeks': grid.remaining_weeks,
+        }
+        column_index = np.flatnonzero(grid.weekly_hours == weekly_hours)
+        if len(column_index):
+            column = int(column_index[0])
+            view = dict(columns, ratio=grid.ratio[:, column:column + 1], status=grid.status[:, column:column + 1])
+        else:
+            view = timeline_service.timeline_grid(columns, [weekly_hours])
+        ratio = view['ratio'][:, 0]
+        status_codes = view['status'][:, 0]
+
+        # 2. 상태/분류 마스킹
+        codes = [timeline_service.STATUS_LABELS.index(label) for label in statuses]
+        mask = np.isin(status_codes, codes)
+        if classfy_name:
+            mask &= grid.categories == classfy_name
+        matched = np.flatnonzero(mask)
+
+        # 3. 학습 강도 오름차순 (같으면 course_id 순) → 페이지만 조회
+        order = matched[np.lexsort((grid.course_ids[matched], ratio[matched]))]
+        page = order[offset:offset + limit]
+
+        page_ids = grid.course_ids[page].tolist()
+        courses = Course.objects.defer('embedding').in_bulk(page_ids)
+
+        results = []
+        for row, course_id in zip(page.tolist(), page_ids):
+            course = courses.get(course_id)
+            if course is None:
+                continue  # 사전 계산 이후 삭제된 강좌
+            results.append({'course': course, 'timeline': timeline_service.grid_entry(view, row, 0)})
+
+        return {'as_of': grid.as_of, 'count': len(matched), 'results': results}
+
+
+# =========================
+# 싱글톤 인스턴스 관리
+# =========================
+
+_feasibility_service_instance = None
+
+
+def get_feasibility_service() -> CourseFeasibilityService:
+    """CourseFeasibilityService 싱글톤 인스턴스 반환"""
+    global _feasibility_service_instance
+
+    if _feasibility_service_instance is None:
+        _feasibility_service_instance = CourseFeasibilityService()
+
+    return _feasibility_service_instance
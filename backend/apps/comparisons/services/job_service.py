@@ -0,0 +1,397 @@
+# backend/apps/comparisons/services/job_service.py
+
+
+# 개요
+"""
+LLM 기반 분석 작업(AnalysisJob) 등록/실행 서비스
+- submit(kind, payload, user)        | 작업 등록 후 즉시 반환 (실행 모드에 따라 스레드 실행 예약)
+- run(job_id)                        | 작업 1개 실행 (섹션별 결과 누적 저장)
+- claim_next()                       | 대기 작업 1개 선점 (워커 컨테이너 모드)
+- requeue_stale(stale_after)         | 실행 중 멈춘 작업 재등록 / 재시도 초과 시 실패 처리
+- purge(retention_days)              | 오래된 완료 작업 삭제
+- iter_events(job_id, last_event_id) | SSE 스트림 이벤트 (새 섹션 → 완료)
+"""
+
+"""
+[설계 의도]
+- ComparisonAnalyzeView / CourseReviewSummaryView는 LLM 응답을 기다리는 동안 gunicorn 워커를 수십 초 점유
+  → 요청은 작업 등록만 하고 job id를 즉시 반환, LLM 호출은 웹 요청 밖에서 수행
+- 결과는 강좌(섹션)별로 끝나는 즉시 DB에 누적 → 폴링/SSE 스트림에서 부분 결과 조회
+
+[상세 고려 사항]
+- 실행 모드 (환경변수 ANALYSIS_JOB_RUNNER)
+  - inprocess(기본): 웹 프로세스 내 스레드 풀에서 실행 | 별도 인프라 없이 동작
+  - worker: 작업만 등록, `python manage.py run_analysis_jobs` 워커 컨테이너가 실행
+- 별도 큐(Redis/Celery) 없이 DB 테이블을 큐로 사용
+  - 선점은 select_for_update(skip_locked=True) → 워커 여러 개가 같은 작업을 가져가지 않음
+- 스레드 실행 시 작업마다 DB 연결을 닫아 연결 누수 방지
+- inprocess 모드 재시작 복구: 스레드 풀을 처음 만들 때(첫 등록 또는 첫 SSE 스트림)와 이후 등록/스트림 요청 시
+  RECOVERY_INTERVAL마다 멈춘 running 작업을 재등록하고, 대기 작업을 선점해 실행
+  (gunicorn 재시작으로 끊긴 작업을 워커 컨테이너 없이 이어서 처리)
+  - 스레드 실행도 pending → running 조건부 UPDATE로 선점 → 여러 웹 워커가 같은 작업을 중복 실행하지 않음
+- 작업 등록은 transaction.on_commit 이후 실행 예약 (커밋 전 조회 방지)
+- 설정(환경변수)
+  - ANALYSIS_JOB_RUNNER: inprocess | worker (기본 inprocess)
+  - ANALYSIS_JOB_THREADS: inprocess 모드 스레드 수 (기본 4)
+  - ANALYSIS_JOB_MAX_ATTEMPTS: 멈춘 작업 최대 재시도 횟수 (기본 2)
+  - ANALYSIS_JOB_STALE_AFTER: running 상태로 이 시간(초) 이상 갱신이 없으면 멈춘 작업으로 판단 (기본 600)
+  - ANALYSIS_JOB_STREAM_TIMEOUT: SSE 연결 1회 최대 유지 시간(초) (기본 120, 이후 클라이언트가 Last-Event-ID로 재연결)
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.comparisons.models import AnalysisJob
+from apps.comparisons.serializers import ComparisonResultSerializer, ReviewSummarySerializer
+from .analysis_service import get_analysis_service
+
+logger = logging.getLogger(__name__)
+
+# =========================
+# 실행 설정 상수
+# =========================
+
+RUNNER_INPROCESS = 'inprocess'
+RUNNER_WORKER = 'worker'
+
+ANALYSIS_JOB_RUNNER = os.environ.get('ANALYSIS_JOB_RUNNER', RUNNER_INPROCESS)
+ANALYSIS_JOB_THREADS = int(os.environ.get('ANALYSIS_JOB_THREADS', 4))
+ANALYSIS_JOB_MAX_ATTEMPTS = int(os.environ.get('ANALYSIS_JOB_MAX_ATTEMPTS', 2))
+ANALYSIS_JOB_STALE_AFTER = int(os.environ.get('ANALYSIS_JOB_STALE_AFTER', 600))
+ANALYSIS_JOB_STREAM_TIMEOUT = int(os.environ.get('ANALYSIS_JOB_STREAM_TIMEOUT', 120))
+RECOVERY_INTERVAL = 60       # inprocess 모드 멈춘/대기 작업 복구 주기 (초)
+STREAM_POLL_INTERVAL = 0.5   # SSE 스트림의 작업 상태 확인 주기 (초)
+STREAM_HEARTBEAT = 15        # 변화가 없을 때 keep-alive 전송 주기 (초) | 프록시 유휴 연결 종료 방지
+
+
+# =========================
+# 작업 종류별 실행 함수
+# - handler(job, emit): 섹션 결과마다 emit(section) 호출, 최종 결과(dict) 반환
+# =========================
+
+def run_comparison_job(job: AnalysisJob, emit: Callable[[Dict], None]) -> Dict:
+    """강좌 비교 분석 | 강좌별 섹션 → 최종 results(매칭 점수 내림차순)"""
+    payload = job.payload
+    service = get_analysis_service()
+    targets, _ = service.get_targets(payload['course_ids'])
+    job.total = len(targets)
+    job.save(update_fields=['total', 'updated_at'])
+
+    sections = []
+    for result_data in service.iter_results(
+        targets,
+        weekly_hours=payload['weekly_hours'],
+        user_preferences=payload['user_preferences'],
+        user_goal=payload['user_goal'],
+    ):
+        section = dict(ComparisonResultSerializer(result_data).data)
+        sections.append(section)
+        emit(section)
+
+    return {'results': sorted(sections, key=lambda x: x['match_score'], reverse=True)}
+
+
+def run_review_summary_job(job: AnalysisJob, emit: Callable[[Dict], None]) -> Dict:
+    """강좌 리뷰 요약 | 섹션 1개 (ReviewSummarySerializer 형식)"""
+    job.total = 1
+    job.save(update_fields=['total', 'updated_at'])
+
+    summary = dict(ReviewSummarySerializer(
+        get_analysis_service().get_review_summary(job.payload['course_id'])
+    ).data)
+    emit(summary)
+    return summary
+
+
+JOB_HANDLERS = {
+    AnalysisJob.KIND_COMPARISON: run_comparison_job,
+    AnalysisJob.KIND_REVIEW_SUMMARY: run_review_summary_job,
+}
+
+
+class AnalysisJobService:
+    """
+    분석 작업 등록/실행 서비스
+
+    [설계 의도]
+    - View는 submit만 호출, 실행 위치(스레드/워커 컨테이너)는 서비스가 결정
+    """
+
+    def __init__(self, runner: str = ANALYSIS_JOB_RUNNER, threads: int = ANALYSIS_JOB_THREADS):
+        self.runner = runner
+        self.threads = threads
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._recovering = False
+        self._recovered_at: Optional[float] = None
+
+    # =========================
+    # 등록
+    # =========================
+
+    def submit(self, kind: str, payload: Dict, user=None) -> AnalysisJob:
+        """
+        작업 등록
+
+        - inprocess 모드: 커밋 이후 스레드 풀에 실행 예약
+        - worker 모드: pending 상태로 저장만 (워커가 선점)
+        """
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f'알 수 없는 작업 종류: {kind}')
+
+        job = AnalysisJob.objects.create(
+            kind=kind,
+            payload=payload,
+            user=user if user is not None and user.is_authenticated else None,
+        )
+        if self.runner == RUNNER_INPROCESS:
+            transaction.on_commit(lambda: self._submit_to_executor(job.id))
+        return job
+
+    def _submit_to_executor(self, job_id):
+        self._get_executor().submit(self._run_in_thread, job_id)
+        self._schedule_recovery()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.threads,
+                    thread_name_prefix='analysis-job',
+                )
+            return self._executor
+
+    def _schedule_recovery(self):
+        """프로세스 첫 호출 또는 RECOVERY_INTERVAL 경과 시 복구 작업 예약 (동시에 1개만)"""
+        executor = self._get_executor()
+        with self._executor_lock:
+            if self._recovering:
+                return
+            if self._recovered_at is not None and time.monotonic() - self._recovered_at < RECOVERY_INTERVAL:
+                return
+            self._recovering = True
+            self._recovered_at = time.monotonic()
+        executor.submit(self._resume_pending)
+
+    def _run_in_thread(self, job_id):
+        close_old_connections()
+        try:
+            # 복구 중인 다른 프로세스가 먼저 선점했으면 건너뜀
+            if self._claim(job_id):
+                self.run(job_id)
+        finally:
+            connection.close()
+
+    def _resume_pending(self):
+        """
+        inprocess 모드 재시작 복구
+
+        - 멈춘 running 작업 재등록 (requeue_stale) 후 대기 작업을 하나씩 선점해 실행
+        - 선점(claim_next)은 skip_locked → 동시에 시작한 다른 웹 워커와 나눠 처리
+        """
+        close_old_connections()
+        try:
+            stale = self.requeue_stale(ANALYSIS_JOB_STALE_AFTER)
+            if stale['requeued'] or stale['failed']:
+                logger.info(f'분석 작업 복구: 재등록 {stale["requeued"]}건, 실패 처리 {stale["failed"]}건')
+
+            while True:
+                job = self.claim_next()
+                if job is None:
+                    break
+                self.run(job)
+        except Exception as e:
+            logger.error(f'분석 작업 복구 실패: {e}', exc_info=True)
+        finally:
+            self._recovering = False
+            connection.close()
+
+    # =========================
+    # 선점 (워커 컨테이너 모드)
+    # =========================
+
+    def claim_next(self) -> Optional[AnalysisJob]:
+        """가장 오래된 대기 작업 1개를 running으로 바꾸고 반환 (없으면 None)"""
+        with transaction.atomic():
+            job = (
+                AnalysisJob.objects
+                .select_for_update(skip_locked=True)
+                .filter(status=AnalysisJob.STATUS_PENDING)
+                .order_by('created_at')
+                .first()
+            )
+            if job is None:
+                return None
+            self._mark_running(job)
+            return job
+
+    @staticmethod
+    def _claim(job_id) -> bool:
+        """지정한 대기 작업을 running으로 전환 (조건부 UPDATE, 이미 선점되었으면 False)"""
+        now = timezone.now()
+        return bool(
+            AnalysisJob.objects
+            .filter(pk=job_id, status=AnalysisJob.STATUS_PENDING)
+            .update(status=AnalysisJob.STATUS_RUNNING, started_at=now, attempts=F('attempts') + 1, updated_at=now)
+        )
+
+    @staticmethod
+    def _mark_running(job: AnalysisJob):
+        job.status = AnalysisJob.STATUS_RUNNING
+        job.started_at = timezone.now()
+        job.attempts += 1
+        job.save(update_fields=['status', 'started_at', 'attempts', 'updated_at'])
+
+    # =========================
+    # 실행
+    # =========================
+
+    def run(self, job_or_id) -> AnalysisJob:
+        """
+        작업 1개 실행
+
+        [처리 흐름]
+        1. pending이면 running으로 전환 (inprocess 모드, 워커는 claim_next에서 전환)
+        2. 종류별 handler 실행 | 섹션마다 result['sections']에 누적 저장
+        3. 최종 결과 저장 후 succeeded / 예외 시 failed + 오류 메시지
+        """
+        job = job_or_id if isinstance(job_or_id, AnalysisJob) else AnalysisJob.objects.get(pk=job_or_id)
+        if job.is_finished:
+            return job
+        if job.status == AnalysisJob.STATUS_PENDING:
+            self._mark_running(job)
+
+        job.result = {'sections': []}
+        job.completed = 0
+
+        def emit(section: Dict):
+            job.result['sections'].append(section)
+            job.completed = len(job.result['sections'])
+            job.save(update_fields=['result', 'completed', 'updated_at'])
+
+        try:
+            final = JOB_HANDLERS[job.kind](job, emit)
+        except Exception as e:
+            logger.error(f'분석 작업 실패 ({job.kind} {job.id}): {e}', exc_info=True)
+            job.status = AnalysisJob.STATUS_FAILED
+            job.error = str(e)[:1000]
+        else:
+            job.status = AnalysisJob.STATUS_SUCCEEDED
+            job.result = {**job.result, **final}
+
+        job.finished_at = timezone.now()
+        job.save(update_fields=['status', 'result', 'error', 'finished_at', 'updated_at'])
+        return job
+
+    # =========================
+    # 스트리밍
+    # =========================
+
+    def iter_events(self, job_id, last_event_id: int = 0,
+                    timeout: int = ANALYSIS_JOB_STREAM_TIMEOUT) -> Iterator[Tuple[Optional[str], Optional[int], Optional[Dict]]]:
+        """
+        SSE 이벤트 생성
+
+        [처리 흐름]
+        1. STREAM_POLL_INTERVAL마다 (status, completed)만 조회 (result JSON은 새 섹션이 있을 때만 로드)
+        2. 새 섹션마다 ('section', 섹션 번호, {index, total, data})
+        3. 작업 종료 시 ('done', None, {status, error}) 후 종료
+        4. timeout 경과 시 ('timeout', None, {status}) 후 종료 → 클라이언트는 Last-Event-ID로 이어받기
+        - 변화 없이 STREAM_HEARTBEAT초가 지나면 (None, None, None) | View가 keep-alive 주석 전송
+
+        Args:
+            last_event_id: 이미 받은 마지막 섹션 번호 (SSE Last-Event-ID, 1부터 시작)
+        """
+        if self.runner == RUNNER_INPROCESS:
+            self._schedule_recovery()  # 재시작 직후 첫 요청이 스트림 재연결이어도 남은 작업 복구 시작
+
+        sent = max(last_event_id, 0)
+        deadline = time.monotonic() + timeout
+        last_sent_at = time.monotonic()
+        queryset = AnalysisJob.objects.filter(pk=job_id)
+
+        while True:
+            state = queryset.values('status', 'completed').first()
+            if state is None:
+                return
+            finished = state['status'] in AnalysisJob.FINISHED_STATUSES
+
+            if state['completed'] > sent or finished:
+                job = queryset.only('status', 'result', 'total', 'error').first()
+                sections = (job.result or {}).get('sections', [])
+                for index in range(sent, len(sections)):
+                    yield 'section', index + 1, {'index': index + 1, 'total': job.total, 'data': sections[index]}
+                    last_sent_at = time.monotonic()
+                sent = max(sent, len(sections))
+                if job.is_finished:
+                    yield 'done', None, {'status': job.status, 'error': job.error or None}
+                    return
+
+            now = time.monotonic()
+            if now >= deadline:
+                yield 'timeout', None, {'status': state['status']}
+                return
+            if now - last_sent_at >= STREAM_HEARTBEAT:
+                yield None, None, None
+                last_sent_at = now
+            time.sleep(STREAM_POLL_INTERVAL)
+
+    # =========================
+    # 관리
+    # =========================
+
+    def requeue_stale(self, stale_after: int = ANALYSIS_JOB_STALE_AFTER, max_attempts: int = ANALYSIS_JOB_MAX_ATTEMPTS) -> Dict[str, int]:
+        """
+        실행 중 상태로 멈춘 작업 처리 (워커 중단 등)
+
+        - 마지막 갱신 후 stale_after초가 지난 running 작업
+          - 시도 횟수가 max_attempts 미만이면 pending으로 재등록
+          - 아니면 failed 처리
+        """
+        cutoff = timezone.now() - timedelta(seconds=stale_after)
+        stale = AnalysisJob.objects.filter(status=AnalysisJob.STATUS_RUNNING, updated_at__lt=cutoff)
+        requeued = stale.filter(attempts__lt=max_attempts).update(
+            status=AnalysisJob.STATUS_PENDING, updated_at=timezone.now()
+        )
+        failed = stale.update(
+            status=AnalysisJob.STATUS_FAILED,
+            error='작업이 제한 시간 내에 완료되지 않았습니다.',
+            finished_at=timezone.now(),
+            updated_at=timezone.now(),
+        )
+        return {'requeued': requeued, 'failed': failed}
+
+    def purge(self, retention_days: int) -> int:
+        """retention_days일이 지난 완료 작업 삭제"""
+        cutoff = timezone.now() - timedelta(days=retention_days)
+        deleted, _ = AnalysisJob.objects.filter(
+            status__in=AnalysisJob.FINISHED_STATUSES,
+            finished_at__lt=cutoff,
+        ).delete()
+        return deleted
+
+
+# =========================
+# 싱글톤 인스턴스 관리
+# =========================
+
+_job_service_instance = None
+
+
+def get_job_service() -> AnalysisJobService:
+    """AnalysisJobService 싱글톤 인스턴스 반환"""
+    global _job_service_instance
+
+    if _job_service_instance is None:
+        _job_service_instance = AnalysisJobService()
+
+    return _job_service_instance
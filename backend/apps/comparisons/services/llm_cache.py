@@ -0,0 +1,268 @@
+# backend/apps/comparisons/services/llm_cache.py
+
+
+# 개요
+"""
+AI 맞춤 코멘트(generate_personalized_comment) 응답 캐시
+- normalize_goal(text)           | 학습 목적 정규화 (캐시 키용)
+- comment_cache_bucket(...)      | (강좌, AI 평가 수정 시각, 프롬프트 버전, 모델) 버킷 키
+- LLMResponseCache               | TTL + LRU 정확 일치 캐시 + 선택적 의미 유사도 캐시
+- get_comment_cache()            | 싱글톤 인스턴스 반환
+"""
+
+"""
+[설계 의도]
+- 강좌 비교 분석은 비교 대상 강좌마다 LLM을 1회씩 호출 → 응답 시간·비용의 대부분
+- 사용자들이 입력하는 학습 목적은 거의 같은 문장이 많음 (예: "비전공자 데이터 분석가")
+  → (강좌, 정규화된 학습 목적)이 같으면 이전 응답을 재사용해 LLM 호출 생략
+
+[상세 고려 사항]
+- 캐시 키: (course_id, CourseAIReview.updated_at, 정규화된 학습 목적, 프롬프트 버전, 모델)
+  - AI 평가가 재생성되거나 프롬프트/모델이 바뀌면 키가 달라져 자동으로 무효화
+- 정규화: NFKC → 소문자 → 문장부호 제거 → 연속 공백 1칸
+  ("비전공자, 데이터 분석가!" == "비전공자 데이터  분석가")
+- 정확 일치 캐시: 항목별 만료 시각(TTL) + 최대 항목 수 초과 시 가장 오래 사용되지 않은 항목 제거(LRU)
+- 의미 유사도 캐시(선택, 기본 비활성):
+  - 같은 버킷(강좌/AI 평가/프롬프트/모델) 안에서만 비교 → 다른 강좌의 응답이 섞이지 않음
+  - 학습 목적 임베딩의 코사인 유사도가 임계값 이상이면 가장 유사한 응답 재사용
+  - 버킷당 최근 학습 목적 N개만 유지 (비교 비용 상한)
+- 프로세스 메모리 캐시 (gunicorn 워커별) | 외부 의존성 없이 동작, 재시작 시 비워짐
+- 설정(환경변수)
+  - LLM_COMMENT_CACHE_SIZE: 최대 항목 수 (기본 5000, 0이면 캐시 사용 안 함)
+  - LLM_COMMENT_CACHE_TTL: 항목 유효 시간(초) (기본 86400)
+  - LLM_COMMENT_SEMANTIC_THRESHOLD: 의미 유사도 임계값 (예: 0.93, 미설정 시 의미 캐시 비활성)
+  - LLM_COMMENT_SEMANTIC_BUCKET_SIZE: 버킷당 의미 비교 대상 최대 개수 (기본 50)
+"""
+
+import copy
+import hashlib
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# =========================
+# 캐시 설정 상수
+# =========================
+
+LLM_COMMENT_CACHE_SIZE = int(os.environ.get('LLM_COMMENT_CACHE_SIZE', 5000))
+LLM_COMMENT_CACHE_TTL = int(os.environ.get('LLM_COMMENT_CACHE_TTL', 60 * 60 * 24))
+LLM_COMMENT_SEMANTIC_THRESHOLD = (
+    float(os.environ['LLM_COMMENT_SEMANTIC_THRESHOLD'])
+    if os.environ.get('LLM_COMMENT_SEMANTIC_THRESHOLD') else None
+)
+LLM_COMMENT_SEMANTIC_BUCKET_SIZE = int(os.environ.get('LLM_COMMENT_SEMANTIC_BUCKET_SIZE', 50))
+
+# 학습 목적 임베딩 메모이제이션 최대 개수 (같은 비교 요청의 강좌 N개가 임베딩 1회 공유)
+GOAL_EMBEDDING_CACHE_SIZE = 1000
+
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_goal(text: str) -> str:
+    """학습 목적 정규화 (NFKC, 소문자, 문장부호 제거, 공백 정리)"""
+    text = unicodedata.normalize('NFKC', text or '').lower()
+    text = _PUNCTUATION_RE.sub(' ', text)
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def comment_cache_bucket(course_id: int, review_updated_at, prompt_version: str, model: str) -> str:
+    """강좌 + AI 평가 버전 + 프롬프트 버전 + 모델 조합 (의미 캐시 비교 범위)"""
+    updated = review_updated_at.isoformat() if review_updated_at else 'none'
+    return f'{course_id}|{updated}|{prompt_version}|{model}'
+
+
+def _entry_key(bucket: str, goal: str) -> str:
+    return hashlib.blake2b(f'{bucket}|{goal}'.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    TTL + LRU 응답 캐시 (정확 일치 + 선택적 의미 유사도)
+
+    Args:
+        max_entries: 최대 항목 수 (0이면 캐시 사용 안 함)
+        ttl: 항목 유효 시간(초)
+        semantic_threshold: 코사인 유사도 임계값 (None이면 의미 캐시 비활성)
+        semantic_bucket_size: 버킷당 의미 비교 대상 최대 개수
+    """
+
+    def __init__(self, max_entries: int = LLM_COMMENT_CACHE_SIZE, ttl: int = LLM_COMMENT_CACHE_TTL,
+                 semantic_threshold: Optional[float] = LLM_COMMENT_SEMANTIC_THRESHOLD,
+                 semantic_bucket_size: int = LLM_COMMENT_SEMANTIC_BUCKET_SIZE):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.semantic_threshold = semantic_threshold
+        self.semantic_bucket_size = semantic_bucket_size
+
+        # entry_key → (만료 시각, bucket, 응답)
+        self._entries: 'OrderedDict[str, Tuple[float, str, Dict]]' = OrderedDict()
+        # bucket → {entry_key: 정규화된 임베딩}
+        self._semantic: Dict[str, 'OrderedDict[str, np.ndarray]'] = {}
+        # 정규화된 학습 목적 → 임베딩
+        self._goal_embeddings: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @property
+    def semantic_enabled(self) -> bool:
+        return self.enabled and self.semantic_threshold is not None
+
+    # =========================
+    # 조회 / 저장
+    # =========================
+
+    def get(self, bucket: str, goal: str) -> Optional[Dict]:
+        """정확 일치 조회 (만료 항목은 제거 후 None)"""
+        if not self.enabled:
+            return None
+        key = _entry_key(bucket, goal)
+        with self._lock:
+            value = self._get_locked(key)
+            if value is not None:
+                self.hits += 1
+            return copy.deepcopy(value) if value is not None else None
+
+    def get_similar(self, bucket: str, embedding) -> Optional[Dict]:
+        """
+        의미 유사도 조회
+
+        - 같은 버킷의 학습 목적 임베딩 중 코사인 유사도 최댓값이 임계값 이상이면 해당 응답 반환
+        """
+        if not self.semantic_enabled or embedding is None:
+            return None
+        query = self._unit(embedding)
+        with self._lock:
+            candidates = self._semantic.get(bucket)
+            if not candidates:
+                return None
+            keys = list(candidates)
+            similarities = np.stack([candidates[k] for k in keys]) @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.semantic_threshold:
+                return None
+            value = self._get_locked(keys[best])
+            if value is not None:
+                self.semantic_hits += 1
+            return copy.deepcopy(value) if value is not None else None
+
+    def set(self, bucket: str, goal: str, value: Dict, embedding=None):
+        """응답 저장 (embedding이 있으면 의미 캐시에도 등록)"""
+        if not self.enabled:
+            return
+        key = _entry_key(bucket, goal)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, bucket, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+
+            if self.semantic_enabled and embedding is not None:
+                candidates = self._semantic.setdefault(bucket, OrderedDict())
+                candidates[key] = self._unit(embedding)
+                candidates.move_to_end(key)
+                while len(candidates) > self.semantic_bucket_size:
+                    candidates.popitem(last=False)
+
+            while len(self._entries) > self.max_entries:
+                old_key, (_, old_bucket, _) = self._entries.popitem(last=False)
+                self._forget_semantic(old_bucket, old_key)
+
+    def record_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def _get_locked(self, key: str) -> Optional[Dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, bucket, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._forget_semantic(bucket, key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _forget_semantic(self, bucket: str, key: str):
+        candidates = self._semantic.get(bucket)
+        if candidates is None:
+            return
+        candidates.pop(key, None)
+        if not candidates:
+            del self._semantic[bucket]
+
+    @staticmethod
+    def _unit(embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    # =========================
+    # 학습 목적 임베딩 메모이제이션
+    # =========================
+
+    def get_goal_embedding(self, goal: str):
+        with self._lock:
+            embedding = self._goal_embeddings.get(goal)
+            if embedding is not None:
+                self._goal_embeddings.move_to_end(goal)
+            return embedding
+
+    def set_goal_embedding(self, goal: str, embedding):
+        with self._lock:
+            self._goal_embeddings[goal] = self._unit(embedding)
+            self._goal_embeddings.move_to_end(goal)
+            while len(self._goal_embeddings) > GOAL_EMBEDDING_CACHE_SIZE:
+                self._goal_embeddings.popitem(last=False)
+
+    # =========================
+    # 관리
+    # =========================
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._semantic.clear()
+            self._goal_embeddings.clear()
+            self.hits = self.semantic_hits = self.misses = 0
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.semantic_hits + self.misses
+        return {
+            'size': len(self._entries),
+            'capacity': self.max_entries,
+            'ttl': self.ttl,
+            'semantic_threshold': self.semantic_threshold,
+            'hits': self.hits,
+            'semantic_hits': self.semantic_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.semantic_hits) / lookups if lookups else 0.0,
+        }
+
+
+# =========================
+# 싱글톤 인스턴스 관리
+# =========================
+
+_comment_cache_instance = None
+
+
+def get_comment_cache() -> LLMResponseCache:
+    """LLMResponseCache 싱글톤 인스턴스 반환 (AI 맞춤 코멘트용)"""
+    global _comment_cache_instance
+
+    if _comment_cache_instance is None:
+        _comment_cache_instance = LLMResponseCache()
+
+    return _comment_cache_instance
@@ -7,7 +7,10 @@ Comparisons 앱에서 LLM(현재는 GMS API)을 호출하여 "맞춤 코멘트"
 - __init__()                                                     | GMS API 키 검증.
 - generate_personalized_comment(course, ai_review, user_goal)    | 개인화 코멘트 생성
 - generate_review_summary(course_id)                             | 리뷰 요약 생성 # courses 앱에서 재사용 가능하도록 설계함'!!
+- stream_personalized_comment / stream_review_summary           | 위 두 기능의 스트리밍 버전 (생성 중인 내용 미리보기)
 - _call_gms_api(messages, temperature, max_tokens)               | 공통 LLM 호출 로직
+- _stream_gms_api(messages, temperature, max_tokens)             | 공통 LLM 스트리밍 호출 로직 (SSE 청크 → 텍스트 조각)
+- _get_goal_embedding(goal)                                      | 학습 목적 임베딩 (코멘트 의미 캐시용)
 """
 
 """
@@ -22,6 +25,7 @@ Comparisons 앱에서 LLM(현재는 GMS API)을 호출하여 "맞춤 코멘트"
 - JSON 모드 활성화로 구조화된 응답 보장
 - timeout, 재시도, 에러 처리로 외부 API 호출 안정성 확보
 - 리뷰 요약은 courses 앱에서도 재사용 가능하도록 독립적으로 설계
+- AI 맞춤 코멘트는 (강좌, AI 평가, 정규화된 학습 목적, 프롬프트 버전, 모델) 단위로 캐시 (llm_cache.py)
 
 [의사결정 배경]
 - #TODO generate_review_summary의 경우, MVP에서는 comparisons/services/에 구현하고 추후 공통 모듈로 리팩토링하고자 함.
@@ -31,11 +35,13 @@ Comparisons 앱에서 LLM(현재는 GMS API)을 호출하여 "맞춤 코멘트"
 import os
 import json
 import requests
-from typing import Dict, List
+from typing import Callable, Dict, Iterator, List, Tuple
 from django.db.models import Q # Q가 있어야 복잡한 쿼리 연산이 가능해짐!
 from apps.courses.models import CourseReview
 from apps.comparisons.models import CourseAIReview
 from apps.courses.models import Course
+from apps.comparisons.services.llm_cache import comment_cache_bucket, get_comment_cache, normalize_goal
+from apps.core.utils.partial_json import parse_partial_json
 
 # =========================
 # LLM 설정 상수
@@ -47,6 +53,8 @@ LLM_TEMPERATURE_CREATIVE = 0.6  # 코멘트 생성용 (창의성 조금 필요)
 LLM_TEMPERATURE_FACTUAL = 0.3   # 요약용 (일관성 조금 더 중요)
 LLM_MAX_TOKENS = 500            # 최대 토큰 수
 LLM_TIMEOUT = 30                # API 호출 타임아웃 (초)
+EMBEDDING_MODEL_NAME = 'text-embedding-3-small'  # 학습 목적 임베딩 모델 (코멘트 의미 캐시용)
+EMBEDDING_TIMEOUT = 5           # 임베딩 API 호출 타임아웃 (초)
 
 # =========================
 # 리뷰 요약 정책 상수
@@ -60,6 +68,19 @@ REVIEW_MIN_LENGTH = 10                               # 유효한 리뷰로 인
 # =========================
 COMMENT_MIN_KEY_POINTS = 2  # 최소 핵심 포인트 개수
 COMMENT_MAX_KEY_POINTS = 5  # 최대 핵심 포인트 개수
+COMMENT_PROMPT_VERSION = 'v1'  # 코멘트 프롬프트 버전 | 프롬프트 수정 시 올리면 기존 캐시 무효화
+
+
+def _string_value(value) -> str:
+    """미리보기용 문자열 (생성 중 형식이 어긋난 값은 빈 문자열)"""
+    return value if isinstance(value, str) else ''
+
+
+def _string_list(value) -> List[str]:
+    """미리보기용 문자열 리스트 (생성 중 형식이 어긋난 값은 제외)"""
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, str)]
 
 
 class LLMService:
@@ -88,6 +109,7 @@ class LLMService:
         - API URL은 상수로 정의 (향후 변경 가능성 고려)
         """
         self.gms_url = "https://gms.ssafy.io/gmsapi/api.openai.com/v1/chat/completions"
+        self.gms_embedding_url = "https://gms.ssafy.io/gmsapi/api.openai.com/v1/embeddings"
         self.gms_key = os.environ.get("GMS_KEY")
 
         # 키 없으면 미리 시패 처리함.
@@ -119,6 +141,10 @@ class LLMService:
         - user_goal: 사용자가 입력한 학습 목적 (예: "비전공자이지만 데이터 분석가로 이직하고 싶습니다")
         - ai_review: DB에 미리 저장된 강좌 AI 평가 (이론/실무/난이도/기간 점수)
         - course: 강좌 기본 정보 (이름, 교수자, 분류 등)
+        - 응답 캐시 (llm_cache.py)
+          1. 정확 일치: (강좌, ai_review.updated_at, 정규화된 학습 목적, 프롬프트 버전, 모델)
+          2. 의미 유사도(설정 시): 같은 강좌/AI 평가에서 학습 목적 임베딩이 임계값 이상 유사하면 재사용
+          → 둘 다 없을 때만 LLM 호출, 검증을 통과한 응답만 저장
 
         Args:
             course: Course 인스턴스
@@ -135,7 +161,92 @@ class LLMService:
         Raises:
             Exception: LLM API 호출 실패 시
         """
-        # 1. 프롬프트 생성
+        # 0. 응답 캐시 조회
+        cached, cache_slot = self._lookup_comment_cache(course, ai_review, user_goal)
+        if cached is not None:
+            return cached
+
+        # 1~2. 프롬프트 생성 + LLM API 호출
+        response_text = self._call_gms_api(
+            messages=self._build_comment_messages(course, ai_review, user_goal),
+            temperature=LLM_TEMPERATURE_CREATIVE,
+            max_tokens=LLM_MAX_TOKENS
+        )
+
+        # 3. 응답 파싱 및 검증
+        result = self._parse_comment_response(response_text)
+
+        # 4. 응답 캐시 저장
+        self._store_comment_cache(cache_slot, result)
+
+        return result
+
+    def stream_personalized_comment(
+        self,
+        course: Course,
+        ai_review: CourseAIReview,
+        user_goal: str
+    ) -> Iterator[Tuple[str, Dict]]:
+        """
+        개인화 코멘트 스트리밍 생성
+
+        [설계 의도]
+        - generate_personalized_comment와 같은 프롬프트/검증/캐시, LLM 응답만 토큰 단위로 수신
+        - 추천 이유와 핵심 포인트를 생성되는 대로 전달 → 첫 글자까지의 대기 시간 = 첫 토큰 지연
+
+        Yields:
+            ('delta', {'recommendation_reason': str, 'key_points': List[str]})  | 지금까지 생성된 내용 (전체 스냅샷)
+            ('result', dict)                                                   | 검증된 최종 결과 (generate_personalized_comment와 동일)
+
+        Raises:
+            Exception: LLM API 호출 실패 / 최종 응답 검증 실패 시
+        """
+        cached, cache_slot = self._lookup_comment_cache(course, ai_review, user_goal)
+        if cached is not None:
+            yield 'result', cached
+            return
+
+        response_text = yield from self._stream_with_preview(
+            messages=self._build_comment_messages(course, ai_review, user_goal),
+            temperature=LLM_TEMPERATURE_CREATIVE,
+            max_tokens=LLM_MAX_TOKENS,
+            preview=lambda parsed: {
+                'recommendation_reason': _string_value(parsed.get('recommendation_reason')),
+                'key_points': _string_list(parsed.get('key_points'))[:COMMENT_MAX_KEY_POINTS],
+            }
+        )
+
+        result = self._parse_comment_response(response_text)
+        self._store_comment_cache(cache_slot, result)
+        yield 'result', result
+
+    def _lookup_comment_cache(self, course: Course, ai_review: CourseAIReview, user_goal: str):
+        """
+        응답 캐시 조회 (정확 일치 → 의미 유사도)
+
+        Returns:
+            (cached, cache_slot) | cache_slot은 _store_comment_cache에 그대로 전달
+        """
+        cache = get_comment_cache()
+        bucket = comment_cache_bucket(course.id, ai_review.updated_at, COMMENT_PROMPT_VERSION, LLM_MODEL_NAME)
+        goal_key = normalize_goal(user_goal)
+        goal_embedding = None
+
+        cached = cache.get(bucket, goal_key)
+        if cached is None and cache.semantic_enabled:
+            goal_embedding = self._get_goal_embedding(goal_key)
+            cached = cache.get_similar(bucket, goal_embedding)
+        if cached is None:
+            cache.record_miss()
+        return cached, (bucket, goal_key, goal_embedding)
+
+    @staticmethod
+    def _store_comment_cache(cache_slot, result: Dict):
+        bucket, goal_key, goal_embedding = cache_slot
+        get_comment_cache().set(bucket, goal_key, result, embedding=goal_embedding)
+
+    def _build_comment_messages(self, course: Course, ai_review: CourseAIReview, user_goal: str) -> List[Dict]:
+        """개인화 코멘트 프롬프트 (system + user)"""
         system_prompt = f"""
 당신은 온라인 강좌 추천 전문가입니다.
 사용자의 학습 목적과 강좌의 특성을 분석하여, 해당 강좌를 추천하는 개인화된 코멘트를 작성해야 합니다.
@@ -178,19 +289,15 @@ class LLMService:
 위 정보를 바탕으로 사용자의 학습 목적에 맞춘 추천 코멘트를 JSON 형식으로 작성해주세요.
 """
 
-        # 2. LLM API 호출
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt}
         ]
+        return messages
 
-        response_text = self._call_gms_api(
-            messages=messages,
-            temperature=LLM_TEMPERATURE_CREATIVE,
-            max_tokens=LLM_MAX_TOKENS
-        )
-
-        # 3. 응답 파싱 및 검증
+    @staticmethod
+    def _parse_comment_response(response_text: str) -> Dict:
+        """개인화 코멘트 응답 파싱 및 검증"""
         try:
             result = json.loads(response_text)
         except json.JSONDecodeError as e:
@@ -213,7 +320,7 @@ class LLMService:
         # NOTE 최대 개수 검증은 굳이 에러까지는 안내하지 않음. 그대신 개수는 자르기. 
         if len(result['key_points']) > COMMENT_MAX_KEY_POINTS:
             result['key_points'] = result['key_points'][:COMMENT_MAX_KEY_POINTS]
-        
+
         return result
 
     # =========================
@@ -252,6 +359,77 @@ class LLMService:
         Raises:
             Exception: Course가 존재하지 않거나 LLM API 호출 실패 시
         """
+        # 1~6. 강좌/리뷰 조회, 신뢰도 판정, 리뷰 샘플링, 프롬프트 생성
+        context = self._prepare_review_summary(course_id)
+        if context['result'] is not None:
+            # 리뷰 없음 → LLM 호출 없이 안내 메시지
+            return context['result']
+
+        # 7. LLM API 호출
+        response_text = self._call_gms_api(
+            messages=context['messages'],
+            temperature=LLM_TEMPERATURE_FACTUAL,
+            max_tokens=LLM_MAX_TOKENS
+        )
+
+        # 8~9. 응답 파싱/검증 및 최종 결과 구성
+        return self._build_review_summary_result(response_text, context)
+
+    def stream_review_summary(self, course_id: int) -> Iterator[Tuple[str, Dict]]:
+        """
+        리뷰 요약 스트리밍 생성
+
+        [설계 의도]
+        - generate_review_summary와 같은 프롬프트/검증, LLM 응답만 토큰 단위로 수신
+        - 리뷰 수/신뢰도는 LLM 호출 전에 먼저 전달, 요약/장점/단점은 생성되는 대로 전달
+
+        Yields:
+            ('meta', {'review_count', 'reliability', 'warning_message'})          | LLM 호출 전 메타 정보
+            ('delta', {'summary': str, 'pros': List[str], 'cons': List[str]})      | 지금까지 생성된 내용 (전체 스냅샷)
+            ('result', dict)                                                      | 최종 결과 (generate_review_summary와 동일)
+
+        Raises:
+            Exception: Course가 존재하지 않거나 LLM API 호출 실패 시
+        """
+        context = self._prepare_review_summary(course_id)
+        if context['result'] is not None:
+            yield 'result', context['result']
+            return
+
+        yield 'meta', {
+            'review_count': context['review_count'],
+            'reliability': context['reliability'],
+            'warning_message': context['warning_message'],
+        }
+
+        def preview(parsed):
+            review_data = parsed.get('review_summary')
+            review_data = review_data if isinstance(review_data, dict) else {}
+            return {
+                'summary': _string_value(review_data.get('summary')),
+                'pros': _string_list(review_data.get('pros')),
+                'cons': _string_list(review_data.get('cons')),
+            }
+
+        response_text = yield from self._stream_with_preview(
+            messages=context['messages'],
+            temperature=LLM_TEMPERATURE_FACTUAL,
+            max_tokens=LLM_MAX_TOKENS,
+            preview=preview
+        )
+
+        yield 'result', self._build_review_summary_result(response_text, context)
+
+    def _prepare_review_summary(self, course_id: int) -> Dict:
+        """
+        리뷰 요약 준비 (LLM 호출 전 단계)
+
+        Returns:
+            dict: {
+                'result': dict | None,   # 리뷰가 없으면 바로 반환할 결과, 아니면 None
+                'course_id', 'messages', 'review_count', 'reliability', 'warning_message'
+            }
+        """
         # 1. 강좌 존재 여부 확인
         try:
             course = Course.objects.get(id=course_id)
@@ -276,14 +454,16 @@ class LLMService:
         # 3. 리뷰 없는 경우 처리
         if review_count == 0:
             return {
-                'review_summary': {
-                    'summary': "리뷰가 없어서 요약을 제공할 수 없습니다",
-                    'pros': [],
-                    'cons': []
-                },
-                'review_count': 0,
-                'reliability': 'low',
-                'warning_message': "아직 수강생 리뷰가 등록되지 않았습니다"
+                'result': {
+                    'review_summary': {
+                        'summary': "리뷰가 없어서 요약을 제공할 수 없습니다",
+                        'pros': [],
+                        'cons': []
+                    },
+                    'review_count': 0,
+                    'reliability': 'low',
+                    'warning_message': "아직 수강생 리뷰가 등록되지 않았습니다"
+                }
             }
 
         # 4. 신뢰도 판정
@@ -338,18 +518,22 @@ class LLMService:
 위 리뷰들을 종합하여 강좌의 핵심 정보를 요약해주세요.
 """
 
-        # 7. LLM API 호출
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt}
         ]
+        return {
+            'result': None,
+            'course_id': course_id,
+            'messages': messages,
+            'review_count': review_count,
+            'reliability': reliability,
+            'warning_message': warning_message,
+        }
 
-        response_text = self._call_gms_api(
-            messages=messages,
-            temperature=LLM_TEMPERATURE_FACTUAL,
-            max_tokens=LLM_MAX_TOKENS
-        )
-
+    @staticmethod
+    def _build_review_summary_result(response_text: str, context: Dict) -> Dict:
+        """리뷰 요약 응답 파싱/검증 및 최종 결과 구성"""
         # 8. 응답 파싱 및 검증
         try:
             result = json.loads(response_text)
@@ -369,11 +553,11 @@ class LLMService:
 
         # 9. 최종 결과 구성
         return {
-            'course_id': course_id,
-            'review_summary': final_summary, 
-            'review_count': review_count,
-            'reliability': reliability,
-            'warning_message': warning_message
+            'course_id': context['course_id'],
+            'review_summary': final_summary,
+            'review_count': context['review_count'],
+            'reliability': context['reliability'],
+            'warning_message': context['warning_message']
         }
 
     # =========================
@@ -469,6 +653,162 @@ class LLMService:
 
         return content
 
+    def _stream_gms_api(
+        self,
+        messages: List[Dict],
+        temperature: float,
+        max_tokens: int
+    ) -> Iterator[str]:
+        """
+        GMS API 스트리밍 호출 (stream=True)
+
+        [설계 의도]
+        - _call_gms_api와 같은 요청이지만, 응답 전체를 기다리지 않고 SSE 청크의 텍스트 조각을 바로 전달
+
+        [상세 고려 사항]
+        - 응답은 `data: {chat.completion.chunk}` 줄 단위, `data: [DONE]`으로 종료
+        - timeout은 연결/청크 사이 대기 시간에 적용 (전체 생성 시간이 아님)
+        - 에러 메시지 형식은 _call_gms_api와 동일
+
+        Yields:
+            str: choices[0].delta.content 조각
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.gms_key}"
+        }
+        data = {
+            "model": LLM_MODEL_NAME,
+            "messages": messages,
+            "response_format": {"type": "json_object"},
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True
+        }
+
+        try:
+            response = requests.post(
+                self.gms_url,
+                headers=headers,
+                data=json.dumps(data),
+                timeout=LLM_TIMEOUT,
+                stream=True
+            )
+        except requests.Timeout:
+            raise Exception(
+                f"GMS API 호출 시간 초과 (timeout: {LLM_TIMEOUT}초). "
+                "잠시 후 다시 시도해주세요."
+            )
+        except requests.RequestException as e:
+            raise Exception(f"GMS API 호출 중 네트워크 에러 발생: {str(e)}")
+
+        with response:
+            if response.status_code != 200:
+                raise Exception(
+                    f"GMS API 호출 실패 (Status: {response.status_code}): {response.text[:200]}"
+                )
+
+            response.encoding = 'utf-8'  # text/event-stream은 charset이 없을 수 있음
+            received = False
+            try:
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith('data:'):
+                        continue
+                    payload = line[len('data:'):].strip()
+                    if payload == '[DONE]':
+                        break
+                    try:
+                        chunk = json.loads(payload)
+                    except json.JSONDecodeError:
+                        continue
+
+                    choices = chunk.get('choices') or []
+                    content = (choices[0].get('delta') or {}).get('content') if choices else None
+                    if content:
+                        received = True
+                        yield content
+            except requests.RequestException as e:
+                raise Exception(f"GMS API 스트리밍 중 네트워크 에러 발생: {str(e)}")
+
+        if not received:
+            raise Exception("GMS API가 빈 응답을 반환했습니다")
+
+    def _stream_with_preview(
+        self,
+        messages: List[Dict],
+        temperature: float,
+        max_tokens: int,
+        preview: Callable[[Dict], Dict]
+    ):
+        """
+        스트리밍 호출 + 생성 중인 JSON 미리보기
+
+        - 청크가 올 때마다 지금까지의 응답을 parse_partial_json으로 파싱하고
+          preview(parsed) 결과가 바뀐 경우에만 ('delta', 미리보기) 전달
+        - 제너레이터 반환값(yield from의 결과)은 완성된 응답 텍스트 → 기존 검증 로직에 그대로 전달
+
+        Yields:
+            ('delta', dict)
+        Returns:
+            str: 전체 응답 텍스트
+        """
+        chunks = []
+        last_preview = None
+        for content in self._stream_gms_api(messages, temperature, max_tokens):
+            chunks.append(content)
+            parsed = parse_partial_json(''.join(chunks), default={})
+            if not isinstance(parsed, dict):
+                continue
+            current = preview(parsed)
+            if current != last_preview and any(current.values()):
+                last_preview = current
+                yield 'delta', current
+        return ''.join(chunks)
+
+    def _get_goal_embedding(self, goal: str):
+        """
+        학습 목적 임베딩 (코멘트 의미 캐시용)
+
+        [상세 고려 사항]
+        - 같은 비교 요청의 강좌 N개가 같은 학습 목적을 쓰므로 캐시에 메모이제이션 (API 1회)
+        - 실패 시 None 반환 → 의미 캐시만 건너뛰고 LLM 호출은 정상 진행
+
+        Returns:
+            List[float] | None
+        """
+        if not goal:
+            return None
+
+        cache = get_comment_cache()
+        embedding = cache.get_goal_embedding(goal)
+        if embedding is not None:
+            return embedding
+
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.gms_key}"
+        }
+        data = {
+            "model": EMBEDDING_MODEL_NAME,
+            "input": goal
+        }
+
+        try:
+            response = requests.post(
+                self.gms_embedding_url,
+                headers=headers,
+                data=json.dumps(data),
+                timeout=EMBEDDING_TIMEOUT
+            )
+            if response.status_code != 200:
+                return None
+            embedding = response.json()['data'][0]['embedding']
+        except (requests.RequestException, ValueError, KeyError, IndexError):
+            return None
+
+        cache.set_goal_embedding(goal, embedding)
+        return embedding
+
 
 # =========================
 # 싱글톤 인스턴스 관리
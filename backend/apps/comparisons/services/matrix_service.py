@@ -0,0 +1,311 @@
+# backend/apps/comparisons/services/matrix_service.py
+
+
+# 개요
+"""
+AI 평가 비교 행렬 스냅샷 (비교 화면 / 레이더 차트용)
+- ReviewMatrixSnapshot                         | 전체 CourseAIReview를 열(column) 단위 NumPy 배열로 보관
+- ReviewMatrixService.get_snapshot()           | 스냅샷 조회 (AI 평가 세대가 바뀌었으면 재생성)
+- ReviewMatrixService.lookup(ids, preferences) | 강좌 N개의 평점/분류 내 백분위/매칭 점수 (벡터화 1회)
+- ReviewMatrixService.invalidate()             | 다음 요청에서 세대 재확인 (signals.py에서 호출)
+- get_matrix_service()                         | 싱글톤 인스턴스 반환
+"""
+
+"""
+[설계 의도]
+- 비교 화면은 강좌 2~4개의 평점 4개를 나란히 보여주는데, 요청마다 CourseAIReview를 다시 읽고 점수를 계산함
+- "같은 대분류 안에서 상위 몇 %인지"(백분위)는 분류 전체를 읽어야 해서 요청 단위로는 계산 비용이 큼
+  → 전체 AI 평가를 프로세스 메모리에 열 단위 배열로 한 번 적재하고, 백분위까지 미리 계산
+
+[상세 고려 사항]
+- 저장 형식 (강좌 1만 개 기준 약 0.2MB)
+  - course_ids: int64 (정렬됨, searchsorted로 course_id → 행 번호)
+  - ratings: (N×4) int8 | theory/practical/difficulty/duration (1~5)
+  - average: int16 | average_rating × 100 (소수 둘째 자리 반올림 값이므로 손실 없음)
+  - category: int16 | 대분류(classfy_name) 코드
+  - percentiles: (N×5) uint8 | 4개 평점 + 종합 평점의 분류 내 백분위 (0~100)
+- 백분위: 분류별 값 히스토그램의 누적합으로 일괄 계산 (중간 순위 방식)
+  - percentile = (분류 내 더 낮은 값 수 + 같은 값 수 / 2) / 분류 내 강좌 수 × 100
+  - 정렬 없이 (분류 × 값) 카운트 행렬 하나로 계산 → 전체 재계산도 수 ms
+- 갱신: AI 평가 세대 = (CourseAIReview 수, 최신 updated_at)
+  - 세대는 REVIEW_MATRIX_CHECK_INTERVAL(기본 30초)마다 한 번만 조회, 바뀌었으면 스냅샷 재생성
+  - CourseAIReview 저장/삭제 시그널은 즉시 재확인하도록 표시 (bulk_create 적재는 세대 비교로 반영)
+  - 재생성 중에도 다른 요청은 이전 스냅샷을 그대로 사용 (교체는 참조 할당 1회)
+- 프로세스 메모리 스냅샷 (gunicorn 워커별) | 외부 의존성 없이 동작, 재시작 시 첫 요청에서 적재
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from apps.comparisons.models import CourseAIReview
+from .score_service import get_score_service
+
+logger = logging.getLogger(__name__)
+
+# =========================
+# 스냅샷 설정 상수
+# =========================
+
+REVIEW_MATRIX_CHECK_INTERVAL = int(os.environ.get('REVIEW_MATRIX_CHECK_INTERVAL', 30))  # 세대 확인 주기 (초)
+
+AVERAGE_SCALE = 100   # average_rating 정수화 배율 (4.25 → 425)
+RATING_BINS = 6       # 평점 값 범위 0~5
+AVERAGE_BINS = 501    # 종합 평점 정수화 값 범위 0~500
+
+
+def _category_percentiles(categories: np.ndarray, values: np.ndarray, n_categories: int, n_bins: int) -> np.ndarray:
+    """
+    분류 내 백분위 (중간 순위 방식)
+
+    Args:
+        categories: (N,) 분류 코드
+        values: (N,) 0 ~ n_bins-1 정수 값
+
+    Returns:
+        np.ndarray: (N,) uint8 백분위 (0~100)
+    """
+    counts = np.zeros((n_categories, n_bins), dtype=np.int32)
+    np.add.at(counts, (categories, values), 1)
+
+    below = np.cumsum(counts, axis=1) - counts       # 분류별 "더 낮은 값" 개수
+    group_sizes = counts.sum(axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        table = (below + counts / 2.0) / group_sizes * 100.0
+
+    return np.rint(np.nan_to_num(table[categories, values])).astype(np.uint8)
+
+
+class ReviewMatrixSnapshot:
+    """
+    CourseAIReview 전체의 열 단위 스냅샷 (읽기 전용)
+
+    Args:
+        rows: [(course_id, theory, practical, difficulty, duration, average_rating, classfy_name), ...]
+        generation: (AI 평가 수, 최신 updated_at ISO 문자열)
+    """
+
+    def __init__(self, rows: List[tuple], generation: tuple):
+        self.generation = generation
+        self.built_at = timezone.now()
+
+        rows = sorted(rows, key=lambda row: row[0])
+        n = len(rows)
+
+        self.course_ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=n)
+        self.ratings = np.array(
+            [[row[1] or 0, row[2] or 0, row[3] or 0, row[4] or 0] for row in rows],
+            dtype=np.int8,
+        ).reshape(n, 4)
+        self.average = np.fromiter(
+            (round((row[5] or 0.0) * AVERAGE_SCALE) for row in rows), dtype=np.int16, count=n
+        )
+        np.clip(self.ratings, 0, RATING_BINS - 1, out=self.ratings)
+        np.clip(self.average, 0, AVERAGE_BINS - 1, out=self.average)
+
+        # 대분류 코드화 (None/빈 문자열은 하나의 분류로 취급)
+        self.category_names: List[Optional[str]] = []
+        codes: Dict[Optional[str], int] = {}
+        category = np.empty(n, dtype=np.int16)
+        for i, row in enumerate(rows):
+            name = row[6] or None
+            if name not in codes:
+                codes[name] = len(self.category_names)
+                self.category_names.append(name)
+            category[i] = codes[name]
+        self.category = category
+
+        # 분류 내 백분위 (4개 평점 + 종합 평점)
+        n_categories = max(len(self.category_names), 1)
+        self.percentiles = np.empty((n, 5), dtype=np.uint8)
+        for column in range(4):
+            self.percentiles[:, column] = _category_percentiles(
+                self.category, self.ratings[:, column], n_categories, RATING_BINS
+            )
+        self.percentiles[:, 4] = _category_percentiles(self.category, self.average, n_categories, AVERAGE_BINS)
+
+    def __len__(self):
+        return len(self.course_ids)
+
+    def positions(self, course_ids: Iterable[int]):
+        """
+        course_id → 행 번호
+
+        Returns:
+            (positions, found_ids, missing_ids) | positions는 found_ids 순서의 행 번호 배열
+        """
+        requested = np.asarray(list(course_ids), dtype=np.int64)
+        if len(self.course_ids) == 0 or len(requested) == 0:
+            return np.empty(0, dtype=np.int64), [], [int(x) for x in requested]
+
+        positions = np.searchsorted(self.course_ids, requested)
+        clipped = np.minimum(positions, len(self.course_ids) - 1)
+        found = self.course_ids[clipped] == requested
+        return clipped[found], requested[found].tolist(), requested[~found].tolist()
+
+    def nbytes(self) -> int:
+        return sum(
+            array.nbytes for array in
+            (self.course_ids, self.ratings, self.average, self.category, self.percentiles)
+        )
+
+
+class ReviewMatrixService:
+    """
+    AI 평가 비교 행렬 서비스
+
+    [설계 의도]
+    - 스냅샷 적재/갱신과 강좌 N개 조회를 담당, 점수 공식은 ScoreService와 공용
+    """
+
+    LABELS = ['theory', 'practical', 'difficulty', 'duration']
+
+    def __init__(self, check_interval: int = REVIEW_MATRIX_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._snapshot: Optional[ReviewMatrixSnapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    # =========================
+    # 스냅샷 관리
+    # =========================
+
+    @staticmethod
+    def current_generation() -> tuple:
+        """AI 평가 세대 (AI 평가 수, 최신 updated_at)"""
+        stats = CourseAIReview.objects.aggregate(total=Count('id'), latest=Max('updated_at'))
+        latest = stats['latest'].isoformat() if stats['latest'] else None
+        return stats['total'], latest
+
+    def get_snapshot(self) -> ReviewMatrixSnapshot:
+        """
+        스냅샷 조회
+
+        - 마지막 확인 후 check_interval이 지났으면 세대를 다시 조회하고, 바뀌었으면 재생성
+        - 재생성은 한 스레드만 수행, 나머지는 이전 스냅샷 사용 (최초 적재 시에만 대기)
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return snapshot
+
+        if snapshot is not None and not self._lock.acquire(blocking=False):
+            return snapshot
+        if snapshot is None:
+            self._lock.acquire()
+
+        try:
+            snapshot = self._snapshot
+            if snapshot is not None and time.monotonic() - self._checked_at < self.check_interval:
+                return snapshot
+
+            generation = self.current_generation()
+            if snapshot is None or snapshot.generation != generation:
+                snapshot = self._build(generation)
+                self._snapshot = snapshot
+            self._checked_at = time.monotonic()
+            return snapshot
+        finally:
+            self._lock.release()
+
+    def _build(self, generation: tuple) -> ReviewMatrixSnapshot:
+        started_at = time.perf_counter()
+        rows = list(
+            CourseAIReview.objects.values_list(
+                'course_id', 'theory_rating', 'practical_rating', 'difficulty_rating',
+                'duration_rating', 'average_rating', 'course__classfy_name',
+            )
+        )
+        snapshot = ReviewMatrixSnapshot(rows, generation)
+        logger.info(
+            f'AI 평가 비교 행렬 적재: {len(snapshot)}개 강좌, '
+            f'{snapshot.nbytes() / 1024:.1f}KB, {(time.perf_counter() - started_at) * 1000:.1f}ms'
+        )
+        return snapshot
+
+    def invalidate(self):
+        """다음 요청에서 세대를 즉시 다시 확인"""
+        self._checked_at = 0.0
+
+    # =========================
+    # 조회
+    # =========================
+
+    def lookup(self, course_ids: List[int], user_preferences: Optional[Dict[str, float]] = None) -> Dict:
+        """
+        강좌 N개의 비교 행렬 (요청 순서 유지)
+
+        Args:
+            course_ids: 조회할 강좌 ID 목록
+            user_preferences: 선호도 (있으면 매칭 점수 계산, 없으면 match_score=None)
+
+        Returns:
+            dict: {
+                'labels': ['theory', 'practical', 'difficulty', 'duration'],
+                'results': [{course_id, category, ratings, average_rating,
+                             percentiles, average_percentile, match_score}, ...],
+                'missing_ids': [...],   # AI 평가가 없는 강좌
+                'snapshot': {size, generation, built_at},
+            }
+        """
+        snapshot = self.get_snapshot()
+        positions, found_ids, missing_ids = snapshot.positions(course_ids)
+
+        ratings = snapshot.ratings[positions]
+        averages = snapshot.average[positions] / AVERAGE_SCALE
+        percentiles = snapshot.percentiles[positions]
+        categories = snapshot.category[positions]
+
+        if user_preferences is not None and len(positions):
+            match_scores = get_score_service().calculate_match_scores(ratings, user_preferences).tolist()
+        else:
+            match_scores = [None] * len(positions)
+
+        results = [
+            {
+                'course_id': course_id,
+                'category': snapshot.category_names[category],
+                'ratings': rating_row,
+                'average_rating': average,
+                'percentiles': percentile_row[:4],
+                'average_percentile': percentile_row[4],
+                'match_score': match_score,
+            }
+            for course_id, category, rating_row, average, percentile_row, match_score in zip(
+                found_ids, categories.tolist(), ratings.tolist(), averages.tolist(),
+                percentiles.tolist(), match_scores,
+            )
+        ]
+
+        return {
+            'labels': self.LABELS,
+            'results': results,
+            'missing_ids': missing_ids,
+            'snapshot': {
+                'size': len(snapshot),
+                'generation': snapshot.generation[1],
+                'built_at': snapshot.built_at,
+            },
+        }
+
+
+# =========================
+# 싱글톤 인스턴스 관리
+# =========================
+
+_matrix_service_instance = None
+
+
+def get_matrix_service() -> ReviewMatrixService:
+    """ReviewMatrixService 싱글톤 인스턴스 반환"""
+    global _matrix_service_instance
+
+    if _matrix_service_instance is None:
+        _matrix_service_instance = ReviewMatrixService()
+
+    return _matrix_service_instance
@@ -16,10 +16,20 @@
 - 모든 항목에서 최대 차이(5)가 나면 0점
 - 비교 항목:
   theory / practical / difficulty / duration (총 4개)
+
+[최적화 내용]
+- 배치 점수 계산: (N×4) 평점 행렬과 선호도 벡터를 NumPy로 한 번에 계산 (강좌별 Python 루프/getattr 제거)
+- 카탈로그 Top-K: 거리 제곱합을 SQL 식으로 annotate → DB에서 정렬/LIMIT 후 K개만 조회
+  (거리와 점수는 단조 관계이므로 sqrt 없이 제곱합으로 정렬해도 순위 동일)
 """
 
 import math
-from typing import Dict
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import Coalesce
+
 from apps.comparisons.models import CourseAIReview
 
 
@@ -43,6 +53,8 @@ class ScoreService:
 
     MAX_RATING = 5.0  # 각 항목의 최대 평점
 
+    CANDIDATE_FACTOR = 3  # Top-K 조회 시 중복 제거를 고려한 후보 배수
+
     def calculate_match_score(
         self,
         ai_review: CourseAIReview,
@@ -77,42 +89,134 @@ class ScoreService:
            - score = 100 * (1 - distance / max_distance)
 
         [상세 고려 사항]
-        - 점수 범위: 0-100 보장 (max, min 사용)
+        - 점수 범위: 0-100 보장 (clip)
         - 소수점 첫째 자리까지 반환
+        - 계산은 calculate_match_scores(배치)와 공용 → 단건/배치 점수가 항상 일치
+        """
+        ratings = [[getattr(ai_review, model_field, 0) or 0.0 for model_field in self.MATCHING_FIELDS]]
+        return float(self.calculate_match_scores(ratings, user_preferences)[0])
+
+    def preference_vector(self, user_preferences: Dict[str, float]) -> np.ndarray:
+        """선호도 dict → MATCHING_FIELDS 순서의 (4,) 벡터 (누락 항목은 0.0)"""
+        return np.array(
+            [float(user_preferences.get(pref_key, 0.0)) for pref_key in self.MATCHING_FIELDS.values()],
+            dtype=np.float64,
+        )
+
+    def calculate_match_scores(self, ratings, user_preferences: Dict[str, float]) -> np.ndarray:
+        """
+        여러 강좌의 매칭 점수를 한 번에 계산 (벡터화)
+
+        Args:
+            ratings: (N×4) 평점 행렬 (MATCHING_FIELDS 순서, None/NaN은 0.0으로 처리)
+            user_preferences: calculate_match_score와 동일
+
+        Returns:
+            np.ndarray: (N,) 매칭 점수 (0-100, 소수점 첫째 자리)
+
+        [계산 로직]
+        - calculate_match_score와 동일한 공식을 행 단위로 적용
+          score = 100 * (1 - ||ratings - pref|| / max_distance)
+        """
+        matrix = np.asarray(ratings, dtype=np.float64).reshape(-1, len(self.MATCHING_FIELDS))
+        matrix = np.nan_to_num(matrix, nan=0.0)
+
+        distances = np.linalg.norm(matrix - self.preference_vector(user_preferences), axis=1)
+        scores = 100.0 * (1.0 - distances / self.max_distance)
+
+        # 범위 보정 (0-100) + 소숫점 첫째 자리
+        # - 반올림은 단건 공식과 같은 파이썬 round(x, 1) (np.round는 ×10 후 짝수 반올림이라 경계값에서 0.1 차이)
+        # - 행 수가 작아(비교 2~4개, Top-K) 파이썬 반올림 루프 비용은 무시 가능
+        clipped = np.clip(scores, 0.0, 100.0)
+        return np.array([round(score, 1) for score in clipped.tolist()], dtype=np.float64)
+
+    @property
+    def max_distance(self) -> float:
+        """최대 가능 거리 (4개 항목 기준: sqrt(4 * 5^2) = 10.0)"""
+        return math.sqrt(len(self.MATCHING_FIELDS) * (self.MAX_RATING ** 2))
+
+    def match_distance_expression(self, user_preferences: Dict[str, float], prefix: str = ''):
         """
-        # 1. 차이 제곱합 계산
-        sum_of_squares = 0.0
-        field_count = len(self.MATCHING_FIELDS)
+        선호도와의 거리 제곱합 SQL 식
+
+        Args:
+            prefix: 다른 모델에서 조인해 사용할 때의 경로 (예: 'ai_review__')
 
-        # 1. 각 항목별 차이의 제곱합 계산
+        Returns:
+            Expression: Σ(COALESCE(field, 0) - pref)²
+        """
+        expression = None
         for model_field, pref_key in self.MATCHING_FIELDS.items():
-            # ai_review 필드 값과 사용자 선호도 값 가져오기, 기본값 0.0 처리
-            ai_val = getattr(ai_review, model_field, 0) or 0.0
-            # 사용자의 선호도 값 가져오기, 기본값 0.0 처리
-            user_val = user_preferences.get(pref_key, 0.0)
-            # (ai_val - user_val)^2 누적
-            sum_of_squares += (ai_val - user_val) ** 2
-
-        # 2. 유클리드 거리 계산 in 4차원.
-        distance = math.sqrt(sum_of_squares)
-
-        # 3. 최대 가능 거리 계산 (모든 항목이 0 vs 5일 때)
-        # 4개 항목 기준: sqrt(4 * 5^2) = sqrt(100) = 10.0
-        max_possible_distance = math.sqrt(field_count * (self.MAX_RATING ** 2))
-
-        # 4. 점수 변환
-        # 방어적 설계
-        if max_possible_distance == 0:
-            return 0.0
-        
-        # 거리에 기반한 점수 계산
-        score = 100 * (1 - (distance / max_possible_distance))
-
-        # 5. 범위 보정 (0-100)
-        score = max(0.0, min(100.0, score))
-
-        # 반올림, 소숫점 첫째 자리까지
-        return round(score, 1)
+            diff = (
+                Coalesce(F(f'{prefix}{model_field}'), 0, output_field=FloatField())
+                - Value(float(user_preferences.get(pref_key, 0.0)), output_field=FloatField())
+            )
+            term = diff * diff
+            expression = term if expression is None else expression + term
+        return expression
+
+    def top_matches(
+        self,
+        user_preferences: Dict[str, float],
+        limit: int = 10,
+        classfy_name: Optional[str] = None,
+        middle_classfy_names: Optional[Iterable[str]] = None,
+    ) -> List[dict]:
+        """
+        카탈로그 전체에서 선호도와 가장 잘 맞는 강좌 Top-K
+
+        Args:
+            user_preferences: 사용자 선호도
+            limit: 반환할 강좌 수
+            classfy_name: 대분류 필터 (선택)
+            middle_classfy_names: 중분류 필터 (선택, OR 조건)
+
+        Returns:
+            list[dict]: [{'course', 'ai_review', 'match_score'}, ...] (점수 내림차순)
+
+        [처리 흐름]
+        1. AI 평가가 있는 강좌 대상, 분류 필터 적용
+        2. 거리 제곱합 annotate → 거리 오름차순 + 종합 평점 내림차순 정렬 후 후보만 조회
+        3. 같은 강좌명+교수자의 다른 기수는 하나만 남김 (목록/검색 API와 동일한 중복 제거 기준)
+        4. 남은 K개만 NumPy로 점수 계산
+
+        [상세 고려사항]
+        - 중복 제거로 줄어들 것을 고려해 후보는 limit * CANDIDATE_FACTOR개 조회
+        - select_related('course') + defer(embedding): 1536차원 벡터 컬럼은 조회하지 않음
+        """
+        queryset = CourseAIReview.objects.select_related('course').defer('course__embedding')
+
+        if classfy_name:
+            queryset = queryset.filter(course__classfy_name=classfy_name)
+        if middle_classfy_names:
+            queryset = queryset.filter(course__middle_classfy_name__in=list(middle_classfy_names))
+
+        candidates = queryset.annotate(
+            match_distance=self.match_distance_expression(user_preferences)
+        ).order_by('match_distance', '-average_rating', 'course_id')[:limit * self.CANDIDATE_FACTOR]
+
+        reviews = []
+        seen_identity = set()
+        for ai_review in candidates:
+            course = ai_review.course
+            identity = ((course.name or '').strip(), (course.professor or '').strip())
+            if identity in seen_identity:
+                continue
+            seen_identity.add(identity)
+            reviews.append(ai_review)
+            if len(reviews) >= limit:
+                break
+
+        if not reviews:
+            return []
+
+        ratings = [[getattr(review, field) for field in self.MATCHING_FIELDS] for review in reviews]
+        scores = self.calculate_match_scores(ratings, user_preferences)
+
+        return [
+            {'course': review.course, 'ai_review': review, 'match_score': float(score)}
+            for review, score in zip(reviews, scores)
+        ]
 
 
 # 싱글톤 인스턴스 관리
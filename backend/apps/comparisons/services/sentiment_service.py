@@ -155,6 +155,16 @@ class SentimentService:
             'reliability': reliability
         }
 
+    def get_model_version(self) -> str:
+        """
+        [설계 의도]
+        - 현재 로드된 감성분석 모델 버전 반환
+        - 모델이 교체되면 같은 리뷰라도 결과가 달라지므로
+          조건부 응답(ETag) 검증자에 포함하기 위함
+        """
+        metadata = self.processor.get_model_info().get('metadata') or {}
+        return str(metadata.get('version', 'unknown'))
+
     def _get_default_result(self) -> Dict:
         """
         [설계 의도]
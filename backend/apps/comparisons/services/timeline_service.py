@@ -23,14 +23,34 @@
   (단, UI 혼란 방지를 위해 최소 1시간 보장)
 - 현재 시각 기준으로 남은 기간 계산
 - 0으로 나누기, 데이터 누락 등 예외 케이스 방어
+
+[최적화 내용]
+- 배치 시뮬레이션: 강좌 N개 × weekly_hours H개를 NumPy로 한 번에 계산 (calculate_timeline_grid)
+  - 강좌별 timezone.now()/날짜 연산 대신 기준일 1회 + 종료일 ordinal 배열 연산
+  - 결과는 (N×H) 상태 코드/비율 행렬 → 카탈로그 전체 "주 N시간으로 들을 수 있는 강좌" 필터에 사용
+  - 비율 반올림은 단건과 같은 파이썬 round(x, 2) 규칙 (np.round는 ×100 후 짝수 반올림이라 1/40=0.025가 0.02로 달라짐)
+    - 행렬에는 반올림 전 비율(float64) 저장, 응답 변환(grid_entry)에서 한 번만 round
+    - 상태 판정은 "round(x, 2)가 임계값 이상이 되는 가장 작은 float" 경계와 비교 → 단건 판정과 같은 결과
 """
 
-from typing import Dict
+import math
+from typing import Dict, Iterable, List, Optional, Sequence
 from datetime import date
+import numpy as np
 from django.utils import timezone
 from apps.courses.models import Course
 
 
+def _rounding_boundary(threshold: float, ndigits: int = 2) -> float:
+    """round(x, ndigits) >= threshold가 되는 가장 작은 float x (경계 근처 float를 한 칸씩 이동하며 탐색)"""
+    boundary = threshold - 0.5 * 10 ** -ndigits
+    while round(boundary, ndigits) >= threshold:
+        boundary = math.nextafter(boundary, -math.inf)
+    while round(boundary, ndigits) < threshold:
+        boundary = math.nextafter(boundary, math.inf)
+    return boundary
+
+
 class TimelineService:
     """
     강좌 수강 가능성 판단을 담당하는 도메인 서비스 클래스
@@ -53,6 +73,19 @@ class TimelineService:
     THRESHOLD_OPTIMAL = 0.8
     THRESHOLD_TIGHT = 1.2
 
+    # 반올림 전 비율 기준 경계 (ratio_raw < 경계 ⇔ round(ratio_raw, 2) < 임계값)
+    BOUNDARY_OPTIMAL = _rounding_boundary(THRESHOLD_OPTIMAL)
+    BOUNDARY_TIGHT = _rounding_boundary(THRESHOLD_TIGHT)
+
+    # =========================
+    # 배치 계산용 상수
+    # =========================
+    DEFAULT_REMAINING_WEEKS = 15  # study_end/week가 모두 없을 때 남은 주차 (한 학기)
+
+    # 상태 코드 (grid['status']의 값 → STATUS_LABELS[code])
+    CODE_OPTIMAL, CODE_RELAXED, CODE_TIGHT, CODE_FINISHED, CODE_UNKNOWN = range(5)
+    STATUS_LABELS = [STATUS_OPTIMAL, STATUS_RELAXED, STATUS_TIGHT, STATUS_FINISHED, STATUS_UNKNOWN]
+
     def calculate_timeline(
         self,
         course: Course,
@@ -171,6 +204,131 @@ class TimelineService:
         # (days + 6) // 7 로직은 일주일이 1일만 남아도 1주로 계산함
         return (remaining_days + 6) // 7
 
+    # =========================
+    # 배치 시뮬레이션 (벡터화)
+    # =========================
+
+    def calculate_timeline_grid(
+        self,
+        courses: Iterable[Course],
+        weekly_hours_values: Sequence[int],
+        today: Optional[date] = None
+    ) -> Dict:
+        """
+        강좌 N개 × weekly_hours H개 타임라인 시뮬레이션 (NumPy 1회)
+
+        Args:
+            courses: Course 목록 (course_playtime, week, study_end 사용)
+            weekly_hours_values: 주당 학습 가능 시간 목록
+            today: 기준일 (기본: 오늘, 요청 1회에 1번만 계산)
+
+        Returns:
+            dict: timeline_grid() 참고
+        """
+        columns = self.timeline_columns(
+            [(course.course_playtime, course.week, course.study_end) for course in courses],
+            today=today
+        )
+        return self.timeline_grid(columns, weekly_hours_values)
+
+    def timeline_columns(self, rows: List[tuple], today: Optional[date] = None) -> Dict[str, np.ndarray]:
+        """
+        (course_playtime, week, study_end) 행 목록 → 열 배열 (weekly_hours와 무관한 부분)
+
+        - calculate_timeline의 1~2단계(총 학습 시간, 총/남은 주차)와 같은 규칙
+        - values_list 결과를 그대로 받을 수 있어 모델 인스턴스 생성 없이 카탈로그 전체 계산 가능
+
+        Returns:
+            {'min_hours_per_week': (N,) float64 | 종료 강좌는 0,
+             'total_weeks': (N,) float64, 'remaining_weeks': (N,) float64}
+        """
+        today = today or timezone.now().date()
+        n = len(rows)
+
+        playtime = np.fromiter((row[0] or 0 for row in rows), dtype=np.float64, count=n)
+        total_weeks = np.fromiter((row[1] or 0 for row in rows), dtype=np.float64, count=n)
+        end_ordinal = np.fromiter(
+            (self._date_of(row[2]).toordinal() if row[2] else np.nan for row in rows),
+            dtype=np.float64, count=n
+        )
+
+        # 1. 총 학습 시간 (초 → 시간, 0 이하는 그대로)
+        total_hours = np.where(playtime > 0, playtime / 3600, playtime)
+
+        # 2. 남은 주차 (종료일 없음 → 총 주차 또는 15주, 종료일 지남 → 0, 그 외 올림)
+        remaining_days = end_ordinal - today.toordinal()
+        remaining_weeks = np.where(
+            np.isnan(end_ordinal),
+            np.where(total_weeks != 0, total_weeks, self.DEFAULT_REMAINING_WEEKS),
+            np.where(remaining_days > 0, np.floor((remaining_days + 6) / 7), 0.0),
+        )
+
+        # 3. 주당 필요 학습 시간 (최소 1시간, 종료 강좌는 0)
+        finished = remaining_weeks <= 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            min_hours = np.maximum(total_hours / np.where(finished, 1.0, remaining_weeks), 1.0)
+        min_hours[finished] = 0.0
+        remaining_weeks[finished] = 0.0
+
+        return {
+            'min_hours_per_week': min_hours,
+            'total_weeks': total_weeks,
+            'remaining_weeks': remaining_weeks,
+        }
+
+    def timeline_grid(self, columns: Dict[str, np.ndarray], weekly_hours_values: Sequence[int]) -> Dict:
+        """
+        열 배열 × weekly_hours 벡터 → 상태/비율 행렬
+
+        - calculate_timeline의 4단계(케이스 A/B/C 분기)를 브로드캐스팅으로 적용
+
+        Returns:
+            dict: {
+                'weekly_hours': (H,) int,
+                'min_hours_per_week', 'total_weeks', 'remaining_weeks': (N,),
+                'ratio': (N×H) float64 | 반올림 전 비율, 종료/판정불가는 0.0 (grid_entry에서 round),
+                'status': (N×H) int8 | STATUS_LABELS 인덱스
+            }
+        """
+        hours = np.asarray(weekly_hours_values, dtype=np.float64).reshape(1, -1)
+        min_hours = columns['min_hours_per_week'].reshape(-1, 1)
+        finished = (columns['remaining_weeks'] <= 0).reshape(-1, 1)
+        valid_hours = hours > 0
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = min_hours / np.where(valid_hours, hours, 1.0)
+        ratio = np.where(valid_hours & ~finished, ratio, 0.0)
+
+        status = np.select(
+            [finished, ~valid_hours, ratio < self.BOUNDARY_OPTIMAL, ratio < self.BOUNDARY_TIGHT],
+            [self.CODE_FINISHED, self.CODE_UNKNOWN, self.CODE_OPTIMAL, self.CODE_RELAXED],
+            default=self.CODE_TIGHT,
+        ).astype(np.int8)
+
+        return {
+            'weekly_hours': hours.ravel().astype(np.int64),
+            'min_hours_per_week': columns['min_hours_per_week'],
+            'total_weeks': columns['total_weeks'],
+            'remaining_weeks': columns['remaining_weeks'],
+            'ratio': ratio,
+            'status': status,
+        }
+
+    def grid_entry(self, grid: Dict, row: int, column: int) -> Dict:
+        """행렬의 (강좌, weekly_hours) 칸 → calculate_timeline과 같은 응답 형식"""
+        return self._format_response(
+            min_hours=float(grid['min_hours_per_week'][row]),
+            total_weeks=grid['total_weeks'][row],
+            remaining_weeks=int(grid['remaining_weeks'][row]),
+            status=self.STATUS_LABELS[int(grid['status'][row, column])],
+            ratio=round(float(grid['ratio'][row, column]), 2)
+        )
+
+    @staticmethod
+    def _date_of(value) -> date:
+        # study_end가 datetime인 경우를 대비해 date 객체로 변환
+        return value if not hasattr(value, 'date') else value.date()
+
     def _format_response(
         self, 
         min_hours: float, 
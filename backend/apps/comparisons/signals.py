@@ -0,0 +1,24 @@
+# backend/apps/comparisons/signals.py
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import CourseAIReview
+from .services.matrix_service import get_matrix_service
+
+
+# 개요
+"""
+AI 평가 비교 행렬 스냅샷 갱신 표시
+
+- CourseAIReview 저장/삭제 시 다음 요청에서 AI 평가 세대를 즉시 다시 확인하도록 표시
+- 커밋 이후(on_commit)에 표시하여, 커밋 전 세대로 스냅샷을 다시 만드는 것을 방지
+- bulk_create 적재(generate_ai_reviews, load_ai_reviews)는 시그널을 우회하므로 주기적 세대 비교로 반영
+"""
+
+
+@receiver(post_save, sender=CourseAIReview)
+@receiver(post_delete, sender=CourseAIReview)
+def invalidate_review_matrix(sender, instance, **kwargs):
+    transaction.on_commit(get_matrix_service().invalidate)
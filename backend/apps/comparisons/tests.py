@@ -1,3 +1,264 @@
-from django.test import TestCase
+import itertools
+import math
+import os
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from apps.comparisons.models import AnalysisJob
+from apps.comparisons.services.feasibility_service import CourseFeasibilityService, FeasibilityGrid
+from apps.comparisons.services.job_service import RUNNER_WORKER, AnalysisJobService
+from apps.comparisons.services.matrix_service import ReviewMatrixService, ReviewMatrixSnapshot
+from apps.comparisons.services.score_service import ScoreService
+from apps.comparisons.services.timeline_service import TimelineService
+from apps.courses.models import Course
+
+
+class AnalysisJobQueueTests(TestCase):
+    """
+    [설계 의도]
+    - DB 테이블 큐의 선점/재등록/SSE 이벤트 순서를 고정 (LLM 호출 없이 상태 전이만 검증)
+    - 스레드 풀을 만들지 않도록 worker 모드 서비스 사용
+    """
+
+    def setUp(self):
+        self.service = AnalysisJobService(runner=RUNNER_WORKER)
+
+    @staticmethod
+    def _job(**fields):
+        return AnalysisJob.objects.create(kind=AnalysisJob.KIND_REVIEW_SUMMARY, payload={'course_id': 1}, **fields)
+
+    def test_claim_next_takes_oldest_pending_once(self):
+        first = self._job()
+        second = self._job()
+        AnalysisJob.objects.filter(pk=first.pk).update(created_at=timezone.now() - timedelta(minutes=1))
+
+        claimed = self.service.claim_next()
+        self.assertEqual(claimed.pk, first.pk)
+        self.assertEqual(claimed.status, AnalysisJob.STATUS_RUNNING)
+        self.assertEqual(claimed.attempts, 1)
+
+        self.assertEqual(self.service.claim_next().pk, second.pk)
+        self.assertIsNone(self.service.claim_next())
+
+    def test_thread_claim_skips_job_already_claimed(self):
+        job = self._job()
+        self.assertTrue(self.service._claim(job.pk))
+        self.assertFalse(self.service._claim(job.pk))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, AnalysisJob.STATUS_RUNNING)
+        self.assertEqual(job.attempts, 1)
+
+    def test_requeue_stale_retries_then_fails(self):
+        retry = self._job(status=AnalysisJob.STATUS_RUNNING, attempts=1)
+        exhausted = self._job(status=AnalysisJob.STATUS_RUNNING, attempts=2)
+        fresh = self._job(status=AnalysisJob.STATUS_RUNNING, attempts=1)
+        AnalysisJob.objects.filter(pk__in=[retry.pk, exhausted.pk]).update(
+            updated_at=timezone.now() - timedelta(minutes=30)
+        )
+
+        result = self.service.requeue_stale(stale_after=600, max_attempts=2)
+
+        self.assertEqual(result, {'requeued': 1, 'failed': 1})
+        statuses = dict(AnalysisJob.objects.values_list('pk', 'status'))
+        self.assertEqual(statuses[retry.pk], AnalysisJob.STATUS_PENDING)
+        self.assertEqual(statuses[exhausted.pk], AnalysisJob.STATUS_FAILED)
+        self.assertEqual(statuses[fresh.pk], AnalysisJob.STATUS_RUNNING)
+
+    def test_iter_events_resumes_after_last_event_id(self):
+        job = self._job(
+            status=AnalysisJob.STATUS_SUCCEEDED, total=2, completed=2,
+            result={'sections': [{'name': 'A'}, {'name': 'B'}]},
+        )
+
+        events = list(self.service.iter_events(job.pk, last_event_id=1))
+
+        self.assertEqual(events, [
+            ('section', 2, {'index': 2, 'total': 2, 'data': {'name': 'B'}}),
+            ('done', None, {'status': AnalysisJob.STATUS_SUCCEEDED, 'error': None}),
+        ])
+
+    def test_iter_events_times_out_without_progress(self):
+        job = self._job(status=AnalysisJob.STATUS_RUNNING)
+
+        events = list(self.service.iter_events(job.pk, timeout=0))
+
+        self.assertEqual(events, [('timeout', None, {'status': AnalysisJob.STATUS_RUNNING})])
+
+
+class ReviewMatrixSnapshotTests(SimpleTestCase):
+    """
+    [설계 의도]
+    - 분류 내 백분위(중간 순위)와 course_id 조회, 세대 확인 주기를 고정 (DB 없이 행 목록만으로 검증)
+    """
+
+    # (course_id, theory, practical, difficulty, duration, average_rating, classfy_name)
+    ROWS = [
+        (30, 2, 3, 3, 3, 3.0, '공학'),
+        (10, 1, 3, 3, 3, 2.5, '공학'),
+        (20, 2, 3, 3, 3, 3.5, '공학'),
+        (40, 5, 3, 3, 3, 4.75, '공학'),
+        (50, 4, 4, 4, 4, 4.0, None),
+    ]
+
+    def setUp(self):
+        self.snapshot = ReviewMatrixSnapshot(self.ROWS, generation=(5, 'v1'))
+
+    def _percentiles(self, course_id):
+        positions, _, _ = self.snapshot.positions([course_id])
+        return self.snapshot.percentiles[positions[0]].tolist()
+
+    def test_mid_rank_percentiles_within_category(self):
+        # theory 값 [1, 2, 2, 5] → 2점: (낮은 값 1 + 같은 값 2/2) / 4 = 50%
+        self.assertEqual(self._percentiles(20)[0], 50)
+        self.assertEqual(self._percentiles(30)[0], 50)
+        # 모두 같은 값(practical 3) → 50%
+        self.assertEqual(self._percentiles(10)[1], 50)
+        # 종합 평점 최고 → (3 + 0.5) / 4 = 87.5% → 88
+        self.assertEqual(self._percentiles(40)[4], 88)
+        # 분류가 없는 강좌는 단독 분류 → 50%
+        self.assertEqual(self._percentiles(50), [50, 50, 50, 50, 50])
+
+    def test_positions_keep_request_order_and_report_missing(self):
+        positions, found, missing = self.snapshot.positions([40, 99, 10])
+
+        self.assertEqual(found, [40, 10])
+        self.assertEqual(missing, [99])
+        self.assertEqual(self.snapshot.course_ids[positions].tolist(), [40, 10])
+        self.assertEqual(self.snapshot.average[positions].tolist(), [475, 250])
+
+    def test_generation_checked_once_per_interval(self):
+        service = ReviewMatrixService(check_interval=60)
+        generations = [(5, 'v1'), (5, 'v1'), (6, 'v2')]
+
+        with mock.patch.object(service, 'current_generation', side_effect=generations) as current, \
+                mock.patch.object(service, '_build', side_effect=lambda g: ReviewMatrixSnapshot(self.ROWS, g)) as build:
+            first = service.get_snapshot()
+            self.assertIs(service.get_snapshot(), first)
+            self.assertEqual((current.call_count, build.call_count), (1, 1))
+
+            service.invalidate()
+            self.assertIs(service.get_snapshot(), first)  # 세대 같음 → 재생성 없음
+            self.assertEqual((current.call_count, build.call_count), (2, 1))
+
+            service.invalidate()
+            self.assertEqual(service.get_snapshot().generation, (6, 'v2'))
+            self.assertEqual(build.call_count, 2)
+
+
+class TimelineGridTests(SimpleTestCase):
+    """
+    [설계 의도]
+    - 벡터화 행렬(timeline_grid)이 강좌 단건 판정(calculate_timeline)과 같은 결과인지 고정 (반올림 경계 포함)
+    - 사전 계산 파일(.npz)이 바뀌면 웹 워커가 다시 로드하는지 확인
+    """
+
+    WEEKLY_HOURS = [0, 1, 3, 5, 10, 40]
+
+    def _courses(self, today):
+        day = timedelta(days=1)
+        return [
+            Course(course_playtime=36000, week=10, study_end=today + 30 * day),
+            Course(course_playtime=7200, week=8, study_end=None),
+            Course(course_playtime=None, week=None, study_end=None),
+            Course(course_playtime=90000, week=4, study_end=today + day),
+            Course(course_playtime=3600, week=6, study_end=today),
+            Course(course_playtime=18000, week=12, study_end=today - 10 * day),
+            Course(course_playtime=0, week=15, study_end=today + 100 * day),
+            # 반올림 경계: 7.95 / 10 = 0.795 → round 0.8 (널널), 1 / 40 = 0.025 → round 0.03
+            Course(course_playtime=28620, week=1, study_end=None),
+        ]
+
+    def test_grid_matches_single_course_timeline(self):
+        service = TimelineService()
+        today = timezone.now().date()
+        courses = self._courses(today)
+
+        grid = service.calculate_timeline_grid(courses, self.WEEKLY_HOURS, today=today)
+
+        for row, course in enumerate(courses):
+            for column, hours in enumerate(self.WEEKLY_HOURS):
+                self.assertEqual(
+                    service.grid_entry(grid, row, column),
+                    service.calculate_timeline(course, hours),
+                    (row, hours),
+                )
+
+    @staticmethod
+    def _grid(as_of, course_ids):
+        n = len(course_ids)
+        return FeasibilityGrid(
+            as_of=as_of,
+            course_ids=np.asarray(course_ids, dtype=np.int64),
+            categories=np.array([''] * n, dtype=str),
+            weekly_hours=np.arange(1, 3),
+            min_hours_per_week=np.ones(n),
+            total_weeks=np.full(n, 10.0),
+            remaining_weeks=np.full(n, 5.0),
+            ratio=np.ones((n, 2)),
+            status=np.zeros((n, 2), dtype=np.int8),
+        )
+
+    def test_reloads_grid_file_when_changed(self):
+        today = timezone.now().date()
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'timeline_grid.npz'
+            writer = CourseFeasibilityService(path=path)
+            reader = CourseFeasibilityService(path=path)
+
+            writer.save_grid(self._grid(today, [1, 2]))
+            self.assertEqual(reader.get_grid().course_ids.tolist(), [1, 2])  # DB 계산 없이 파일 로드
+
+            writer.save_grid(self._grid(today, [3]))
+            mtime = path.stat().st_mtime + 1
+            os.utime(path, (mtime, mtime))
+            grid = reader.get_grid()
+
+            self.assertEqual(grid.course_ids.tolist(), [3])
+            self.assertEqual(grid.as_of, today)
+
+
+class MatchScoreTests(SimpleTestCase):
+    """
+    [설계 의도]
+    - 배치 점수(calculate_match_scores)가 기존 단건 공식(파이썬 round)과 소수점까지 같은지 고정
+      → top_matches / 비교 분석 / 비교 행렬이 같은 강좌에 같은 match_score를 보고
+    """
+
+    PREFERENCES = [
+        {'theory': 3, 'practical': 3, 'difficulty': 3, 'duration': 3},
+        {'theory': 5, 'practical': 1, 'difficulty': 2, 'duration': 4},
+        {'theory': 2.5, 'practical': 3.7, 'difficulty': 0.5, 'duration': 4.2},
+        {'theory': 0, 'practical': 0, 'difficulty': 0, 'duration': 0},
+    ]
+
+    @staticmethod
+    def _scalar_score(ratings, preferences):
+        """기존 단건 공식 (강좌별 루프 + round(score, 1))"""
+        sum_of_squares = 0.0
+        for rating, key in zip(ratings, ('theory', 'practical', 'difficulty', 'duration')):
+            sum_of_squares += (rating - preferences[key]) ** 2
+        score = 100 * (1 - (math.sqrt(sum_of_squares) / 10.0))
+        return round(max(0.0, min(100.0, score)), 1)
+
+    def test_vectorized_scores_match_scalar_formula(self):
+        service = ScoreService()
+        ratings = list(itertools.product(range(1, 6), repeat=4))
+
+        for preferences in self.PREFERENCES:
+            scores = service.calculate_match_scores(ratings, preferences).tolist()
+            expected = [self._scalar_score(row, preferences) for row in ratings]
+            self.assertEqual(scores, expected, preferences)
+
+    def test_missing_ratings_count_as_zero(self):
+        service = ScoreService()
+        preferences = self.PREFERENCES[1]
+
+        scores = service.calculate_match_scores([[None, 2, float('nan'), 4]], preferences).tolist()
+        self.assertEqual(scores, [self._scalar_score((0, 2, 0, 4), preferences)])
@@ -10,25 +10,55 @@
 ```
 /api/v1/comparisons/
 ├── analyze/                              # POST: 강좌 비교 분석
+│   └── jobs/                             # POST: 강좌 비교 분석 작업 등록 (비동기)
+├── top-matches/                          # GET: 선호도 기준 카탈로그 Top-K 강좌
+├── matrix/                               # GET: 강좌 N개 비교 행렬 (레이더 차트)
+├── timeline/
+│   └── feasible/                         # GET: 주당 학습 시간 기준 수강 가능 강좌
+├── jobs/
+│   └── {job_id}/                         # GET: 작업 상태/결과 조회 (폴링)
+│       └── stream/                       # GET: 작업 결과 스트리밍 (SSE)
 └── courses/
     └── {course_id}/
         └── ai-review/                    # GET: 강좌 AI 평가 상세 조회
         └── review-summary/              # GET: 강좌 리뷰 요약 조회
+            └── jobs/                     # POST: 강좌 리뷰 요약 작업 등록 (비동기)
+            └── stream/                   # GET: 강좌 리뷰 요약 스트리밍 (SSE)
+        └── comment/
+            └── stream/                   # POST: 강좌 맞춤 코멘트 스트리밍 (SSE)
         └── sentiment/                    # GET: 강좌 감성분석 조회
 ```
 
 - /api/v1/comparisons/analyze/ - 강좌 비교 분석
+- /api/v1/comparisons/top-matches/ - 선호도 기준 카탈로그 Top-K 강좌
+- /api/v1/comparisons/matrix/?ids=1,2,3 - 강좌 N개 평점/분류 내 백분위/매칭 점수
+- /api/v1/comparisons/timeline/feasible/?weekly_hours=5 - 주당 학습 시간 기준 수강 가능 강좌
 - /api/v1/comparisons/courses/<int:course_id>/ai-review/ - AI 평가 조회
 - /api/v1/comparisons/courses/<int:course_id>/review-summary/ - 강좌 리뷰 요약 조회
 - /api/v1/comparisons/courses/<int:course_id>/sentiment/ - 강좌 감성분석 조회
+- /api/v1/comparisons/analyze/jobs/ - 강좌 비교 분석 작업 등록
+- /api/v1/comparisons/courses/<int:course_id>/review-summary/jobs/ - 강좌 리뷰 요약 작업 등록
+- /api/v1/comparisons/jobs/<uuid:job_id>/ - 작업 상태/결과 조회
+- /api/v1/comparisons/jobs/<uuid:job_id>/stream/ - 작업 결과 스트리밍 (SSE)
+- /api/v1/comparisons/courses/<int:course_id>/review-summary/stream/ - 강좌 리뷰 요약 스트리밍 (SSE)
+- /api/v1/comparisons/courses/<int:course_id>/comment/stream/ - 강좌 맞춤 코멘트 스트리밍 (SSE)
 """
 
 from django.urls import path
 from .views import (
+    AnalysisJobDetailView,
+    AnalysisJobStreamView,
+    ComparisonAnalyzeJobView,
     ComparisonAnalyzeView,
+    ComparisonMatrixView,
     CourseAIReviewDetailView,
+    CourseReviewSummaryJobView,
+    CourseReviewSummaryStreamView,
     CourseReviewSummaryView,
-    CourseSentimentView
+    CourseSentimentView,
+    FeasibleCoursesView,
+    PersonalizedCommentStreamView,
+    TopMatchCoursesView,
 )
 
 app_name = 'comparisons'
@@ -41,6 +71,27 @@ urlpatterns = [
         name='comparison-analyze'
     ),
 
+    # 선호도 기준 카탈로그 Top-K 강좌
+    path(
+        'top-matches/',
+        TopMatchCoursesView.as_view(),
+        name='comparison-top-matches'
+    ),
+
+    # 강좌 N개 비교 행렬 (레이더 차트)
+    path(
+        'matrix/',
+        ComparisonMatrixView.as_view(),
+        name='comparison-matrix'
+    ),
+
+    # 주당 학습 시간 기준 수강 가능 강좌
+    path(
+        'timeline/feasible/',
+        FeasibleCoursesView.as_view(),
+        name='comparison-feasible-courses'
+    ),
+
     # 강좌 AI 평가 조회
     path(
         'courses/<int:course_id>/ai-review/',
@@ -61,4 +112,40 @@ urlpatterns = [
         CourseSentimentView.as_view(),
         name='course-sentiment'
     ),
-]
\ No newline at end of file
+
+    # 비동기 분석 작업 등록
+    path(
+        'analyze/jobs/',
+        ComparisonAnalyzeJobView.as_view(),
+        name='comparison-analyze-job'
+    ),
+    path(
+        'courses/<int:course_id>/review-summary/jobs/',
+        CourseReviewSummaryJobView.as_view(),
+        name='course-review-summary-job'
+    ),
+
+    # 비동기 분석 작업 조회 (폴링 / SSE)
+    path(
+        'jobs/<uuid:job_id>/',
+        AnalysisJobDetailView.as_view(),
+        name='analysis-job-detail'
+    ),
+    path(
+        'jobs/<uuid:job_id>/stream/',
+        AnalysisJobStreamView.as_view(),
+        name='analysis-job-stream'
+    ),
+
+    # LLM 생성 스트리밍 (SSE)
+    path(
+        'courses/<int:course_id>/review-summary/stream/',
+        CourseReviewSummaryStreamView.as_view(),
+        name='course-review-summary-stream'
+    ),
+    path(
+        'courses/<int:course_id>/comment/stream/',
+        PersonalizedCommentStreamView.as_view(),
+        name='course-comment-stream'
+    ),
+]
@@ -14,6 +14,25 @@
 4. 감성분석 API
 4.1 CourseSentimentView        | 강좌 감성분석 조회 API
 
+5. 카탈로그 매칭 API
+5.1 TopMatchCoursesView        | 선호도 기준 카탈로그 Top-K 강좌 조회 API
+
+6. 비동기 분석 작업 API
+6.1 ComparisonAnalyzeJobView   | 강좌 비교 분석 작업 등록 API
+6.2 CourseReviewSummaryJobView | 강좌 리뷰 요약 작업 등록 API
+6.3 AnalysisJobDetailView      | 작업 상태/결과 조회 API (폴링)
+6.4 AnalysisJobStreamView      | 작업 결과 스트리밍 API (Server-Sent Events)
+
+7. LLM 생성 스트리밍 API
+7.1 CourseReviewSummaryStreamView  | 강좌 리뷰 요약 스트리밍 API (SSE)
+7.2 PersonalizedCommentStreamView  | 강좌 맞춤 코멘트 스트리밍 API (SSE)
+
+8. AI 평가 비교 행렬 API
+8.1 ComparisonMatrixView       | 강좌 N개 평점/분류 내 백분위/매칭 점수 조회 API (레이더 차트)
+
+9. 수강 가능 강좌 필터 API
+9.1 FeasibleCoursesView        | 주당 학습 시간 기준 수강 가능 강좌 조회 API
+
 [구조]
 1.1 ComparisonAnalyzeView
   1) 요청 검증 `ComparisonAnalyzeRequestSerializer` 사용
@@ -54,7 +73,7 @@
 # TODO
 - 향후 캐싱 도입 검토
 - LLM 호출을 강좌별로 병렬 처리
-- Celery + asyncio 조합 검토 -> 응답 시간 단축 목적
+- Celery + asyncio 조합 검토 -> 응답 시간 단축 목적 (현재는 AnalysisJob 비동기 작업 API로 웹 워커 점유만 해소)
 - 프롬프트 버저닝 -> 프롬프트 변경 시점 추적 및 재생산성 확보
 """
 
@@ -62,24 +81,41 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
+from rest_framework.renderers import JSONRenderer
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.db.models import Count, Max, OuterRef, Subquery
 
-from apps.courses.models import Course
-from apps.comparisons.models import CourseAIReview
+from apps.core.renderers import EventStreamRenderer, format_sse
+from apps.core.utils.http_cache import Validators, conditional_get
+from apps.courses.models import Course, CourseReview
+from apps.comparisons.models import AnalysisJob, CourseAIReview
 from apps.comparisons.serializers import (
+    AnalysisJobSerializer,
+    ComparisonMatrixQuerySerializer,
+    ComparisonMatrixRowSerializer,
+    FeasibleCourseQuerySerializer,
+    FeasibleCourseSerializer,
     ComparisonAnalyzeRequestSerializer,
     ComparisonAnalyzeResponseSerializer,
     ComparisonResultSerializer,
     CourseAIReviewDetailSerializer,
+    PersonalizedCommentRequestSerializer,
+    PersonalizedCommentSerializer,
     ReviewSummarySerializer,
-    SentimentResultSerializer
-
+    SentimentResultSerializer,
+    TopMatchQuerySerializer,
+    TopMatchResultSerializer,
 )
 from apps.comparisons.services import (
     get_sentiment_service,
-    get_timeline_service,
     get_score_service,
-    get_llm_service
+    get_analysis_service,
+    get_feasibility_service,
+    get_job_service,
+    get_llm_service,
+    get_matrix_service,
 )
 import logging
 logger = logging.getLogger(__name__)
@@ -141,136 +177,33 @@ class ComparisonAnalyzeView(APIView):
         user_goal = request_serializer.validated_data['user_goal']
 
         # 2. 강좌 조회 (AI 평가 포함)
-        # select_related('ai_review'):
-        # - Course → CourseAIReview(OneToOne) 조인으로 미리 로드
-        # - N+1 쿼리 방지
-        courses = Course.objects.filter(
-            id__in=course_ids
-        ).select_related('ai_review')
-
-        # 요청한 강좌 ID와 실제 조회된 강좌 개수 비교
-        found_ids = set(courses.values_list('id', flat=True))
-        missing_ids = set(course_ids) - found_ids
+        # - select_related('ai_review')로 N+1 방지 (ComparisonAnalysisService.get_targets)
+        # NOTE AI 평가가 없는 강좌는 스킵
+        # # TODO UX관점에서 (1) 전체 실패를 하거나 (2) AI 평가 부분만 NULL로 보내서 프론트엔드에서 "평가 준비중" 표시하는 방안도 고려 가능
+        analysis_service = get_analysis_service()
+        targets, missing_ids = analysis_service.get_targets(course_ids)
 
         if missing_ids:
             # 일부 강좌가 없으면 404 반환
             return Response(
                 {
                     'detail': '일부 강좌를 찾을 수 없습니다.',
-                    'missing_ids': list(missing_ids)
+                    'missing_ids': missing_ids
                 },
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # 3. 서비스 인스턴스 가져오기 (싱글톤)
-        sentiment_service = get_sentiment_service()
-        timeline_service = get_timeline_service()
-        score_service = get_score_service()
-        llm_service = get_llm_service()
-
-        # 4. 각 강좌별 분석 수행
-        results = []
-
-        for course in courses:
-            # 4-1. AI 평가 확인
-            try:
-                ai_review = course.ai_review
-            except CourseAIReview.DoesNotExist:
-                # NOTE
-                # AI 평가가 없는 강좌는 스킵
-                # # TODO UX관점에서 (1) 전체 실패를 하거나 (2) AI 평가 부분만 NULL로 보내서 프론트엔드에서 "평가 준비중" 표시하는 방안도 고려 가능
-                continue
-
-            # 4-2. 매칭 점수 계산
-            match_score = score_service.calculate_match_score(
-                ai_review=ai_review,
-                user_preferences=user_preferences
-            )
-
-            # 4-3. 감성분석 수행
-            sentiment_result = sentiment_service.analyze_course_reviews(
-                course_id=course.id
-            )
-
-            # 4-4. 타임라인 시뮬레이션
-            timeline_result = timeline_service.calculate_timeline(
-                course=course,
-                weekly_hours=weekly_hours
-            )
-
-            # 4-5. 맞춤 코멘트 생성
-            try:
-                personalized_comment = llm_service.generate_personalized_comment(
-                    course=course,
-                    ai_review=ai_review,
-                    user_goal=user_goal,
-                )
-            # LLM 호출 과정에서 발생할 수 있는 모든 예외를 포괄적으로 처리
-            # 네트워크 오류, 타임아웃, API 제한 초과, JSON 파싱 오류 등
-            except Exception as e: 
-                # LLM 호출 실패 시 로그로 기록하여 추후 디버깅/모니터링 가능하게 함.
-                logger.warning(
-                    f'리뷰 요약 생성 실패 (Course {course.id}): {str(e)}',
-                    # 어떤 강좌에서 실패했는지 + 예외 메시지를 함께 기록
-                    exc_info=True # trackbqack까지 로그에 남김.
-                )
-                # LLM 호출 실패 시데오 API응답 구조를 깨뜨리지 않기 위한 gracefull  fallback 처리
-                # 전체 요청을 실패시키지 않고 안내 메시지 제공
-                personalized_comment = {
-                    'course_id': course.id,
-                    # 실패했더라도 UI에서 강좌 이름은 보여줄 수 있도록 함.
-                    'course_name': course.name,
-                    # 사용자에게 안내 메시지 제공
-                    'recommendation_reason': '현재 개인화 추천을 생성할 수 없습니다. 잠시 후 다시 시도해주세요.',
-                    # 빈 리스트만 제공.
-                    'key_points': []
-                }
-
-                
-            # 4-6. 리뷰 요약 생성
-            try:
-                review_summary = llm_service.generate_review_summary(
-                    course_id=course.id
-                )
-            except Exception as e:
-                # LLM 호출 실패 시 로그로 기록
-                logger.warning(
-                    f'리뷰 요약 생성 실패 (Course {course.id}): {str(e)}',
-                    exc_info=True
-                )
-                # gracefull fallback 처리
-                review_summary = {
-                    'course_id': course.id,
-                    'course_name': course.name,
-                    'review_summary': {  
-                        'summary': '현재 리뷰 요약을 생성할 수 없습니다. 잠시 후 다시 시도해주세요.',
-                        'pros': [],
-                        'cons': []
-                    },
-                    'review_count': 0,
-                    'reliability': 'low',
-                    'warning_message': '리뷰 요약 생성에 실패했습니다.'
-                }
-
-            # 4-7. 결과 데이터 구성
-            result_data = {
-                'course': course,
-                'ai_review': ai_review,
-                'match_score': match_score,
-                'sentiment': sentiment_result,
-                'timeline': timeline_result,
-                'personalized_comment': personalized_comment,
-                'review_summary': review_summary
-            }
-
-            results.append(result_data)
+        # 3~4. 각 강좌별 분석 수행 (매칭 점수 / 감성분석 / 타임라인 / 맞춤 코멘트 / 리뷰 요약)
+        # - LLM 호출 실패 시 강좌별 graceful fallback (전체 요청은 실패시키지 않음)
+        results = list(analysis_service.iter_results(
+            targets,
+            weekly_hours=weekly_hours,
+            user_preferences=user_preferences,
+            user_goal=user_goal,
+        ))
 
         # 5. 매칭 점수 기준 내림차순 정렬
-        # 점수가 높은 강좌가 먼저 오도록
-        results.sort(
-            key=lambda x: x['match_score'],
-            reverse=True
-        )
+        results = analysis_service.sort_results(results)
 
         # 6. 응답 직렬화
         response_data = {'results': results}
@@ -377,30 +310,9 @@ class CourseReviewSummaryView(APIView):
         # 1. 강좌 존재 여부 확인
         course = get_object_or_404(Course, pk=course_id)
 
-        # 2. 서비스 인스턴스 가져오기 (싱글톤)
-        llm_service = get_llm_service()
-
-        # 3. 리뷰 요약 생성
-        try:
-            review_summary = llm_service.generate_review_summary(
-                course_id=course.id
-            )
-        except Exception as e:
-            # LLM 호출 실패 시 에러 로깅 후 fallback 메시지 반환
-            # 전체 요청을 500으로 실패시키지 않고 안내 메시지 제공
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(
-                f'리뷰 요약 생성 실패 (Course {course_id}): {str(e)}',
-                exc_info=True
-            )
-
-            review_summary = {
-                'summary': '일시적으로 리뷰 요약을 제공할 수 없습니다. 잠시 후 다시 시도해주세요.',
-                'review_count': 0,
-                'reliability': 'low',
-                'warning_message': 'LLM 서비스 일시적 오류가 발생했습니다'
-            }
+        # 2. 리뷰 요약 생성
+        # - LLM 호출 실패 시 500 대신 안내 메시지 반환 (ComparisonAnalysisService.get_review_summary)
+        review_summary = get_analysis_service().get_review_summary(course.id)
 
         # 4. 직렬화 및 응답
         serializer = ReviewSummarySerializer(review_summary)
@@ -437,6 +349,28 @@ class CourseSentimentView(APIView):
 
     permission_classes = [AllowAny]    # courses/ 강좌 상세 페이지에서 비로그인 사용자도 접근 가능해야 함.
 
+    def get_validators(self, request, course_id):
+        """
+        조건부 응답 검증자: 리뷰 (개수, 최신 수정 시각) + 감성분석 모델 버전
+
+        - 리뷰와 모델이 그대로면 결과도 같으므로 추론 전체를 건너뛰고 304 응답
+        - 사용자와 무관한 응답이므로 공개(public) 캐시 허용
+        """
+        reviews = CourseReview.objects.filter(course=OuterRef('pk')).values('course')
+        row = Course.objects.filter(pk=course_id).annotate(
+            review_count=Subquery(reviews.annotate(cnt=Count('pk')).values('cnt')),
+            review_updated_at=Subquery(reviews.annotate(latest=Max('updated_at')).values('latest')),
+        ).values('review_count', 'review_updated_at').first()
+        if row is None:
+            return None  # 404는 본 View에서 처리
+
+        return Validators(
+            parts=('course-sentiment', course_id, row['review_count'], row['review_updated_at'],
+                   get_sentiment_service().get_model_version()),
+            last_modified=row['review_updated_at'],
+        )
+
+    @conditional_get(max_age=60)
     def get(self, request, course_id):
         """
         강좌 리뷰 감성분석 조회
@@ -480,4 +414,370 @@ class CourseSentimentView(APIView):
         return Response(
             response_serializer.data,
             status=status.HTTP_200_OK
-        )
\ No newline at end of file
+        )
+
+
+# =========================
+# 5. 카탈로그 매칭 API
+# =========================
+
+# 5.1 TopMatchCoursesView | 선호도 기준 카탈로그 Top-K 강좌 조회 API
+class TopMatchCoursesView(APIView):
+    """
+    [API]
+    - GET: /api/v1/comparisons/top-matches/?theory=3&practical=4&difficulty=2&duration=3&limit=10
+
+    [설계 의도]
+    - 사용자가 직접 고른 2~4개 강좌가 아니라, 카탈로그 전체에서
+      선호도(user_preferences)와 가장 잘 맞는 강좌를 매칭 점수 순으로 제공
+    - 비교 분석과 같은 ScoreService 점수 체계 사용 (점수 일관성)
+
+    [상세 고려 사항]
+    - 인증 필요 (전역 설정 IsAuthenticated, 비교 분석 API와 동일)
+    - 정렬/LIMIT은 DB에서 수행 (ScoreService.top_matches)
+    - 분류 필터: classfy_name(대분류), middle_classfy_name(중분류, 다중)
+    """
+
+    def get(self, request):
+        # 1. 조회 조건 검증
+        query_serializer = TopMatchQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        params = query_serializer.validated_data
+
+        user_preferences = {
+            key: params[key] for key in get_score_service().MATCHING_FIELDS.values()
+        }
+
+        # 2. Top-K 조회 (DB 정렬 + 벡터화 점수 계산)
+        results = get_score_service().top_matches(
+            user_preferences=user_preferences,
+            limit=params['limit'],
+            classfy_name=params.get('classfy_name') or None,
+            middle_classfy_names=params.get('middle_classfy_name'),
+        )
+
+        # 3. 응답 반환
+        return Response(
+            {
+                'results': TopMatchResultSerializer(results, many=True).data,
+                'count': len(results),
+            },
+            status=status.HTTP_200_OK
+        )
+
+
+# =========================
+# 6. 비동기 분석 작업 API
+# - LLM 호출이 포함된 분석을 웹 요청 밖(스레드 풀 / 워커 컨테이너)에서 실행
+# - 등록 API는 job id를 즉시 반환(202), 결과는 폴링 또는 SSE 스트림으로 조회
+# =========================
+
+def _sse_response(stream) -> StreamingHttpResponse:
+    """SSE 응답 (캐시/프록시 버퍼링 비활성화 → 이벤트 단위 즉시 전달)"""
+    response = StreamingHttpResponse(stream, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+def _job_accepted_response(job: AnalysisJob) -> Response:
+    """작업 등록 응답 (202 Accepted + 조회/스트림 URL)"""
+    return Response(
+        {
+            'job_id': job.id,
+            'status': job.status,
+            'status_url': reverse('comparisons:analysis-job-detail', kwargs={'job_id': job.id}),
+            'stream_url': reverse('comparisons:analysis-job-stream', kwargs={'job_id': job.id}),
+        },
+        status=status.HTTP_202_ACCEPTED
+    )
+
+
+# 6.1 ComparisonAnalyzeJobView | 강좌 비교 분석 작업 등록 API
+class ComparisonAnalyzeJobView(APIView):
+    """
+    [API]
+    - POST: /api/v1/comparisons/analyze/jobs/
+
+    [설계 의도]
+    - ComparisonAnalyzeView와 같은 요청/결과 형식, 실행만 비동기
+    - 강좌별 결과(섹션)는 끝나는 즉시 스트림으로 전달
+
+    [상세 고려 사항]
+    - 요청 검증과 강좌 존재 여부(404)는 등록 시점에 즉시 확인
+    """
+
+    def post(self, request):
+        # 1. 요청 데이터 검증
+        request_serializer = ComparisonAnalyzeRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        data = request_serializer.validated_data
+
+        # 2. 강좌 존재 여부 확인
+        _, missing_ids = get_analysis_service().get_targets(data['course_ids'])
+        if missing_ids:
+            return Response(
+                {
+                    'detail': '일부 강좌를 찾을 수 없습니다.',
+                    'missing_ids': missing_ids
+                },
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        # 3. 작업 등록
+        job = get_job_service().submit(
+            AnalysisJob.KIND_COMPARISON,
+            payload={
+                'course_ids': list(data['course_ids']),
+                'weekly_hours': data['weekly_hours'],
+                'user_preferences': dict(data['user_preferences']),
+                'user_goal': data['user_goal'],
+            },
+            user=request.user,
+        )
+        return _job_accepted_response(job)
+
+
+# 6.2 CourseReviewSummaryJobView | 강좌 리뷰 요약 작업 등록 API
+class CourseReviewSummaryJobView(APIView):
+    """
+    [API]
+    - POST: /api/v1/comparisons/courses/{course_id}/review-summary/jobs/
+
+    [설계 의도]
+    - CourseReviewSummaryView와 같은 결과 형식, 실행만 비동기
+    """
+
+    def post(self, request, course_id):
+        course = get_object_or_404(Course, pk=course_id)
+        job = get_job_service().submit(
+            AnalysisJob.KIND_REVIEW_SUMMARY,
+            payload={'course_id': course.id},
+            user=request.user,
+        )
+        return _job_accepted_response(job)
+
+
+# 6.3 AnalysisJobDetailView | 작업 상태/결과 조회 API (폴링)
+class AnalysisJobDetailView(APIView):
+    """
+    [API]
+    - GET: /api/v1/comparisons/jobs/{job_id}/
+
+    [상세 고려 사항]
+    - 본인이 등록한 작업만 조회 가능 (다른 사용자의 작업은 404)
+    - 진행 중에도 끝난 섹션은 sections로 제공
+    """
+
+    def get(self, request, job_id):
+        job = get_object_or_404(AnalysisJob, pk=job_id, user=request.user)
+        return Response(AnalysisJobSerializer(job).data, status=status.HTTP_200_OK)
+
+
+# 6.4 AnalysisJobStreamView | 작업 결과 스트리밍 API (Server-Sent Events)
+class AnalysisJobStreamView(APIView):
+    """
+    [API]
+    - GET: /api/v1/comparisons/jobs/{job_id}/stream/
+
+    [설계 의도]
+    - 강좌별 결과가 끝나는 즉시 `event: section`으로 전달, 작업 종료 시 `event: done`
+
+    [상세 고려 사항]
+    - 이벤트 id = 섹션 번호 → 재연결 시 Last-Event-ID 헤더(또는 ?last_event_id=) 이후 섹션만 전송
+    - 연결 1회 최대 유지 시간(ANALYSIS_JOB_STREAM_TIMEOUT) 후 `event: timeout`으로 종료 → 클라이언트 재연결
+    - 토큰 인증(Authorization 헤더)이 필요하므로 브라우저 EventSource 대신 fetch 스트림으로 수신
+    - 프록시 버퍼링 비활성화(X-Accel-Buffering: no)로 섹션 단위 즉시 전달
+    """
+
+    renderer_classes = [EventStreamRenderer, JSONRenderer]
+
+    def get(self, request, job_id):
+        job = get_object_or_404(AnalysisJob, pk=job_id, user=request.user)
+
+        last_event_id = request.META.get('HTTP_LAST_EVENT_ID') or request.query_params.get('last_event_id') or 0
+        try:
+            last_event_id = int(last_event_id)
+        except (TypeError, ValueError):
+            last_event_id = 0
+
+        def event_stream():
+            for event, event_id, data in get_job_service().iter_events(job.id, last_event_id):
+                if event is None:
+                    yield b': keep-alive\n\n'
+                else:
+                    yield format_sse(data, event=event, event_id=event_id)
+
+        return _sse_response(event_stream())
+
+
+# =========================
+# 7. LLM 생성 스트리밍 API
+# - LLM 응답을 토큰 단위로 받아, 생성 중인 요약/추천 이유를 `event: delta`로 바로 전달
+# - 완료 시 기존 API와 같은 형식의 최종 결과를 `event: done`으로 전달
+# - 실패 시 `event: error` 후 기존 API와 같은 안내 메시지를 `event: done`으로 전달 (UI 처리 일관성)
+# =========================
+
+# 7.1 CourseReviewSummaryStreamView | 강좌 리뷰 요약 스트리밍 API (SSE)
+class CourseReviewSummaryStreamView(APIView):
+    """
+    [API]
+    - GET: /api/v1/comparisons/courses/{course_id}/review-summary/stream/
+
+    [이벤트]
+    - meta  : {review_count, reliability, warning_message} | LLM 호출 전
+    - delta : {summary, pros, cons} | 지금까지 생성된 내용 (전체 스냅샷, 화면 교체용)
+    - done  : ReviewSummarySerializer 형식 최종 결과
+
+    [상세 고려 사항]
+    - 첫 내용 표시까지의 대기 시간이 전체 생성 시간 → 첫 토큰 지연으로 단축
+    - 토큰 인증(Authorization 헤더)이 필요하므로 브라우저 EventSource 대신 fetch 스트림으로 수신
+    """
+
+    renderer_classes = [EventStreamRenderer, JSONRenderer]
+
+    def get(self, request, course_id):
+        course = get_object_or_404(Course, pk=course_id)
+
+        def event_stream():
+            try:
+                for event, data in get_llm_service().stream_review_summary(course.id):
+                    if event == 'result':
+                        yield format_sse(ReviewSummarySerializer(data).data, event='done')
+                    else:
+                        yield format_sse(data, event=event)
+            except Exception as e:
+                logger.error(f'리뷰 요약 스트리밍 실패 (Course {course.id}): {str(e)}', exc_info=True)
+                fallback = get_analysis_service().review_summary_fallback()
+                yield format_sse({'detail': fallback['warning_message']}, event='error')
+                yield format_sse(ReviewSummarySerializer(fallback).data, event='done')
+
+        return _sse_response(event_stream())
+
+
+# 7.2 PersonalizedCommentStreamView | 강좌 맞춤 코멘트 스트리밍 API (SSE)
+class PersonalizedCommentStreamView(APIView):
+    """
+    [API]
+    - POST: /api/v1/comparisons/courses/{course_id}/comment/stream/
+      body: {"user_goal": "..."}
+
+    [이벤트]
+    - delta : {recommendation_reason, key_points} | 지금까지 생성된 내용 (전체 스냅샷)
+    - done  : PersonalizedCommentSerializer 형식 최종 결과 (응답 캐시 적중 시 delta 없이 바로 전달)
+
+    [상세 고려 사항]
+    - 학습 목표 검증은 강좌 비교 분석 요청과 동일 (400은 스트림 시작 전에 반환)
+    - AI 평가가 없는 강좌는 404
+    """
+
+    renderer_classes = [EventStreamRenderer, JSONRenderer]
+
+    def post(self, request, course_id):
+        request_serializer = PersonalizedCommentRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        user_goal = request_serializer.validated_data['user_goal']
+
+        course = get_object_or_404(Course.objects.select_related('ai_review'), pk=course_id)
+        try:
+            ai_review = course.ai_review
+        except CourseAIReview.DoesNotExist:
+            return Response(
+                {'detail': '해당 강좌의 AI 평가가 존재하지 않습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        def event_stream():
+            try:
+                for event, data in get_llm_service().stream_personalized_comment(course, ai_review, user_goal):
+                    if event == 'result':
+                        yield format_sse(PersonalizedCommentSerializer(data).data, event='done')
+                    else:
+                        yield format_sse(data, event=event)
+            except Exception as e:
+                logger.warning(f'맞춤 코멘트 스트리밍 실패 (Course {course.id}): {str(e)}', exc_info=True)
+                fallback = get_analysis_service().personalized_comment_fallback(course)
+                yield format_sse({'detail': fallback['recommendation_reason']}, event='error')
+                yield format_sse(PersonalizedCommentSerializer(fallback).data, event='done')
+
+        return _sse_response(event_stream())
+
+
+# =========================
+# 8. AI 평가 비교 행렬 API
+# =========================
+
+# 8.1 ComparisonMatrixView | 강좌 N개 비교 행렬 조회 API
+class ComparisonMatrixView(APIView):
+    """
+    [API]
+    - GET: /api/v1/comparisons/matrix/?ids=1,2,3[&theory=3&practical=4&difficulty=2&duration=3]
+
+    [설계 의도]
+    - 비교 화면/레이더 차트 데이터 (평점 4개, 종합 평점, 같은 대분류 내 백분위, 매칭 점수)
+    - DB 조회 없이 메모리 스냅샷(ReviewMatrixService)에서 벡터화 1회로 계산
+
+    [상세 고려 사항]
+    - 요청 순서대로 반환, AI 평가가 없거나 존재하지 않는 강좌는 missing_ids로 분리 (404 대신 부분 응답)
+    - 인증 필요 (전역 설정 IsAuthenticated, 비교 분석 API와 동일)
+    """
+
+    def get(self, request):
+        query_serializer = ComparisonMatrixQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        params = query_serializer.validated_data
+
+        matrix = get_matrix_service().lookup(params['ids'], params['user_preferences'])
+
+        return Response(
+            {
+                'labels': matrix['labels'],
+                'results': ComparisonMatrixRowSerializer(matrix['results'], many=True).data,
+                'missing_ids': matrix['missing_ids'],
+                'snapshot': matrix['snapshot'],
+            },
+            status=status.HTTP_200_OK
+        )
+
+
+# =========================
+# 9. 수강 가능 강좌 필터 API
+# =========================
+
+# 9.1 FeasibleCoursesView | 주당 학습 시간 기준 수강 가능 강좌 조회 API
+class FeasibleCoursesView(APIView):
+    """
+    [API]
+    - GET: /api/v1/comparisons/timeline/feasible/?weekly_hours=5[&status=적정&status=널널&classfy_name=...&limit=20&offset=0]
+
+    [설계 의도]
+    - 수강신청 중인 강좌 전체에서 "주 N시간으로 들을 수 있는 강좌"를 학습 강도(ratio) 낮은 순으로 제공
+    - 판정 규칙은 비교 분석 화면의 타임라인(TimelineService)과 동일
+
+    [상세 고려 사항]
+    - 강좌 × weekly_hours 행렬은 야간 사전 계산(precompute_timeline_grid), 요청은 열 1개 마스킹/정렬만 수행
+    - 강좌 정보는 현재 페이지 강좌만 조회
+    - 인증 필요 (전역 설정 IsAuthenticated, 비교 분석 API와 동일)
+    """
+
+    def get(self, request):
+        query_serializer = FeasibleCourseQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        params = query_serializer.validated_data
+
+        feasible = get_feasibility_service().feasible_courses(
+            weekly_hours=params['weekly_hours'],
+            statuses=params['status'],
+            classfy_name=params.get('classfy_name') or None,
+            limit=params['limit'],
+            offset=params['offset'],
+        )
+
+        return Response(
+            {
+                'as_of': feasible['as_of'],
+                'count': feasible['count'],
+                'results': FeasibleCourseSerializer(feasible['results'], many=True).data,
+            },
+            status=status.HTTP_200_OK
+        )
@@ -0,0 +1,45 @@
+# backend/apps/core/batch/__init__.py
+
+"""
+외부 API 대량 호출용 배치 엔진
+
+[구성]
+1. TokenBucket      | 초당 요청 수 제한 (고정 sleep 대체)
+2. post_with_retry  | 429/5xx/네트워크 오류 시 지수 백오프 재시도
+3. Checkpoint       | 재시작 가능한 작업 체크포인트 (JSONL, 버전 키)
+4. ProgressReporter | 처리량/ETA 실시간 출력
+5. run_concurrent   | N개 동시 요청 + 결과는 메인 스레드에서 처리 (DB 저장 등)
+6. jobs             | 오프라인 배치 모드 (요청 JSONL → 배치 작업 제출 → 결과 스트리밍 반영)
+7. BatchModeCommandMixin | 관리 커맨드용 배치 모드 옵션/단계 실행 공용 로직
+"""
+
+from .rate_limit import TokenBucket
+from .retry import RetryableError, post_with_retry
+from .checkpoint import Checkpoint
+from .progress import ProgressReporter
+from .runner import run_concurrent
+from .jobs import (
+    BatchJob,
+    BatchWorkspace,
+    get_batch_adapter,
+    iter_results,
+    wait_for_job,
+    write_requests,
+)
+from .command import BatchModeCommandMixin
+
+__all__ = [
+    'TokenBucket',
+    'RetryableError',
+    'post_with_retry',
+    'Checkpoint',
+    'ProgressReporter',
+    'run_concurrent',
+    'BatchJob',
+    'BatchWorkspace',
+    'get_batch_adapter',
+    'iter_results',
+    'wait_for_job',
+    'write_requests',
+    'BatchModeCommandMixin',
+]
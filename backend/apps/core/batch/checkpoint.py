@@ -0,0 +1,95 @@
+# backend/apps/core/batch/checkpoint.py
+
+"""
+재시작 가능한 배치 체크포인트
+
+[설계 의도]
+- 수 시간짜리 배치가 중간에 끊겨도(네트워크, 배포, Ctrl+C) 처음부터 다시 돌리지 않도록
+  "완료된 항목"을 파일에 남기고 재실행 시 건너뜀
+- 키는 (항목 ID, 버전) 조합 → 프롬프트/모델 버전이 바뀌면 자연스럽게 전체 재처리
+
+[파일 형식 (JSONL, 추가 전용)]
+{"key": 123, "version": "v2.1"}
+
+[상세 고려사항]
+- 추가(append) 전용 + 매 기록마다 flush/fsync → 비정상 종료 시에도 마지막 줄까지 보존
+- 마지막 줄이 잘려 있으면(기록 중 종료) 열 때 해당 줄을 잘라냄
+  → 그대로 두면 다음 추가 기록이 잘린 줄 뒤에 이어 붙어 새 항목까지 읽을 수 없게 됨
+- DB 저장이 끝난 항목만 기록해야 함 (체크포인트가 DB보다 앞서지 않도록)
+"""
+
+import json
+import os
+from typing import Iterable, Set
+
+
+class Checkpoint:
+    """
+    Args:
+        path: 체크포인트 파일 경로
+        version: 현재 작업 버전 (다른 버전으로 기록된 항목은 미완료로 취급)
+    """
+
+    def __init__(self, path: str, version: str):
+        self.path = path
+        self.version = version
+        self._done: Set = set()
+        self._file = None
+        self._load()
+
+    def _load(self):
+        if not os.path.isfile(self.path):
+            return
+        with open(self.path, 'rb+') as f:
+            complete = 0  # 마지막 완전한 줄(개행 포함)의 끝 위치
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # 기록 도중 종료된 마지막 줄
+                complete += len(line)
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry.get('version') == self.version:
+                    self._done.add(entry.get('key'))
+
+            if complete < f.seek(0, os.SEEK_END):
+                f.truncate(complete)
+
+    def __contains__(self, key) -> bool:
+        return key in self._done
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    @property
+    def done_keys(self) -> Set:
+        return set(self._done)
+
+    def mark_done(self, keys: Iterable):
+        """완료 항목 기록 (DB 반영 이후 호출)"""
+        keys = [key for key in keys if key not in self._done]
+        if not keys:
+            return
+
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+
+        for key in keys:
+            self._file.write(json.dumps({'key': key, 'version': self.version}) + '\n')
+            self._done.add(key)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def reset(self):
+        """체크포인트 초기화 (파일 삭제)"""
+        self.close()
+        if os.path.isfile(self.path):
+            os.remove(self.path)
+        self._done.clear()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
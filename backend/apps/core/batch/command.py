@@ -0,0 +1,148 @@
+# backend/apps/core/batch/command.py
+
+"""
+관리 커맨드용 배치 모드 공용 로직
+
+[설계 의도]
+- generate_ai_reviews, make_embeddings가 같은 옵션/단계(prepare → submit → collect)를 공유
+- 커맨드는 "요청 만들기(build_requests)"와 "결과 반영하기(apply_results)"만 구현
+
+[사용 예시]
+# 한 번에 실행 (제출 후 완료될 때까지 폴링)
+python manage.py make_embeddings --batch run --batch-adapter local
+
+# 단계별 실행 (배치 완료까지 수 시간 걸리는 경우)
+python manage.py generate_ai_reviews --batch prepare
+python manage.py generate_ai_reviews --batch submit
+python manage.py generate_ai_reviews --batch collect
+"""
+
+import os
+
+from django.conf import settings
+from django.core.management.base import CommandError
+
+from .jobs import BATCH_ADAPTERS, BatchWorkspace, get_batch_adapter, iter_results, wait_for_job, write_requests
+
+DEFAULT_BATCH_API_BASE = os.environ.get(
+    'OPENAI_BATCH_BASE', 'https://gms.ssafy.io/gmsapi/api.openai.com/v1'
+)
+
+BATCH_STEPS = ['prepare', 'submit', 'collect', 'run']
+
+
+class BatchModeCommandMixin:
+    """
+    BaseCommand와 함께 사용하는 배치 모드 믹스인
+
+    - add_batch_arguments(parser): add_arguments()에서 호출
+    - run_batch_mode(...): handle()에서 options['batch']가 있으면 호출
+    """
+
+    def add_batch_arguments(self, parser):
+        parser.add_argument(
+            '--batch',
+            choices=BATCH_STEPS,
+            default=None,
+            help='오프라인 배치 모드 단계 (prepare: 요청 JSONL 작성, submit: 제출, collect: 결과 반영, run: 전체)'
+        )
+        parser.add_argument(
+            '--batch-adapter',
+            choices=sorted(BATCH_ADAPTERS),
+            default='openai',
+            help='배치 작업 어댑터 (local: 파일 기반 테스트용)'
+        )
+        parser.add_argument(
+            '--batch-dir',
+            type=str,
+            default=None,
+            help='배치 작업 파일 디렉토리 (기본: data/batch/<작업명>)'
+        )
+        parser.add_argument(
+            '--batch-api-base',
+            type=str,
+            default=DEFAULT_BATCH_API_BASE,
+            help='Batch API 기본 URL (openai 어댑터)'
+        )
+        parser.add_argument(
+            '--batch-poll-interval',
+            type=float,
+            default=60.0,
+            help='collect 단계 상태 조회 간격(초)'
+        )
+        parser.add_argument(
+            '--batch-timeout',
+            type=float,
+            default=None,
+            help='collect 단계 최대 대기 시간(초), 초과 시 종료 후 다시 collect로 재개'
+        )
+
+    def run_batch_mode(self, options, *, name, endpoint, build_requests, apply_results, api_key=None):
+        """
+        배치 모드 단계 실행
+
+        Args:
+            name: 작업 이름 (기본 작업 디렉토리명)
+            endpoint: 요청 엔드포인트 (예: /v1/embeddings)
+            build_requests: () -> Iterable[(custom_id, body)]
+            apply_results: (Iterator[(custom_id, body, error)]) -> (성공 수, 실패 수)
+            api_key: openai 어댑터 인증 키
+        """
+        step = options['batch']
+        workspace = BatchWorkspace(
+            options['batch_dir'] or os.path.join(settings.BASE_DIR.parent, 'data', 'batch', name)
+        )
+
+        if step in ('prepare', 'run'):
+            count = write_requests(workspace.input_path, build_requests(), endpoint)
+            self.stdout.write(self.style.SUCCESS(f'✅ 요청 {count}건 작성: {workspace.input_path}'))
+            if count == 0:
+                return
+
+        if step in ('submit', 'run'):
+            if not os.path.isfile(workspace.input_path):
+                raise CommandError(f'요청 파일이 없습니다. 먼저 --batch prepare를 실행하세요: {workspace.input_path}')
+
+            adapter = self._get_batch_adapter(options['batch_adapter'], options, workspace, api_key)
+            job = adapter.submit(workspace.input_path, endpoint, metadata={'name': name})
+            workspace.save_job(job)
+            self.stdout.write(self.style.SUCCESS(f'✅ 배치 작업 제출: {job.job_id} ({job.adapter})'))
+
+        if step in ('collect', 'run'):
+            job = workspace.load_job()
+            if job is None:
+                raise CommandError(f'제출된 작업이 없습니다. 먼저 --batch submit을 실행하세요: {workspace.job_path}')
+
+            adapter = self._get_batch_adapter(job.adapter, options, workspace, api_key)
+
+            def on_poll(current):
+                counts = current.request_counts
+                self.stdout.write(
+                    f'  [{current.job_id}] {current.status} '
+                    f'({counts.get("completed", 0)}/{counts.get("total", "?")}, 실패 {counts.get("failed", 0)})'
+                )
+
+            job = wait_for_job(
+                adapter, job,
+                poll_interval=options['batch_poll_interval'],
+                timeout=options['batch_timeout'],
+                on_poll=on_poll,
+            )
+            workspace.save_job(job)
+
+            if not job.is_terminal:
+                self.stdout.write(self.style.WARNING('⏳ 아직 처리 중입니다. 나중에 --batch collect로 다시 실행하세요.'))
+                return
+            if job.status != 'completed':
+                raise CommandError(f'배치 작업이 완료되지 않았습니다: {job.status}')
+
+            adapter.download(job, workspace.output_path)
+            succeeded, failed = apply_results(iter_results(workspace.output_path))
+            self.stdout.write(self.style.SUCCESS(f'✅ 결과 반영 완료 - 성공 {succeeded}건, 실패 {failed}건'))
+
+    def _get_batch_adapter(self, adapter_name, options, workspace, api_key):
+        if adapter_name == 'local':
+            return get_batch_adapter('local', root=os.path.join(workspace.root, 'local_jobs'))
+        if not api_key:
+            raise CommandError('GMS_KEY 환경변수가 설정되지 않았습니다.')
+        return get_batch_adapter('openai', base_url=options['batch_api_base'], api_key=api_key)
@@ -0,0 +1,78 @@
+# backend/apps/core/batch/fake.py
+
+"""
+로컬 테스트용 가짜 API 응답 생성기
+
+[설계 의도]
+- fake_llm_server(HTTP)와 LocalFileBatchAdapter(파일 배치)가 같은 응답 규칙을 쓰도록 공용화
+- 실제 API 비용 없이 배치 엔진/배치 모드 전체 흐름(요청 → 응답 파싱 → DB 반영) 검증
+
+[상세 고려사항]
+- chat.completions: generate_ai_reviews 검증 규칙을 통과하는 평가 JSON 반환
+- embeddings: 입력 텍스트 해시로 시드를 고정한 단위 벡터 → 같은 입력이면 같은 벡터
+"""
+
+import hashlib
+import json
+import math
+import random
+
+FAKE_EMBEDDING_DIMENSIONS = 1536
+
+
+def fake_chat_completion(body: dict, completion_id: str = 'chatcmpl-fake') -> dict:
+    """OpenAI chat.completions 응답 형식의 가짜 평가 결과"""
+    content = {
+        'course_summary': '로컬 테스트용 강좌 요약입니다. 핵심 개념과 실습을 함께 다룹니다.',
+        'theory_rating': random.randint(1, 5),
+        'practical_rating': random.randint(1, 5),
+        'difficulty_rating': random.randint(1, 5),
+        'reasoning': {
+            'theory': '테스트 근거',
+            'practical': '테스트 근거',
+            'difficulty': '테스트 근거',
+        },
+    }
+    return {
+        'id': completion_id,
+        'object': 'chat.completion',
+        'model': body.get('model', 'fake'),
+        'choices': [{
+            'index': 0,
+            'message': {'role': 'assistant', 'content': json.dumps(content, ensure_ascii=False)},
+            'finish_reason': 'stop',
+        }],
+    }
+
+
+def fake_embedding(body: dict) -> dict:
+    """OpenAI embeddings 응답 형식의 결정적(deterministic) 가짜 벡터"""
+    inputs = body.get('input', '')
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    dimensions = body.get('dimensions') or FAKE_EMBEDDING_DIMENSIONS
+
+    data = []
+    for index, text in enumerate(inputs):
+        seed = int.from_bytes(hashlib.md5(str(text).encode('utf-8')).digest()[:8], 'big')
+        rng = random.Random(seed)
+        vector = [rng.gauss(0, 1) for _ in range(dimensions)]
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        data.append({'object': 'embedding', 'index': index, 'embedding': [v / norm for v in vector]})
+
+    return {'object': 'list', 'model': body.get('model', 'fake'), 'data': data}
+
+
+def fake_response(url: str, body: dict, request_id: str = 'fake'):
+    """
+    엔드포인트별 가짜 응답
+
+    Returns:
+        (status_code, response_body)
+    """
+    path = url.rstrip('/')
+    if path.endswith('/chat/completions'):
+        return 200, fake_chat_completion(body, completion_id=f'chatcmpl-{request_id}')
+    if path.endswith('/embeddings'):
+        return 200, fake_embedding(body)
+    return 404, {'error': {'message': f'지원하지 않는 엔드포인트: {url}'}}
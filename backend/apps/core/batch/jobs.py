@@ -0,0 +1,349 @@
+# backend/apps/core/batch/jobs.py
+
+"""
+오프라인 배치 모드 (Provider Batch API)
+
+[설계 의도]
+- 대량 재생성(전체 강좌 AI 평가, 전체 임베딩)은 요청마다 동기 호출할 필요가 없음
+  → 요청 전체를 JSONL 파일로 만들어 배치 작업으로 제출하고, 완료 후 결과 파일을 한 번에 반영
+- 동기 호출의 속도 제한/재시도/연결 유지 비용이 사라지고, 처리 시간당 처리량이 크게 증가
+
+[동작 흐름]
+1. prepare | 요청 JSONL 작성 (custom_id + method + url + body)
+2. submit  | 어댑터로 배치 작업 제출 → job.json에 작업 ID 기록
+3. collect | 상태 폴링 → 결과 JSONL 다운로드 → 스트리밍 파싱 후 DB 일괄 반영 (커맨드 측)
+
+[어댑터]
+- openai: Files API 업로드 + Batches API 제출/조회/결과 다운로드
+- local : 파일 기반 구현 (테스트용), 가짜 응답(fake.py)으로 결과 파일 생성
+
+[파일 형식]
+요청: {"custom_id": "course-1", "method": "POST", "url": "/v1/embeddings", "body": {...}}
+결과: {"custom_id": "course-1", "response": {"status_code": 200, "body": {...}}, "error": null}
+
+[실패 요청]
+- Batches API는 실패한 요청을 결과 파일이 아닌 별도 오류 파일(error_file_id)에 기록
+- download는 결과 파일 뒤에 오류 파일을 이어 붙여 하나의 JSONL로 저장
+  → iter_results가 실패 항목을 (custom_id, None, error)로 돌려주어
+    커맨드가 동기 모드와 같은 방식으로 실패를 집계/출력
+"""
+
+import json
+import os
+import shutil
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+import requests
+
+from .fake import fake_response
+
+# 배치 작업 상태 (OpenAI Batches API 상태 값과 동일)
+TERMINAL_STATUSES = {'completed', 'failed', 'expired', 'cancelled'}
+
+
+@dataclass
+class BatchJob:
+    """제출된 배치 작업 정보 (job.json으로 저장)"""
+    job_id: str
+    adapter: str
+    endpoint: str
+    status: str = 'validating'
+    output_file_id: Optional[str] = None
+    error_file_id: Optional[str] = None
+    request_counts: Dict = field(default_factory=dict)
+    metadata: Dict = field(default_factory=dict)
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+
+# ========================
+# 1. JSONL 입출력
+# ========================
+
+def write_requests(path: str, items: Iterable[Tuple[str, dict]], endpoint: str) -> int:
+    """
+    (custom_id, body) 목록을 배치 요청 JSONL로 저장
+
+    Returns:
+        int: 작성한 요청 수
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for custom_id, body in items:
+            f.write(json.dumps(
+                {'custom_id': custom_id, 'method': 'POST', 'url': endpoint, 'body': body},
+                ensure_ascii=False,
+            ) + '\n')
+            count += 1
+    return count
+
+
+def iter_results(path: str) -> Iterator[Tuple[str, Optional[dict], Optional[str]]]:
+    """
+    결과 JSONL 스트리밍 파싱 (파일 전체를 메모리에 올리지 않음)
+
+    Yields:
+        (custom_id, response_body, error): 성공 시 error=None, 실패 시 response_body=None
+    """
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            custom_id = entry.get('custom_id')
+            error = entry.get('error')
+            response = entry.get('response') or {}
+
+            if error:
+                yield custom_id, None, error.get('message', str(error)) if isinstance(error, dict) else str(error)
+            elif response.get('status_code') != 200:
+                yield custom_id, None, f"HTTP {response.get('status_code')}: {str(response.get('body'))[:200]}"
+            else:
+                yield custom_id, response.get('body'), None
+
+
+# ========================
+# 2. 작업 디렉토리
+# ========================
+
+class BatchWorkspace:
+    """
+    배치 작업 1건의 파일 모음 (단계별 커맨드 실행 간 상태 공유)
+
+    <root>/input.jsonl   요청
+    <root>/job.json      제출된 작업 정보
+    <root>/output.jsonl  결과
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.input_path = os.path.join(root, 'input.jsonl')
+        self.job_path = os.path.join(root, 'job.json')
+        self.output_path = os.path.join(root, 'output.jsonl')
+
+    def save_job(self, job: BatchJob):
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.job_path, 'w', encoding='utf-8') as f:
+            json.dump(asdict(job), f, ensure_ascii=False, indent=2)
+
+    def load_job(self) -> Optional[BatchJob]:
+        if not os.path.isfile(self.job_path):
+            return None
+        with open(self.job_path, encoding='utf-8') as f:
+            return BatchJob(**json.load(f))
+
+
+# ========================
+# 3. 어댑터
+# ========================
+
+class BatchJobAdapter(ABC):
+    """배치 작업 어댑터 인터페이스 (메서드를 모두 구현하지 않으면 생성 시점에 TypeError)"""
+
+    name = None
+
+    @abstractmethod
+    def submit(self, input_path: str, endpoint: str, metadata: dict = None) -> BatchJob:
+        """입력 JSONL 제출"""
+
+    @abstractmethod
+    def refresh(self, job: BatchJob) -> BatchJob:
+        """최신 상태 조회"""
+
+    @abstractmethod
+    def download(self, job: BatchJob, dest_path: str) -> str:
+        """결과 파일 + 오류 파일 다운로드 (completed 상태에서 호출)"""
+
+
+class OpenAIBatchAdapter(BatchJobAdapter):
+    """
+    OpenAI 호환 Batches API 어댑터
+
+    Args:
+        base_url: API 기본 URL (예: https://api.openai.com/v1)
+        api_key: Bearer 토큰
+    """
+
+    name = 'openai'
+    COMPLETION_WINDOW = '24h'
+
+    def __init__(self, base_url: str, api_key: str, timeout: int = 60):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({'Authorization': f'Bearer {api_key}'})
+
+    def _check(self, response):
+        if response.status_code >= 400:
+            raise Exception(f"Batch API 호출 실패 (Status: {response.status_code}): {response.text[:200]}")
+        return response
+
+    def submit(self, input_path, endpoint, metadata=None):
+        with open(input_path, 'rb') as f:
+            uploaded = self._check(self.session.post(
+                f'{self.base_url}/files',
+                data={'purpose': 'batch'},
+                files={'file': (os.path.basename(input_path), f, 'application/jsonl')},
+                timeout=self.timeout,
+            )).json()
+
+        created = self._check(self.session.post(
+            f'{self.base_url}/batches',
+            json={
+                'input_file_id': uploaded['id'],
+                'endpoint': endpoint,
+                'completion_window': self.COMPLETION_WINDOW,
+                'metadata': metadata or {},
+            },
+            timeout=self.timeout,
+        )).json()
+
+        return self._to_job(created, endpoint, metadata)
+
+    def refresh(self, job):
+        data = self._check(self.session.get(f'{self.base_url}/batches/{job.job_id}', timeout=self.timeout)).json()
+        return self._to_job(data, job.endpoint, job.metadata)
+
+    def download(self, job, dest_path):
+        # 모든 요청이 실패하면 output_file_id 없이 error_file_id만 존재
+        file_ids = [file_id for file_id in (job.output_file_id, job.error_file_id) if file_id]
+        if not file_ids:
+            raise Exception(f'결과 파일이 없습니다 (status={job.status})')
+
+        os.makedirs(os.path.dirname(dest_path) or '.', exist_ok=True)
+        with open(dest_path, 'wb') as f:
+            for file_id in file_ids:
+                with self.session.get(
+                    f'{self.base_url}/files/{file_id}/content', stream=True, timeout=self.timeout
+                ) as response:
+                    self._check(response)
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        f.write(chunk)
+                f.write(b'\n')  # 마지막 줄에 개행이 없어도 다음 파일과 섞이지 않도록 (빈 줄은 iter_results가 무시)
+        return dest_path
+
+    def _to_job(self, data, endpoint, metadata):
+        return BatchJob(
+            job_id=data['id'],
+            adapter=self.name,
+            endpoint=endpoint,
+            status=data.get('status', 'validating'),
+            output_file_id=data.get('output_file_id'),
+            error_file_id=data.get('error_file_id'),
+            request_counts=data.get('request_counts') or {},
+            metadata=metadata or {},
+        )
+
+
+class LocalFileBatchAdapter(BatchJobAdapter):
+    """
+    파일 기반 로컬 배치 어댑터 (테스트용)
+
+    - submit: 입력 파일을 <root>/<job_id>/input.jsonl로 복사
+    - refresh: 첫 조회 시 요청별 가짜 응답(fake.py)으로 결과 파일 생성 후 completed
+      (Batches API처럼 200이 아닌 응답은 오류 파일 errors.jsonl로 분리)
+    - 네트워크/비용 없이 prepare → submit → collect 전체 흐름 검증
+    """
+
+    name = 'local'
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _job_dir(self, job_id):
+        return os.path.join(self.root, job_id)
+
+    def submit(self, input_path, endpoint, metadata=None):
+        job_id = f'batch_local_{uuid.uuid4().hex[:12]}'
+        job_dir = self._job_dir(job_id)
+        os.makedirs(job_dir, exist_ok=True)
+        shutil.copyfile(input_path, os.path.join(job_dir, 'input.jsonl'))
+        return BatchJob(job_id=job_id, adapter=self.name, endpoint=endpoint, metadata=metadata or {})
+
+    def refresh(self, job):
+        job_dir = self._job_dir(job.job_id)
+        output_path = os.path.join(job_dir, 'output.jsonl')
+        error_path = os.path.join(job_dir, 'errors.jsonl')
+
+        if not os.path.isfile(output_path):
+            total = completed = failed = 0
+            with open(os.path.join(job_dir, 'input.jsonl'), encoding='utf-8') as src, \
+                    open(output_path, 'w', encoding='utf-8') as output, \
+                    open(error_path, 'w', encoding='utf-8') as errors:
+                for line in src:
+                    if not line.strip():
+                        continue
+                    request = json.loads(line)
+                    status_code, body = fake_response(request['url'], request['body'], request['custom_id'])
+                    (output if status_code == 200 else errors).write(json.dumps({
+                        'id': f'batch_req_{uuid.uuid4().hex[:12]}',
+                        'custom_id': request['custom_id'],
+                        'response': {'status_code': status_code, 'body': body},
+                        'error': None,
+                    }, ensure_ascii=False) + '\n')
+                    total += 1
+                    completed += status_code == 200
+                    failed += status_code != 200
+            job.request_counts = {'total': total, 'completed': completed, 'failed': failed}
+
+        job.status = 'completed'
+        job.output_file_id = output_path
+        job.error_file_id = error_path if os.path.getsize(error_path) else None
+        return job
+
+    def download(self, job, dest_path):
+        os.makedirs(os.path.dirname(dest_path) or '.', exist_ok=True)
+        with open(dest_path, 'wb') as dst:
+            for path in (job.output_file_id, job.error_file_id):
+                if path:
+                    with open(path, 'rb') as src:
+                        shutil.copyfileobj(src, dst)
+        return dest_path
+
+
+BATCH_ADAPTERS = {
+    OpenAIBatchAdapter.name: OpenAIBatchAdapter,
+    LocalFileBatchAdapter.name: LocalFileBatchAdapter,
+}
+
+
+def get_batch_adapter(name: str, **kwargs) -> BatchJobAdapter:
+    """이름으로 어댑터 생성 (openai: base_url/api_key, local: root)"""
+    try:
+        adapter_class = BATCH_ADAPTERS[name]
+    except KeyError:
+        raise ValueError(f'알 수 없는 배치 어댑터: {name} (사용 가능: {", ".join(BATCH_ADAPTERS)})')
+    return adapter_class(**kwargs)
+
+
+def wait_for_job(adapter: BatchJobAdapter, job: BatchJob, poll_interval: float = 30.0,
+                 timeout: float = None, on_poll=None) -> BatchJob:
+    """
+    종료 상태가 될 때까지 폴링
+
+    Args:
+        timeout: 최대 대기 시간(초), None이면 무제한
+        on_poll: 조회할 때마다 호출되는 콜백 (job)
+    """
+    started_at = time.monotonic()
+    while True:
+        job = adapter.refresh(job)
+        if on_poll is not None:
+            on_poll(job)
+        if job.is_terminal:
+            return job
+        if timeout is not None and time.monotonic() - started_at >= timeout:
+            return job
+        time.sleep(poll_interval)
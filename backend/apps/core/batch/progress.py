@@ -0,0 +1,97 @@
+# backend/apps/core/batch/progress.py
+
+"""
+배치 진행률/처리량/ETA 출력
+
+[설계 의도]
+- 동시 처리에서는 "[idx/total] 처리 중" 한 줄 로그가 순서대로 나오지 않으므로
+  일정 간격으로 요약 한 줄(완료/실패/처리량/남은 시간)을 출력
+
+[상세 고려사항]
+- 처리량은 최근 구간(window) 기준 이동 평균 → 재시도/백오프 구간이 반영된 현실적인 ETA
+- TTY면 같은 줄을 덮어쓰고(\r), 파일/로그 리다이렉트면 줄 단위로 출력
+"""
+
+import time
+from collections import deque
+
+
+class ProgressReporter:
+    """
+    Args:
+        total: 전체 처리 대상 수
+        stream: 출력 스트림 (management command의 self.stdout)
+        interval: 출력 최소 간격(초)
+        window: 처리량 계산에 사용할 최근 구간(초)
+    """
+
+    def __init__(self, total: int, stream, interval: float = 1.0, window: float = 30.0):
+        self.total = total
+        self.stream = stream
+        self.interval = interval
+        self.window = window
+        self.succeeded = 0
+        self.failed = 0
+        self.started_at = time.monotonic()
+        self._last_output = 0.0
+        self._events = deque()
+        self._isatty = hasattr(stream, 'isatty') and stream.isatty()
+
+    @property
+    def processed(self) -> int:
+        return self.succeeded + self.failed
+
+    def update(self, succeeded: int = 0, failed: int = 0):
+        now = time.monotonic()
+        self.succeeded += succeeded
+        self.failed += failed
+        self._events.append((now, succeeded + failed))
+        while self._events and now - self._events[0][0] > self.window:
+            self._events.popleft()
+
+        if now - self._last_output >= self.interval or self.processed >= self.total:
+            self._last_output = now
+            self._write(self.render(now))
+
+    def throughput(self, now: float = None) -> float:
+        """최근 구간 처리량 (건/초)"""
+        now = now or time.monotonic()
+        if not self._events:
+            return 0.0
+        span = max(now - self._events[0][0], 1e-6)
+        if len(self._events) == 1:
+            span = max(now - self.started_at, 1e-6)
+        return sum(count for _, count in self._events) / span
+
+    def render(self, now: float = None) -> str:
+        now = now or time.monotonic()
+        rate = self.throughput(now)
+        remaining = max(self.total - self.processed, 0)
+        eta = remaining / rate if rate > 0 else None
+        percent = self.processed / self.total * 100 if self.total else 100.0
+        return (
+            f'[{self.processed}/{self.total}] {percent:5.1f}% | '
+            f'성공 {self.succeeded} · 실패 {self.failed} | '
+            f'{rate * 60:.1f}건/분 | 경과 {_format_seconds(now - self.started_at)} | '
+            f'ETA {_format_seconds(eta) if eta is not None else "-"}'
+        )
+
+    def finish(self):
+        if self._isatty:
+            self.stream.write('')
+
+    def _write(self, line: str):
+        if self._isatty:
+            self.stream.write('\r' + line, ending='')
+            self.stream.flush()
+        else:
+            self.stream.write(line)
+
+
+def _format_seconds(seconds: float) -> str:
+    seconds = int(seconds)
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    if hours:
+        return f'{hours}h{minutes:02d}m'
+    return f'{minutes}m{secs:02d}s'
@@ -0,0 +1,63 @@
+# backend/apps/core/batch/rate_limit.py
+
+"""
+토큰 버킷 기반 호출 속도 제한
+
+[설계 의도]
+- 기존 배치는 요청마다 time.sleep(delay)로 속도를 제한 → 응답 대기 시간 + sleep이 직렬로 누적
+- 토큰 버킷은 "초당 rate개" 토큰을 채우고 요청 시 1개씩 소비
+  → 동시 요청 여러 개가 있어도 전체 호출 속도는 rate 이하로 유지되고,
+    응답을 기다리는 동안에도 다음 요청 토큰이 채워짐
+
+[상세 고려사항]
+- 여러 워커 스레드가 공유하므로 Lock으로 보호
+- capacity: 순간적으로 허용하는 최대 연속 요청 수 (burst)
+- rate <= 0 이면 제한 없음
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷
+
+    Args:
+        rate: 초당 토큰 충전 수 (= 초당 최대 요청 수)
+        capacity: 버킷 최대 크기 (기본: max(1, rate))
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 확보할 때까지 대기
+
+        Returns:
+            float: 대기한 시간(초)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+
+                # 부족한 토큰이 채워질 때까지 필요한 시간
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
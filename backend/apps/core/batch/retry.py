@@ -0,0 +1,101 @@
+# backend/apps/core/batch/retry.py
+
+"""
+재시도 가능한 HTTP POST
+
+[설계 의도]
+- 대량 호출 중 일시적인 실패(429 Too Many Requests, 5xx, 타임아웃/연결 오류)는
+  잠시 후 다시 보내면 성공하는 경우가 대부분 → 강좌 단위 실패로 처리하지 않고 재시도
+- 4xx(429 제외)는 요청 자체의 문제이므로 즉시 실패
+
+[상세 고려사항]
+- 지수 백오프 + 지터: base * 2^attempt * (0.5 ~ 1.5), 최대 max_backoff
+- 서버가 Retry-After 헤더를 주면 그 값을 우선 사용
+- 재시도 시에도 rate_limiter가 있으면 토큰을 다시 확보 (재시도가 속도 제한을 우회하지 않도록)
+"""
+
+import random
+import time
+
+import requests
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class RetryableError(Exception):
+    """재시도 횟수를 모두 소진한 일시적 오류"""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _retry_after(response):
+    value = response.headers.get('Retry-After') if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def post_with_retry(
+    session,
+    url,
+    *,
+    json=None,
+    headers=None,
+    timeout=30,
+    max_retries=5,
+    backoff_base=1.0,
+    max_backoff=60.0,
+    rate_limiter=None,
+    on_retry=None,
+):
+    """
+    POST 요청 + 일시적 오류 재시도
+
+    Args:
+        session: requests.Session (커넥션 재사용)
+        max_retries: 최대 재시도 횟수 (최초 요청 제외)
+        rate_limiter: TokenBucket (요청마다 acquire)
+        on_retry: 재시도 직전 호출되는 콜백 (attempt, reason, wait)
+
+    Returns:
+        requests.Response: 2xx 응답
+
+    Raises:
+        RetryableError: 재시도 소진
+        Exception: 재시도 대상이 아닌 HTTP 오류
+    """
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        response = None
+        try:
+            response = session.post(url, json=json, headers=headers, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            reason, status_code = f'{type(e).__name__}: {e}', None
+        else:
+            if 200 <= response.status_code < 300:
+                return response
+            if response.status_code not in RETRYABLE_STATUS:
+                raise Exception(
+                    f"API 호출 실패 (Status: {response.status_code}): {response.text[:200]}"
+                )
+            reason, status_code = f'HTTP {response.status_code}', response.status_code
+
+        if attempt >= max_retries:
+            raise RetryableError(f'재시도 {max_retries}회 초과 ({reason})', status_code=status_code)
+
+        wait = _retry_after(response)
+        if wait is None:
+            wait = min(max_backoff, backoff_base * (2 ** attempt)) * random.uniform(0.5, 1.5)
+
+        attempt += 1
+        if on_retry is not None:
+            on_retry(attempt, reason, wait)
+        time.sleep(wait)
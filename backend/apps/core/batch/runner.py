@@ -0,0 +1,60 @@
+# backend/apps/core/batch/runner.py
+
+"""
+동시 실행 배치 러너
+
+[설계 의도]
+- 네트워크 대기(I/O bound)가 대부분인 외부 API 호출을 N개 동시에 진행
+- 워커 스레드는 "API 호출 + 응답 파싱"만 담당하고,
+  결과 처리(DB 저장, 체크포인트, 진행률)는 메인 스레드에서 수행
+  → DB 커넥션/트랜잭션을 스레드마다 열지 않아도 됨
+
+[상세 고려사항]
+- 동시 진행 중인 작업을 concurrency개로 제한 (대상 전체를 한 번에 submit 하지 않음)
+- 워커 예외는 (item, None, exc)로 전달 → 호출 측에서 실패로 집계하고 계속 진행
+- KeyboardInterrupt 시 대기 중인 작업은 취소하고 예외를 그대로 올림
+  (이미 처리된 결과는 호출 측 on_result에서 저장/체크포인트 완료 상태)
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, Tuple
+
+
+def run_concurrent(
+    items: Iterable,
+    worker: Callable,
+    concurrency: int = 4,
+) -> Iterator[Tuple[object, object, BaseException]]:
+    """
+    items 각각에 worker(item)을 동시에 실행하고 완료 순서대로 결과를 반환
+
+    Yields:
+        (item, result, error): 성공 시 error=None, 실패 시 result=None
+    """
+    concurrency = max(1, concurrency)
+    iterator = iter(items)
+    pending = {}
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        def submit_next():
+            for item in iterator:
+                pending[executor.submit(worker, item)] = item
+                return True
+            return False
+
+        for _ in range(concurrency):
+            if not submit_next():
+                break
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                error = future.exception()
+                yield item, (None if error else future.result()), error
+                submit_next()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True, cancel_futures=True)
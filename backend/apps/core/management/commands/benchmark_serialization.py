@@ -0,0 +1,114 @@
+"""
+강좌 목록 직렬화 벤치마크 커맨드
+
+[설계 의도]
+- 목록 응답 경로(직렬화 + JSON 인코딩)의 CPU 비용을 기존 방식과 고속 방식으로 비교
+  1. 기존: 모델 인스턴스 → CourseListSerializer → JSONRenderer
+  2. 고속: values_list() 행 → CourseListValuesSerializer → FastJSONRenderer
+- DB 조회 시간은 제외하고(미리 조회한 데이터 사용) 순수 CPU 시간만 측정 (time.process_time)
+
+[사용 예시]
+```bash
+# 실제 DB 강좌 100건 기준
+python manage.py benchmark_serialization --page-size 100 --iterations 200
+
+# DB 없이 합성 데이터로 측정
+python manage.py benchmark_serialization --synthetic
+```
+"""
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.db.models import Avg, Count
+from django.db.models.functions import Coalesce
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.renderers import FastJSONRenderer, orjson
+from apps.courses.models import Course
+from apps.courses.serializers import CourseListSerializer, CourseListValuesSerializer
+
+
+class Command(BaseCommand):
+    help = '강좌 목록 직렬화(기존 Serializer vs values 기반 고속 경로) CPU 시간 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--page-size', type=int, default=100, help='한 페이지 강좌 수 (기본: 100)')
+        parser.add_argument('--iterations', type=int, default=100, help='반복 횟수 (기본: 100)')
+        parser.add_argument('--synthetic', action='store_true', help='DB 대신 합성 데이터 사용')
+
+    def handle(self, *args, **options):
+        page_size = options['page_size']
+        iterations = options['iterations']
+
+        if options['synthetic']:
+            instances, rows = self._synthetic_page(page_size)
+        else:
+            instances, rows = self._db_page(page_size)
+
+        if not rows:
+            self.stdout.write(self.style.WARNING('측정할 강좌가 없습니다. --synthetic 옵션을 사용하세요.'))
+            return
+
+        json_renderer = JSONRenderer()
+        fast_renderer = FastJSONRenderer()
+
+        def legacy():
+            return json_renderer.render(CourseListSerializer(instances, many=True).data)
+
+        def fast():
+            return fast_renderer.render(CourseListValuesSerializer.serialize(rows))
+
+        legacy_time = self._measure(legacy, iterations)
+        fast_time = self._measure(fast, iterations)
+
+        self.stdout.write(f'강좌 {len(rows)}건 × {iterations}회 (orjson: {"사용" if orjson else "미설치"})')
+        self.stdout.write(f'  기존 (ModelSerializer + JSONRenderer): {legacy_time * 1000:.3f} ms/page')
+        self.stdout.write(f'  고속 (values + FastJSONRenderer)     : {fast_time * 1000:.3f} ms/page')
+        if fast_time > 0:
+            self.stdout.write(self.style.SUCCESS(f'✅ {legacy_time / fast_time:.1f}배 빠름'))
+
+    def _measure(self, func, iterations):
+        func()  # 워밍업
+        start = time.process_time()
+        for _ in range(iterations):
+            func()
+        return (time.process_time() - start) / iterations
+
+    def _db_page(self, page_size):
+        queryset = Course.objects.annotate(
+            average_rating=Coalesce(Avg('reviews__rating'), 0.0),
+            review_count=Count('reviews', distinct=True),
+        ).order_by('id')[:page_size]
+        instances = list(queryset.defer('embedding'))
+        rows = list(CourseListValuesSerializer.values_list(queryset))
+        return instances, rows
+
+    def _synthetic_page(self, page_size):
+        instances, rows = [], []
+        for i in range(page_size):
+            values = {
+                'id': i + 1,
+                'name': f'합성 강좌 {i}',
+                'professor': f'교수 {i % 17}',
+                'org_name': '테스트대학교',
+                'classfy_name': '공학',
+                'middle_classfy_name': '컴퓨터·통신',
+                'course_image': f'https://example.com/images/{i}.png',
+                'url': f'https://example.com/courses/{i}',
+                'week': 15.0,
+                'course_playtime': 720.0,
+                'average_rating': 3.0 + (i % 20) / 10 + 0.04,
+                'review_count': i % 50,
+                'enrollment_start': date(2025, 1, 1),
+                'enrollment_end': date(2025, 2, 1),
+                'study_start': date(2025, 3, 1),
+                'study_end': date(2025, 6, 30),
+                'status': Course.STATUS_FINISHED,
+            }
+            course = Course(**{k: v for k, v in values.items() if k not in ('average_rating', 'review_count')})
+            course.average_rating = values['average_rating']
+            course.review_count = values['review_count']
+            instances.append(course)
+            rows.append(tuple(values[name] for name in CourseListValuesSerializer.fields))
+        return instances, rows
@@ -0,0 +1,96 @@
+# apps/core/management/commands/run_scheduler.py
+
+import time
+from datetime import datetime, time as dt_time, timedelta
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+"""
+[설계의도]
+- 날짜가 바뀔 때 다시 계산해야 하는 사전 계산 작업을 매일 자정(TIME_ZONE 기준)에 실행하는 스케줄러
+- cron 대신 scheduler 컨테이너에서 상시 실행 → 이미지/설정을 backend와 그대로 공유
+
+[상세고려사항]
+- 실행 순서: 강좌 상태 갱신(refresh_course_status) → 검색 평점 동기화(sync_course_ratings)
+  → 자동완성 인덱스 스냅샷(build_suggest_index) → 타임라인 행렬 사전 계산(precompute_timeline_grid)
+  → 협업 필터링 추천 계산(build_recommendations)
+- 작업 하나가 실패해도 나머지 작업과 다음 날 실행은 계속 진행
+- 다음 자정까지 대기 시간은 매번 다시 계산 (장시간 sleep 오차 누적 방지)
+- 매 실행 전 close_old_connections로 하루 동안 끊어진 DB 연결 정리
+
+[사용 예시]
+python manage.py run_scheduler                   # 매일 자정 실행 (scheduler 컨테이너)
+python manage.py run_scheduler --run-on-start    # 시작 시 1회 실행 후 매일 자정 실행
+python manage.py run_scheduler --once            # 1회 실행 후 종료
+"""
+
+# 자정 작업 목록 (커맨드 이름, 인자)
+DAILY_JOBS = [
+    ('refresh_course_status', []),
+    ('sync_course_ratings', []),
+    ('build_suggest_index', []),
+    ('precompute_timeline_grid', []),
+    ('build_recommendations', []),
+]
+
+# 자정 직후 여유 시간 (초) - 경계 시각에 깨어나 전날로 계산되는 것을 방지
+MIDNIGHT_MARGIN_SECONDS = 5
+
+
+class Command(BaseCommand):
+    help = '매일 자정 사전 계산 작업(강좌 상태, 검색 평점, 타임라인 행렬, 추천) 실행'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--run-on-start',
+            action='store_true',
+            help='시작하자마자 1회 실행 (배포 직후 상태 보정)'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='1회 실행 후 종료'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('🕛 스케줄러 시작')
+
+        try:
+            if options['run_on_start'] or options['once']:
+                self._run_daily_jobs()
+            if options['once']:
+                return
+
+            while True:
+                wait_seconds = self._seconds_until_next_midnight()
+                self.stdout.write(f'다음 실행까지 {wait_seconds / 3600:.1f}시간 대기')
+                time.sleep(wait_seconds)
+                self._run_daily_jobs()
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING('\n⏹ 스케줄러 중지 요청'))
+
+    def _run_daily_jobs(self):
+        close_old_connections()
+        self.stdout.write(f'[{timezone.localtime().isoformat(timespec="seconds")}] 자정 작업 실행')
+
+        for name, args in DAILY_JOBS:
+            started_at = time.perf_counter()
+            try:
+                call_command(name, *args, stdout=self.stdout, stderr=self.stderr)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'  ✗ {name} 실패: {str(e)}'))
+                continue
+            self.stdout.write(self.style.SUCCESS(
+                f'  ✓ {name} 완료 ({time.perf_counter() - started_at:.1f}초)'
+            ))
+
+    @staticmethod
+    def _seconds_until_next_midnight():
+        now = timezone.localtime()
+        next_midnight = datetime.combine(
+            now.date() + timedelta(days=1), dt_time.min, tzinfo=now.tzinfo
+        )
+        return max((next_midnight - now).total_seconds(), 0) + MIDNIGHT_MARGIN_SECONDS
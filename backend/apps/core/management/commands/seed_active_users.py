@@ -41,6 +41,7 @@ from django.conf import settings
 # 모델 임포트
 from apps.accounts.models import User, UserConsent, EmailVerification
 from apps.community.models import Board, Post, Comment, PostLike, Scrap
+from apps.mypage.services import get_activity_stats_service
 from apps.courses.models import Course, Enrollment, Wishlist, CourseReview
 from apps.comparisons.models import CourseAIReview
 
@@ -489,6 +490,9 @@ class Command(BaseCommand):
                 self.create_wishlists(users, target_courses, enrollments)        # 위시리스트
                 reviews = self.create_course_reviews(enrollments)                # 강좌리뷰
 
+                # Phase 5: 파생 데이터 재계산 (bulk_create는 시그널을 우회하므로)
+                get_activity_stats_service().rebuild()                           # 마이페이지 활동 카운터
+
             self.stdout.write(self.style.SUCCESS('가짜 데이터 생성 완료!'))
 
         except Exception as e:
@@ -731,6 +735,8 @@ class Command(BaseCommand):
                 posts.append(post)
 
         Post.objects.bulk_create(posts, batch_size=BATCH_SIZE)
+        # bulk_create는 시그널을 우회하므로 게시판별 게시글 수 카운터를 재계산
+        Board.recalculate_posts_count()
         self.stdout.write(self.style.SUCCESS(f'✓ {len(posts)}개 게시글 생성 (게시판 {len(boards)}개)'))
 
         return list(Post.objects.all().order_by('-id')[:len(posts)])
@@ -0,0 +1,105 @@
+# backend/apps/core/renderers.py
+
+"""
+고속 JSON 렌더러 / Server-Sent Events 렌더러
+
+[설계 의도]
+- DRF 기본 JSONRenderer는 표준 라이브러리 json + 커스텀 Encoder(Python 레벨 default 호출)로 동작
+- 대용량 목록 응답(최대 100건 페이지, 검색 결과 등)에서 인코딩 비용을 줄이기 위해
+  C 구현 JSON 인코더(orjson)를 사용하는 렌더러 제공
+
+[상세 고려사항]
+- orjson은 선택 의존성: 설치되어 있지 않으면 DRF 기본 렌더러로 그대로 동작 (응답 형식 동일)
+- 들여쓰기 요청(브라우저블 API의 indent 등)은 orjson이 2칸만 지원하므로 기본 렌더러로 위임
+- orjson이 직접 처리하지 못하는 타입(Decimal, 지연 번역 문자열, timedelta 등)은
+  DRF JSONEncoder와 같은 규칙으로 변환
+- View 단위 opt-in: renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+- EventStreamRenderer: SSE 스트림 View가 Accept: text/event-stream 요청에서
+  콘텐츠 협상(406)에 걸리지 않도록 하는 렌더러 (본문은 View가 StreamingHttpResponse로 직접 생성)
+"""
+
+import datetime
+import decimal
+import json
+
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils import encoders
+from rest_framework.settings import api_settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+
+def _default(obj):
+    """orjson이 기본 지원하지 않는 타입 변환 (DRF JSONEncoder 규칙과 동일)"""
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, decimal.Decimal):
+        return str(obj) if api_settings.COERCE_DECIMAL_TO_STRING else float(obj)
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if hasattr(obj, 'tolist'):
+        # numpy 배열/스칼라
+        return obj.tolist()
+    if hasattr(obj, '__getitem__'):
+        try:
+            return dict(obj)
+        except (TypeError, ValueError):
+            pass
+    if hasattr(obj, '__iter__'):
+        return list(obj)
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson 기반 JSON 렌더러 (미설치 시 DRF JSONRenderer와 동일하게 동작)
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def format_sse(data, event: str = None, event_id=None) -> bytes:
+    """Server-Sent Events 메시지 1개 (data는 JSON 직렬화)"""
+    lines = []
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    if event:
+        lines.append(f'event: {event}')
+    payload = FastJSONRenderer().render(data).decode() if orjson is not None else json.dumps(
+        data, cls=encoders.JSONEncoder, ensure_ascii=False
+    )
+    lines.extend(f'data: {line}' for line in payload.splitlines() or [''])
+    return ('\n'.join(lines) + '\n\n').encode()
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    text/event-stream 렌더러
+
+    - 정상 응답은 View가 StreamingHttpResponse로 직접 생성
+    - 스트림 시작 전 오류 응답(401/404 등)만 이 렌더러로 `event: error` 메시지 1개를 렌더링
+    """
+
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return format_sse(data, event='error')
@@ -1,3 +1,358 @@
-from django.test import TestCase
+import json
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from apps.core.batch import Checkpoint, RetryableError, TokenBucket, post_with_retry, run_concurrent
+from apps.core.batch import jobs, rate_limit, retry
+from apps.core.batch.fake import fake_response
+from apps.core.utils import db_routing
+from apps.core.utils.db_routing import (
+    REPLICA_DB_ALIAS,
+    REPLICA_STICKY_COOKIE,
+    ReadReplicaRouter,
+    ReplicaRoutingMiddleware,
+)
+from apps.core.utils.partial_json import parse_partial_json
+
+
+class ReplicaRoutingTests(SimpleTestCase):
+    """읽기 복제본 라우팅 (DB 연결 없이 라우터/미들웨어 판단만 검증)"""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.router = ReadReplicaRouter()
+
+    def _course_view(self):
+        def view(request):
+            return HttpResponse()
+        view.__module__ = 'apps.courses.views'
+        return view
+
+    def _run(self, request, view):
+        """미들웨어 안에서 View 실행 → (View 실행 시점의 읽기 DB, 응답)"""
+        seen = {}
+
+        def get_response(req):
+            middleware.process_view(req, view, (), {})
+            seen['alias'] = self.router.db_for_read(None)
+            return view(req)
+
+        middleware = ReplicaRoutingMiddleware(get_response)
+        response = middleware(request)
+        return seen['alias'], response
+
+    def test_reads_use_primary_without_middleware(self):
+        self.assertIsNone(self.router.db_for_read(None))
+        self.assertEqual(self.router.db_for_write(None), 'default')
+        self.assertFalse(self.router.allow_migrate(REPLICA_DB_ALIAS, 'courses'))
+        self.assertIsNone(self.router.allow_migrate('default', 'courses'))
+
+    @mock.patch.object(db_routing, 'replica_configured', return_value=True)
+    @mock.patch.object(db_routing.replica_health, 'is_available', return_value=True)
+    def test_safe_course_request_reads_from_replica(self, *_):
+        alias, _ = self._run(self.factory.get('/api/v1/courses/'), self._course_view())
+        self.assertEqual(alias, REPLICA_DB_ALIAS)
+        self.assertIsNone(self.router.db_for_read(None))  # 요청 종료 후 복원
+
+    @mock.patch.object(db_routing, 'replica_configured', return_value=True)
+    @mock.patch.object(db_routing.replica_health, 'is_available', return_value=True)
+    def test_sticky_cookie_after_write_keeps_primary(self, *_):
+        alias, response = self._run(self.factory.post('/api/v1/courses/'), self._course_view())
+        self.assertIsNone(alias)
+        self.assertIn(REPLICA_STICKY_COOKIE, response.cookies)
+
+        request = self.factory.get('/api/v1/courses/')
+        request.COOKIES[REPLICA_STICKY_COOKIE] = str(int(time.time()) + 5)
+        alias, _ = self._run(request, self._course_view())
+        self.assertIsNone(alias)
+
+    @mock.patch.object(db_routing, 'replica_configured', return_value=True)
+    @mock.patch.object(db_routing.replica_health, 'is_available', return_value=False)
+    def test_unhealthy_replica_falls_back_to_primary(self, *_):
+        alias, _ = self._run(self.factory.get('/api/v1/courses/'), self._course_view())
+        self.assertIsNone(alias)
+
+
+class PartialJsonTests(SimpleTestCase):
+    """생성 중인 LLM 응답 미리보기 파서 (확정된 값 + 작성 중인 문자열만 복원)"""
+
+    DOCUMENT = json.dumps({
+        'summary': '실습 위주 "파이썬" 강좌\n초보자 추천 \u2713',
+        'pros': ['예제 풍부', '짧은 강의'],
+        'score': 4.5,
+        'count': 12,
+        'flags': {'certificate': True, 'free': False, 'note': None},
+    }, ensure_ascii=True)
+
+    def test_in_progress_string_and_array(self):
+        self.assertEqual(parse_partial_json('{"summary": "이 강좌는 실'), {'summary': '이 강좌는 실'})
+        self.assertEqual(parse_partial_json('{"pros": ["실습 위주", "예제'), {'pros': ['실습 위주', '예제']})
+
+    def test_unfinished_scalars_and_keys_are_dropped(self):
+        self.assertEqual(parse_partial_json('{"count": 12'), {})
+        self.assertEqual(parse_partial_json('{"count": 12,'), {'count': 12})
+        self.assertEqual(parse_partial_json('{"ok": tr'), {})
+        self.assertEqual(parse_partial_json('{"a": 1, "b'), {'a': 1})
+        self.assertEqual(parse_partial_json('{"a": 1, "b":'), {'a': 1})
+
+    def test_escape_cut_in_the_middle(self):
+        self.assertEqual(parse_partial_json('{"a": "x\\'), {'a': 'x'})
+        self.assertEqual(parse_partial_json('{"a": "x\\u27'), {'a': 'x'})
+        self.assertEqual(parse_partial_json('{"a": "x\\u2713y"}'), {'a': 'x\u2713y'})
+
+    def test_every_prefix_parses_and_full_document_matches_json(self):
+        self.assertIsNone(parse_partial_json(''))
+        self.assertEqual(parse_partial_json('  ', default={}), {})
+
+        previous_keys = 0
+        for end in range(1, len(self.DOCUMENT) + 1):
+            value = parse_partial_json(self.DOCUMENT[:end])
+            self.assertIsInstance(value, dict, end)
+            self.assertGreaterEqual(len(value), previous_keys, end)  # 확정된 키는 사라지지 않음
+            previous_keys = len(value)
+
+        self.assertEqual(parse_partial_json(self.DOCUMENT), json.loads(self.DOCUMENT))
+
+
+class FakeClock:
+    """time 모듈 대역: sleep하면 monotonic이 그만큼 진행 (실제 대기 없음)"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeSession:
+    """
+    requests.Session 대역
+    - script의 상태 코드/예외를 차례로 돌려준 뒤, 이후 요청은 fake_response(로컬 가짜 API)로 응답
+    """
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.calls = 0
+
+    def post(self, url, **kwargs):
+        self.calls += 1
+        step = self.script.pop(0) if self.script else None
+        if isinstance(step, Exception):
+            raise step
+
+        headers = {}
+        if step is None:
+            status_code, body = fake_response(url, kwargs.get('json') or {})
+        else:
+            status_code, body = step[0], {'error': {'message': 'scripted'}}
+            headers = step[1] if len(step) > 1 else {}
+
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers)
+        response._content = json.dumps(body).encode('utf-8')
+        return response
+
+
+class BatchEngineTests(SimpleTestCase):
+    """
+    [설계 의도]
+    - 배치 엔진(속도 제한/재시도/동시 실행/체크포인트)을 실제 API 없이 가짜 응답(fake.py)과 가짜 시계로 고정
+    """
+
+    URL = 'http://fake/v1/chat/completions'
+
+    def setUp(self):
+        self.clock = FakeClock()
+        for module in (rate_limit, retry):
+            patcher = mock.patch.object(module, 'time', self.clock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_token_bucket_allows_burst_then_waits(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        self.assertEqual([bucket.acquire(), bucket.acquire()], [0.0, 0.0])
+        self.assertAlmostEqual(bucket.acquire(), 0.1)
+        self.assertAlmostEqual(self.clock.now, 0.1)
+
+        self.assertEqual(TokenBucket(rate=0).acquire(), 0.0)  # 제한 없음
+
+    def test_retry_until_success_with_retry_after(self):
+        session = FakeSession((429, {'Retry-After': '2'}), (503,), requests.ConnectionError('reset'))
+        retries = []
+
+        response = post_with_retry(
+            session, self.URL, json={'model': 'fake'}, backoff_base=1.0,
+            rate_limiter=TokenBucket(rate=0), on_retry=lambda *args: retries.append(args),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('choices', response.json())
+        self.assertEqual(session.calls, 4)
+        self.assertEqual([(attempt, reason) for attempt, reason, _ in retries], [
+            (1, 'HTTP 429'), (2, 'HTTP 503'), (3, 'ConnectionError: reset'),
+        ])
+        self.assertEqual(retries[0][2], 2.0)  # Retry-After 우선
+        self.assertTrue(1.0 <= retries[1][2] <= 3.0)  # 1 * 2^1 * (0.5 ~ 1.5)
+
+    def test_retry_gives_up_after_max_retries(self):
+        session = FakeSession(*[requests.Timeout('slow')] * 3)
+
+        with self.assertRaises(RetryableError) as raised:
+            post_with_retry(session, self.URL, json={}, max_retries=2)
+
+        self.assertIsNone(raised.exception.status_code)
+        self.assertEqual(session.calls, 3)
+
+    def test_client_error_is_not_retried(self):
+        session = FakeSession()
+
+        with self.assertRaisesMessage(Exception, 'Status: 404'):
+            post_with_retry(session, 'http://fake/v1/unknown', json={})
+        self.assertEqual(session.calls, 1)
+
+    def test_run_concurrent_reports_errors_and_limits_concurrency(self):
+        lock = threading.Lock()
+        active = {'now': 0, 'max': 0}
+
+        def worker(item):
+            with lock:
+                active['now'] += 1
+                active['max'] = max(active['max'], active['now'])
+            time.sleep(0.01)
+            with lock:
+                active['now'] -= 1
+            if item % 3 == 0:
+                raise ValueError(item)
+            return item * 10
+
+        results = {item: (result, error) for item, result, error in run_concurrent(range(10), worker, concurrency=3)}
+
+        self.assertEqual(sorted(results), list(range(10)))
+        self.assertLessEqual(active['max'], 3)
+        self.assertEqual(results[4], (40, None))
+        self.assertIsNone(results[6][0])
+        self.assertIsInstance(results[6][1], ValueError)
+
+    def test_checkpoint_version_filter_and_partial_line(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'nested', 'reviews.jsonl')
+
+            checkpoint = Checkpoint(path, version='v1')
+            checkpoint.mark_done([1, 2, 2])
+            checkpoint.close()
+            other_version = Checkpoint(path, version='v2')
+            other_version.mark_done([3])
+            other_version.close()
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('{"key": 4, "ver')  # 기록 도중 종료
+
+            resumed = Checkpoint(path, version='v1')
+            self.assertEqual(resumed.done_keys, {1, 2})
+            self.assertNotIn(3, resumed)  # 다른 버전 → 미완료
+            resumed.mark_done([5])
+            resumed.close()
+
+            self.assertEqual(Checkpoint(path, version='v1').done_keys, {1, 2, 5})
+            with open(path, encoding='utf-8') as f:
+                self.assertEqual(len(f.read().splitlines()), 4)
+
+            resumed.reset()
+            self.assertFalse(os.path.exists(path))
+            self.assertEqual(len(resumed), 0)
+
+
+class BatchJobTests(SimpleTestCase):
+    """
+    [설계 의도]
+    - 오프라인 배치 작업의 폴링(wait_for_job)과 결과/오류 파일 병합을 로컬 어댑터와 가짜 응답으로 고정
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = directory.name
+
+    def _input(self, requests_by_url):
+        path = os.path.join(self.root, 'input.jsonl')
+        with open(path, 'w', encoding='utf-8') as f:
+            for custom_id, url in requests_by_url:
+                f.write(json.dumps({'custom_id': custom_id, 'method': 'POST', 'url': url, 'body': {'input': custom_id}}) + '\n')
+        return path
+
+    def test_local_job_splits_failures_into_error_file(self):
+        adapter = jobs.get_batch_adapter('local', root=os.path.join(self.root, 'jobs'))
+        input_path = self._input([('course-1', '/v1/embeddings'), ('course-2', '/v1/unknown')])
+        polls = []
+
+        job = adapter.submit(input_path, '/v1/embeddings')
+        job = jobs.wait_for_job(adapter, job, poll_interval=0, on_poll=polls.append)
+
+        self.assertEqual(len(polls), 1)
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(job.request_counts, {'total': 2, 'completed': 1, 'failed': 1})
+        self.assertIsNotNone(job.error_file_id)
+
+        results = list(jobs.iter_results(adapter.download(job, os.path.join(self.root, 'output.jsonl'))))
+        self.assertEqual([(custom_id, error is None) for custom_id, _, error in results], [
+            ('course-1', True), ('course-2', False),
+        ])
+        self.assertTrue(results[1][2].startswith('HTTP 404'))
+
+    def test_wait_for_job_stops_at_timeout(self):
+        class PendingAdapter(jobs.LocalFileBatchAdapter):
+            def refresh(self, job):
+                job.status = 'in_progress'
+                return job
+
+        job = jobs.BatchJob(job_id='batch_pending', adapter='local', endpoint='/v1/embeddings')
+        with mock.patch.object(jobs.time, 'sleep') as sleep:
+            job = jobs.wait_for_job(PendingAdapter(self.root), job, poll_interval=5, timeout=0)
+
+        self.assertFalse(job.is_terminal)
+        sleep.assert_not_called()
+
+    def test_openai_download_appends_error_file(self):
+        contents = {
+            'file-out': b'{"custom_id": "course-1", "response": {"status_code": 200, "body": {"data": []}}}',
+            'file-err': b'{"custom_id": "course-2", "response": null, "error": {"message": "invalid input"}}\n',
+        }
+
+        def get(url, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response._content = contents[url.split('/')[-2]]
+            response._content_consumed = True
+            return response
+
+        adapter = jobs.OpenAIBatchAdapter('http://fake/v1', api_key='test')
+        job = jobs.BatchJob(
+            job_id='batch_1', adapter='openai', endpoint='/v1/embeddings', status='completed',
+            output_file_id='file-out', error_file_id='file-err',
+        )
+
+        with mock.patch.object(adapter.session, 'get', side_effect=get):
+            path = adapter.download(job, os.path.join(self.root, 'output.jsonl'))
+
+        self.assertEqual(list(jobs.iter_results(path)), [
+            ('course-1', {'data': []}, None),
+            ('course-2', None, 'invalid input'),
+        ])
+
+        job.output_file_id = None  # 모든 요청이 실패한 작업
+        with mock.patch.object(adapter.session, 'get', side_effect=get):
+            path = adapter.download(job, os.path.join(self.root, 'errors_only.jsonl'))
+        self.assertEqual([error for _, _, error in jobs.iter_results(path)], ['invalid input'])
@@ -0,0 +1,255 @@
+# backend/apps/core/utils/db_routing.py
+
+"""
+읽기 전용 복제본(replica) 라우팅 레이어
+
+[설계 의도]
+- 조회 위주 API(강좌, 커뮤니티 목록, 마이페이지 조회)의 읽기 쿼리를 복제본으로 보내
+  primary는 쓰기와 트랜잭션에 집중하도록 분리
+- 요청 단위로 결정: 미들웨어가 "이 요청의 읽기는 복제본" 여부를 contextvar에 기록하고,
+  DB 라우터는 그 값만 보고 db_for_read를 결정 (View 코드 수정 없음)
+
+[동작 흐름]
+1. ReplicaRoutingMiddleware.process_view: URL 해석 후 View가 실행되기 직전에 판단
+   - 안전한 메서드(GET/HEAD/OPTIONS)
+   - 대상 View (REPLICA_READ_MODULES의 앱 전체 + REPLICA_READ_VIEW_NAMES의 커뮤니티 목록 View)
+   - 쓰기 직후 고정(stickiness) 쿠키가 없음
+   - 복제본 상태 확인 통과 (ReplicaHealth)
+2. ReadReplicaRouter.db_for_read: 위 조건을 통과한 요청이면 'replica', 아니면 기본(primary)
+3. 응답 후 contextvar 복원 (gthread 워커의 스레드 재사용 대비)
+
+[상세 고려 사항]
+- read-your-writes: 쓰기 요청(POST/PUT/PATCH/DELETE)이 성공하면 REPLICA_STICKY_SECONDS 동안
+  primary 고정 쿠키를 내려줌 → 다음 조회가 다른 워커로 가도 방금 쓴 데이터를 읽음
+- 트랜잭션(atomic) 안의 읽기는 primary (같은 트랜잭션의 쓰기를 볼 수 있어야 함)
+- 상태 확인: REPLICA_HEALTH_INTERVAL마다 "SELECT 복제 지연" 1회 (워커 프로세스별)
+  - 연결 실패 또는 지연이 REPLICA_MAX_LAG_SECONDS 초과 → primary로 전환,
+    REPLICA_RETRY_SECONDS 뒤 다시 확인 (장애 중 매 요청 연결 시도 방지)
+  - 확인 주기 사이에 복제본 쿼리가 연결 오류(OperationalError)로 실패해도 즉시 primary로 전환
+    (해당 요청은 500, 다음 요청부터 primary)
+  - WAL 수신/재생 위치가 같으면 지연 0 (쓰기가 없어 마지막 재생 시각이 오래된 경우 오판 방지)
+- DATABASES에 'replica'가 없으면 모든 요청이 primary (개발 환경 그대로 동작)
+- 마이그레이션은 primary에만 적용 (allow_migrate)
+
+[사용 예시]
+# settings
+DATABASE_ROUTERS = ['apps.core.utils.db_routing.ReadReplicaRouter']
+MIDDLEWARE = [..., 'apps.core.utils.db_routing.ReplicaRoutingMiddleware', ...]
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from django.conf import settings
+from django.core.signals import got_request_exception
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, OperationalError, connections
+
+logger = logging.getLogger(__name__)
+
+# =========================
+# 라우팅 설정 상수
+# =========================
+
+REPLICA_DB_ALIAS = 'replica'
+
+REPLICA_STICKY_COOKIE = 'db_primary_until'
+REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 5))          # 쓰기 후 primary 고정 시간
+REPLICA_HEALTH_INTERVAL = int(os.environ.get('REPLICA_HEALTH_INTERVAL', 10))       # 상태 확인 주기 (초)
+REPLICA_RETRY_SECONDS = int(os.environ.get('REPLICA_RETRY_SECONDS', 30))           # 장애 시 재확인 대기 (초)
+REPLICA_MAX_LAG_SECONDS = float(os.environ.get('REPLICA_MAX_LAG_SECONDS', 5))      # 허용 복제 지연 (초)
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# 읽기를 복제본으로 보낼 View
+# - 앱 단위: View 클래스가 정의된 모듈 접두사
+# - 개별 View: URL 이름 (커뮤니티는 목록/검색만, 상세는 조회수 갱신 등 쓰기가 섞일 수 있어 제외)
+REPLICA_READ_MODULES = ('apps.courses.', 'apps.mypage.')
+REPLICA_READ_VIEW_NAMES = frozenset({
+    'community:board-list',
+    'community:post-list-by-id',
+    'community:post-list-by-slug',
+    'community:post-search',
+    'community:comment-list',
+})
+
+# 복제 지연 (초) | primary에서 실행하면 NULL
+REPLICATION_LAG_SQL = """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+# 현재 요청의 읽기 DB (None이면 primary)
+_read_alias: ContextVar[Optional[str]] = ContextVar('db_read_alias', default=None)
+
+
+def replica_configured() -> bool:
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+# =========================
+# 복제본 상태 확인
+# =========================
+
+class ReplicaHealth:
+    """
+    복제본 사용 가능 여부 (워커 프로세스별 캐시)
+
+    - 확인 쿼리는 한 스레드만 실행, 나머지 스레드는 직전 결과 사용
+    """
+
+    def __init__(self):
+        self._available = False
+        self._next_check_at = 0.0
+        self._lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        if not replica_configured():
+            return False
+        if time.monotonic() < self._next_check_at:
+            return self._available
+        if not self._lock.acquire(blocking=False):
+            return self._available
+
+        try:
+            self._available = self._probe()
+            delay = REPLICA_HEALTH_INTERVAL if self._available else REPLICA_RETRY_SECONDS
+            self._next_check_at = time.monotonic() + delay
+            return self._available
+        finally:
+            self._lock.release()
+
+    def mark_unavailable(self):
+        """복제본 쿼리 실패 시 즉시 primary로 전환 (REPLICA_RETRY_SECONDS 뒤 재확인)"""
+        self._available = False
+        self._next_check_at = time.monotonic() + REPLICA_RETRY_SECONDS
+
+    @staticmethod
+    def _probe() -> bool:
+        connection = connections[REPLICA_DB_ALIAS]
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(REPLICATION_LAG_SQL)
+                lag = cursor.fetchone()[0]
+        except DatabaseError as e:
+            logger.warning(f'복제본 상태 확인 실패, primary로 전환: {str(e)}')
+            try:
+                connection.close()
+            except DatabaseError:
+                pass
+            return False
+
+        if lag is not None and float(lag) > REPLICA_MAX_LAG_SECONDS:
+            logger.warning(f'복제 지연 {float(lag):.1f}초 (허용 {REPLICA_MAX_LAG_SECONDS}초), primary로 전환')
+            return False
+        return True
+
+
+replica_health = ReplicaHealth()
+
+
+# =========================
+# DB 라우터
+# =========================
+
+class ReadReplicaRouter:
+    """
+    [설계 의도]
+    - 읽기: 미들웨어가 복제본으로 표시한 요청만 'replica', 그 외 None(=primary)
+    - 쓰기/마이그레이션: 항상 primary
+    """
+
+    def db_for_read(self, model, **hints):
+        alias = _read_alias.get()
+        if alias is None:
+            return None
+        # 트랜잭션 안의 읽기는 같은 트랜잭션의 쓰기를 볼 수 있도록 primary
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 primary와 같은 데이터 → 어느 쪽에서 읽은 객체끼리도 관계 허용
+        databases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == REPLICA_DB_ALIAS:
+            return False
+        return None
+
+
+def _on_request_exception(sender, request=None, **kwargs):
+    """복제본에서 읽던 요청이 연결 오류로 실패하면 다음 요청부터 primary (상태 확인 주기를 기다리지 않음)"""
+    exc = sys.exc_info()[1]
+    if isinstance(exc, OperationalError) and _read_alias.get() == REPLICA_DB_ALIAS:
+        logger.warning(f'복제본 쿼리 실패, primary로 전환: {str(exc)}')
+        replica_health.mark_unavailable()
+
+
+# =========================
+# 미들웨어
+# =========================
+
+class ReplicaRoutingMiddleware:
+    """
+    요청 단위 읽기 DB 결정 + 쓰기 후 primary 고정 쿠키
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        got_request_exception.connect(_on_request_exception, dispatch_uid='replica_routing_failover')
+
+    def __call__(self, request):
+        token = _read_alias.set(None)
+        try:
+            response = self.get_response(request)
+        finally:
+            _read_alias.reset(token)
+
+        # 성공한 쓰기 요청 → 잠시 primary 고정 (read-your-writes)
+        if request.method not in SAFE_METHODS and response.status_code < 400 and replica_configured():
+            response.set_cookie(
+                REPLICA_STICKY_COOKIE,
+                str(int(time.time()) + REPLICA_STICKY_SECONDS),
+                max_age=REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite='Lax',
+                secure=request.is_secure(),
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if self._reads_from_replica(request, view_func):
+            _read_alias.set(REPLICA_DB_ALIAS)
+        return None
+
+    @staticmethod
+    def _reads_from_replica(request, view_func) -> bool:
+        if request.method not in SAFE_METHODS or not replica_configured():
+            return False
+
+        # 최근 쓰기가 있었으면 primary
+        try:
+            if float(request.COOKIES.get(REPLICA_STICKY_COOKIE, 0)) > time.time():
+                return False
+        except ValueError:
+            pass
+
+        module = getattr(getattr(view_func, 'view_class', view_func), '__module__', '') or ''
+        view_name = request.resolver_match.view_name if request.resolver_match else ''
+        if not (module.startswith(REPLICA_READ_MODULES) or view_name in REPLICA_READ_VIEW_NAMES):
+            return False
+
+        return replica_health.is_available()
@@ -0,0 +1,113 @@
+# backend/apps/core/utils/fast_serialization.py
+
+"""
+읽기 전용 목록 응답용 고속 직렬화 레이어
+
+[설계 의도]
+- ModelSerializer는 객체마다 (1) 모델 인스턴스 생성, (2) 필드별 get_attribute/to_representation,
+  (3) OrderedDict 구성을 반복하므로 100건 페이지에서도 CPU 비용이 큼
+- 목록 응답처럼 "DB 컬럼/annotate 값을 그대로 내려주는" 경우에는
+  values_list() 튜플을 받아 미리 준비한 필드 이름과 zip 하는 것으로 충분
+
+[구성]
+1. ValuesSerializer  | 필드 목록 + 값 변환기(transforms)를 클래스 정의 시점에 한 번만 준비
+2. ValuesListMixin   | ListAPIView에 섞어 쓰는 opt-in 믹스인 (페이지네이션/필터 그대로 사용)
+
+[상세 고려사항]
+- 응답 형식은 기존 ModelSerializer와 같아야 함 → 반올림 등 표현 규칙은 transforms로 옮김
+- DateField 값(date)은 JSON 인코딩 시 기존과 같은 'YYYY-MM-DD'로 변환되지만,
+  DateTimeField는 DRF 표기(…Z)와 다를 수 있으므로 필요하면 transforms에서 문자열로 변환
+- 쓰기(POST/PUT) 검증에는 사용하지 않음 (ModelSerializer 유지)
+"""
+
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
+
+from apps.core.renderers import FastJSONRenderer
+
+
+class ValuesSerializer:
+    """
+    values_list() 행(tuple)을 dict로 바꾸는 경량 직렬화기
+
+    [사용 예시]
+    class CourseListValuesSerializer(ValuesSerializer):
+        fields = ('id', 'name', 'average_rating')
+        transforms = {'average_rating': round_1}
+
+    rows = CourseListValuesSerializer.values_list(queryset)
+    data = CourseListValuesSerializer.serialize(rows)
+    """
+
+    fields: Tuple[str, ...] = ()
+    transforms: Dict[str, Callable] = {}
+
+    # 클래스 정의 시점에 준비되는 값 (요청마다 다시 계산하지 않음)
+    _names: Tuple[str, ...] = ()
+    _transforms: Tuple[Tuple[str, Callable], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        unknown = set(cls.transforms) - set(cls.fields)
+        if unknown:
+            raise ValueError(f'{cls.__name__}.transforms에 fields에 없는 키가 있습니다: {sorted(unknown)}')
+        cls._names = tuple(cls.fields)
+        cls._transforms = tuple(cls.transforms.items())
+
+    @classmethod
+    def values_list(cls, queryset):
+        """직렬화에 필요한 컬럼만 조회하는 QuerySet"""
+        return queryset.values_list(*cls._names)
+
+    @classmethod
+    def to_dict(cls, row: tuple) -> dict:
+        data = dict(zip(cls._names, row))
+        for name, transform in cls._transforms:
+            data[name] = transform(data[name])
+        return data
+
+    @classmethod
+    def serialize(cls, rows: Iterable[tuple]) -> List[dict]:
+        names = cls._names
+        transforms = cls._transforms
+        if not transforms:
+            return [dict(zip(names, row)) for row in rows]
+
+        results = []
+        for row in rows:
+            data = dict(zip(names, row))
+            for name, transform in transforms:
+                data[name] = transform(data[name])
+            results.append(data)
+        return results
+
+
+class ValuesListMixin:
+    """
+    ListAPIView용 고속 목록 응답 믹스인 (opt-in)
+
+    - get_queryset() / filter_queryset() / 페이지네이션은 기존 흐름 그대로 사용
+    - 페이지 조회만 values_list()로 바꿔 모델 인스턴스 생성을 생략
+    - serializer_class는 스키마 문서화(drf-spectacular)와 브라우저블 API용으로 유지
+    """
+
+    values_serializer_class = None
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    def get_values_serializer_class(self):
+        assert self.values_serializer_class is not None, (
+            f"'{self.__class__.__name__}' should include a `values_serializer_class` attribute."
+        )
+        return self.values_serializer_class
+
+    def list(self, request, *args, **kwargs):
+        values_serializer = self.get_values_serializer_class()
+        queryset = values_serializer.values_list(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(values_serializer.serialize(page))
+
+        return Response(values_serializer.serialize(queryset))
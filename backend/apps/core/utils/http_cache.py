@@ -0,0 +1,117 @@
+# backend/apps/core/utils/http_cache.py
+
+"""
+조건부 응답(Conditional GET) 공용 레이어
+
+[설계 의도]
+- 공개 조회 API가 재방문/뒤로가기 때마다 전체 쿼리 + 직렬화를 반복하지 않도록
+  "검증자(validator)"만 먼저 계산하고, 클라이언트가 가진 버전과 같으면 304로 응답
+- 검증자는 updated_at, max(review.updated_at), 캐시 세대 번호처럼
+  본 응답보다 훨씬 싼 값으로 구성
+
+[동작 흐름]
+1. View의 get_validators()가 Validators(ETag 재료, Last-Modified, 개인화 여부) 반환
+2. If-None-Match / If-Modified-Since와 비교 → 일치하면 View 본문을 실행하지 않고 304
+3. 불일치하면 View 본문 실행 후 ETag, Last-Modified, Cache-Control, Vary 헤더 부착
+
+[Cache-Control 정책]
+- 비로그인(공개) 응답: public, max-age=N → Nginx(proxy_cache)와 브라우저가 N초간 재사용,
+  이후에는 If-None-Match로 재검증(proxy_cache_revalidate)
+- 로그인(개인화) 응답: private, no-cache → 공유 캐시 저장 금지, 매번 재검증(304는 허용)
+
+[사용 예시]
+class CourseDetailView(generics.RetrieveAPIView):
+    def get_validators(self, request, *args, **kwargs):
+        return Validators(parts=(...), last_modified=...)
+
+    @conditional_get(max_age=60)
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from functools import wraps
+from typing import Optional, Tuple
+
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+
+@dataclass(frozen=True)
+class Validators:
+    """
+    조건부 응답 검증자
+
+    Attributes:
+        parts: ETag를 구성할 값들 (순서 포함, repr 가능한 값)
+        last_modified: 응답 데이터의 마지막 변경 시각 (없으면 Last-Modified 생략)
+        private: 사용자별로 달라지는 응답인지 여부 (True면 공유 캐시 금지)
+    """
+    parts: Tuple
+    last_modified: Optional[datetime] = None
+    private: bool = False
+
+    @property
+    def etag(self) -> str:
+        return make_etag(*self.parts)
+
+
+def make_etag(*parts) -> str:
+    """검증자 값들로 강한(strong) ETag 생성"""
+    payload = '|'.join(repr(part) for part in parts)
+    return '"%s"' % hashlib.md5(payload.encode('utf-8')).hexdigest()
+
+
+def conditional_get(max_age: int = 60, vary: Tuple[str, ...] = ('Authorization', 'Cookie')):
+    """
+    DRF View의 get() 메서드용 조건부 응답 데코레이터
+
+    - View에 get_validators(request, *args, **kwargs) 메서드가 있어야 함
+    - get_validators가 None을 반환하면(대상 없음 등) 일반 응답으로 처리
+    - 2xx 응답에만 검증자 헤더를 부착 (404/500 응답은 캐시되지 않도록)
+
+    Args:
+        max_age: 공개 응답의 공유 캐시 유효 시간(초)
+        vary: 응답이 달라질 수 있는 요청 헤더 (인증 수단)
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            validators = self.get_validators(request, *args, **kwargs)
+            if validators is None:
+                return view_method(self, request, *args, **kwargs)
+
+            etag = validators.etag
+            last_modified = (
+                int(validators.last_modified.timestamp())
+                if validators.last_modified else None
+            )
+
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = view_method(self, request, *args, **kwargs)
+                if not 200 <= response.status_code < 300:
+                    return response
+
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+
+            if validators.private:
+                patch_cache_control(response, private=True, no_cache=True)
+            else:
+                patch_cache_control(response, public=True, max_age=max_age)
+            patch_vary_headers(response, vary)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def latest(*values: Optional[datetime]) -> Optional[datetime]:
+    """None을 제외한 시각 중 가장 최근 값 (Last-Modified 계산용)"""
+    candidates = [value for value in values if value is not None]
+    return max(candidates) if candidates else None
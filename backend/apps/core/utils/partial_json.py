@@ -0,0 +1,164 @@
+# backend/apps/core/utils/partial_json.py
+
+"""
+불완전한(생성 중인) JSON 문자열 파서
+
+[설계 의도]
+- LLM 스트리밍 응답은 JSON이 토큰 단위로 조금씩 도착 → 끝나기 전까지 json.loads 불가
+- 지금까지 받은 앞부분만으로 "현재까지 확정된 값 + 작성 중인 문자열"을 복원해
+  요약문/추천 이유를 생성되는 대로 화면에 보여줄 수 있게 함
+
+[상세 고려사항]
+- 작성 중인 문자열은 지금까지의 내용으로 포함 (이스케이프 중간에서 끊기면 그 앞까지)
+- 작성 중인 배열/객체는 지금까지의 원소만 포함
+- 값이 시작되지 않은 키, 끝나지 않은 숫자/true/false/null은 제외
+- 최종 결과 검증은 완성된 응답을 json.loads로 다시 파싱해서 수행 (이 파서는 미리보기 용도)
+"""
+
+from typing import Any
+
+_MISSING = object()
+_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+_LITERALS = {'true': True, 'false': False, 'null': None}
+
+
+class _PartialParser:
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def _skip_ws(self):
+        while self.pos < len(self.text) and self.text[self.pos] in ' \t\r\n':
+            self.pos += 1
+
+    def _eof(self) -> bool:
+        return self.pos >= len(self.text)
+
+    def parse_value(self):
+        self._skip_ws()
+        if self._eof():
+            return _MISSING
+        ch = self.text[self.pos]
+        if ch == '{':
+            return self._parse_object()
+        if ch == '[':
+            return self._parse_array()
+        if ch == '"':
+            value, _ = self._parse_string()
+            return value
+        return self._parse_scalar()
+
+    def _parse_object(self):
+        self.pos += 1
+        result = {}
+        while True:
+            self._skip_ws()
+            if self._eof():
+                return result
+            ch = self.text[self.pos]
+            if ch == '}':
+                self.pos += 1
+                return result
+            if ch == ',':
+                self.pos += 1
+                continue
+            if ch != '"':
+                return result  # 형식 오류 → 지금까지만
+
+            key, closed = self._parse_string()
+            if not closed:
+                return result
+            self._skip_ws()
+            if self._eof() or self.text[self.pos] != ':':
+                return result
+            self.pos += 1
+
+            value = self.parse_value()
+            if value is _MISSING:
+                return result
+            result[key] = value
+
+    def _parse_array(self):
+        self.pos += 1
+        result = []
+        while True:
+            self._skip_ws()
+            if self._eof():
+                return result
+            ch = self.text[self.pos]
+            if ch == ']':
+                self.pos += 1
+                return result
+            if ch == ',':
+                self.pos += 1
+                continue
+            value = self.parse_value()
+            if value is _MISSING:
+                return result
+            result.append(value)
+
+    def _parse_string(self):
+        """Returns: (문자열, 닫는 따옴표까지 도착했는지)"""
+        self.pos += 1
+        chars = []
+        text = self.text
+        while self.pos < len(text):
+            ch = text[self.pos]
+            if ch == '"':
+                self.pos += 1
+                return ''.join(chars), True
+            if ch == '\\':
+                if self.pos + 1 >= len(text):
+                    break
+                code = text[self.pos + 1]
+                if code == 'u':
+                    hex_digits = text[self.pos + 2:self.pos + 6]
+                    if len(hex_digits) < 4:
+                        break
+                    try:
+                        chars.append(chr(int(hex_digits, 16)))
+                    except ValueError:
+                        pass
+                    self.pos += 6
+                    continue
+                chars.append(_ESCAPES.get(code, code))
+                self.pos += 2
+                continue
+            chars.append(ch)
+            self.pos += 1
+        self.pos = len(text)
+        return ''.join(chars), False
+
+    def _parse_scalar(self):
+        start = self.pos
+        while self.pos < len(self.text) and self.text[self.pos] not in ',]}' + ' \t\r\n':
+            self.pos += 1
+        token = self.text[start:self.pos]
+        if self._eof():
+            # 값이 끝났는지 알 수 없음 (예: 12 → 123, tr → true)
+            return _MISSING
+        if token in _LITERALS:
+            return _LITERALS[token]
+        try:
+            return int(token)
+        except ValueError:
+            pass
+        try:
+            return float(token)
+        except ValueError:
+            return _MISSING
+
+
+def parse_partial_json(text: str, default: Any = None) -> Any:
+    """
+    JSON 앞부분 파싱
+
+    Examples:
+        parse_partial_json('{"summary": "이 강좌는 실')      → {'summary': '이 강좌는 실'}
+        parse_partial_json('{"pros": ["실습 위주", "예제')   → {'pros': ['실습 위주', '예제']}
+
+    Returns:
+        파싱된 값 (아직 값이 시작되지 않았으면 default)
+    """
+    value = _PartialParser(text or '').parse_value()
+    return default if value is _MISSING else value
@@ -1,6 +1,11 @@
+# backend/apps/courses/apps.py
+
 from django.apps import AppConfig
 
 
 class CoursesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.courses'
+
+    def ready(self):
+        from . import signals
@@ -0,0 +1,38 @@
+# backend/apps/courses/cache.py
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from .models import Course
+
+
+# =========================
+# 카탈로그(검색 인덱스) 세대
+# =========================
+"""
+[설계 의도]
+- 추천/검색 결과는 ES 인덱스 내용에 따라 달라지므로 조건부 응답의 검증자로 "인덱스 세대"가 필요
+- ES 인덱스는 push_to_es로 DB(courses 테이블)를 그대로 옮긴 것이므로
+  (강좌 수, 최신 updated_at) 쌍을 인덱스 세대로 사용
+  → import_courses / make_embeddings 등으로 강좌가 바뀌면 세대도 바뀜
+
+[상세 고려사항]
+- 전체 테이블 집계이므로 짧은 TTL로 캐시하여 요청마다 집계하지 않음
+"""
+
+CATALOG_GENERATION_CACHE_KEY = 'courses:catalog_generation'
+CATALOG_GENERATION_CACHE_TIMEOUT = 60  # 1분
+
+
+def get_catalog_generation():
+    """
+    Returns:
+        (강좌 수, 최신 updated_at ISO 문자열) 튜플
+    """
+    generation = cache.get(CATALOG_GENERATION_CACHE_KEY)
+    if generation is None:
+        stats = Course.objects.aggregate(total=Count('id'), latest=Max('updated_at'))
+        latest = stats['latest'].isoformat() if stats['latest'] else None
+        generation = (stats['total'], latest)
+        cache.set(CATALOG_GENERATION_CACHE_KEY, generation, CATALOG_GENERATION_CACHE_TIMEOUT)
+    return generation
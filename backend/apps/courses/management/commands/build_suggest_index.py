@@ -0,0 +1,52 @@
+# apps/courses/management/commands/build_suggest_index.py
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.courses.services import get_suggest_service
+
+"""
+[설계의도]
+- 검색어 자동완성(/api/v1/courses/suggest/)용 접두사 인덱스를 DB에서 만들어 스냅샷 파일로 저장
+- 웹 워커는 시작 시/파일 수정 시각이 바뀌면 파일을 로드 → DB 조회 없이 인덱스 준비
+
+[상세고려사항]
+- backend 컨테이너 시작 시, load_courses/import_courses 적재 후, 매일 자정(run_scheduler) 실행
+- 실행하지 않아도 API는 동작 (첫 요청에서 DB로 생성 후 메모리에 보관)
+
+[사용 예시]
+python manage.py build_suggest_index
+"""
+
+# 조회 지연 측정용 예시 검색어
+SAMPLE_QUERIES = ['ㄷ', '데이', '데이터 분', 'ㅍㅇㅆ', '경영', 'python']
+
+
+class Command(BaseCommand):
+    help = '검색어 자동완성 접두사 인덱스 생성 및 스냅샷 파일 저장'
+
+    def handle(self, *args, **options):
+        service = get_suggest_service()
+
+        started_at = time.perf_counter()
+        index = service.build_index()
+        built_at = time.perf_counter()
+        service.save_index(index)
+        saved_at = time.perf_counter()
+
+        self.stdout.write(f'용어 {len(index)}개, 키 {len(index.keys)}개, 사전 계산 접두사 {len(index.top)}개')
+
+        # 조회 지연 확인 (운영 확인용)
+        repeat = 1000
+        for query in SAMPLE_QUERIES:
+            lookup_started_at = time.perf_counter()
+            for _ in range(repeat):
+                results = index.search(query)
+            elapsed_us = (time.perf_counter() - lookup_started_at) / repeat * 1_000_000
+            self.stdout.write(f'  - "{query}": {len(results)}개, {elapsed_us:.1f}µs')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 저장 완료: {service.path} '
+            f'(생성 {(built_at - started_at) * 1000:.0f}ms, 저장 {(saved_at - built_at) * 1000:.0f}ms)'
+        ))
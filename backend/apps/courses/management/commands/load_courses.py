@@ -5,6 +5,8 @@ from datetime import datetime
 from django.core.management.base import BaseCommand
 from django.conf import settings
 from apps.courses.models import Course
+from apps.courses.services import get_suggest_service
+from apps.courses.status import refresh_course_statuses
 
 # CSV 필드 크기 제한 해제 (raw_summary 등 긴 텍스트 처리용)
 csv.field_size_limit(sys.maxsize)
@@ -94,3 +96,13 @@ class Command(BaseCommand):
 
             self.stdout.write(self.style.SUCCESS(f'Successfully processed {count} courses.'))
             self.stdout.write(self.style.SUCCESS(f'Created: {created_count}, Updated: {updated_count}'))
+
+            # 적재된 강좌의 진행 상태 계산 (오늘 날짜 기준)
+            changed = refresh_course_statuses()
+            self.stdout.write(self.style.SUCCESS(f'Status refreshed: {sum(len(ids) for ids in changed.values())}'))
+
+            # 자동완성 인덱스 스냅샷 갱신 (웹 워커는 파일 수정 시각을 보고 다시 로드)
+            suggest_service = get_suggest_service()
+            suggest_index = suggest_service.build_index()
+            suggest_service.save_index(suggest_index)
+            self.stdout.write(self.style.SUCCESS(f'Suggest index rebuilt: {len(suggest_index)} terms'))
@@ -3,12 +3,50 @@ import requests
 import json
 import re
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
 from apps.courses.models import Course
+from apps.core.batch import BatchModeCommandMixin
 
-class Command(BaseCommand):
+"""
+[오프라인 배치 모드]
+- --batch prepare : 임베딩 입력(전처리된 텍스트)을 /v1/embeddings 요청 JSONL로 작성
+- --batch submit  : Batch API로 제출 (--batch-adapter local 은 파일 기반 테스트용)
+- --batch collect : 완료 대기 → 결과 파일 스트리밍 파싱 → Course.embedding 일괄 반영(bulk_update)
+- --batch run     : 위 단계를 한 번에 실행
+
+python manage.py make_embeddings --batch run --batch-adapter local
+"""
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+BATCH_ENDPOINT = "/v1/embeddings"
+
+# 전처리 시 제거할 불용어
+STOPWORDS = ['주차', '학교', 'email', '이메일', '수강신청', '이수증', '석사', '박사', '저서',
+             '출판사', '학지사', '퀴즈', '공개', '일시', '주요경력', '전)', '현)', '주제']
+
+# 임베딩 입력 생성에 필요한 강좌 필드 (embedding 등 대용량 컬럼 제외)
+COURSE_FIELDS = ['id', 'name', 'summary', 'classfy_name', 'middle_classfy_name']
+
+
+class Command(BatchModeCommandMixin, BaseCommand):
     help = "강의 데이터를 전처리 후 배치 방식으로 임베딩을 생성하여 저장합니다."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--db-batch-size',
+            type=int,
+            default=500,
+            help='배치 모드 결과 반영 시 bulk_update 단위 (기본: 500)'
+        )
+        self.add_batch_arguments(parser)
+
     def handle(self, *args, **options):
+        # 오프라인 배치 모드: 요청 파일 작성/제출/결과 반영 후 종료
+        if options['batch']:
+            self._handle_batch(options)
+            return
+
         # 1. 설정 및 환경 변수
         GMS_URL = "https://gms.ssafy.io/gmsapi/api.openai.com/v1/embeddings"
         GMS_KEY = os.environ.get("GMS_KEY")
@@ -40,35 +78,7 @@ class Command(BaseCommand):
             valid_courses = []
 
             for course in batch_segment:
-                # --- 전처리 로직 시작 ---
-                name = course.name or ""
-                summary = course.summary or ""
-                category = f"{course.classfy_name or ''} {course.middle_classfy_name or ''}"
-
-                # (1) 불용어 및 노이즈 제거
-                text = f"{category} {summary}"
-                text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '', text) # 이메일 제거
-                text = re.sub(r'\d{4}[-./]\d{1,2}[-./]\d{1,2}', '', text) # 날짜 제거
-                
-                stopwords = ['주차', '학교', 'email', '이메일', '수강신청', '이수증', '석사', '박사', '저서', 
-                             '출판사', '학지사', '퀴즈', '공개', '일시', '주요경력', '전)', '현)', '주제']
-                for word in stopwords:
-                    text = text.replace(word, '')
-
-                # 특수문자 제거 및 공백 정규화
-                text = re.sub(r'[^\w\s가-힣]', ' ', text)
-                text = " ".join(text.split())
-
-                # (2) 제목 반복 (Title Boosting) 및 길이 제한
-                # 제목 3번 반복
-                boosted_name = (name + " ") * 3
-                combined_text = f"{boosted_name} {text}".strip()
-
-                # (3) [핵심 안전장치] 개별 텍스트 길이 제한
-                # 한글 기준 3,000자면 약 4,500~5,000 토큰입니다. 
-                # 배치 2개의 합이 8,192 토큰을 넘지 않도록 안전하게 3,000자로 제한합니다.
-                if len(combined_text) > 3000:
-                    combined_text = combined_text[:3000]
+                combined_text = self._build_input_text(course)
 
                 if combined_text:
                     processed_texts.append(combined_text)
@@ -80,7 +90,7 @@ class Command(BaseCommand):
             # 4. GMS(OpenAI) 배치 호출
             try:
                 data = {
-                    "model": "text-embedding-3-small",
+                    "model": EMBEDDING_MODEL,
                     "input": processed_texts
                 }
                 
@@ -103,4 +113,98 @@ class Command(BaseCommand):
             except Exception as e:
                 self.stdout.write(self.style.ERROR(f"에러 발생: {e}"))
 
-        self.stdout.write(self.style.SUCCESS("모든 작업이 완료되었습니다."))
\ No newline at end of file
+        self.stdout.write(self.style.SUCCESS("모든 작업이 완료되었습니다."))
+
+    def _build_input_text(self, course):
+        """
+        강좌 1개의 임베딩 입력 텍스트 생성 (동기/배치 모드 공용 전처리)
+
+        Returns:
+            str: 전처리된 텍스트 (비어 있으면 임베딩 대상 아님)
+        """
+        # --- 전처리 로직 시작 ---
+        name = course.name or ""
+        summary = course.summary or ""
+        category = f"{course.classfy_name or ''} {course.middle_classfy_name or ''}"
+
+        # (1) 불용어 및 노이즈 제거
+        text = f"{category} {summary}"
+        text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '', text) # 이메일 제거
+        text = re.sub(r'\d{4}[-./]\d{1,2}[-./]\d{1,2}', '', text) # 날짜 제거
+
+        for word in STOPWORDS:
+            text = text.replace(word, '')
+
+        # 특수문자 제거 및 공백 정규화
+        text = re.sub(r'[^\w\s가-힣]', ' ', text)
+        text = " ".join(text.split())
+
+        # (2) 제목 반복 (Title Boosting) 및 길이 제한
+        # 제목 3번 반복
+        boosted_name = (name + " ") * 3
+        combined_text = f"{boosted_name} {text}".strip()
+
+        # (3) [핵심 안전장치] 개별 텍스트 길이 제한
+        # 한글 기준 3,000자면 약 4,500~5,000 토큰입니다.
+        # 배치 2개의 합이 8,192 토큰을 넘지 않도록 안전하게 3,000자로 제한합니다.
+        if len(combined_text) > 3000:
+            combined_text = combined_text[:3000]
+
+        return combined_text
+
+    def _handle_batch(self, options):
+        """
+        오프라인 배치 모드
+
+        - prepare: 임베딩이 없는 강좌 1개당 요청 1줄 (custom_id = course-<id>)
+        - collect: 결과를 스트리밍으로 읽으며 db_batch_size개씩 bulk_update (강좌별 save() 반복 제거)
+        """
+        def build_requests():
+            courses = Course.objects.filter(embedding__isnull=True).only(*COURSE_FIELDS).order_by('id')
+            for course in courses.iterator(chunk_size=500):
+                text = self._build_input_text(course)
+                if text:
+                    yield f'course-{course.id}', {"model": EMBEDDING_MODEL, "input": text}
+
+        def apply_results(results):
+            succeeded = failed = 0
+            pending = []
+
+            def flush():
+                nonlocal succeeded, pending
+                if pending:
+                    # bulk_update는 auto_now를 적용하지 않음 → updated_at 직접 갱신 (ETag/카탈로그 세대 반영)
+                    now = timezone.now()
+                    for course in pending:
+                        course.updated_at = now
+                    with transaction.atomic():
+                        Course.objects.bulk_update(pending, ['embedding', 'updated_at'])
+                    succeeded += len(pending)
+                    self.stdout.write(self.style.SUCCESS(f"완료: {succeeded}"))
+                    pending = []
+
+            for custom_id, body, error in results:
+                try:
+                    if error:
+                        raise Exception(error)
+                    course_id = int(custom_id.split('-', 1)[1])
+                    pending.append(Course(id=course_id, embedding=body['data'][0]['embedding']))
+                except Exception as e:
+                    failed += 1
+                    self.stdout.write(self.style.ERROR(f"[{custom_id}] 실패: {e}"))
+                    continue
+
+                if len(pending) >= options['db_batch_size']:
+                    flush()
+
+            flush()
+            return succeeded, failed
+
+        self.run_batch_mode(
+            options,
+            name='embeddings',
+            endpoint=BATCH_ENDPOINT,
+            build_requests=build_requests,
+            apply_results=apply_results,
+            api_key=os.environ.get("GMS_KEY"),
+        )
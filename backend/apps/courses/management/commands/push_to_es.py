@@ -3,6 +3,7 @@ import requests
 from django.core.management.base import BaseCommand
 from django.conf import settings
 from apps.courses.models import Course
+from apps.courses.services.search_index import rating_documents
 
 class Command(BaseCommand):
     help = 'DB의 데이터를 Elasticsearch로 벌크 전송합니다.'
@@ -17,6 +18,9 @@ class Command(BaseCommand):
         total_courses = Course.objects.count()
         skipped = total_courses - courses.count()
 
+        # 하이브리드 검색 평점 가중치용 비정규화 필드 (GROUP BY 1회)
+        ratings = rating_documents()
+
         bulk_data = ""
 
         self.stdout.write("ES 데이터 전송 시작...")
@@ -48,6 +52,9 @@ class Command(BaseCommand):
                 "course_image": course.course_image,
                 "url": course.url,
                 "content_key": course.content_key,
+                "status": course.status,
+                "rating": ratings.get(course.id, {}).get("rating"),
+                "review_count": ratings.get(course.id, {}).get("review_count", 0),
                 "embedding": safe_embedding
             }
             bulk_data += json.dumps(doc) + "\n"
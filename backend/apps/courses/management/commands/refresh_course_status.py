@@ -0,0 +1,72 @@
+# apps/courses/management/commands/refresh_course_status.py
+
+import time
+
+import requests
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.courses.models import Course
+from apps.courses.services.search_index import ensure_mapping, partial_update
+from apps.courses.status import refresh_course_statuses
+
+"""
+[설계의도]
+- 강좌 진행 상태(Course.status)를 오늘 날짜 기준으로 다시 계산하는 커맨드
+- 매일 자정 스케줄러(run_scheduler)가 실행 → 목록/검색의 ?status= 필터는 저장된 컬럼만 사용
+
+[상세고려사항]
+- DB: 상태별 UPDATE 1회 (상태가 바뀐 행만)
+- ES: 상태가 바뀐 강좌만 _bulk partial update로 status 필드 동기화 (전체 push_to_es 불필요, services/search_index.py)
+  - 인덱스에 status 매핑이 없으면 keyword로 추가 (기존 인덱스 재생성 없이 적용)
+  - 임베딩이 없어 ES에 없는 강좌(document_missing)는 정상으로 간주
+- --skip-es: DB만 갱신 (ES가 없는 로컬 환경)
+"""
+
+
+class Command(BaseCommand):
+    help = '강좌 진행 상태(status)를 오늘 날짜 기준으로 갱신하고 Elasticsearch 문서에 반영'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--skip-es',
+            action='store_true',
+            help='Elasticsearch 동기화 생략 (DB만 갱신)'
+        )
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        started_at = time.perf_counter()
+
+        self.stdout.write(f'기준일: {today.isoformat()}')
+
+        # 1. DB 상태 갱신
+        changed = refresh_course_statuses(today)
+        total_changed = sum(len(ids) for ids in changed.values())
+
+        for status, label in Course.STATUS_CHOICES:
+            self.stdout.write(f'  - {label}({status}): {len(changed.get(status, []))}개 변경')
+        self.stdout.write(self.style.SUCCESS(
+            f'DB 상태 갱신 완료: {total_changed}개 변경 ({time.perf_counter() - started_at:.2f}초)'
+        ))
+
+        # 2. ES 문서 동기화
+        if options['skip_es'] or total_changed == 0:
+            return
+
+        try:
+            ensure_mapping({'status': {'type': 'keyword'}})
+            updated, missing, failed = partial_update({
+                course_id: {'status': status}
+                for status, ids in changed.items()
+                for course_id in ids
+            })
+        except requests.RequestException as e:
+            self.stdout.write(self.style.ERROR(f'ES 동기화 실패: {str(e)}'))
+            return
+
+        message = f'ES 상태 동기화 완료: {updated}개 반영, {missing}개 ES 문서 없음'
+        if failed:
+            self.stdout.write(self.style.WARNING(f'{message}, {failed}개 실패'))
+        else:
+            self.stdout.write(self.style.SUCCESS(message))
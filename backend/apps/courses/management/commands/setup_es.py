@@ -32,6 +32,9 @@ class Command(BaseCommand):
                     "course_image": {"type": "keyword", "index": False},
                     "url": {"type": "keyword", "index": False},
                     "content_key": {"type": "keyword"},
+                    "status": {"type": "keyword"},  # 진행 상태 (refresh_course_status가 매일 갱신)
+                    "rating": {"type": "float"},  # 평균 평점 (sync_course_ratings가 매일 갱신)
+                    "review_count": {"type": "integer"},
                     "embedding": {
                         "type": "dense_vector",
                         "dims": 1536,
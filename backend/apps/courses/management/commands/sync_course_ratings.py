@@ -0,0 +1,47 @@
+# apps/courses/management/commands/sync_course_ratings.py
+
+import time
+
+import requests
+from django.core.management.base import BaseCommand
+
+from apps.courses.models import Course
+from apps.courses.services.search_index import ensure_mapping, partial_update, rating_documents
+
+"""
+[설계의도]
+- 하이브리드 검색의 평점 가중치용 비정규화 필드(rating, review_count)를 ES 문서에 동기화
+- 검색 요청은 ES 응답만으로 평점 가중치를 계산 (후보마다 DB 집계 없음)
+
+[상세고려사항]
+- 평균 평점/리뷰 수는 GROUP BY 1회로 계산, 전체 강좌를 _bulk partial update
+  - 값이 같은 문서는 ES가 noop 처리 → 실제 쓰기는 리뷰가 바뀐 강좌만
+  - 리뷰가 모두 삭제된 강좌도 rating=null, review_count=0으로 되돌림
+- scheduler 컨테이너(run_scheduler)가 매일 자정 실행 → 최대 하루 지연 (정렬 가중치 용도라 허용)
+"""
+
+
+class Command(BaseCommand):
+    help = '강좌 평균 평점/리뷰 수를 Elasticsearch 문서(rating, review_count)에 동기화'
+
+    def handle(self, *args, **options):
+        started_at = time.perf_counter()
+
+        docs = rating_documents(Course.objects.values_list('id', flat=True))
+        self.stdout.write(f'평점 집계: {len(docs)}개 강좌 ({time.perf_counter() - started_at:.2f}초)')
+
+        try:
+            ensure_mapping({'rating': {'type': 'float'}, 'review_count': {'type': 'integer'}})
+            updated, missing, failed = partial_update(docs)
+        except requests.RequestException as e:
+            self.stdout.write(self.style.ERROR(f'ES 동기화 실패: {str(e)}'))
+            return
+
+        message = (
+            f'ES 평점 동기화 완료: {updated}개 반영, {missing}개 ES 문서 없음 '
+            f'({time.perf_counter() - started_at:.2f}초)'
+        )
+        if failed:
+            self.stdout.write(self.style.WARNING(f'{message}, {failed}개 실패'))
+        else:
+            self.stdout.write(self.style.SUCCESS(message))
@@ -0,0 +1,45 @@
+# Generated manually for course status precomputation
+
+from django.db import migrations, models
+
+
+def compute_initial_statuses(apps, schema_editor):
+    """기존 강좌 상태 계산 (apps/courses/status.py와 같은 규칙)"""
+    from django.db.models import Q
+    from django.utils import timezone
+
+    Course = apps.get_model('courses', 'Course')
+    today = timezone.localdate()
+
+    enrolling = (
+        (Q(enrollment_start__isnull=True) | Q(enrollment_start__lte=today))
+        & (Q(enrollment_end__isnull=True) | Q(enrollment_end__gte=today))
+        & (Q(study_end__isnull=True) | Q(study_end__gte=today))
+    )
+    upcoming = Q(enrollment_start__gt=today)
+    finished = Q(study_end__lt=today)
+
+    # 기본값(in_progress)에서 우선순위 순서로 덮어씀
+    Course.objects.filter(enrolling).update(status='enrolling')
+    Course.objects.filter(upcoming).exclude(enrolling).update(status='upcoming')
+    Course.objects.filter(finished).exclude(enrolling).exclude(upcoming).update(status='finished')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0006_add_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='status',
+            field=models.CharField(choices=[('upcoming', '신청 예정'), ('enrolling', '신청 중'), ('in_progress', '진행 중'), ('finished', '종료')], default='in_progress', help_text='진행 상태 (upcoming/enrolling/in_progress/finished)', max_length=20),
+        ),
+        migrations.RunPython(compute_initial_statuses, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(condition=models.Q(('status', 'enrolling')), fields=['name', 'professor', '-study_start'], name='idx_course_enrolling'),
+        ),
+    ]
@@ -2,6 +2,18 @@ from django.db import models
 from pgvector.django import VectorField 
 
 class Course(models.Model):
+    # 진행 상태 (날짜 기준, refresh_course_status 커맨드가 매일 자정 갱신 → apps/courses/status.py)
+    STATUS_UPCOMING = 'upcoming'
+    STATUS_ENROLLING = 'enrolling'
+    STATUS_IN_PROGRESS = 'in_progress'
+    STATUS_FINISHED = 'finished'
+    STATUS_CHOICES = [
+        (STATUS_UPCOMING, '신청 예정'),
+        (STATUS_ENROLLING, '신청 중'),
+        (STATUS_IN_PROGRESS, '진행 중'),
+        (STATUS_FINISHED, '종료'),
+    ]
+
     # K-MOOC 원본 데이터의 식별자 (CSV의 id 컬럼)
     kmooc_id = models.CharField(max_length=50, unique=True)
     
@@ -32,6 +44,14 @@ class Course(models.Model):
     week = models.FloatField(blank=True, null=True)            # 주차 수
     course_playtime = models.FloatField(blank=True, null=True) # 총 재생 시간 (분 단위 등)
 
+    # 사전 계산된 진행 상태 (요청 시 날짜 비교 대신 사용)
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_IN_PROGRESS,
+        help_text='진행 상태 (upcoming/enrolling/in_progress/finished)'
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -61,6 +81,14 @@ class Course(models.Model):
             models.Index(fields=['org_name'], name='idx_org_name'),
             models.Index(fields=['professor'], name='idx_professor'),
 
+            # 신청 중인 강좌 부분 인덱스 (?status=enrolling)
+            # - 전체의 일부인 신청 중 강좌만 담아 작고, 중복 제거 Window의 정렬 순서와 같음
+            models.Index(
+                fields=['name', 'professor', '-study_start'],
+                name='idx_course_enrolling',
+                condition=models.Q(status='enrolling'),
+            ),
+
             # 벡터 검색 최적화를 위한 인덱스 (임베딩)
             # models.Index(fields=['embedding'], name='idx_embedding'),
         ]
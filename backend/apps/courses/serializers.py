@@ -1,12 +1,13 @@
 from rest_framework import serializers
-from django.db.models import Avg
-from apps.courses.models import Course, Wishlist, CourseReview
+from apps.courses.models import Course, CourseReview
+from apps.core.utils.fast_serialization import ValuesSerializer
 
 # 개요
 """
 1.1 CourseListSerializer   | 강의 목록 시리얼라이저
 1.2 CourseDetailSerializer | 강의 상세 정보 시리얼라이저
 1.3 CourseReviewSerializer | 강의 리뷰 목록 시리얼라이저
+1.4 CourseListValuesSerializer | 강의 목록 고속 직렬화기 (values_list 기반)
 """
 
 # 1.1 CourseListSerializer | 강의 목록 시리얼라이저
@@ -47,7 +48,8 @@ class CourseListSerializer(serializers.ModelSerializer):
             'enrollment_start',      # 수강 신청 시작일
             'enrollment_end',        # 수강 신청 종료일
             'study_start',           # 학습 시작일
-            'study_end'              # 학습 종료일
+            'study_end',             # 학습 종료일
+            'status'                 # 진행 상태 (upcoming/enrolling/in_progress/finished)
         ]
         read_only_fields = fields
 
@@ -73,11 +75,16 @@ class CourseDetailSerializer(serializers.ModelSerializer):
     1. is_wished: 현재 로그인한 유저의 찜 여부 (True/False)
     2. rating: 해당 강좌의 평균 별점 (리뷰 기반)
     3. review_count: 해당 강좌에 달린 전체 수강평 개수
+
+    [최적화 내용]
+    - 기존: 필드마다 별도 쿼리 (Wishlist exists, Avg 집계, COUNT, ai_review 지연 로딩) → 강좌당 4~5회
+    - 변경: CourseDetailView에서 annotate(is_wished, rating, review_count) + select_related('ai_review')
+      → Serializer는 이미 로드된 값만 사용 (추가 쿼리 0회)
     """
     
-    is_wished = serializers.SerializerMethodField()
+    is_wished = serializers.BooleanField(read_only=True)
     rating = serializers.SerializerMethodField()
-    review_count = serializers.SerializerMethodField()
+    review_count = serializers.IntegerField(read_only=True)
     ai_summary = serializers.SerializerMethodField()
 
     class Meta:
@@ -87,41 +94,25 @@ class CourseDetailSerializer(serializers.ModelSerializer):
             'classfy_name', 'middle_classfy_name', 'summary', 'raw_summary',
             'course_image', 'url', 'week', 'course_playtime',
             'certificate_yn', 'is_wished', 'rating', 'review_count',
-            'enrollment_start', 'enrollment_end', 'study_start', 'study_end',
+            'enrollment_start', 'enrollment_end', 'study_start', 'study_end', 'status',
             'ai_summary'
         ]
 
-    def get_is_wished(self, obj):
-        """
-        [로직] 
-        - 요청자(request.user)가 로그인 상태라면 Wishlist 모델에서 해당 강좌 존재 여부 확인
-        - 비로그인 상태이거나 찜하지 않았다면 False 반환
-        """
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return Wishlist.objects.filter(user=request.user, course=obj).exists()
-        return False
-
     def get_rating(self, obj):
         """
         [로직] 
-        - CourseReview 모델에서 해당 강좌의 rating 평균값 계산
-        - 리뷰가 없을 경우 기본값 0.0 반환
+        - View에서 annotate로 주입된 평균값을 소수점 1자리로 반올림
+        - 리뷰가 없을 경우(NULL) 기본값 0.0 반환
         """
-        avg_rating = CourseReview.objects.filter(course=obj).aggregate(Avg('rating'))['rating__avg']
+        avg_rating = obj.rating
         return round(avg_rating, 1) if avg_rating else 0.0
 
-    def get_review_count(self, obj):
-        """
-        [로직] 
-        - 해당 강좌에 달린 수강평의 총 개수 반환
-        """
-        return CourseReview.objects.filter(course=obj).count()
-
     def get_ai_summary(self, obj):
         """
         [로직]
         - CourseAIReview 모델에서 생성된 강좌 요약 반환
+        - select_related('ai_review')로 함께 로드되므로 추가 쿼리 없음
+          (AI 리뷰가 없으면 hasattr가 False, 역시 쿼리 없음)
         """
         if hasattr(obj, 'ai_review'):
             return obj.ai_review.course_summary
@@ -151,3 +142,22 @@ class CourseReviewSerializer(serializers.ModelSerializer):
         if request and hasattr(request, 'user') and request.user.is_authenticated:
             return obj.user == request.user
         return False
+
+
+# 1.4 CourseListValuesSerializer | 강의 목록 고속 직렬화기 (values_list 기반)
+def _round_rating(value):
+    return round(value, 1) if value is not None else None
+
+
+class CourseListValuesSerializer(ValuesSerializer):
+    """
+    [설계 의도]
+    - CourseListSerializer와 같은 응답 형식을 모델 인스턴스 없이 생성
+    - 목록/키워드 검색처럼 건수가 많은 읽기 전용 응답에서 사용
+
+    [상세 고려사항]
+    - fields는 CourseListSerializer.Meta.fields와 동일하게 유지 (응답 스키마 일치)
+    - average_rating 반올림 규칙은 CourseListSerializer.to_representation과 동일
+    """
+    fields = tuple(CourseListSerializer.Meta.fields)
+    transforms = {'average_rating': _round_rating}
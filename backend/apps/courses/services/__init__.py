@@ -0,0 +1,24 @@
+# backend/apps/courses/services/__init__.py
+
+"""
+[설계 의도]
+- courses 서비스 패키지 진입점
+- 각 서비스의 싱글톤 인스턴스를 외부에서 쉽게 가져올 수 있도록 export
+
+[사용 예시]
+from apps.courses.services import get_facet_service, get_search_service, get_suggest_service, es_filters
+"""
+
+from .facet_service import get_facet_service, FacetService
+from .search_service import get_search_service, HybridSearchService, es_filters
+from .suggest_service import get_suggest_service, SuggestService
+
+__all__ = [
+    'get_facet_service',
+    'FacetService',
+    'get_search_service',
+    'HybridSearchService',
+    'es_filters',
+    'get_suggest_service',
+    'SuggestService',
+]
@@ -0,0 +1,355 @@
+# backend/apps/courses/services/facet_service.py
+
+
+# 개요
+"""
+강좌 목록 필터 패싯 집계 (프로세스 메모리 비트셋 인덱스)
+- FacetIndex                                  | 중복 제거된 카탈로그의 패싯 값별 비트셋 (읽기 전용)
+- FacetService.get_index()                    | 인덱스 조회 (카탈로그 세대가 바뀌었으면 재생성)
+- FacetService.facet_counts(query_params)     | 현재 검색/필터 상태의 대분류/중분류/운영기관별 강좌 수
+- get_facet_service()                         | 싱글톤 인스턴스 반환
+"""
+
+"""
+[설계 의도]
+- 목록 사이드바 필터(classfy_name, middle_classfy_name, org_name)에 강좌 수를 표시
+- 패싯마다 GROUP BY를 하면 Window 중복 제거가 들어간 목록 쿼리를 패싯 수만큼 반복
+  → 중복 제거된 카탈로그를 메모리에 올리고, 패싯 값마다 비트셋(Python int) 하나를 둠
+  → 필터 = 비트셋 AND/OR, 개수 = int.bit_count() (강좌 2만 개 기준 비트셋 1개 약 2.5KB)
+
+[상세 고려 사항]
+- 중복 제거: CourseListView와 같은 기준 (강좌명 + 교수자가 같으면 study_start 최신 1개, NULL은 마지막)
+  - 목록 쿼리는 모든 필터(status, search, 분류, 기관, 교수자)가 Window 안쪽 WHERE에 들어감
+    → 필터를 통과한 행들 중에서 그룹별 대표를 고름 (예: 기관 필터가 이전 회차만 통과하면 이전 회차가 대표)
+  - 비트 배치: 같은 그룹의 행을 대표 우선순위대로 연속 배치하고, 그룹 끝마다 가드 비트 1개
+    → "그룹별 첫 번째 통과 행" = M & ~(M - S) (M = 필터 결과 | 가드, S = 그룹 시작 비트)
+       뺄셈의 빌림(borrow)이 그룹 안의 가장 낮은 1비트에서 멈추고, 가드 덕분에 다음 그룹으로 넘어가지 않음
+- 필터 해석도 CourseListView와 동일
+  - search: 강좌명에 모든 키워드 포함 (대소문자 무시) → 강좌명 스캔 1회, 결과 비트셋은 LRU 캐시
+  - classfy_name: 일치 / middle_classfy_name: 다중 값 OR / org_name, professor: 부분 일치 (고유 값 단위로 OR)
+  - 교수자는 고유 값이 많아 비트셋 대신 행 번호 목록만 보관 (필터 요청 시 비트셋 생성)
+- 패싯 개수는 "자기 자신의 필터만 뺀" 결과 집합 기준 (다중 선택 패싯 방식)
+  - 예: 중분류를 하나 선택해도 다른 중분류 개수가 0이 되지 않아 선택을 넓힐 수 있음
+- 갱신: FACET_CHECK_INTERVAL(기본 60초)마다 카탈로그 세대(get_catalog_generation, 캐시 1분) 비교 → 바뀌었으면 재생성
+  - 상태 갱신(refresh_course_status)도 updated_at을 올리므로 세대 변경으로 반영
+  - 재생성 중에도 다른 요청은 이전 인덱스를 그대로 사용 (교체는 참조 할당 1회)
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from apps.courses.cache import get_catalog_generation
+from apps.courses.models import Course
+
+logger = logging.getLogger(__name__)
+
+# =========================
+# 패싯 설정 상수
+# =========================
+
+FACET_CHECK_INTERVAL = int(os.environ.get('FACET_CHECK_INTERVAL', 60))  # 카탈로그 세대 확인 주기 (초)
+FACET_SEARCH_CACHE_SIZE = 256                                          # 검색어별 비트셋 캐시 크기
+
+# 응답 패싯 이름 → Course 필드
+FACET_FIELDS = ('classfy_name', 'middle_classfy_name', 'org_name')
+
+
+def _to_bitset(positions: Iterable[int], size: int) -> int:
+    """행 번호 목록 → 비트셋 (bytearray로 모은 뒤 int 변환 1회)"""
+    buffer = bytearray((size + 7) // 8)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+class FacetIndex:
+    """
+    패싯 비트셋 인덱스 (읽기 전용)
+
+    Args:
+        rows: [(id, name, professor, study_start, status, classfy_name, middle_classfy_name, org_name), ...]
+        generation: 카탈로그 세대 (강좌 수, 최신 updated_at ISO 문자열)
+    """
+
+    def __init__(self, rows: List[tuple], generation: tuple):
+        self.generation = tuple(generation)
+
+        # 그룹(강좌명 + 교수자)별 연속 배치, 그룹 안에서는 대표 우선순위 순 (study_start 최신, NULL 마지막)
+        def representative_order(row):
+            study_start = row[3]
+            return (row[1] or '', row[2] or '', study_start is None,
+                    -study_start.toordinal() if study_start else 0, row[0])
+
+        ordered = []            # [(비트 위치, 행), ...]
+        starts, guards = [], []
+        position = 0
+        previous_group = None
+        for row in sorted(rows, key=representative_order):
+            group = (row[1] or '', row[2] or '')
+            if group != previous_group:
+                if previous_group is not None:
+                    guards.append(position)
+                    position += 1
+                starts.append(position)
+                previous_group = group
+            ordered.append((position, row))
+            position += 1
+        if previous_group is not None:
+            guards.append(position)
+            position += 1
+
+        size = position
+        self.size = size
+        self.row_count = len(ordered)
+        self.group_count = len(starts)
+        self.rows = _to_bitset((position for position, _ in ordered), size)
+        self.group_starts = _to_bitset(starts, size)
+        self.guards = _to_bitset(guards, size)
+
+        # 상태별 비트셋 (목록과 같이 중복 제거 이전에 적용)
+        self.statuses: Dict[str, int] = {
+            status: _to_bitset(positions, size)
+            for status, positions in self._positions_by_value(ordered, 4).items()
+        }
+
+        # 값별 비트셋 (패싯 3종)
+        self.values: Dict[str, Dict[str, int]] = {}
+        for field, column in (('classfy_name', 5), ('middle_classfy_name', 6), ('org_name', 7)):
+            self.values[field] = {
+                value: _to_bitset(positions, size)
+                for value, positions in self._positions_by_value(ordered, column).items()
+            }
+
+        # 교수자는 고유 값이 많아 비트 위치만 보관 (부분 일치 필터 시에만 비트셋 생성)
+        self.professor_positions = self._positions_by_value(ordered, 2)
+
+        self.names_lower = [(position, (row[1] or '').lower()) for position, row in ordered]
+        self._search_cache: 'OrderedDict[Tuple[str, ...], int]' = OrderedDict()
+        self._search_lock = threading.Lock()
+
+    def __len__(self):
+        return self.row_count
+
+    @staticmethod
+    def _positions_by_value(ordered: List[tuple], column: int) -> Dict[str, List[int]]:
+        positions_by_value = defaultdict(list)
+        for position, row in ordered:
+            if row[column]:
+                positions_by_value[row[column]].append(position)
+        return positions_by_value
+
+    def nbytes(self) -> int:
+        bitsets = [self.rows, self.group_starts, self.guards, *self.statuses.values()]
+        bitsets += [bits for values in self.values.values() for bits in values.values()]
+        return sum((bits.bit_length() + 7) // 8 for bits in bitsets)
+
+    def representatives(self, mask: int) -> int:
+        """필터를 통과한 행(mask) 중 그룹별 첫 번째 행 = 중복 제거 결과"""
+        marked = mask | self.guards
+        return marked & ~(marked - self.group_starts) & ~self.guards
+
+    # =========================
+    # 필터 비트셋
+    # =========================
+
+    def search_bits(self, keywords: Tuple[str, ...]) -> int:
+        """강좌명에 모든 키워드 포함 (icontains AND)"""
+        with self._search_lock:
+            bits = self._search_cache.get(keywords)
+            if bits is not None:
+                self._search_cache.move_to_end(keywords)
+                return bits
+
+        bits = _to_bitset(
+            (position for position, name in self.names_lower
+             if all(keyword in name for keyword in keywords)),
+            self.size,
+        )
+
+        with self._search_lock:
+            self._search_cache[keywords] = bits
+            while len(self._search_cache) > FACET_SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return bits
+
+    def contains_bits(self, field: str, text: str) -> int:
+        """부분 일치 (고유 값 중 text를 포함하는 값들의 OR)"""
+        text = text.lower()
+        if field == 'professor':
+            return _to_bitset(
+                (position
+                 for value, positions in self.professor_positions.items() if text in value.lower()
+                 for position in positions),
+                self.size,
+            )
+
+        bits = 0
+        for value, value_bits in self.values[field].items():
+            if text in value.lower():
+                bits |= value_bits
+        return bits
+
+    def filter_bits(self, query_params) -> Tuple[int, Dict[str, int]]:
+        """
+        CourseListView와 같은 규칙으로 필터 해석
+
+        Returns:
+            (기준 집합(전체 행, status 반영, 중복 제거 이전), {필터 이름: 비트셋})  # 적용하지 않은 필터는 제외
+        """
+        course_status = query_params.get('status')
+        if course_status in dict(Course.STATUS_CHOICES):
+            base = self.statuses.get(course_status, 0)
+        else:
+            base = self.rows
+
+        filters = {}
+
+        search_query = query_params.get('search', '').strip()
+        if search_query:
+            filters['search'] = self.search_bits(tuple(keyword.lower() for keyword in search_query.split()))
+
+        classfy_name = query_params.get('classfy_name')
+        if classfy_name:
+            filters['classfy_name'] = self.values['classfy_name'].get(classfy_name, 0)
+
+        middle_classfy_names = query_params.getlist('middle_classfy_name')
+        if middle_classfy_names:
+            bits = 0
+            for name in middle_classfy_names:
+                bits |= self.values['middle_classfy_name'].get(name, 0)
+            filters['middle_classfy_name'] = bits
+
+        org_name = query_params.get('org_name')
+        if org_name:
+            filters['org_name'] = self.contains_bits('org_name', org_name)
+
+        professor = query_params.get('professor')
+        if professor:
+            filters['professor'] = self.contains_bits('professor', professor)
+
+        return base, filters
+
+    # =========================
+    # 패싯 집계
+    # =========================
+
+    def counts(self, query_params) -> Dict:
+        """
+        Returns:
+            dict: {
+                'total': 현재 필터 결과 수 (목록 count와 같음),
+                'classfy_name': [{'value': str, 'count': int}, ...],       # 개수 내림차순, 0개 제외
+                'middle_classfy_name': [...],
+                'org_name': [...],
+            }
+        """
+        base, filters = self.filter_bits(query_params)
+
+        def masked(excluded: Optional[str] = None) -> int:
+            """필터 적용 후 중복 제거 (목록 쿼리와 같은 순서)"""
+            mask = base
+            for name, bits in filters.items():
+                if name != excluded:
+                    mask &= bits
+            return self.representatives(mask)
+
+        result = {'total': masked().bit_count()}
+        for field in FACET_FIELDS:
+            mask = masked(field)
+            counts = []
+            if mask:
+                for value, value_bits in self.values[field].items():
+                    count = (mask & value_bits).bit_count()
+                    if count:
+                        counts.append({'value': value, 'count': count})
+            counts.sort(key=lambda item: (-item['count'], item['value']))
+            result[field] = counts
+        return result
+
+
+class FacetService:
+    """
+    패싯 집계 서비스
+
+    [설계 의도]
+    - 인덱스 적재/갱신을 담당, 집계는 요청마다 비트 연산만 수행 (DB 조회 없음)
+    """
+
+    def __init__(self, check_interval: int = FACET_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._index: Optional[FacetIndex] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_index(self) -> FacetIndex:
+        """
+        인덱스 조회
+
+        - 마지막 확인 후 check_interval이 지났으면 카탈로그 세대를 다시 조회하고, 바뀌었으면 재생성
+        - 재생성은 한 스레드만 수행, 나머지는 이전 인덱스 사용 (최초 적재 시에만 대기)
+        """
+        index = self._index
+        if index is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return index
+
+        if index is not None and not self._lock.acquire(blocking=False):
+            return index
+        if index is None:
+            self._lock.acquire()
+
+        try:
+            index = self._index
+            if index is not None and time.monotonic() - self._checked_at < self.check_interval:
+                return index
+
+            generation = get_catalog_generation()
+            if index is None or index.generation != tuple(generation):
+                index = self._build(generation)
+                self._index = index
+            self._checked_at = time.monotonic()
+            return index
+        finally:
+            self._lock.release()
+
+    def _build(self, generation: tuple) -> FacetIndex:
+        started_at = time.perf_counter()
+        rows = list(
+            Course.objects.values_list(
+                'id', 'name', 'professor', 'study_start', 'status',
+                'classfy_name', 'middle_classfy_name', 'org_name',
+            ).iterator()
+        )
+        index = FacetIndex(rows, generation)
+        logger.info(
+            f'패싯 인덱스 적재: {len(index)}개 강좌, {index.nbytes() / 1024:.1f}KB, '
+            f'{(time.perf_counter() - started_at) * 1000:.1f}ms'
+        )
+        return index
+
+    def invalidate(self):
+        """다음 요청에서 카탈로그 세대를 즉시 다시 확인"""
+        self._checked_at = 0.0
+
+    def facet_counts(self, query_params) -> Dict:
+        return self.get_index().counts(query_params)
+
+
+# =========================
+# 싱글톤 인스턴스 관리
+# =========================
+
+_facet_service_instance = None
+
+
+def get_facet_service() -> FacetService:
+    """FacetService 싱글톤 인스턴스 반환"""
+    global _facet_service_instance
+
+    if _facet_service_instance is None:
+        _facet_service_instance = FacetService()
+
+    return _facet_service_instance
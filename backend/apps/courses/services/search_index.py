@@ -0,0 +1,109 @@
+# backend/apps/courses/services/search_index.py
+
+
+# 개요
+"""
+Elasticsearch 강좌 문서 부분 갱신 (push_to_es 전체 재전송 없이 일부 필드만 동기화)
+- ensure_mapping(properties)          | 인덱스에 필드 매핑 추가 (이미 있으면 그대로 성공)
+- partial_update(docs)                | {course_id: {필드: 값}} → _bulk update
+- rating_documents(course_ids=None)   | 강좌별 평균 평점/리뷰 수 문서 (하이브리드 검색 평점 가중치용)
+"""
+
+"""
+[설계 의도]
+- status(진행 상태), rating/review_count(평점)처럼 임베딩과 무관하게 자주 바뀌는 필드는
+  문서 전체를 다시 보내지 않고 해당 필드만 갱신
+- refresh_course_status / sync_course_ratings 커맨드가 공용으로 사용
+
+[상세 고려 사항]
+- update 요청은 ES 기본값(detect_noop)으로 값이 같으면 쓰기 없이 noop 처리 → 전체 강좌를 보내도 부담이 적음
+- 임베딩이 없어 ES에 없는 강좌(document_missing)는 실패로 세지 않음
+"""
+
+import json
+from typing import Dict, Iterable, Optional, Tuple
+
+import requests
+from django.conf import settings
+from django.db.models import Avg, Count
+
+from apps.courses.models import CourseReview
+
+ES_INDEX = 'kmooc_courses'
+ES_BULK_SIZE = 500
+
+
+def _base_url() -> str:
+    return getattr(settings, 'ELASTICSEARCH_URL', 'http://elasticsearch:9200')
+
+
+def ensure_mapping(properties: Dict) -> None:
+    """필드 매핑 추가 (기존 인덱스 재생성 없이 적용)"""
+    response = requests.put(
+        f'{_base_url()}/{ES_INDEX}/_mapping',
+        json={'properties': properties},
+        timeout=10,
+    )
+    response.raise_for_status()
+
+
+def partial_update(docs: Dict[int, Dict]) -> Tuple[int, int, int]:
+    """
+    강좌 문서 부분 갱신
+
+    Args:
+        docs: {course_id: {필드: 값}}
+
+    Returns:
+        (반영 수(noop 포함), ES 문서 없음 수, 실패 수)
+    """
+    items = list(docs.items())
+    updated = missing = failed = 0
+
+    for start in range(0, len(items), ES_BULK_SIZE):
+        bulk_data = ''
+        for course_id, doc in items[start:start + ES_BULK_SIZE]:
+            bulk_data += json.dumps({'update': {'_index': ES_INDEX, '_id': str(course_id)}}) + '\n'
+            bulk_data += json.dumps({'doc': doc}) + '\n'
+
+        response = requests.post(
+            f'{_base_url()}/_bulk',
+            data=bulk_data,
+            headers={'Content-Type': 'application/x-ndjson'},
+            timeout=30,
+        )
+        response.raise_for_status()
+
+        for item in response.json().get('items', []):
+            error = item.get('update', {}).get('error')
+            if not error:
+                updated += 1
+            elif error.get('type') == 'document_missing_exception':
+                missing += 1
+            else:
+                failed += 1
+
+    return updated, missing, failed
+
+
+def rating_documents(course_ids: Optional[Iterable[int]] = None) -> Dict[int, Dict]:
+    """
+    강좌별 평균 평점/리뷰 수 (GROUP BY 1회)
+
+    - course_ids를 주면 리뷰가 없는 강좌도 rating=None, review_count=0으로 포함
+    """
+    reviews = CourseReview.objects.all()
+    if course_ids is not None:
+        course_ids = list(course_ids)
+        reviews = reviews.filter(course_id__in=course_ids)
+
+    docs = {
+        row['course_id']: {
+            'rating': round(float(row['rating']), 2),
+            'review_count': row['review_count'],
+        }
+        for row in reviews.values('course_id').annotate(rating=Avg('rating'), review_count=Count('id'))
+    }
+    for course_id in course_ids or []:
+        docs.setdefault(course_id, {'rating': None, 'review_count': 0})
+    return docs
@@ -0,0 +1,325 @@
+# backend/apps/courses/services/search_service.py
+
+
+# 개요
+"""
+하이브리드 강좌 검색 (BM25 키워드 + kNN 벡터, Reciprocal Rank Fusion)
+- es_filters(query_params)                          | 검색 공용 ES filter 절 (분류/기관/교수/진행 상태)
+- HybridSearchService.get_query_embedding(text)     | 검색어 임베딩 (프로세스 LRU 캐시)
+- HybridSearchService.search(query, filters)        | _msearch 1회 → RRF 융합 → 평점 가중치 → 중복 제거
+- get_search_service()                              | 싱글톤 인스턴스 반환
+"""
+
+"""
+[설계 의도]
+- 기존: 키워드 검색(BM25)과 의미 검색(kNN)이 별도 엔드포인트 → 프론트가 둘 다 호출
+  (ES 2회 + DB 재조회 2회 + 임베딩 API 1회, 중복 제거도 각각 수행)
+- 변경: 두 쿼리를 _msearch 요청 1회로 보내고 순위 기반(RRF)으로 합침
+  - 척도가 다른 BM25 점수와 코사인 유사도를 정규화 없이 합칠 수 있음
+  - ES 내장 rank.rrf는 8.11 기준 기술 미리보기/라이선스 제약 → 애플리케이션에서 융합
+
+[상세 고려 사항]
+- RRF: score = Σ 1 / (HYBRID_RRF_K + rank)  (rank는 1부터, 두 목록에 모두 있으면 합산)
+- 평점 가중치: score × (1 + HYBRID_RATING_WEIGHT × 베이지안 평균 평점 / 5)
+  - 베이지안 평균 = (사전 평점 × 사전 개수 + 평균 평점 × 리뷰 수) / (사전 개수 + 리뷰 수)
+    → 리뷰 1~2개짜리 5점 강좌가 과하게 올라가지 않음, 리뷰 없는 강좌는 사전 평점으로 중립
+  - rating/review_count는 ES 문서의 비정규화 필드 (sync_course_ratings가 매일 동기화) → 후보별 DB 집계 없음
+- 중복 제거: (강좌명, 교수자)가 같으면 융합 점수가 가장 높은 1개만 (기존 검색과 같은 기준)
+- 임베딩 생략
+  - 검색어가 HYBRID_MIN_SEMANTIC_LENGTH자 미만이면 BM25만 사용 (짧은 검색어는 의미 벡터 품질이 낮음)
+  - 같은 검색어(공백 정리/소문자)는 LRU 캐시의 임베딩 재사용 (gunicorn 워커별 메모리)
+  - 임베딩 API 실패 시에도 BM25 결과로 응답
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import requests
+from django.conf import settings
+from elasticsearch import Elasticsearch
+
+from apps.courses.models import Course
+
+logger = logging.getLogger(__name__)
+
+# =========================
+# 검색 설정 상수
+# =========================
+
+ES_INDEX = 'kmooc_courses'
+
+GMS_EMBEDDING_URL = 'https://gms.ssafy.io/gmsapi/api.openai.com/v1/embeddings'
+EMBEDDING_MODEL_NAME = 'text-embedding-3-small'
+
+HYBRID_CANDIDATES = int(os.environ.get('HYBRID_CANDIDATES', 50))                  # 쿼리별 후보 수
+HYBRID_NUM_CANDIDATES = int(os.environ.get('HYBRID_NUM_CANDIDATES', 300))         # kNN 샤드별 탐색 후보 수
+HYBRID_RRF_K = int(os.environ.get('HYBRID_RRF_K', 60))                            # RRF 순위 상수
+HYBRID_RATING_WEIGHT = float(os.environ.get('HYBRID_RATING_WEIGHT', 0.3))         # 평점 가중치 (0이면 미사용)
+HYBRID_RATING_PRIOR = 3.0                                                         # 베이지안 평균 사전 평점
+HYBRID_RATING_PRIOR_COUNT = 5                                                     # 베이지안 평균 사전 리뷰 수
+HYBRID_MIN_SEMANTIC_LENGTH = int(os.environ.get('HYBRID_MIN_SEMANTIC_LENGTH', 3)) # 임베딩 사용 최소 글자 수
+HYBRID_EMBEDDING_CACHE_SIZE = int(os.environ.get('HYBRID_EMBEDDING_CACHE_SIZE', 1000))
+HYBRID_EMBEDDING_TIMEOUT = 5  # 초
+
+
+def normalize_query(text: str) -> str:
+    """검색어 정규화 (연속 공백 1칸, 소문자) - 임베딩 캐시 키/입력 공용"""
+    return ' '.join((text or '').split()).lower()
+
+
+def es_filters(query_params) -> List[Dict]:
+    """
+    검색 공용 ES filter 절
+
+    - 키워드/하이브리드 검색이 같은 파라미터를 같은 조건으로 해석하도록 일원화
+    """
+    filters = []
+
+    # 대분류 필터 (정확히 일치)
+    classfy_name = query_params.get('classfy_name')
+    if classfy_name:
+        filters.append({"term": {"classfy_name.keyword": classfy_name}})
+
+    # 중분류 필터 (다중 값 지원)
+    middle_classfy_names = query_params.getlist('middle_classfy_name')
+    if middle_classfy_names:
+        filters.append({"terms": {"middle_classfy_name.keyword": middle_classfy_names}})
+
+    # 운영기관 필터 (부분 일치)
+    org_name = query_params.get('org_name')
+    if org_name:
+        filters.append({"match": {"org_name": org_name}})
+
+    # 교수명 필터 (부분 일치)
+    professor = query_params.get('professor')
+    if professor:
+        filters.append({"match": {"professor": professor}})
+
+    # 진행 상태 필터 (refresh_course_status가 동기화한 status 필드)
+    course_status = query_params.get('status')
+    if course_status in dict(Course.STATUS_CHOICES):
+        filters.append({"term": {"status": course_status}})
+
+    return filters
+
+
+class HybridSearchService:
+    """
+    하이브리드 검색 서비스
+
+    [설계 의도]
+    - ES 조회/융합/중복 제거까지만 담당, 응답용 DB 조회(페이지 강좌만)는 View에서 수행
+    """
+
+    SOURCE_FIELDS = ['id', 'name', 'professor', 'rating', 'review_count']
+
+    def __init__(self, es_url: Optional[str] = None, cache_size: int = HYBRID_EMBEDDING_CACHE_SIZE):
+        self.es_url = es_url or getattr(settings, 'ELASTICSEARCH_URL', 'http://elasticsearch:9200')
+        self.cache_size = cache_size
+        self._client = None
+        self._embeddings: 'OrderedDict[str, List[float]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> Elasticsearch:
+        if self._client is None:
+            self._client = Elasticsearch(self.es_url)
+        return self._client
+
+    # =========================
+    # 검색어 임베딩
+    # =========================
+
+    def get_query_embedding(self, text: str) -> Optional[List[float]]:
+        """
+        검색어 임베딩 (캐시 → GMS 임베딩 API)
+
+        Returns:
+            list | None: 실패/키 없음이면 None
+        """
+        key = normalize_query(text)
+        if not key:
+            return None
+
+        with self._lock:
+            embedding = self._embeddings.get(key)
+            if embedding is not None:
+                self._embeddings.move_to_end(key)
+                return embedding
+
+        gms_key = os.environ.get('GMS_KEY')
+        if not gms_key:
+            logger.warning('GMS_KEY가 설정되지 않아 검색어 임베딩을 생략합니다.')
+            return None
+
+        try:
+            response = requests.post(
+                GMS_EMBEDDING_URL,
+                headers={'Content-Type': 'application/json', 'Authorization': f'Bearer {gms_key}'},
+                json={'model': EMBEDDING_MODEL_NAME, 'input': key},
+                timeout=HYBRID_EMBEDDING_TIMEOUT,
+            )
+            response.raise_for_status()
+            embedding = response.json()['data'][0]['embedding']
+        except (requests.RequestException, KeyError, IndexError, ValueError) as e:
+            logger.warning(f'검색어 임베딩 생성 실패: {str(e)}')
+            return None
+
+        if self.cache_size > 0:
+            with self._lock:
+                self._embeddings[key] = embedding
+                self._embeddings.move_to_end(key)
+                while len(self._embeddings) > self.cache_size:
+                    self._embeddings.popitem(last=False)
+        return embedding
+
+    # =========================
+    # 검색
+    # =========================
+
+    def search(self, query: str, filters: List[Dict], size: int = HYBRID_CANDIDATES) -> Dict:
+        """
+        하이브리드 검색
+
+        1. 검색어 임베딩 (짧은 검색어는 생략, 캐시 우선)
+        2. BM25 + kNN을 _msearch 1회로 조회 (임베딩이 없으면 BM25만)
+        3. RRF 융합 → 평점 가중치 → (강좌명, 교수자) 중복 제거
+
+        Returns:
+            dict: {
+                'mode': 'hybrid' | 'keyword',
+                'results': [{'id': course_id, 'score': float}, ...]  # 점수 내림차순
+            }
+        """
+        query = ' '.join(query.split())
+        embedding = None
+        if len(query) >= HYBRID_MIN_SEMANTIC_LENGTH:
+            embedding = self.get_query_embedding(query)
+
+        searches = [{'index': ES_INDEX}, self._keyword_body(query, filters, size)]
+        if embedding is not None:
+            searches += [{'index': ES_INDEX}, self._knn_body(embedding, filters, size)]
+
+        ranked_lists = []
+        for response in self.client.msearch(searches=searches)['responses']:
+            if 'error' in response:
+                # 한쪽 쿼리만 실패하면 나머지 결과로 응답
+                logger.warning(f'하이브리드 검색 하위 쿼리 실패: {response["error"]}')
+                ranked_lists.append([])
+                continue
+            ranked_lists.append(response.get('hits', {}).get('hits', []))
+
+        return {
+            'mode': 'hybrid' if embedding is not None else 'keyword',
+            'results': self.fuse(ranked_lists),
+        }
+
+    def _keyword_body(self, query: str, filters: List[Dict], size: int) -> Dict:
+        """BM25 (nori): 강좌명 오타 보정 매칭 + 소개 매칭"""
+        return {
+            'query': {
+                'bool': {
+                    'should': [
+                        {
+                            'multi_match': {
+                                'query': query,
+                                'fields': ['name^2'],
+                                'fuzziness': 1,
+                                'operator': 'and',
+                                'prefix_length': 1,
+                            }
+                        },
+                        {'match': {'summary': {'query': query, 'operator': 'and'}}},
+                    ],
+                    'minimum_should_match': 1,
+                    'filter': filters,
+                }
+            },
+            'size': size,
+            '_source': self.SOURCE_FIELDS,
+        }
+
+    def _knn_body(self, embedding: List[float], filters: List[Dict], size: int) -> Dict:
+        """kNN: 필터는 후보 탐색 단계에서 적용 (사후 필터로 후보가 줄어드는 것 방지)"""
+        knn = {
+            'field': 'embedding',
+            'query_vector': embedding,
+            'k': size,
+            'num_candidates': max(HYBRID_NUM_CANDIDATES, size),
+        }
+        if filters:
+            knn['filter'] = filters
+        return {'knn': knn, 'size': size, '_source': self.SOURCE_FIELDS}
+
+    # =========================
+    # 융합
+    # =========================
+
+    def fuse(self, ranked_lists: List[List[Dict]]) -> List[Dict]:
+        """
+        RRF 융합 + 평점 가중치 + 중복 제거
+
+        Args:
+            ranked_lists: [ES hits 목록, ...]  # 각 목록은 순위순
+        """
+        scores: Dict[int, float] = {}
+        sources: Dict[int, Dict] = {}
+        for hits in ranked_lists:
+            for rank, hit in enumerate(hits, start=1):
+                source = hit.get('_source', {})
+                course_id = int(source['id'])
+                scores[course_id] = scores.get(course_id, 0.0) + 1.0 / (HYBRID_RRF_K + rank)
+                sources.setdefault(course_id, source)
+
+        fused = sorted(
+            (
+                (score * self.rating_boost(sources[course_id].get('rating'), sources[course_id].get('review_count')),
+                 course_id)
+                for course_id, score in scores.items()
+            ),
+            key=lambda item: (-item[0], item[1]),
+        )
+
+        results = []
+        seen_identity = set()
+        for score, course_id in fused:
+            source = sources[course_id]
+            identity = ((source.get('name') or '').strip(), (source.get('professor') or '').strip())
+            if identity in seen_identity:
+                continue
+            seen_identity.add(identity)
+            results.append({'id': course_id, 'score': round(score, 6)})
+        return results
+
+    @staticmethod
+    def rating_boost(rating: Optional[float], review_count: Optional[int]) -> float:
+        """평점 가중치 배수 (베이지안 평균 평점 기준)"""
+        review_count = review_count or 0
+        if rating is None or review_count <= 0:
+            smoothed = HYBRID_RATING_PRIOR
+        else:
+            smoothed = (
+                (HYBRID_RATING_PRIOR * HYBRID_RATING_PRIOR_COUNT + rating * review_count)
+                / (HYBRID_RATING_PRIOR_COUNT + review_count)
+            )
+        return 1.0 + HYBRID_RATING_WEIGHT * smoothed / 5.0
+
+
+# =========================
+# 싱글톤 인스턴스 관리
+# =========================
+
+_search_service_instance = None
+
+
+def get_search_service() -> HybridSearchService:
+    """HybridSearchService 싱글톤 인스턴스 반환"""
+    global _search_service_instance
+
+    if _search_service_instance is None:
+        _search_service_instance = HybridSearchService()
+
+    return _search_service_instance
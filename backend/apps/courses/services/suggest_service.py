@@ -0,0 +1,363 @@
+# backend/apps/courses/services/suggest_service.py
+
+
+# 개요
+"""
+검색어 자동완성 (프로세스 메모리 접두사 인덱스)
+- jamo_key(text) / chosung_key(text)     | 한글 자모/초성 분해 키 (공백 제거, 소문자)
+- SuggestIndex                           | 정렬된 키 배열 + bisect 접두사 검색 (읽기 전용)
+- SuggestService.build_index()           | DB에서 강좌명/교수자/운영기관 용어 수집 → 인덱스 생성
+- SuggestService.save_index(index)       | 스냅샷 파일 저장 (build_suggest_index / load_courses / import_courses)
+- SuggestService.get_index()             | 인덱스 조회 (파일 → 없으면 DB, 카탈로그 세대가 바뀌면 재생성)
+- SuggestService.suggest(query, limit)   | 자동완성 후보
+- get_suggest_service()                  | 싱글톤 인스턴스 반환
+"""
+
+"""
+[설계 의도]
+- 검색창 입력마다 CourseListView(icontains)나 ES fuzzy 검색을 호출하면 키 입력 수만큼 DB/ES 요청 발생
+- 자동완성 후보(강좌명/교수자/운영기관)는 카탈로그가 바뀔 때만 바뀜
+  → 용어 전체를 프로세스 메모리에 정렬 배열로 올려두고 bisect로 접두사 범위만 찾음 (DB/ES 조회 없음)
+
+[상세 고려 사항]
+- 키: 용어 하나당 여러 개
+  - 자모 분해: "파이썬" → "ㅍㅏㅇㅣㅆㅓㄴ" (조합 중인 글자도 일치: "데잍" → "데이터")
+    - 겹받침/이중모음은 낱자로 분해 (ㄺ → ㄹㄱ, ㅘ → ㅗㅏ) → "달" 입력 중에도 "닭" 일치
+  - 초성: "파이썬" → "ㅍㅇㅆ"
+  - 단어 시작 접미사: "데이터 분석 입문" → "분석 입문", "입문"도 키로 등록 (용어당 SUGGEST_MAX_TOKENS개까지)
+  - 공백은 제거 → "데이터분석"/"데이터 분석" 모두 일치
+- 순위: 용어 id를 (강좌 수 내림차순, 길이, 가나다순)으로 부여 → 범위 안에서 가장 작은 id가 최상위
+  - 1~2자모 접두사처럼 범위가 큰 질의는 인덱스 생성 시 상위 후보를 미리 계산 (SUGGEST_PRECOMPUTE_DEPTH)
+  - 그 외 질의는 범위가 작아 set + heapq.nsmallest로 충분 (수십 µs)
+- 갱신
+  - 스냅샷 파일(SUGGEST_INDEX_PATH, JSON)은 build_suggest_index / load_courses / import_courses가 저장
+    → 워커는 파일 수정 시각이 바뀌면 다시 로드 (DB 조회 없이 시작)
+  - SUGGEST_CHECK_INTERVAL(기본 60초)마다 카탈로그 세대(get_catalog_generation, 캐시 1분)를 비교,
+    파일이 오래됐으면 DB에서 재생성 (admin 수정 등 파일을 거치지 않는 변경 반영)
+  - 재생성 중에도 다른 요청은 이전 인덱스를 그대로 사용 (교체는 참조 할당 1회)
+- 프로세스 메모리 인덱스 (gunicorn 워커별) | 강좌 2만 개 기준 키 약 10만 개, 수 MB
+"""
+
+import heapq
+import json
+import logging
+import os
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.courses.cache import get_catalog_generation
+from apps.courses.models import Course
+
+logger = logging.getLogger(__name__)
+
+# =========================
+# 자동완성 설정 상수
+# =========================
+
+SUGGEST_INDEX_PATH = Path(os.environ.get(
+    'SUGGEST_INDEX_PATH',
+    Path(settings.BASE_DIR).parent / 'data' / 'cache' / 'suggest_index.json'
+))
+SUGGEST_CHECK_INTERVAL = int(os.environ.get('SUGGEST_CHECK_INTERVAL', 60))  # 카탈로그 세대 확인 주기 (초)
+SUGGEST_DEFAULT_LIMIT = 10
+SUGGEST_MAX_LIMIT = 20
+SUGGEST_MAX_TOKENS = 6          # 용어당 단어 시작 접미사 키 최대 개수
+SUGGEST_PRECOMPUTE_DEPTH = 2    # 상위 후보를 미리 계산할 접두사 길이 (자모 기준)
+
+KIND_COURSE = 'course'
+KIND_PROFESSOR = 'professor'
+KIND_ORG = 'org'
+
+# =========================
+# 한글 자모 분해
+# =========================
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSUNG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSUNG = ('', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+            'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ')
+
+# 겹받침/이중모음 → 입력 순서대로 낱자 분해
+COMPOUND_JAMO = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+}
+
+# str.translate용 변환표 (문자 단위 분기 없이 C 레벨에서 일괄 변환)
+_JAMO_TABLE = {
+    HANGUL_BASE + code: (
+        CHOSUNG[code // 588]
+        + COMPOUND_JAMO.get(JUNGSUNG[(code % 588) // 28], JUNGSUNG[(code % 588) // 28])
+        + COMPOUND_JAMO.get(JONGSUNG[code % 28], JONGSUNG[code % 28])
+    )
+    for code in range(HANGUL_LAST - HANGUL_BASE + 1)
+}
+_JAMO_TABLE.update({ord(char): parts for char, parts in COMPOUND_JAMO.items()})
+_CHOSUNG_TABLE = {
+    HANGUL_BASE + code: CHOSUNG[code // 588]
+    for code in range(HANGUL_LAST - HANGUL_BASE + 1)
+}
+
+_WHITESPACE = re.compile(r'\s+')
+_TOKEN_START = re.compile(r'\w+')
+_PROFESSOR_SEPARATOR = re.compile(r'[,/·]')
+
+
+def jamo_key(text: str) -> str:
+    """자모 분해 키 (공백 제거, 소문자)"""
+    return _WHITESPACE.sub('', text or '').lower().translate(_JAMO_TABLE)
+
+
+def chosung_key(text: str) -> str:
+    """초성 키 (한글 음절이 없으면 빈 문자열)"""
+    normalized = _WHITESPACE.sub('', text or '').lower()
+    key = normalized.translate(_CHOSUNG_TABLE)
+    return key if key != normalized else ''
+
+
+def index_keys(text: str) -> set:
+    """용어 하나의 인덱스 키 (전체/단어 시작 접미사 × 자모/초성)"""
+    keys = set()
+    for match in list(_TOKEN_START.finditer(text))[:SUGGEST_MAX_TOKENS] or [None]:
+        suffix = text[match.start():] if match else text
+        keys.add(jamo_key(suffix))
+        keys.add(chosung_key(suffix))
+    keys.discard('')
+    return keys
+
+
+class SuggestIndex:
+    """
+    자동완성 접두사 인덱스 (읽기 전용)
+
+    Args:
+        terms: [(text, kind, count), ...]  # count: 해당 용어를 가진 강좌 수
+        generation: 카탈로그 세대 (강좌 수, 최신 updated_at ISO 문자열)
+    """
+
+    def __init__(self, terms: Iterable[Tuple[str, str, int]], generation: tuple, built_at=None):
+        self.generation = tuple(generation)
+        self.built_at = built_at or timezone.now()
+
+        # 용어 id = 순위 (강좌 수 내림차순 → 짧은 용어 → 가나다순)
+        ranked = sorted(terms, key=lambda term: (-term[2], len(term[0]), term[0], term[1]))
+        self.texts = [term[0] for term in ranked]
+        self.kinds = [term[1] for term in ranked]
+        self.counts = [term[2] for term in ranked]
+
+        pairs = sorted({
+            (key, term_id)
+            for term_id, text in enumerate(self.texts)
+            for key in index_keys(text)
+        })
+        self.keys = [pair[0] for pair in pairs]
+        self.term_ids = array('I', (pair[1] for pair in pairs))
+
+        # 범위가 큰 짧은 접두사는 상위 후보를 미리 계산
+        self.top: Dict[str, Tuple[int, ...]] = {}
+        prefixes = {key[:depth] for key in self.keys for depth in range(1, SUGGEST_PRECOMPUTE_DEPTH + 1)}
+        for prefix in prefixes:
+            lo, hi = self._range(prefix)
+            self.top[prefix] = tuple(sorted(set(self.term_ids[lo:hi]))[:SUGGEST_MAX_LIMIT])
+
+    def __len__(self):
+        return len(self.texts)
+
+    def _range(self, key: str) -> Tuple[int, int]:
+        return bisect_left(self.keys, key), bisect_left(self.keys, key + '\U0010ffff')
+
+    def search(self, query: str, limit: int = SUGGEST_DEFAULT_LIMIT) -> List[Dict]:
+        """접두사 일치 용어 (순위순)"""
+        key = jamo_key(query)
+        if not key:
+            return []
+
+        term_ids = self.top.get(key)
+        if term_ids is None:
+            lo, hi = self._range(key)
+            term_ids = heapq.nsmallest(limit, set(self.term_ids[lo:hi]))
+
+        return [
+            {'text': self.texts[term_id], 'type': self.kinds[term_id], 'count': self.counts[term_id]}
+            for term_id in term_ids[:limit]
+        ]
+
+    def to_dict(self) -> Dict:
+        return {
+            'generation': list(self.generation),
+            'built_at': self.built_at.isoformat(),
+            'terms': [list(term) for term in zip(self.texts, self.kinds, self.counts)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SuggestIndex':
+        built_at = data.get('built_at')
+        return cls(
+            [tuple(term) for term in data['terms']],
+            data['generation'],
+            built_at=datetime.fromisoformat(built_at) if built_at else None,
+        )
+
+
+class SuggestService:
+    """
+    자동완성 서비스
+
+    [설계 의도]
+    - 인덱스 생성/저장/로드와 갱신 주기 관리를 담당, 요청 처리는 메모리 인덱스만 사용
+    """
+
+    def __init__(self, path: Path = SUGGEST_INDEX_PATH, check_interval: int = SUGGEST_CHECK_INTERVAL):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._index: Optional[SuggestIndex] = None
+        self._loaded_mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    # =========================
+    # 인덱스 생성 / 저장 / 조회
+    # =========================
+
+    @staticmethod
+    def collect_terms() -> List[Tuple[str, str, int]]:
+        """강좌명/교수자/운영기관 용어와 강좌 수 (values_list 1회)"""
+        counters = {KIND_COURSE: Counter(), KIND_PROFESSOR: Counter(), KIND_ORG: Counter()}
+
+        for name, professor, org_name in Course.objects.values_list('name', 'professor', 'org_name').iterator():
+            if name and name.strip():
+                counters[KIND_COURSE][' '.join(name.split())] += 1
+            if org_name and org_name.strip():
+                counters[KIND_ORG][' '.join(org_name.split())] += 1
+            # 공동 강의는 "홍길동, 김철수" 형태 → 교수자별로 분리
+            for person in _PROFESSOR_SEPARATOR.split(professor or ''):
+                person = ' '.join(person.split())
+                if person:
+                    counters[KIND_PROFESSOR][person] += 1
+
+        return [
+            (text, kind, count)
+            for kind, counter in counters.items()
+            for text, count in counter.items()
+        ]
+
+    def build_index(self, generation: Optional[tuple] = None) -> SuggestIndex:
+        started_at = time.perf_counter()
+        if generation is None:
+            generation = get_catalog_generation()
+        index = SuggestIndex(self.collect_terms(), generation)
+        logger.info(
+            f'자동완성 인덱스 생성: 용어 {len(index)}개, 키 {len(index.keys)}개, '
+            f'{(time.perf_counter() - started_at) * 1000:.1f}ms'
+        )
+        return index
+
+    def save_index(self, index: SuggestIndex):
+        """임시 파일에 쓴 뒤 os.replace로 교체 → 읽는 쪽은 항상 완성된 파일만 봄"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp.json')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+        with self._lock:
+            self._index = index
+            self._loaded_mtime = self.path.stat().st_mtime
+            self._checked_at = time.monotonic()
+
+    def get_index(self) -> SuggestIndex:
+        """
+        인덱스 조회
+
+        - 마지막 확인 후 check_interval이 지났으면 스냅샷 파일/카탈로그 세대를 다시 확인
+        - 재생성은 한 스레드만 수행, 나머지는 이전 인덱스 사용 (최초 적재 시에만 대기)
+        """
+        index = self._index
+        if index is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return index
+
+        if index is not None and not self._lock.acquire(blocking=False):
+            return index
+        if index is None:
+            self._lock.acquire()
+
+        try:
+            index = self._index
+            if index is not None and time.monotonic() - self._checked_at < self.check_interval:
+                return index
+
+            # 새 스냅샷 파일을 읽었으면 이번 확인은 파일을 신뢰 (워커의 세대 캐시가 파일보다 늦을 수 있음)
+            if not self._reload_if_changed():
+                generation = get_catalog_generation()
+                if self._index is None or self._index.generation != tuple(generation):
+                    self._index = self.build_index(generation)
+            self._checked_at = time.monotonic()
+            return self._index
+        finally:
+            self._lock.release()
+
+    def _reload_if_changed(self) -> bool:
+        """스냅샷 파일이 바뀌었으면 다시 로드 (로드했으면 True)"""
+        try:
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        if mtime == self._loaded_mtime:
+            return False
+
+        self._loaded_mtime = mtime
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self._index = SuggestIndex.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f'자동완성 인덱스 파일 로드 실패 ({self.path}): {str(e)}')
+            return False
+        return True
+
+    def invalidate(self):
+        """다음 요청에서 스냅샷 파일/카탈로그 세대를 즉시 다시 확인"""
+        self._checked_at = 0.0
+
+    # =========================
+    # 조회
+    # =========================
+
+    def suggest(self, query: str, limit: int = SUGGEST_DEFAULT_LIMIT) -> List[Dict]:
+        """
+        자동완성 후보
+
+        Returns:
+            [{'text': str, 'type': 'course' | 'professor' | 'org', 'count': int}, ...]
+        """
+        limit = min(max(limit, 1), SUGGEST_MAX_LIMIT)
+        return self.get_index().search(query, limit)
+
+
+# =========================
+# 싱글톤 인스턴스 관리
+# =========================
+
+_suggest_service_instance = None
+
+
+def get_suggest_service() -> SuggestService:
+    """SuggestService 싱글톤 인스턴스 반환"""
+    global _suggest_service_instance
+
+    if _suggest_service_instance is None:
+        _suggest_service_instance = SuggestService()
+
+    return _suggest_service_instance
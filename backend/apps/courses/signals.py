@@ -0,0 +1,26 @@
+# backend/apps/courses/signals.py
+
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from .models import Course
+from .status import compute_status
+
+
+# 개요
+"""
+강좌 진행 상태 계산
+
+- Course 단건 저장(admin, ORM) 시 진행 상태를 바로 계산
+  → 자정 refresh_course_status 전까지 기본값(in_progress)으로 남아 ?status=enrolling에서 빠지는 것을 방지
+  (update()/bulk_create는 신호가 없으므로 load_courses/import_courses가 끝에 refresh_course_statuses 실행)
+"""
+
+
+@receiver(pre_save, sender=Course)
+def set_course_status(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return  # loaddata: 저장된 값 그대로
+    # update_fields에 status가 없는 부분 저장(예: load_courses의 raw_summary 보정)은 상태를 건드리지 않음
+    if update_fields is None or 'status' in update_fields:
+        instance.status = compute_status(instance)
@@ -0,0 +1,102 @@
+# backend/apps/courses/status.py
+
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Course
+
+
+# 개요
+"""
+강좌 진행 상태(Course.status) 사전 계산
+
+- status_condition(status, today)   | 상태별 조건 (Q 객체)
+- compute_status(course, today)     | 강좌 1개 상태 계산 (파이썬, 단건 저장 시 signals.py의 pre_save에서 사용)
+- refresh_course_statuses(today)    | 전체 강좌 상태 일괄 갱신 (상태별 UPDATE 1회)
+
+[설계 의도]
+- "지금 신청 가능한 강좌" 필터를 요청마다 날짜 비교(enrollment_start/end, study_end)로 계산하면
+  인덱스를 쓰기 어렵고, 목록 API의 중복 제거(Window) 대상 전체를 훑게 됨
+- 상태는 날짜가 바뀔 때만 달라지므로 자정에 한 번 계산해 컬럼에 저장하고
+  조회는 status = 'enrolling' 부분 인덱스(idx_course_enrolling)로 처리
+
+[상세 고려사항]
+- 판정 우선순위: 신청 중 → 신청 전 → 종료 → 진행 중(그 외)
+  - 신청 중: 신청 기간 안(날짜가 없으면 제한 없음) + 아직 종료되지 않음
+  - 신청 전: 신청 시작일이 미래
+  - 종료: 수강 종료일이 과거
+- 기준일은 timezone.localdate() (TIME_ZONE=Asia/Seoul 자정 기준)
+- 일괄 갱신은 상태가 바뀌는 행만 UPDATE하고 updated_at도 함께 갱신
+  → 카탈로그 세대/상세 검증자(ETag)가 바뀌어 상태가 포함된 캐시 응답이 갱신됨
+"""
+
+STATUS_PRECEDENCE = (
+    Course.STATUS_ENROLLING,
+    Course.STATUS_UPCOMING,
+    Course.STATUS_FINISHED,
+    Course.STATUS_IN_PROGRESS,
+)
+
+
+def status_condition(status, today):
+    """상태별 조건 (우선순위가 앞선 상태와 겹치는 경우는 refresh_course_statuses에서 제외)"""
+    if status == Course.STATUS_ENROLLING:
+        return (
+            (Q(enrollment_start__isnull=True) | Q(enrollment_start__lte=today))
+            & (Q(enrollment_end__isnull=True) | Q(enrollment_end__gte=today))
+            & (Q(study_end__isnull=True) | Q(study_end__gte=today))
+        )
+    if status == Course.STATUS_UPCOMING:
+        return Q(enrollment_start__gt=today)
+    if status == Course.STATUS_FINISHED:
+        return Q(study_end__lt=today)
+    return Q()
+
+
+def compute_status(course, today=None):
+    """강좌 1개 상태 (status_condition과 같은 규칙)"""
+    today = today or timezone.localdate()
+    enrollment_open = (
+        (course.enrollment_start is None or course.enrollment_start <= today)
+        and (course.enrollment_end is None or course.enrollment_end >= today)
+    )
+    not_finished = course.study_end is None or course.study_end >= today
+
+    if enrollment_open and not_finished:
+        return Course.STATUS_ENROLLING
+    if course.enrollment_start is not None and course.enrollment_start > today:
+        return Course.STATUS_UPCOMING
+    if not not_finished:
+        return Course.STATUS_FINISHED
+    return Course.STATUS_IN_PROGRESS
+
+
+def refresh_course_statuses(today=None):
+    """
+    전체 강좌 상태 일괄 갱신
+
+    - 우선순위 순서로 "앞선 상태 조건에 해당하지 않고 + 이 상태 조건에 해당하는" 행을 UPDATE
+    - 이미 같은 상태인 행은 제외 (바뀐 행만 쓰기)
+
+    Returns:
+        dict: {status: [상태가 바뀐 course_id, ...]}  # ES 문서 동기화용
+    """
+    today = today or timezone.localdate()
+    now = timezone.now()
+    changed = {}
+    preceding = Q()
+
+    for status in STATUS_PRECEDENCE:
+        queryset = Course.objects.filter(status_condition(status, today))
+        if preceding:
+            queryset = queryset.exclude(preceding)
+        queryset = queryset.exclude(status=status)
+
+        ids = list(queryset.values_list('id', flat=True))
+        if ids:
+            Course.objects.filter(id__in=ids).update(status=status, updated_at=now)
+        changed[status] = ids
+
+        preceding |= status_condition(status, today)
+
+    return changed
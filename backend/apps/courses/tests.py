@@ -1,3 +1,413 @@
-from django.test import TestCase
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.http import QueryDict
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.comparisons.models import CourseAIReview
+from apps.core.batch import fake, jobs
+from apps.courses.models import Course, CourseReview, Wishlist
+from apps.courses.services.facet_service import FacetIndex
+from apps.courses.services.search_service import HybridSearchService
+from apps.courses.services.suggest_service import SuggestIndex, chosung_key, jamo_key
+from apps.courses.status import compute_status, refresh_course_statuses
+
+User = get_user_model()
+
+
+class CourseDetailQueryCountTests(TestCase):
+    """
+    [설계 의도]
+    - 강좌 상세 API가 단일 상세 쿼리로 응답하는지 고정 (회귀 방지)
+    - is_wished / rating / review_count / ai_summary가 Serializer에서 추가 쿼리를 만들지 않아야 함
+
+    [쿼리 수 기준]
+    - 전체 응답: 조건부 응답 검증자 1 + 상세 쿼리 1 = 2
+    - 304 응답: 검증자 1 (상세 쿼리/직렬화 생략)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = Course.objects.create(kmooc_id='TEST-001', name='테스트 강좌', professor='홍길동')
+        cls.user = User.objects.create_user(
+            username='viewer', email='viewer@example.com', password='pw-1234!', name='조회자'
+        )
+        reviewer = User.objects.create_user(
+            username='reviewer', email='reviewer@example.com', password='pw-1234!', name='리뷰어'
+        )
+        CourseReview.objects.create(user=cls.user, course=cls.course, rating=5, review_text='좋아요')
+        CourseReview.objects.create(user=reviewer, course=cls.course, rating=4, review_text='괜찮아요')
+        Wishlist.objects.create(user=cls.user, course=cls.course)
+        CourseAIReview.objects.create(
+            course=cls.course,
+            course_summary='AI 요약',
+            average_rating=3.5,
+            theory_rating=3,
+            practical_rating=4,
+            difficulty_rating=3,
+            duration_rating=4,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse('course-detail', kwargs={'pk': self.course.pk})
+
+    def test_anonymous_detail_uses_single_detail_query(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.data['is_wished'])
+        self.assertEqual(response.data['rating'], 4.5)
+        self.assertEqual(response.data['review_count'], 2)
+        self.assertEqual(response.data['ai_summary'], 'AI 요약')
+
+    def test_authenticated_detail_uses_single_detail_query(self):
+        self.client.force_authenticate(user=self.user)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['is_wished'])
+
+    def test_review_write_visible_from_fresh_cache(self):
+        self.client.get(self.url)
+
+        third = User.objects.create_user(
+            username='third', email='third@example.com', password='pw-1234!', name='세번째'
+        )
+        CourseReview.objects.create(user=third, course=self.course, rating=3, review_text='보통')
+        cache.clear()  # 리뷰를 저장하지 않은 다른 워커 (자기 프로세스 캐시만 가짐)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.data['rating'], 4.0)
+        self.assertEqual(response.data['review_count'], 3)
+
+    def test_review_write_visible_without_cache_invalidation(self):
+        self.client.get(self.url)
+
+        CourseReview.objects.filter(user=self.user, course=self.course).update(rating=1)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['rating'], 2.5)
+        self.assertEqual(response.data['review_count'], 2)
+
+    def test_course_without_ai_review(self):
+        course = Course.objects.create(kmooc_id='TEST-002', name='AI 평가 없는 강좌')
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('course-detail', kwargs={'pk': course.pk}))
+
+        self.assertIsNone(response.data['ai_summary'])
+        self.assertEqual(response.data['rating'], 0.0)
+        self.assertEqual(response.data['review_count'], 0)
+
+    def test_matching_etag_returns_304_with_validator_query_only(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_changes_when_wishlist_changes(self):
+        self.client.force_authenticate(user=self.user)
+        etag = self.client.get(self.url)['ETag']
+
+        Wishlist.objects.filter(user=self.user, course=self.course).delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.data['is_wished'])
+        self.assertIn('private', response['Cache-Control'])
+
+
+class CourseStatusRefreshTests(TestCase):
+    """
+    [설계 의도]
+    - 사전 계산 상태(refresh_course_statuses)가 파이썬 판정(compute_status)과 같은지 고정
+    - ?status= 목록 필터가 저장된 상태 컬럼을 사용하는지 확인
+    """
+
+    TODAY = date(2025, 3, 10)
+
+    @classmethod
+    def setUpTestData(cls):
+        day = timedelta(days=1)
+        today = cls.TODAY
+        cls.courses = {
+            'enrolling': Course.objects.create(
+                kmooc_id='ST-1', name='신청 중', professor='A',
+                enrollment_start=today - day, enrollment_end=today + day, study_end=today + 30 * day,
+            ),
+            'open_ended': Course.objects.create(kmooc_id='ST-2', name='기간 없음', professor='B'),
+            'upcoming': Course.objects.create(
+                kmooc_id='ST-3', name='신청 전', professor='C', enrollment_start=today + day,
+            ),
+            'in_progress': Course.objects.create(
+                kmooc_id='ST-4', name='진행 중', professor='D',
+                enrollment_end=today - day, study_end=today + day,
+            ),
+            'finished': Course.objects.create(
+                kmooc_id='ST-5', name='종료', professor='E', study_end=today - day,
+            ),
+        }
+
+    def setUp(self):
+        cache.clear()
+
+    def test_refresh_matches_compute_status(self):
+        refresh_course_statuses(self.TODAY)
+
+        expected = {
+            'enrolling': Course.STATUS_ENROLLING,
+            'open_ended': Course.STATUS_ENROLLING,
+            'upcoming': Course.STATUS_UPCOMING,
+            'in_progress': Course.STATUS_IN_PROGRESS,
+            'finished': Course.STATUS_FINISHED,
+        }
+        for key, course in self.courses.items():
+            course.refresh_from_db()
+            self.assertEqual(course.status, expected[key], key)
+            self.assertEqual(compute_status(course, self.TODAY), expected[key], key)
+
+    def test_refresh_only_reports_changed_rows(self):
+        refresh_course_statuses(self.TODAY)
+        changed = refresh_course_statuses(self.TODAY)
+
+        self.assertEqual(sum(len(ids) for ids in changed.values()), 0)
+
+    def test_single_save_computes_status(self):
+        today = timezone.localdate()
+        course = Course.objects.create(
+            kmooc_id='ST-6', name='오늘 개강', professor='F',
+            enrollment_start=today, enrollment_end=today + timedelta(days=7),
+        )
+        self.assertEqual(course.status, Course.STATUS_ENROLLING)
+
+        course.enrollment_start = today + timedelta(days=1)
+        course.save()
+        course.refresh_from_db()
+        self.assertEqual(course.status, Course.STATUS_UPCOMING)
+
+    def test_list_filters_by_status(self):
+        refresh_course_statuses(self.TODAY)
+
+        response = APIClient().get(reverse('course-list'), {'status': 'enrolling'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            {row['id'] for row in response.data['results']},
+            {self.courses['enrolling'].id, self.courses['open_ended'].id},
+        )
+
+
+class HybridSearchFusionTests(SimpleTestCase):
+    """
+    [설계 의도]
+    - 하이브리드 검색 융합 규칙 고정 (ES 없이 hits 목록만으로 검증)
+    - 두 목록에 모두 있는 강좌가 위로, 평점은 리뷰 수로 보정, (강좌명, 교수자) 중복은 1개만
+    """
+
+    @staticmethod
+    def _hit(course_id, name, professor='홍길동', rating=None, review_count=0):
+        return {'_source': {
+            'id': course_id, 'name': name, 'professor': professor,
+            'rating': rating, 'review_count': review_count,
+        }}
+
+    def test_course_in_both_lists_ranks_first(self):
+        keyword_hits = [self._hit(1, '파이썬 입문'), self._hit(2, '자료구조')]
+        knn_hits = [self._hit(3, '데이터 분석'), self._hit(2, '자료구조')]
+
+        results = HybridSearchService().fuse([keyword_hits, knn_hits])
+
+        self.assertEqual([r['id'] for r in results], [2, 1, 3])
+
+    def test_duplicate_identity_keeps_best_scored(self):
+        keyword_hits = [self._hit(1, '파이썬 입문'), self._hit(2, ' 파이썬 입문 ')]
+        knn_hits = [self._hit(2, ' 파이썬 입문 ')]
+
+        results = HybridSearchService().fuse([keyword_hits, knn_hits])
+
+        self.assertEqual([r['id'] for r in results], [2])
+
+    def test_rating_boost_is_smoothed_by_review_count(self):
+        few_reviews = HybridSearchService.rating_boost(5.0, 1)
+        many_reviews = HybridSearchService.rating_boost(4.5, 200)
+        unrated = HybridSearchService.rating_boost(None, 0)
+
+        self.assertGreater(many_reviews, few_reviews)
+        self.assertGreater(few_reviews, unrated)
+
+
+class SuggestIndexTests(SimpleTestCase):
+    """
+    [설계 의도]
+    - 자동완성 접두사 인덱스의 한글 처리/순위 규칙 고정 (DB 없이 용어 목록만으로 검증)
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.index = SuggestIndex(
+            [
+                ('파이썬 입문', 'course', 3),
+                ('파이썬 데이터 분석', 'course', 5),
+                ('데이터 분석 기초', 'course', 2),
+                ('닭 기르기', 'course', 1),
+                ('홍길동', 'professor', 4),
+                ('서울대학교', 'org', 50),
+            ],
+            generation=(6, None),
+        )
+
+    def _texts(self, query):
+        return [result['text'] for result in self.index.search(query)]
+
+    def test_jamo_and_chosung_keys(self):
+        self.assertEqual(jamo_key('파이 썬'), 'ㅍㅏㅇㅣㅆㅓㄴ')
+        self.assertEqual(jamo_key('닭'), 'ㄷㅏㄹㄱ')
+        self.assertEqual(chosung_key('파이썬'), 'ㅍㅇㅆ')
+        self.assertEqual(chosung_key('Python'), '')
+
+    def test_prefix_ranked_by_course_count(self):
+        self.assertEqual(self._texts('파이'), ['파이썬 데이터 분석', '파이썬 입문'])
+
+    def test_composing_syllable_chosung_and_word_start(self):
+        self.assertEqual(self._texts('데잍'), ['파이썬 데이터 분석', '데이터 분석 기초'])
+        self.assertEqual(self._texts('ㅎㄱㄷ'), ['홍길동'])
+        self.assertEqual(self._texts('분석'), ['파이썬 데이터 분석', '데이터 분석 기초'])
+        self.assertEqual(self._texts('달'), ['닭 기르기'])
+
+    def test_snapshot_round_trip(self):
+        restored = SuggestIndex.from_dict(self.index.to_dict())
+
+        self.assertEqual(restored.generation, self.index.generation)
+        self.assertEqual(restored.search('ㅅ'), self.index.search('ㅅ'))
+
+
+class FacetIndexTests(SimpleTestCase):
+    """
+    [설계 의도]
+    - 패싯 비트셋 집계가 목록 API와 같은 중복 제거/필터 규칙을 따르는지 고정 (DB 없이 행 목록만으로 검증)
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # (id, name, professor, study_start, status, classfy_name, middle_classfy_name, org_name)
+        cls.index = FacetIndex(
+            [
+                (1, '파이썬', '김교수', date(2024, 3, 1), Course.STATUS_FINISHED, '공학', '컴퓨터', '서울대학교'),
+                (2, '파이썬', '김교수', date(2025, 3, 1), Course.STATUS_ENROLLING, '공학', '컴퓨터', '서울대학교'),
+                (3, '파이썬 심화', '박교수', date(2024, 9, 1), Course.STATUS_FINISHED, '공학', '전기', 'KAIST'),
+                (4, '경영학원론', '이교수', None, Course.STATUS_ENROLLING, '사회', '경영', '연세대학교'),
+            ],
+            generation=(4, None),
+        )
+
+    def _counts(self, query_string=''):
+        return self.index.counts(QueryDict(query_string))
+
+    @staticmethod
+    def _values(facet):
+        return {item['value']: item['count'] for item in facet}
+
+    def test_counts_deduplicated_catalog(self):
+        counts = self._counts()
+
+        self.assertEqual(counts['total'], 3)
+        self.assertEqual(self._values(counts['classfy_name']), {'공학': 2, '사회': 1})
+
+    def test_status_filter_applies_before_deduplication(self):
+        counts = self._counts('status=finished')
+
+        self.assertEqual(counts['total'], 2)
+        self.assertEqual(self._values(counts['org_name']), {'서울대학교': 1, 'KAIST': 1})
+
+    def test_facet_excludes_its_own_filter(self):
+        counts = self._counts('search=파이썬&middle_classfy_name=전기')
+
+        self.assertEqual(counts['total'], 1)
+        self.assertEqual(self._values(counts['middle_classfy_name']), {'컴퓨터': 1, '전기': 1})
+        self.assertEqual(self._values(counts['org_name']), {'KAIST': 1})
+
+    def test_org_name_is_partial_match(self):
+        self.assertEqual(self._counts('org_name=대학교')['total'], 2)
+
+    def test_filter_matching_only_older_duplicate_applies_before_deduplication(self):
+        # 목록 쿼리는 필터가 Window 안쪽 WHERE에 들어감 → 이전 회차만 통과해도 그 회차가 대표로 남음
+        index = FacetIndex(
+            [
+                (1, '데이터과학', '최교수', date(2025, 3, 1), Course.STATUS_ENROLLING, '공학', '컴퓨터', '서울대학교'),
+                (2, '데이터과학', '최교수', date(2024, 3, 1), Course.STATUS_FINISHED, '공학', '통계', 'KAIST'),
+            ],
+            generation=(2, None),
+        )
+
+        counts = index.counts(QueryDict('org_name=KAIST'))
+        self.assertEqual(counts['total'], 1)
+        self.assertEqual(self._values(counts['middle_classfy_name']), {'통계': 1})
+        self.assertEqual(self._values(counts['org_name']), {'서울대학교': 1})
+
+        self.assertEqual(index.counts(QueryDict('middle_classfy_name=통계'))['total'], 1)
+        self.assertEqual(index.counts(QueryDict())['total'], 1)
+
+
+class EmbeddingBatchModeTests(TestCase):
+    """
+    [설계 의도]
+    - make_embeddings 오프라인 배치 모드(prepare → submit → collect)를 로컬 어댑터로 끝까지 실행
+    - 오류 파일로 분리된 실패 요청이 동기 모드처럼 실패로 집계/출력되는지 고정
+    """
+
+    def setUp(self):
+        self.ok = Course.objects.create(kmooc_id='EMB-1', name='파이썬 입문', professor='A', summary='기초 문법')
+        self.broken = Course.objects.create(kmooc_id='EMB-2', name='데이터 분석', professor='B')
+        Course.objects.filter(pk__in=[self.ok.pk, self.broken.pk]).update(
+            updated_at=timezone.now() - timedelta(days=1)
+        )
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.batch_dir = directory.name
+
+    def _fake_response(self, url, body, request_id='fake'):
+        if request_id == f'course-{self.broken.pk}':
+            return 500, {'error': {'message': 'upstream failure'}}
+        return fake.fake_response(url, body, request_id)
+
+    def test_batch_run_applies_embeddings_and_reports_failures(self):
+        out = StringIO()
+        started = timezone.now()
+
+        with mock.patch.object(jobs, 'fake_response', side_effect=self._fake_response):
+            call_command(
+                'make_embeddings', batch='run', batch_adapter='local', batch_dir=self.batch_dir, stdout=out,
+            )
+
+        self.ok.refresh_from_db()
+        self.broken.refresh_from_db()
+        self.assertEqual(len(self.ok.embedding), fake.FAKE_EMBEDDING_DIMENSIONS)
+        self.assertGreaterEqual(self.ok.updated_at, started)  # bulk_update에서도 세대 갱신
+        self.assertIsNone(self.broken.embedding)
+
+        output = out.getvalue()
+        self.assertIn(f'[course-{self.broken.pk}] 실패: HTTP 500', output)
+        self.assertIn('성공 1건, 실패 1건', output)
+
+        job = jobs.BatchWorkspace(self.batch_dir).load_job()
+        self.assertEqual(job.request_counts, {'total': 2, 'completed': 1, 'failed': 1})
+        self.assertIsNotNone(job.error_file_id)
@@ -3,9 +3,12 @@ from .views import (
     CourseDetailView,
     CourseReviewListView,
     CourseRecommendationView,
+    CourseAlsoEnrolledView,
     CourseListView,
     CourseKeywordSearchView,
     CourseSemanticSearchView,
+    CourseHybridSearchView,
+    CourseSuggestView,
 )
 
 # 개요
@@ -15,7 +18,12 @@ from .views import (
 ├── /                               # 강좌 목록
 ├── <int:pk>/                       # 강좌 상세
 ├── <int:course_id>/reviews/        # 리뷰 목록
-└── <int:course_id>/recommendations/ # 추천 강좌
+├── <int:course_id>/recommendations/ # 추천 강좌
+├── <int:course_id>/also-enrolled/  # 함께 수강한 강좌
+├── search/keyword/                 # 키워드 검색 (BM25)
+├── search/semantic/                # 의미 기반 검색 (kNN)
+├── search/hybrid/                  # 하이브리드 검색 (BM25 + kNN, RRF)
+└── suggest/                        # 검색어 자동완성
 ```
 
 #### 강좌 목록 API
@@ -27,9 +35,11 @@ from .views import (
 | `middle_classfy_name` | string | 중분류 필터링                | `?middle_classfy_name=교육학` |
 | `org_name`            | string | 운영기관 필터링              | `?org_name=서울대학교`        |
 | `professor`           | string | 교수 필터링                  | `?professor=김교수`           |
+| `status`              | string | 진행 상태 필터링 (upcoming/enrolling/in_progress/finished) | `?status=enrolling` |
 | `ordering`            | string | 정렬 기준                    | `?ordering=-average_rating`   |
 | `page`                | int    | 페이지 번호                  | `?page=2`                     |
 | `page_size`           | int    | 페이지 크기                  | `?page_size=20`               |
+| `facets`              | bool   | 필터별 강좌 수 포함          | `?facets=true`                |
 
 2. Ordering 옵션
 
@@ -41,6 +51,19 @@ from .views import (
 - `-name`: 이름 내림차순
 - `-review_count`: 리뷰 많은순
 
+3. 패싯 (`?facets=true`)
+- 응답에 `facets` 추가: `{"total": n, "classfy_name": [{"value": "공학", "count": 120}, ...], "middle_classfy_name": [...], "org_name": [...]}`
+- 현재 검색/필터 상태 기준, 각 패싯은 자기 자신의 필터만 빼고 집계 (다중 선택용)
+
+#### 하이브리드 검색 API
+- `search`(필수), `page`, `page_size`(기본 10, 최대 100) + 목록 API와 같은 필터 파라미터
+- 응답: `{"results": [...], "count": n, "mode": "hybrid" | "keyword"}` (각 결과에 융합 점수 `score` 포함)
+
+#### 자동완성 API
+- `q`(입력 중인 검색어), `limit`(기본 10, 최대 20)
+- 강좌명/교수자/운영기관 접두사 일치 (자모/초성 지원: `?q=데잍`, `?q=ㄷㅇㅌ`), 단어 중간부터 입력해도 일치(`?q=분석`)
+- 응답: `{"query": "...", "results": [{"text": "...", "type": "course" | "professor" | "org", "count": n}]}`
+
 """
 
 urlpatterns = [
@@ -56,9 +79,18 @@ urlpatterns = [
     # 3. 추천 강의 조회: /api/v1/courses/<id>/recommendations/
     path('<int:course_id>/recommendations/', CourseRecommendationView.as_view(), name='course-recommendations'),
 
+    # 3.1 함께 수강한 강의 조회: /api/v1/courses/<id>/also-enrolled/
+    path('<int:course_id>/also-enrolled/', CourseAlsoEnrolledView.as_view(), name='course-also-enrolled'),
+
     # 4. 키워드 검색 (ES + Fuzzy): /api/v1/courses/search/keyword/?search=...
     path('search/keyword/', CourseKeywordSearchView.as_view(), name='course-keyword-search'),
 
     # 5. 의미 기반 검색: /api/v1/courses/search/semantic/?query=...
     path('search/semantic/', CourseSemanticSearchView.as_view(), name='course-semantic-search'),
+
+    # 6. 하이브리드 검색 (BM25 + kNN): /api/v1/courses/search/hybrid/?search=...
+    path('search/hybrid/', CourseHybridSearchView.as_view(), name='course-hybrid-search'),
+
+    # 7. 검색어 자동완성: /api/v1/courses/suggest/?q=...
+    path('suggest/', CourseSuggestView.as_view(), name='course-suggest'),
 ]
@@ -1,7 +1,9 @@
+import logging
+
 from django.shortcuts import render, get_object_or_404
 from django.conf import settings
 from django.core.cache import cache
-from django.db.models import Q, Count, Avg, Window, F
+from django.db.models import Q, Count, Avg, Max, Window, F, Exists, OuterRef, Subquery, Value, BooleanField
 from django.db.models.functions import Coalesce, RowNumber
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.pagination import PageNumberPagination
@@ -10,15 +12,23 @@ from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from rest_framework.renderers import BrowsableAPIRenderer
 
 from elasticsearch import Elasticsearch
-import requests
-import json
-import os
 
-from .models import Course, CourseReview
-from .serializers import CourseDetailSerializer, CourseReviewSerializer, CourseListSerializer
-from apps.mypage.serializers import SimpleCourseSerializer
+from .models import Course, CourseReview, Wishlist
+from .cache import get_catalog_generation
+from apps.core.utils.http_cache import Validators, conditional_get, latest
+from apps.core.utils.fast_serialization import ValuesListMixin
+from apps.core.renderers import FastJSONRenderer
+from .serializers import (
+    CourseDetailSerializer, CourseReviewSerializer, CourseListSerializer, CourseListValuesSerializer,
+)
+from apps.mypage.serializers import SimpleCourseSerializer, AlsoEnrolledCourseSerializer
+from apps.mypage.services import get_recommendation_service
+from .services import get_facet_service, get_search_service, get_suggest_service, es_filters
+
+logger = logging.getLogger(__name__)
 
 # 개요
 """
@@ -29,6 +39,12 @@ from apps.mypage.serializers import SimpleCourseSerializer
 2.1 CourseDetailView         | 강의 상세 정보 조회
 2.2 CourseReviewListView     | 강의 리뷰 목록 조회
 2.3 CourseRecommendationView | 추천 강의 조회
+2.4 CourseAlsoEnrolledView   | 함께 수강한 강의 조회
+
+3.1 CourseKeywordSearchView  | 키워드 검색 (BM25)
+3.2 CourseSemanticSearchView | 의미 기반 검색 (kNN)
+3.3 CourseHybridSearchView   | 하이브리드 검색 (BM25 + kNN, RRF + 평점 가중치)
+3.4 CourseSuggestView        | 검색어 자동완성 (메모리 접두사 인덱스)
 """
 
 
@@ -55,7 +71,7 @@ class CourseListPagination(PageNumberPagination):
     max_page_size = MAX_PAGE_SIZE
 
 # 1.2 CourseListView | 강의 목록 조회
-class CourseListView(generics.ListAPIView):
+class CourseListView(ValuesListMixin, generics.ListAPIView):
     """
     [API]
     - GET: /api/v1/courses/
@@ -70,6 +86,7 @@ class CourseListView(generics.ListAPIView):
     2. 검색 조건 적용 (search 파라미터)
     3. 필터링 적용 (classfy_name, org_name 등)
     4. 정렬 적용 (ordering 파라미터, 기본값: -average_rating)
+       (status 필터는 1단계 annotate 이전에 적용)
     5. 페이지네이션 적용
     6. 응답 반환
 
@@ -80,9 +97,12 @@ class CourseListView(generics.ListAPIView):
     - Coalesce: average_rating이 NULL이면 0.0으로 처리
         - COALESCE(값, 대체값) := 값이 NULL이 아니면 그대로, 값이 NULL이면 대체값 반환
     - default ordering: -average_rating (평점 높은순)
+    - 고속 직렬화: ValuesListMixin으로 페이지를 values_list()로 조회하고
+      CourseListValuesSerializer + FastJSONRenderer로 응답 (형식은 CourseListSerializer와 동일)
     """
 
-    serializer_class = CourseListSerializer
+    serializer_class = CourseListSerializer            # 스키마 문서화용
+    values_serializer_class = CourseListValuesSerializer
     permission_classes = [AllowAny]
     pagination_class = CourseListPagination
 
@@ -106,7 +126,16 @@ class CourseListView(generics.ListAPIView):
 
         # - 목록 화면에서 필요한 집계 값(평균 평점, 리뷰 수)을 미리 계산하여 N+1을 방지한다.
         # - Window Function으로 중복 제거 처리
-        queryset = Course.objects.annotate(
+        queryset = Course.objects.all()
+
+        # 진행 상태 필터 (?status=enrolling)
+        # - Window보다 먼저 적용: 중복 제거 대상 자체를 해당 상태 강좌로 좁힘
+        #   (enrolling은 부분 인덱스 idx_course_enrolling 사용)
+        course_status = self.request.query_params.get('status')
+        if course_status in dict(Course.STATUS_CHOICES):
+            queryset = queryset.filter(status=course_status)
+
+        queryset = queryset.annotate(
             # 평균 평점 계산 (NULL이면 0.0)
             # - 리뷰가 없는 강좌는 Avg 결과가 NULL이 되므로 Coalesce로 0.0으로 대체
             # - 이렇게 하면 Serializer/프론트에서 None 처리 분기를 줄일 수 있음
@@ -210,6 +239,7 @@ class CourseListView(generics.ListAPIView):
         2. 캐시에서 데이터 확인
         3. 캐시 히트 시 캐시 데이터 반환
         4. 캐시 미스 시 DB 조회 후 캐시 저장 및 반환
+           (?facets=true이면 대분류/중분류/운영기관별 강좌 수를 facets로 함께 반환)
         """
         # 1. 캐시 키 생성 (쿼리 파라미터 기반)
         query_params = request.GET.urlencode()
@@ -223,6 +253,11 @@ class CourseListView(generics.ListAPIView):
         # 3. 캐시 미스 - DB 조회
         response = super().list(request, *args, **kwargs)
 
+        # 3.1 필터 패싯 개수 (?facets=true, 같은 응답에 포함)
+        # - DB GROUP BY 없이 메모리 비트셋 인덱스로 집계 (services/facet_service.py)
+        if request.query_params.get('facets') in ('1', 'true') and isinstance(response.data, dict):
+            response.data['facets'] = get_facet_service().facet_counts(request.query_params)
+
         # 4. 캐시에 저장 (5분 TTL)
         cache.set(cache_key, response.data, 300)
 
@@ -238,10 +273,73 @@ class CourseListView(generics.ListAPIView):
 
 # 2.1 CourseDetailView | 강의 상세 정보 조회
 class CourseDetailView(generics.RetrieveAPIView):
-    queryset = Course.objects.all()
+    """
+    [설계 의도]
+    - 강좌 상세 정보를 단일 쿼리로 조회
+      · is_wished: Exists 서브쿼리
+      · rating / review_count: 집계 서브쿼리
+      · ai_summary: select_related('ai_review')로 JOIN
+
+    [상세 고려사항]
+    - 리뷰 집계는 JOIN + GROUP BY 대신 상관 서브쿼리로 작성
+      → select_related('ai_review')와 함께 써도 행이 불어나지 않음
+    - 평점 요약은 프로세스별 캐시(LocMemCache)에 두지 않고 상세 쿼리에서 매번 집계
+      → 리뷰를 저장한 워커가 아닌 다른 gunicorn 워커도 커밋 직후 새 평점을 응답
+      → 한 강좌의 리뷰만 course_id 인덱스로 집계하므로 쿼리 수는 그대로(1개)
+    """
     serializer_class = CourseDetailSerializer
     permission_classes = [AllowAny]
 
+    def get_queryset(self):
+        user = self.request.user
+
+        if user.is_authenticated:
+            is_wished = Exists(Wishlist.objects.filter(user=user, course=OuterRef('pk')))
+        else:
+            is_wished = Value(False, output_field=BooleanField())
+
+        reviews = CourseReview.objects.filter(course=OuterRef('pk')).values('course')
+        return Course.objects.select_related('ai_review').annotate(
+            is_wished=is_wished,
+            rating=Subquery(reviews.annotate(avg=Avg('rating')).values('avg')),
+            review_count=Coalesce(Subquery(reviews.annotate(cnt=Count('pk')).values('cnt')), 0),
+        )
+
+    def get_validators(self, request, *args, **kwargs):
+        """
+        조건부 응답 검증자: 강좌/AI 요약 수정 시각 + 리뷰 (개수, 최신 수정 시각) + 찜 여부
+
+        - 본 쿼리보다 가벼운 values() 단일 쿼리
+        - 로그인 사용자는 is_wished가 응답에 포함되므로 사용자별(private) 검증자
+        """
+        reviews = CourseReview.objects.filter(course=OuterRef('pk')).values('course')
+        queryset = Course.objects.filter(pk=kwargs[self.lookup_field]).annotate(
+            review_count=Subquery(reviews.annotate(cnt=Count('pk')).values('cnt')),
+            review_updated_at=Subquery(reviews.annotate(latest=Max('updated_at')).values('latest')),
+        )
+        fields = ['updated_at', 'ai_review__updated_at', 'review_count', 'review_updated_at']
+
+        user = request.user
+        if user.is_authenticated:
+            queryset = queryset.annotate(
+                is_wished=Exists(Wishlist.objects.filter(user=user, course=OuterRef('pk')))
+            )
+            fields.append('is_wished')
+
+        row = queryset.values(*fields).first()
+        if row is None:
+            return None  # 404는 본 View에서 처리
+
+        return Validators(
+            parts=('course-detail', user.pk, *(row[field] for field in fields)),
+            last_modified=latest(row['updated_at'], row['ai_review__updated_at'], row['review_updated_at']),
+            private=user.is_authenticated,
+        )
+
+    @conditional_get(max_age=60)
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
         context.update({"request": self.request})
@@ -256,6 +354,27 @@ class CourseReviewListView(generics.ListAPIView):
         course_id = self.kwargs.get('course_id')
         return CourseReview.objects.filter(course_id=course_id).select_related('user').order_by('-created_at')
 
+    def get_validators(self, request, *args, **kwargs):
+        """
+        조건부 응답 검증자: 리뷰 (개수, 최신 수정 시각) + 페이지 쿼리
+
+        - 로그인 사용자는 is_owner가 응답에 포함되므로 사용자별(private) 검증자
+        """
+        stats = CourseReview.objects.filter(course_id=kwargs.get('course_id')).aggregate(
+            total=Count('id'), latest=Max('updated_at')
+        )
+        user = request.user
+        return Validators(
+            parts=('course-reviews', kwargs.get('course_id'), user.pk,
+                   request.query_params.urlencode(), stats['total'], stats['latest']),
+            last_modified=stats['latest'],
+            private=user.is_authenticated,
+        )
+
+    @conditional_get(max_age=30)
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
         context.update({"request": self.request})
@@ -268,6 +387,21 @@ ES_CLIENT = Elasticsearch(getattr(settings, 'ELASTICSEARCH_URL', 'http://elastic
 class CourseRecommendationView(APIView):
     permission_classes = [AllowAny]
 
+    def get_validators(self, request, course_id):
+        """
+        조건부 응답 검증자: 대상 강좌 수정 시각(임베딩 포함) + 카탈로그(ES 인덱스) 세대
+
+        - 사용자와 무관한 응답이므로 공개(public) 캐시 허용
+        """
+        updated_at = Course.objects.filter(pk=course_id).values_list('updated_at', flat=True).first()
+        if updated_at is None:
+            return None
+        return Validators(
+            parts=('course-recommendations', course_id, updated_at, get_catalog_generation()),
+            last_modified=updated_at,
+        )
+
+    @conditional_get(max_age=300)
     def get(self, request, course_id):
         target_course = get_object_or_404(Course, id=course_id)
         query_vector = target_course.embedding
@@ -331,6 +465,26 @@ class CourseRecommendationView(APIView):
             return Response([], status=status.HTTP_200_OK)
 
 
+# 2.4 CourseAlsoEnrolledView | 함께 수강한 강의 조회
+class CourseAlsoEnrolledView(APIView):
+    """
+    [API]
+    - GET: /api/v1/courses/<course_id>/also-enrolled/
+
+    [설계 의도]
+    - 이 강좌를 수강한 사용자들이 함께 수강한 강좌 (수강 이력 기반, 임베딩 추천과 별개)
+    - build_recommendations 배치 결과를 강좌 PK 조회 1회 + 강좌 in_bulk 1회로 응답
+
+    [상세 고려사항]
+    - 계산 결과가 없는 강좌(공동 수강자 부족 등)는 빈 목록
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, course_id):
+        also_enrolled = get_recommendation_service().get_also_enrolled(course_id)
+        return Response(AlsoEnrolledCourseSerializer(also_enrolled['results'], many=True).data)
+
+
 class CourseKeywordSearchView(APIView):
     """
     Elasticsearch를 활용한 키워드 검색 (Fuzzy Search 지원)
@@ -340,34 +494,17 @@ class CourseKeywordSearchView(APIView):
     - 제목(name) 필드만 검색
     - 필터링 및 페이지네이션 지원
     - 중복 제거 (같은 이름+교수 조합)
+
+    [최적화 내용]
+    - 후보(최대 200건)를 모델 인스턴스 대신 values_list()로 조회 (embedding 등 대용량 컬럼 제외)
+    - 응답은 CourseListValuesSerializer + FastJSONRenderer로 직렬화
     """
     permission_classes = [AllowAny]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
 
     def _build_es_filters(self):
-        """ES query용 필터 조건 생성"""
-        filters = []
-
-        # 대분류 필터 (정확히 일치)
-        classfy_name = self.request.query_params.get('classfy_name')
-        if classfy_name:
-            filters.append({"term": {"classfy_name.keyword": classfy_name}})
-
-        # 중분류 필터 (다중 값 지원)
-        middle_classfy_names = self.request.query_params.getlist('middle_classfy_name')
-        if middle_classfy_names:
-            filters.append({"terms": {"middle_classfy_name.keyword": middle_classfy_names}})
-
-        # 운영기관 필터 (부분 일치)
-        org_name = self.request.query_params.get('org_name')
-        if org_name:
-            filters.append({"match": {"org_name": org_name}})
-
-        # 교수명 필터 (부분 일치)
-        professor = self.request.query_params.get('professor')
-        if professor:
-            filters.append({"match": {"professor": professor}})
-
-        return filters
+        """ES query용 필터 조건 생성 (하이브리드 검색과 공용, services/search_service.py)"""
+        return es_filters(self.request.query_params)
 
     def get(self, request):
         search_query = request.query_params.get('search', '').strip()
@@ -415,12 +552,16 @@ class CourseKeywordSearchView(APIView):
             hits = res.get("hits", {}).get("hits", [])
             candidate_ids = [int(h["_source"]["id"]) for h in hits]
 
-            # DB 조회
+            # DB 조회 (목록 응답에 필요한 컬럼만)
             courses_queryset = Course.objects.filter(id__in=candidate_ids).annotate(
                 average_rating=Coalesce(Avg('reviews__rating'), 0.0),
                 review_count=Count('reviews', distinct=True)
             )
-            course_data_map = {c.id: c for c in courses_queryset}
+            rows = CourseListValuesSerializer.values_list(courses_queryset)
+            course_data_map = {
+                course['id']: course
+                for course in CourseListValuesSerializer.serialize(rows)
+            }
 
             # 중복 제거 (ES 순서 유지)
             final_courses = []
@@ -431,8 +572,8 @@ class CourseKeywordSearchView(APIView):
                 if not course:
                     continue
 
-                curr_name = course.name.strip()
-                curr_professor = course.professor.strip()
+                curr_name = (course['name'] or '').strip()
+                curr_professor = (course['professor'] or '').strip()
                 identity = (curr_name, curr_professor)
 
                 if identity not in seen_identity:
@@ -447,10 +588,8 @@ class CourseKeywordSearchView(APIView):
             end = from_index + page_size
             paginated_courses = final_courses[start:end]
 
-            serializer = CourseListSerializer(paginated_courses, many=True)
-
             return Response({
-                "results": serializer.data,
+                "results": paginated_courses,
                 "count": total_count
             })
 
@@ -469,39 +608,8 @@ class CourseSemanticSearchView(APIView):
     permission_classes = [AllowAny]
 
     def _get_embedding(self, text):
-        """내부용 임베딩 생성 메서드"""
-        GMS_URL = "https://gms.ssafy.io/gmsapi/api.openai.com/v1/embeddings"
-        GMS_KEY = os.environ.get("GMS_KEY")
-
-        if not GMS_KEY:
-            print("❌ GMS_KEY가 설정되지 않았습니다.")
-            return None
-
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {GMS_KEY}"
-        }
-
-        clean_text = text.replace('\n', ' ').replace('\r', ' ').strip()
-        if not clean_text:
-            return None
-
-        data = {
-            "model": "text-embedding-3-small",
-            "input": clean_text
-        }
-
-        try:
-            response = requests.post(GMS_URL, headers=headers, data=json.dumps(data), timeout=5)
-            if response.status_code == 200:
-                result = response.json()
-                return result['data'][0]['embedding']
-            else:
-                print(f"❌ 임베딩 API 호출 실패: {response.status_code} - {response.text}")
-                return None
-        except Exception as e:
-            print(f"❌ 임베딩 생성 중 에러 발생: {e}")
-            return None
+        """검색어 임베딩 (하이브리드 검색과 LRU 캐시 공유)"""
+        return get_search_service().get_query_embedding(text)
 
     def _apply_filters(self, queryset):
         """필터링 로직 (CourseListView와 동일)"""
@@ -530,6 +638,11 @@ class CourseSemanticSearchView(APIView):
         if professor:
             filters &= Q(professor__icontains=professor)
 
+        # 진행 상태 필터
+        course_status = self.request.query_params.get('status')
+        if course_status in dict(Course.STATUS_CHOICES):
+            filters &= Q(status=course_status)
+
         return queryset.filter(filters)
 
     def get(self, request):
@@ -545,14 +658,20 @@ class CourseSemanticSearchView(APIView):
 
         try:
             # 2. ES 벡터 검색
+            knn = {
+                "field": "embedding",
+                "query_vector": query_vector,
+                "k": 50,
+                "num_candidates": 500
+            }
+            # 진행 상태는 kNN 후보 단계에서 거름 (DB 필터로만 거르면 후보 50개 중 일부만 남음)
+            course_status = request.query_params.get('status')
+            if course_status in dict(Course.STATUS_CHOICES):
+                knn["filter"] = {"term": {"status": course_status}}
+
             res = ES_CLIENT.search(
                 index="kmooc_courses",
-                knn={
-                    "field": "embedding",
-                    "query_vector": query_vector,
-                    "k": 50,
-                    "num_candidates": 500
-                },
+                knn=knn,
                 source=["id"]
             )
 
@@ -593,3 +712,102 @@ class CourseSemanticSearchView(APIView):
             print(f"❌ ES 검색 로직 에러: {e}")
             print(traceback.format_exc())
             return Response([], status=status.HTTP_200_OK)
+
+
+class CourseHybridSearchView(APIView):
+    """
+    키워드(BM25) + 의미(kNN) 하이브리드 검색
+
+    [설계 의도]
+    - 키워드/의미 검색을 각각 호출하던 것을 한 번의 호출로 통합 (ES _msearch 1회)
+    - 순위 융합(RRF) + 평점 가중치 + 중복 제거는 HybridSearchService가 담당
+
+    [최적화 내용]
+    - DB는 현재 페이지 강좌만 조회 (후보 전체가 아니라 page_size개)
+    - 짧은 검색어/캐시된 검색어는 임베딩 API 호출 생략
+    - 응답은 CourseListValuesSerializer + FastJSONRenderer로 직렬화
+
+    [응답]
+    - mode: 'hybrid'(BM25 + kNN) | 'keyword'(임베딩 생략/실패 시 BM25만)
+    """
+    permission_classes = [AllowAny]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    def get(self, request):
+        search_query = request.query_params.get('search', '').strip()
+        if not search_query:
+            return Response({"results": [], "count": 0, "mode": None}, status=status.HTTP_200_OK)
+
+        # 페이지네이션 파라미터
+        try:
+            page = max(int(request.query_params.get('page', 1)), 1)
+            page_size = min(max(int(request.query_params.get('page_size', PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+        except ValueError:
+            return Response({"detail": "page, page_size는 정수여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        from_index = (page - 1) * page_size
+
+        try:
+            result = get_search_service().search(search_query, es_filters(request.query_params))
+        except Exception:
+            logger.error('ES 하이브리드 검색 에러', exc_info=True)
+            return Response({"results": [], "count": 0, "mode": None}, status=status.HTTP_200_OK)
+
+        candidates = result['results']
+        page_candidates = candidates[from_index:from_index + page_size]
+
+        # DB 조회 (현재 페이지 강좌만, 목록 응답에 필요한 컬럼만)
+        courses_queryset = Course.objects.filter(
+            id__in=[candidate['id'] for candidate in page_candidates]
+        ).annotate(
+            average_rating=Coalesce(Avg('reviews__rating'), 0.0),
+            review_count=Count('reviews', distinct=True)
+        )
+        rows = CourseListValuesSerializer.values_list(courses_queryset)
+        course_data_map = {
+            course['id']: course
+            for course in CourseListValuesSerializer.serialize(rows)
+        }
+
+        # 융합 순서 유지 + 점수 포함
+        results = [
+            {**course_data_map[candidate['id']], 'score': candidate['score']}
+            for candidate in page_candidates
+            if candidate['id'] in course_data_map
+        ]
+
+        return Response({
+            "results": results,
+            "count": len(candidates),
+            "mode": result['mode'],
+        })
+
+
+class CourseSuggestView(APIView):
+    """
+    검색어 자동완성 (강좌명/교수자/운영기관)
+
+    [설계 의도]
+    - 검색창 키 입력마다 호출되는 API → DB/ES 조회 없이 프로세스 메모리 인덱스만 사용
+    - 한글 자모/초성 분해 키로 조합 중인 글자("데잍")와 초성("ㄷㅇㅌ")도 일치
+
+    [응답]
+    - results: [{"text": "데이터 분석 입문", "type": "course" | "professor" | "org", "count": 3}, ...]
+    """
+    permission_classes = [AllowAny]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({"query": query, "results": []}, status=status.HTTP_200_OK)
+
+        try:
+            limit = int(request.query_params.get('limit', 10))
+        except ValueError:
+            return Response({"detail": "limit는 정수여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "query": query,
+            "results": get_suggest_service().suggest(query, limit),
+        })
+
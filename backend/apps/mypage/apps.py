@@ -1,6 +1,11 @@
+# backend/apps/mypage/apps.py
+
 from django.apps import AppConfig
 
 
 class MypageConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.mypage'
+
+    def ready(self):
+        from . import signals
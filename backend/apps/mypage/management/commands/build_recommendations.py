@@ -0,0 +1,118 @@
+# backend/apps/mypage/management/commands/build_recommendations.py
+
+"""
+협업 필터링 추천 계산 커맨드
+
+[설계 의도]
+- 수강/찜/수강평 상호작용으로 사용자별 추천 강좌(UserCourseRecommendation)와
+  강좌별 함께 수강한 강좌(CourseAlsoEnrolled)를 다시 계산
+- scheduler 컨테이너(run_scheduler)가 매일 자정 실행 → API는 저장된 결과만 조회
+
+[사용 예시]
+python manage.py build_recommendations
+python manage.py build_recommendations --top-n 30 --n-jobs 4
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.mypage.services import get_recommendation_service
+from apps.mypage.services.recommendation_service import (
+    ALSO_ENROLLED_MIN_SUPPORT,
+    ALSO_ENROLLED_TOP_N,
+    RECOMMENDATION_NEIGHBORS,
+    RECOMMENDATION_TOP_N,
+)
+
+
+class Command(BaseCommand):
+    help = '수강/찜/수강평 기반 협업 필터링 추천(사용자별 Top-N, 함께 수강한 강좌)을 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top-n',
+            type=int,
+            default=RECOMMENDATION_TOP_N,
+            help=f'사용자별 저장할 추천 강좌 수 (기본: {RECOMMENDATION_TOP_N})'
+        )
+        parser.add_argument(
+            '--neighbors',
+            type=int,
+            default=RECOMMENDATION_NEIGHBORS,
+            help=f'강좌별 유지할 유사 강좌 수 (기본: {RECOMMENDATION_NEIGHBORS})'
+        )
+        parser.add_argument(
+            '--also-enrolled-top-n',
+            type=int,
+            default=ALSO_ENROLLED_TOP_N,
+            help=f'강좌별 저장할 함께 수강한 강좌 수 (기본: {ALSO_ENROLLED_TOP_N})'
+        )
+        parser.add_argument(
+            '--min-support',
+            type=int,
+            default=ALSO_ENROLLED_MIN_SUPPORT,
+            help=f'함께 수강한 강좌 최소 공동 수강자 수 (기본: {ALSO_ENROLLED_MIN_SUPPORT})'
+        )
+        parser.add_argument(
+            '--n-jobs',
+            type=int,
+            default=-1,
+            help='병렬 스레드 수 (기본: -1, 전체 코어)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='점수 계산 사용자 청크 크기 (기본: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        for name in ('top_n', 'neighbors', 'also_enrolled_top_n', 'min_support', 'chunk_size'):
+            if options[name] < 1:
+                raise CommandError(f'--{name.replace("_", "-")}는 1 이상이어야 합니다.')
+
+        service = get_recommendation_service()
+        start = time.perf_counter()
+
+        # 1. 상호작용 행렬
+        self.stdout.write('상호작용 행렬 구성 중...')
+        interactions = service.load_interactions()
+        if interactions is None:
+            self.stdout.write(self.style.WARNING('상호작용 데이터가 없습니다. 기존 추천 결과를 정리합니다.'))
+            service.save([], [])
+            return
+
+        weights = interactions['weights']
+        self.stdout.write(
+            f'  - 사용자 {weights.shape[0]}명 × 강좌 {weights.shape[1]}개, '
+            f'상호작용 {interactions["seen"].nnz}건 ({time.perf_counter() - start:.2f}초)'
+        )
+
+        # 2. 사용자별 Top-N
+        step = time.perf_counter()
+        user_rows = service.user_recommendations(
+            interactions,
+            top_n=options['top_n'],
+            neighbors=options['neighbors'],
+            n_jobs=options['n_jobs'],
+            chunk_size=options['chunk_size'],
+        )
+        self.stdout.write(f'  - 사용자 추천 {len(user_rows)}명 계산 ({time.perf_counter() - step:.2f}초)')
+
+        # 3. 함께 수강한 강좌
+        step = time.perf_counter()
+        course_rows = service.also_enrolled(
+            interactions,
+            top_n=options['also_enrolled_top_n'],
+            min_support=options['min_support'],
+        )
+        self.stdout.write(f'  - 함께 수강한 강좌 {len(course_rows)}개 계산 ({time.perf_counter() - step:.2f}초)')
+
+        # 4. 저장
+        saved = service.save(user_rows, course_rows)
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ 추천 저장 완료: 사용자 {saved["users"]}명, 강좌 {saved["courses"]}개 ({elapsed:.2f}초)'
+        ))
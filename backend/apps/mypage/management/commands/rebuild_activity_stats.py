@@ -0,0 +1,54 @@
+# backend/apps/mypage/management/commands/rebuild_activity_stats.py
+
+"""
+사용자 활동 카운터(UserActivityStats) 재계산 커맨드
+
+[설계 의도]
+- 시그널을 우회하는 적재(bulk_create 시드 데이터, SQL 직접 수정 등) 이후
+  원본 테이블로부터 카운터를 다시 맞추기 위함
+- 신규 배포 직후 전체 사용자 카운터를 미리 채워 두는 용도
+
+[사용 예시]
+python manage.py rebuild_activity_stats
+python manage.py rebuild_activity_stats --user-id 3 --user-id 7
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.mypage.services import get_activity_stats_service
+
+
+class Command(BaseCommand):
+    help = '사용자 활동 카운터(UserActivityStats)를 원본 테이블로부터 재계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user-id',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='재계산할 사용자 ID (여러 번 지정 가능, 생략 시 전체)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='upsert 배치 크기 (기본: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        target = options['user_ids']
+
+        self.stdout.write('활동 카운터 재계산 중...')
+        updated = get_activity_stats_service().rebuild(
+            user_ids=target,
+            batch_size=options['batch_size'],
+        )
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ {updated}명의 활동 카운터 재계산 완료 ({elapsed:.2f}초)'
+        ))
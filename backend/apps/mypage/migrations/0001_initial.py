@@ -0,0 +1,37 @@
+# Generated manually for user activity stats projection
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserActivityStats',
+            fields=[
+                ('user', models.OneToOneField(help_text='집계 대상 사용자', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='activity_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('enrolled_count', models.PositiveIntegerField(default=0, help_text='수강 중 강좌 수')),
+                ('completed_count', models.PositiveIntegerField(default=0, help_text='수강 완료 강좌 수')),
+                ('wishlist_count', models.PositiveIntegerField(default=0, help_text='찜한 강좌 수')),
+                ('my_review_count', models.PositiveIntegerField(default=0, help_text='작성한 수강평 수')),
+                ('post_count', models.PositiveIntegerField(default=0, help_text='작성한 게시글 수')),
+                ('comment_count', models.PositiveIntegerField(default=0, help_text='작성한 댓글 수')),
+                ('scrap_count', models.PositiveIntegerField(default=0, help_text='스크랩한 게시글 수')),
+                ('received_likes_count', models.PositiveIntegerField(default=0, help_text='내 게시글이 받은 좋아요 수')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='마지막 갱신 시각')),
+            ],
+            options={
+                'verbose_name': '사용자 활동 통계',
+                'verbose_name_plural': '사용자 활동 통계 목록',
+                'db_table': 'mypage_user_activity_stats',
+            },
+        ),
+    ]
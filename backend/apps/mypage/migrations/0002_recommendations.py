@@ -0,0 +1,45 @@
+# Generated manually for collaborative-filtering recommendation projections
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0007_course_status'),
+        ('mypage', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserCourseRecommendation',
+            fields=[
+                ('user', models.OneToOneField(help_text='추천 대상 사용자', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='course_recommendation', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('course_ids', models.JSONField(default=list, help_text='추천 강좌 ID (점수 내림차순)')),
+                ('scores', models.JSONField(default=list, help_text='추천 점수 (course_ids와 같은 순서)')),
+                ('generated_at', models.DateTimeField(help_text='추천 계산 시각')),
+            ],
+            options={
+                'verbose_name': '사용자 추천 강좌',
+                'verbose_name_plural': '사용자 추천 강좌 목록',
+                'db_table': 'mypage_user_course_recommendation',
+            },
+        ),
+        migrations.CreateModel(
+            name='CourseAlsoEnrolled',
+            fields=[
+                ('course', models.OneToOneField(help_text='기준 강좌', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='also_enrolled', serialize=False, to='courses.course')),
+                ('course_ids', models.JSONField(default=list, help_text='함께 수강한 강좌 ID (공동 수강자 수 내림차순)')),
+                ('counts', models.JSONField(default=list, help_text='공동 수강자 수 (course_ids와 같은 순서)')),
+                ('generated_at', models.DateTimeField(help_text='계산 시각')),
+            ],
+            options={
+                'verbose_name': '함께 수강한 강좌',
+                'verbose_name_plural': '함께 수강한 강좌 목록',
+                'db_table': 'mypage_course_also_enrolled',
+            },
+        ),
+    ]
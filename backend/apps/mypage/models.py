@@ -1,10 +1,11 @@
 # backend/apps/mypage/models.py
 
+from django.conf import settings
 from django.db import models
 
 """
 [ 설계 의도 ]
-본 mypage 앱은 독자적인 모델(DB Table)을 정의하지 않습니다.
+본 mypage 앱은 원본 데이터(Source of Truth) 모델을 정의하지 않습니다.
 
 1. 모델 배치 전략 (Domain-Driven):
    - 데이터의 주체가 되는 도메인별로 모델을 분리하여 배치하였습니다.
@@ -20,4 +21,116 @@ from django.db import models
 3. 기대 효과:
    - 앱 간의 불필요한 순환 참조(Circular Dependency) 방지
    - 데이터 소유권과 참조 로직의 명확한 분리
-"""
\ No newline at end of file
+
+4. 예외: 읽기 전용 집계 프로젝션 (UserActivityStats)
+   - 여러 도메인의 데이터를 사용자 단위로 미리 집계해 둔 "파생 데이터"입니다.
+   - 원본은 여전히 각 도메인 앱에 있으며, 이 테이블은 언제든 원본으로부터
+     재계산할 수 있습니다. (rebuild_activity_stats 커맨드)
+   - 특정 도메인에 귀속되지 않는 집계이므로 Aggregation Layer인 mypage에 둡니다.
+   - 추천 결과(UserCourseRecommendation, CourseAlsoEnrolled)도 같은 이유로 여기에 둡니다.
+     (수강/찜/수강평으로부터 재계산 가능 → build_recommendations 커맨드)
+"""
+
+
+class UserActivityStats(models.Model):
+    """
+    [설계의도]
+    - 마이페이지 대시보드/커뮤니티 통계를 사용자 PK 한 번의 조회로 제공하기 위한 카운터 테이블
+    - 기존: 요청마다 Enrollment/Wishlist/CourseReview/Post/Comment/Scrap/PostLike 7개 테이블 집계
+
+    [상세고려사항]
+    - user를 primary key로 사용 → 조회가 곧 PK 조회
+    - 카운터는 signals.py에서 각 도메인 모델의 생성/삭제/상태 변경 시 F() 증감으로 유지
+    - bulk_create 등 시그널을 우회한 적재 이후에는 rebuild_activity_stats로 재계산
+    - 필드명은 DashboardStatsSerializer/CommunityStatsSerializer의 응답 필드명과 일치시켜
+      인스턴스를 그대로 직렬화할 수 있도록 함
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='activity_stats',
+        help_text="집계 대상 사용자"
+    )
+
+    # 학습 활동 (courses)
+    enrolled_count = models.PositiveIntegerField(default=0, help_text="수강 중 강좌 수")
+    completed_count = models.PositiveIntegerField(default=0, help_text="수강 완료 강좌 수")
+    wishlist_count = models.PositiveIntegerField(default=0, help_text="찜한 강좌 수")
+    my_review_count = models.PositiveIntegerField(default=0, help_text="작성한 수강평 수")
+
+    # 커뮤니티 활동 (community)
+    post_count = models.PositiveIntegerField(default=0, help_text="작성한 게시글 수")
+    comment_count = models.PositiveIntegerField(default=0, help_text="작성한 댓글 수")
+    scrap_count = models.PositiveIntegerField(default=0, help_text="스크랩한 게시글 수")
+    received_likes_count = models.PositiveIntegerField(default=0, help_text="내 게시글이 받은 좋아요 수")
+
+    updated_at = models.DateTimeField(auto_now=True, help_text="마지막 갱신 시각")
+
+    class Meta:
+        db_table = 'mypage_user_activity_stats'
+        verbose_name = '사용자 활동 통계'
+        verbose_name_plural = '사용자 활동 통계 목록'
+
+    def __str__(self):
+        return f"{self.user} activity stats"
+
+
+class UserCourseRecommendation(models.Model):
+    """
+    [설계의도]
+    - 협업 필터링(수강/찜/수강평 상호작용) 기반 사용자별 추천 강좌 Top-N
+    - /mypage/recommendations/ 요청은 사용자 PK 조회 1회로 목록을 가져옴
+
+    [상세고려사항]
+    - build_recommendations 커맨드가 야간에 전체 재계산 후 upsert (요청 시 계산 없음)
+    - course_ids/scores는 점수 내림차순 병렬 리스트 (JSON 1컬럼 → 행 N개 대신 1행)
+    - 상호작용이 없는 사용자는 행이 없음 (콜드 스타트)
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='course_recommendation',
+        help_text="추천 대상 사용자"
+    )
+    course_ids = models.JSONField(default=list, help_text="추천 강좌 ID (점수 내림차순)")
+    scores = models.JSONField(default=list, help_text="추천 점수 (course_ids와 같은 순서)")
+    generated_at = models.DateTimeField(help_text="추천 계산 시각")
+
+    class Meta:
+        db_table = 'mypage_user_course_recommendation'
+        verbose_name = '사용자 추천 강좌'
+        verbose_name_plural = '사용자 추천 강좌 목록'
+
+    def __str__(self):
+        return f"{self.user} recommendations ({len(self.course_ids)})"
+
+
+class CourseAlsoEnrolled(models.Model):
+    """
+    [설계의도]
+    - "이 강좌를 수강한 사람들이 함께 수강한 강좌" 목록 (강좌 PK 조회 1회)
+
+    [상세고려사항]
+    - 수강(Enrollment, 수강취소 제외) 동시 발생 횟수 기준, 최소 공동 수강자 수 미만은 제외
+    - build_recommendations 커맨드가 UserCourseRecommendation과 함께 재계산
+    """
+    course = models.OneToOneField(
+        "courses.Course",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='also_enrolled',
+        help_text="기준 강좌"
+    )
+    course_ids = models.JSONField(default=list, help_text="함께 수강한 강좌 ID (공동 수강자 수 내림차순)")
+    counts = models.JSONField(default=list, help_text="공동 수강자 수 (course_ids와 같은 순서)")
+    generated_at = models.DateTimeField(help_text="계산 시각")
+
+    class Meta:
+        db_table = 'mypage_course_also_enrolled'
+        verbose_name = '함께 수강한 강좌'
+        verbose_name_plural = '함께 수강한 강좌 목록'
+
+    def __str__(self):
+        return f"{self.course} also enrolled ({len(self.course_ids)})"
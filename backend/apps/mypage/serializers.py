@@ -19,6 +19,7 @@ User = get_user_model() # 커스텀 유저 모델 가져오기
 """
 1. 대시보드
   - 1. DashboardStatsSerializer | 학습 현황 요약
+  - 2. MypageSummarySerializer  | 대시보드 + 커뮤니티 통계 통합 (3.1 정의 이후에 위치)
 
 2. 학습현황
   - 1. SimpleCourseSerializer           | 간단한 강좌 정보
@@ -26,6 +27,8 @@ User = get_user_model() # 커스텀 유저 모델 가져오기
   - 3. EnrollmentDetailSerializer       | 수강 상세 정보
   - 4. CourseReviewSerializer           | 수강평
   - 5. WishlistSerializer               | 위시리스트
+  - 6. RecommendedCourseSerializer      | 추천 강좌 (협업 필터링)
+  - 7. AlsoEnrolledCourseSerializer     | 함께 수강한 강좌
 
 3. 커뮤니티
   - 1. CommunityStatsSerializer | 커뮤니티 활동 통계
@@ -71,6 +74,8 @@ class DashboardStatsSerializer(serializers.Serializer):
 #   - 3. EnrollmentDetailSerializer       | 수강 상세 정보
 #   - 4. CourseReviewSerializer           | 수강평
 #   - 5. WishlistSerializer               | 위시리스트
+#   - 6. RecommendedCourseSerializer      | 추천 강좌 (협업 필터링)
+#   - 7. AlsoEnrolledCourseSerializer     | 함께 수강한 강좌
 # =========================
 
 
@@ -316,6 +321,30 @@ class WishlistSerializer(serializers.ModelSerializer):
         )
 
 
+# 2.6 RecommendedCourseSerializer
+class RecommendedCourseSerializer(serializers.Serializer):
+    """
+    [설계 의도]
+    - 협업 필터링 추천 결과 1건 (강좌 카드 + 추천 점수)
+
+    [상세 고려 사항]
+    - 입력은 CourseRecommendationService.get_for_user()의 results 항목 ({'course', 'score'})
+    - score는 상대 순위용 값 (사용자 간 비교 의미 없음)
+    """
+    course = SimpleCourseSerializer(read_only=True)
+    score = serializers.FloatField(read_only=True)
+
+
+# 2.7 AlsoEnrolledCourseSerializer
+class AlsoEnrolledCourseSerializer(serializers.Serializer):
+    """
+    [설계 의도]
+    - "이 강좌를 수강한 사람들이 함께 수강한 강좌" 1건 (강좌 카드 + 공동 수강자 수)
+    """
+    course = SimpleCourseSerializer(read_only=True)
+    count = serializers.IntegerField(read_only=True)
+
+
 
 # =========================
 # 3. 커뮤니티
@@ -357,6 +386,22 @@ class CommunityStatsSerializer(serializers.Serializer):
     received_likes_count = serializers.IntegerField(read_only=True) # 내가 쓴 글이 받은 좋아요 총합
 
 
+# 1.2 MypageSummarySerializer
+# - DashboardStatsSerializer, CommunityStatsSerializer를 모두 참조하므로 3.1 이후에 정의
+class MypageSummarySerializer(serializers.Serializer):
+    """
+    [설계 의도]
+    - 마이페이지 진입 시 필요한 두 통계를 한 번의 응답으로 제공
+
+    [상세 고려 사항]
+    - UserActivityStats 인스턴스 하나를 source='*'로 두 Serializer에 그대로 전달
+      → 기존 /dashboard/stats/, /community/stats/ 응답 형식을 그대로 재사용
+    """
+    dashboard = DashboardStatsSerializer(source='*', read_only=True)
+    community = CommunityStatsSerializer(source='*', read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True) # 카운터 마지막 갱신 시각
+
+
 
 # 3.2 MyPostSerializer
 class MyPostSerializer(serializers.ModelSerializer):
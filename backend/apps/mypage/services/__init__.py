@@ -0,0 +1,21 @@
+# backend/apps/mypage/services/__init__.py
+
+"""
+[설계 의도]
+- mypage 서비스 패키지 진입점
+- 각 서비스의 싱글톤 인스턴스를 외부에서 쉽게 가져올 수 있도록 export
+
+[사용 예시]
+from apps.mypage.services import get_activity_stats_service
+from apps.mypage.services import get_recommendation_service
+"""
+
+from .activity_stats_service import get_activity_stats_service, ActivityStatsService
+from .recommendation_service import get_recommendation_service, CourseRecommendationService
+
+__all__ = [
+    'get_activity_stats_service',
+    'ActivityStatsService',
+    'get_recommendation_service',
+    'CourseRecommendationService',
+]
@@ -0,0 +1,203 @@
+# apps/mypage/services/activity_stats_service.py
+"""
+[설계 의도]
+- 사용자별 활동 카운터(UserActivityStats)의 조회/증감/재계산을 담당하는 서비스
+- View는 PK 조회만, 시그널은 증감만, 커맨드는 재계산만 호출하도록 책임 분리
+
+[상세 고려 사항]
+- 증감은 F() + Greatest(0)로 DB에서 원자적으로 처리 (동시 요청 경쟁 조건 방지, 음수 방지)
+- 카운터 행이 없으면 증감을 건너뛰고, 첫 조회 시 원본 테이블로부터 계산하여 생성
+  → 사용자 삭제(CASCADE) 도중 시그널이 행을 되살리는 문제를 피하기 위함
+- 전체 재계산은 테이블별 GROUP BY 집계 7회 + bulk upsert로 처리 (사용자 수와 무관한 쿼리 수)
+"""
+
+from typing import Dict, Iterable, Optional
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, F, Q, Value
+from django.db.models.functions import Greatest
+
+from apps.community.models import Comment, Post, PostLike, Scrap
+from apps.courses.models import CourseReview, Enrollment, Wishlist
+from apps.mypage.models import UserActivityStats
+
+User = get_user_model()
+
+
+class ActivityStatsService:
+    """
+    사용자 활동 카운터 프로젝션 관리 서비스
+
+    [설계 의도]
+    - 대시보드 통계(DashboardStatsView), 커뮤니티 통계(CommunityStatsView),
+      통합 요약(MypageSummaryView)이 모두 같은 카운터 행을 읽도록 일원화
+    """
+
+    COUNTER_FIELDS = (
+        'enrolled_count',
+        'completed_count',
+        'wishlist_count',
+        'my_review_count',
+        'post_count',
+        'comment_count',
+        'scrap_count',
+        'received_likes_count',
+    )
+
+    # Enrollment.status → 카운터 필드 (수강취소는 집계하지 않음)
+    ENROLLMENT_STATUS_FIELDS = {
+        Enrollment.Status.ENROLLED: 'enrolled_count',
+        Enrollment.Status.COMPLETED: 'completed_count',
+    }
+
+    DEFAULT_BATCH_SIZE = 1000
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get_stats(self, user) -> UserActivityStats:
+        """
+        사용자 활동 카운터 조회 (PK 조회 1회)
+
+        - 행이 아직 없으면(신규 기능 배포 직후 등) 원본 테이블로부터 계산하여 생성
+        """
+        try:
+            return UserActivityStats.objects.get(pk=user.pk)
+        except UserActivityStats.DoesNotExist:
+            return self.rebuild_for_user(user.pk)
+
+    # ------------------------------------------------------------------
+    # 증감
+    # ------------------------------------------------------------------
+    def increment(self, user_id: Optional[int], **deltas: int) -> None:
+        """
+        카운터 증감
+
+        Args:
+            user_id: 대상 사용자 PK
+            **deltas: {'post_count': 1, 'scrap_count': -1, ...}
+        """
+        if not user_id or not deltas:
+            return
+        self._apply(UserActivityStats.objects.filter(pk=user_id), deltas)
+
+    def increment_post_author(self, post_id: int, **deltas: int) -> None:
+        """
+        게시글 작성자의 카운터 증감 (받은 좋아요 수)
+
+        - 작성자 PK를 Python으로 가져오지 않고 Subquery로 UPDATE 한 번에 처리
+        """
+        if not post_id or not deltas:
+            return
+        author_ids = Post.objects.filter(pk=post_id).values('author_id')
+        self._apply(UserActivityStats.objects.filter(pk__in=author_ids), deltas)
+
+    def _apply(self, queryset, deltas: Dict[str, int]) -> None:
+        updates = {
+            field: Greatest(F(field) + delta, Value(0))
+            for field, delta in deltas.items()
+            if delta
+        }
+        if updates:
+            queryset.update(**updates)
+
+    # ------------------------------------------------------------------
+    # 재계산
+    # ------------------------------------------------------------------
+    def compute_counts(self, user_ids: Optional[Iterable[int]] = None) -> Dict[int, Dict[str, int]]:
+        """
+        원본 테이블로부터 사용자별 카운터 계산
+
+        Returns:
+            {user_id: {'enrolled_count': ..., ...}}  (활동이 없는 사용자는 포함되지 않음)
+        """
+        user_ids = list(user_ids) if user_ids is not None else None
+
+        def scoped(queryset, user_field):
+            if user_ids is None:
+                return queryset
+            return queryset.filter(**{f'{user_field}__in': user_ids})
+
+        counts: Dict[int, Dict[str, int]] = {}
+
+        def merge(user_id, field, value):
+            if user_id is None:
+                return
+            counts.setdefault(user_id, dict.fromkeys(self.COUNTER_FIELDS, 0))[field] = value
+
+        enrollment_rows = scoped(Enrollment.objects, 'user').values('user').annotate(
+            enrolled=Count('id', filter=Q(status=Enrollment.Status.ENROLLED)),
+            completed=Count('id', filter=Q(status=Enrollment.Status.COMPLETED)),
+        )
+        for row in enrollment_rows:
+            merge(row['user'], 'enrolled_count', row['enrolled'])
+            merge(row['user'], 'completed_count', row['completed'])
+
+        simple_sources = (
+            (Wishlist.objects, 'user', 'wishlist_count'),
+            (CourseReview.objects, 'user', 'my_review_count'),
+            (Post.objects, 'author', 'post_count'),
+            (Comment.objects, 'author', 'comment_count'),
+            (Scrap.objects, 'user', 'scrap_count'),
+            (PostLike.objects, 'post__author', 'received_likes_count'),
+        )
+        for manager, user_field, counter_field in simple_sources:
+            rows = scoped(manager, user_field).values(user_field).annotate(cnt=Count('id'))
+            for row in rows:
+                merge(row[user_field], counter_field, row['cnt'])
+
+        return counts
+
+    def rebuild_for_user(self, user_id: int) -> UserActivityStats:
+        """단일 사용자 카운터 재계산"""
+        counts = self.compute_counts([user_id]).get(user_id, dict.fromkeys(self.COUNTER_FIELDS, 0))
+        stats, _ = UserActivityStats.objects.update_or_create(user_id=user_id, defaults=counts)
+        return stats
+
+    def rebuild(self, user_ids: Optional[Iterable[int]] = None, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        카운터 일괄 재계산
+
+        - 활동이 없는 사용자도 0으로 행을 만들어 둠 (조회 시 lazy 계산을 피하기 위함)
+        - bulk_create(update_conflicts=True)로 INSERT ... ON CONFLICT DO UPDATE
+
+        Returns:
+            갱신한 사용자 수
+        """
+        user_queryset = User.objects.all()
+        if user_ids is not None:
+            user_ids = list(user_ids)
+            user_queryset = user_queryset.filter(pk__in=user_ids)
+        target_ids = list(user_queryset.values_list('pk', flat=True))
+
+        counts = self.compute_counts(user_ids)
+        zeros = dict.fromkeys(self.COUNTER_FIELDS, 0)
+
+        rows = [
+            UserActivityStats(user_id=user_id, **counts.get(user_id, zeros))
+            for user_id in target_ids
+        ]
+        UserActivityStats.objects.bulk_create(
+            rows,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['user'],
+            update_fields=[*self.COUNTER_FIELDS, 'updated_at'],
+        )
+        return len(rows)
+
+
+# 싱글톤 인스턴스 관리
+_activity_stats_service_instance = None
+
+def get_activity_stats_service() -> ActivityStatsService:
+    """
+    ActivityStatsService 싱글톤 인스턴스 반환
+
+    - 서비스는 상태를 가지지 않으므로
+      단일 인스턴스 재사용이 적합
+    """
+    global _activity_stats_service_instance
+    if _activity_stats_service_instance is None:
+        _activity_stats_service_instance = ActivityStatsService()
+    return _activity_stats_service_instance
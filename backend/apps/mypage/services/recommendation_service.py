@@ -0,0 +1,359 @@
+# apps/mypage/services/recommendation_service.py
+"""
+[설계 의도]
+- 수강(Enrollment)/찜(Wishlist)/수강평(CourseReview) 상호작용 기반 협업 필터링 추천
+- 기존 추천(CourseRecommendationView)은 임베딩 kNN(내용 기반)만 사용 → 사용자 행동 데이터는 미사용
+- 계산은 야간 배치(build_recommendations)에서만 수행하고, 요청은 저장된 결과를 PK 조회 1회로 읽음
+
+[상세 고려 사항]
+- 사용자×강좌 상호작용 행렬: scipy CSR (같은 사용자-강좌 쌍의 가중치는 합산 후 log1p로 완화)
+  - 수강 완료 3, 수강 중 2, 수강취소 0 / 찜 1 / 수강평 (평점 - 2, 2점 이하는 0)
+  - 가중치가 0인 상호작용도 "이미 본 강좌"로 기록하여 추천에서 제외
+- 강좌-강좌 유사도: 가중치 열 정규화 후 코사인 (X^T X), 강좌마다 상위 RECOMMENDATION_NEIGHBORS개만 유지
+- 사용자 점수: X @ S (사용자 청크 단위), 청크는 joblib 스레드로 병렬 처리
+  - scipy 희소 행렬 곱/NumPy 정렬은 GIL을 해제 → 스레드로 여러 코어 사용 가능
+  - 프로세스 백엔드는 워커마다 Django 초기화가 필요하므로 사용하지 않음
+- 함께 수강한 강좌: 수강(수강취소 제외) 이진 행렬의 공동 수강자 수 (E^T E), ALSO_ENROLLED_MIN_SUPPORT명 미만 제외
+- 저장: bulk upsert 후 이번 계산에 포함되지 않은 이전 행 삭제 (한 트랜잭션)
+- 조회: 종료(finished)된 강좌는 응답에서 제외 (Course.status 사전 계산 값)
+- implicit ALS 등 행렬 분해는 추가 의존성이 필요하므로 사용하지 않음 (동시 발생 기반)
+"""
+
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+from joblib import Parallel, delayed
+from scipy import sparse
+
+from apps.courses.models import Course, CourseReview, Enrollment, Wishlist
+from apps.mypage.models import CourseAlsoEnrolled, UserCourseRecommendation
+
+User = get_user_model()
+
+# =========================
+# 추천 설정 상수
+# =========================
+
+RECOMMENDATION_TOP_N = int(os.environ.get('RECOMMENDATION_TOP_N', 20))            # 사용자별 저장 개수
+RECOMMENDATION_NEIGHBORS = int(os.environ.get('RECOMMENDATION_NEIGHBORS', 50))    # 강좌별 유사 강좌 수
+ALSO_ENROLLED_TOP_N = int(os.environ.get('ALSO_ENROLLED_TOP_N', 10))              # 강좌별 저장 개수
+ALSO_ENROLLED_MIN_SUPPORT = int(os.environ.get('ALSO_ENROLLED_MIN_SUPPORT', 2))   # 최소 공동 수강자 수
+
+
+def _top_n_for_rows(weights, seen, similarity, top_n):
+    """
+    사용자 청크 Top-N (joblib 작업 단위)
+
+    Returns:
+        [(강좌 인덱스 배열, 점수 배열), ...]  # 청크의 사용자 순서, 점수 내림차순
+    """
+    scores = (weights @ similarity).toarray().astype(np.float32, copy=False)
+    scores[seen.nonzero()] = 0  # 이미 상호작용한 강좌 제외
+
+    results = []
+    for row in scores:
+        candidates = np.flatnonzero(row > 0)
+        if len(candidates) > top_n:
+            candidates = candidates[np.argpartition(row[candidates], -top_n)[-top_n:]]
+        order = candidates[np.lexsort((candidates, -row[candidates]))]  # 점수 내림차순, 같으면 강좌 순
+        results.append((order, row[order]))
+    return results
+
+
+def _top_k_per_row(matrix, k):
+    """CSR 행마다 값이 큰 k개만 유지"""
+    keep = np.zeros(len(matrix.data), dtype=bool)
+    for row in range(matrix.shape[0]):
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        if end - start <= k:
+            keep[start:end] = True
+        else:
+            keep[start + np.argpartition(matrix.data[start:end], -k)[-k:]] = True
+
+    pruned = matrix.copy()
+    pruned.data[~keep] = 0
+    pruned.eliminate_zeros()
+    return pruned
+
+
+class CourseRecommendationService:
+    """
+    협업 필터링 추천 계산/저장/조회 서비스
+
+    [설계 의도]
+    - 커맨드는 build → save만, View는 get_for_user / get_also_enrolled만 호출
+    """
+
+    ENROLLMENT_WEIGHTS = {
+        Enrollment.Status.COMPLETED: 3.0,
+        Enrollment.Status.ENROLLED: 2.0,
+        Enrollment.Status.DROPPED: 0.0,
+    }
+    WISHLIST_WEIGHT = 1.0
+    REVIEW_RATING_OFFSET = 2  # 수강평 가중치 = max(평점 - 2, 0)
+
+    DEFAULT_CHUNK_SIZE = 1000
+    DEFAULT_BATCH_SIZE = 1000
+
+    # ------------------------------------------------------------------
+    # 상호작용 행렬
+    # ------------------------------------------------------------------
+    def load_interactions(self) -> Optional[Dict]:
+        """
+        상호작용 행렬 구성 (테이블별 values_list 1회)
+
+        Returns:
+            dict | None: {
+                'user_ids': (U,) int64, 'course_ids': (I,) int64,
+                'weights': U×I CSR float32, 'seen': U×I CSR (이진), 'enrolled': U×I CSR (이진)
+            }  # 상호작용이 없으면 None
+        """
+        users, courses, weights, enrolled = [], [], [], []
+
+        def add(user_id, course_id, weight, is_enrollment=False):
+            users.append(user_id)
+            courses.append(course_id)
+            weights.append(weight)
+            enrolled.append(is_enrollment)
+
+        for user_id, course_id, status in Enrollment.objects.values_list(
+            'user_id', 'course_id', 'status'
+        ).iterator(chunk_size=5000):
+            add(user_id, course_id, self.ENROLLMENT_WEIGHTS.get(status, 0.0),
+                is_enrollment=status != Enrollment.Status.DROPPED)
+
+        for user_id, course_id in Wishlist.objects.values_list('user_id', 'course_id').iterator(chunk_size=5000):
+            add(user_id, course_id, self.WISHLIST_WEIGHT)
+
+        for user_id, course_id, rating in CourseReview.objects.values_list(
+            'user_id', 'course_id', 'rating'
+        ).iterator(chunk_size=5000):
+            add(user_id, course_id, float(max(rating - self.REVIEW_RATING_OFFSET, 0)))
+
+        if not users:
+            return None
+
+        user_ids, user_index = np.unique(np.asarray(users, dtype=np.int64), return_inverse=True)
+        course_ids, course_index = np.unique(np.asarray(courses, dtype=np.int64), return_inverse=True)
+        shape = (len(user_ids), len(course_ids))
+
+        def binary(mask):
+            matrix = sparse.csr_matrix(
+                (np.ones(int(mask.sum()), dtype=np.float32), (user_index[mask], course_index[mask])),
+                shape=shape,
+            )
+            matrix.data[:] = 1  # 중복 쌍 합산 결과를 1로
+            return matrix
+
+        # COO → CSR 변환 시 같은 (사용자, 강좌) 가중치는 합산됨
+        weight_matrix = sparse.csr_matrix(
+            (np.asarray(weights, dtype=np.float32), (user_index, course_index)), shape=shape
+        )
+        weight_matrix.data = np.log1p(weight_matrix.data)
+        weight_matrix.eliminate_zeros()
+
+        return {
+            'user_ids': user_ids,
+            'course_ids': course_ids,
+            'weights': weight_matrix,
+            'seen': binary(np.ones(len(users), dtype=bool)),
+            'enrolled': binary(np.asarray(enrolled, dtype=bool)),
+        }
+
+    # ------------------------------------------------------------------
+    # 계산
+    # ------------------------------------------------------------------
+    def item_similarity(self, weights, neighbors: int = RECOMMENDATION_NEIGHBORS):
+        """강좌-강좌 코사인 유사도 (자기 자신 제외, 강좌별 상위 neighbors개)"""
+        norms = np.sqrt(np.asarray(weights.multiply(weights).sum(axis=0)).ravel())
+        inverse = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+        normalized = weights @ sparse.diags(inverse.astype(np.float32))
+
+        similarity = (normalized.T @ normalized).tocsr()
+        similarity = (similarity - sparse.diags(similarity.diagonal())).tocsr()
+        similarity.eliminate_zeros()
+        return _top_k_per_row(similarity, neighbors)
+
+    def user_recommendations(
+        self,
+        interactions: Dict,
+        top_n: int = RECOMMENDATION_TOP_N,
+        neighbors: int = RECOMMENDATION_NEIGHBORS,
+        n_jobs: int = -1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[tuple]:
+        """
+        사용자별 Top-N
+
+        Returns:
+            [(user_id, [course_id, ...], [score, ...]), ...]  # 추천이 없는 사용자는 제외
+        """
+        weights, seen = interactions['weights'], interactions['seen']
+        similarity = self.item_similarity(weights, neighbors)
+
+        starts = range(0, weights.shape[0], chunk_size)
+        chunks = Parallel(n_jobs=n_jobs, prefer='threads')(
+            delayed(_top_n_for_rows)(
+                weights[start:start + chunk_size], seen[start:start + chunk_size], similarity, top_n
+            )
+            for start in starts
+        )
+
+        user_ids, course_ids = interactions['user_ids'], interactions['course_ids']
+        results = []
+        for start, chunk in zip(starts, chunks):
+            for offset, (columns, scores) in enumerate(chunk):
+                if len(columns):
+                    results.append((
+                        int(user_ids[start + offset]),
+                        course_ids[columns].tolist(),
+                        [round(float(score), 4) for score in scores],
+                    ))
+        return results
+
+    def also_enrolled(
+        self,
+        interactions: Dict,
+        top_n: int = ALSO_ENROLLED_TOP_N,
+        min_support: int = ALSO_ENROLLED_MIN_SUPPORT,
+    ) -> List[tuple]:
+        """
+        강좌별 함께 수강한 강좌
+
+        Returns:
+            [(course_id, [course_id, ...], [공동 수강자 수, ...]), ...]
+        """
+        enrolled = interactions['enrolled']
+        co_counts = (enrolled.T @ enrolled).tocsr()
+        co_counts = (co_counts - sparse.diags(co_counts.diagonal())).tocsr()
+        co_counts.data[co_counts.data < min_support] = 0
+        co_counts.eliminate_zeros()
+
+        course_ids = interactions['course_ids']
+        results = []
+        for row in range(co_counts.shape[0]):
+            start, end = co_counts.indptr[row], co_counts.indptr[row + 1]
+            if start == end:
+                continue
+            columns = co_counts.indices[start:end]
+            counts = co_counts.data[start:end]
+            order = np.lexsort((columns, -counts))[:top_n]
+            results.append((
+                int(course_ids[row]),
+                course_ids[columns[order]].tolist(),
+                counts[order].astype(int).tolist(),
+            ))
+        return results
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+    def save(self, user_rows: List[tuple], course_rows: List[tuple], batch_size: int = DEFAULT_BATCH_SIZE) -> Dict:
+        """
+        계산 결과 upsert + 이전 결과 정리 (한 트랜잭션)
+
+        - 계산 도중 삭제된 사용자/강좌는 제외 (FK 위반 방지)
+
+        Returns:
+            {'users': 저장한 사용자 수, 'courses': 저장한 강좌 수}
+        """
+        generated_at = timezone.now()
+        valid_users = set(User.objects.filter(pk__in=[row[0] for row in user_rows]).values_list('pk', flat=True))
+        valid_courses = set(Course.objects.filter(pk__in=[row[0] for row in course_rows]).values_list('pk', flat=True))
+
+        with transaction.atomic():
+            UserCourseRecommendation.objects.bulk_create(
+                [
+                    UserCourseRecommendation(user_id=user_id, course_ids=ids, scores=scores, generated_at=generated_at)
+                    for user_id, ids, scores in user_rows
+                    if user_id in valid_users
+                ],
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=['user'],
+                update_fields=['course_ids', 'scores', 'generated_at'],
+            )
+            UserCourseRecommendation.objects.filter(generated_at__lt=generated_at).delete()
+
+            CourseAlsoEnrolled.objects.bulk_create(
+                [
+                    CourseAlsoEnrolled(course_id=course_id, course_ids=ids, counts=counts, generated_at=generated_at)
+                    for course_id, ids, counts in course_rows
+                    if course_id in valid_courses
+                ],
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=['course'],
+                update_fields=['course_ids', 'counts', 'generated_at'],
+            )
+            CourseAlsoEnrolled.objects.filter(generated_at__lt=generated_at).delete()
+
+        return {'users': len(valid_users), 'courses': len(valid_courses)}
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get_for_user(self, user, limit: int = RECOMMENDATION_TOP_N) -> Dict:
+        """
+        사용자 추천 강좌 (추천 행 PK 조회 1회 + 강좌 in_bulk 1회)
+
+        Returns:
+            dict: {'generated_at': 계산 시각 | None, 'results': [{'course': Course, 'score': float}, ...]}
+        """
+        row = UserCourseRecommendation.objects.filter(pk=user.pk).first()
+        if row is None:
+            return {'generated_at': None, 'results': []}
+        return {
+            'generated_at': row.generated_at,
+            'results': self._attach_courses(row.course_ids, row.scores, 'score', limit),
+        }
+
+    def get_also_enrolled(self, course_id: int, limit: int = ALSO_ENROLLED_TOP_N) -> Dict:
+        """
+        함께 수강한 강좌 (강좌 PK 조회 1회 + 강좌 in_bulk 1회)
+
+        Returns:
+            dict: {'generated_at': 계산 시각 | None, 'results': [{'course': Course, 'count': int}, ...]}
+        """
+        row = CourseAlsoEnrolled.objects.filter(pk=course_id).first()
+        if row is None:
+            return {'generated_at': None, 'results': []}
+        return {
+            'generated_at': row.generated_at,
+            'results': self._attach_courses(row.course_ids, row.counts, 'count', limit),
+        }
+
+    @staticmethod
+    def _attach_courses(course_ids, values, value_name, limit):
+        """저장된 순서 유지, 삭제/종료된 강좌 제외"""
+        courses = Course.objects.defer('embedding', 'summary', 'raw_summary').in_bulk(course_ids)
+        results = []
+        for course_id, value in zip(course_ids, values):
+            course = courses.get(course_id)
+            if course is None or course.status == Course.STATUS_FINISHED:
+                continue
+            results.append({'course': course, value_name: value})
+            if len(results) >= limit:
+                break
+        return results
+
+
+# =========================
+# 싱글톤 인스턴스 관리
+# =========================
+
+_recommendation_service_instance = None
+
+
+def get_recommendation_service() -> CourseRecommendationService:
+    """CourseRecommendationService 싱글톤 인스턴스 반환"""
+    global _recommendation_service_instance
+
+    if _recommendation_service_instance is None:
+        _recommendation_service_instance = CourseRecommendationService()
+
+    return _recommendation_service_instance
@@ -0,0 +1,130 @@
+# backend/apps/mypage/signals.py
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from apps.community.models import Comment, Post, PostLike, Scrap
+from apps.courses.models import CourseReview, Enrollment, Wishlist
+from apps.mypage.models import UserActivityStats
+from apps.mypage.services import get_activity_stats_service
+
+
+# 개요
+"""
+UserActivityStats 카운터 유지 (쓰기 경로 → 프로젝션 반영)
+
+1. courses
+- Enrollment   | 생성/삭제/상태 변경 → enrolled_count, completed_count
+- Wishlist     | 생성/삭제          → wishlist_count
+- CourseReview | 생성/삭제          → my_review_count
+
+2. community
+- Post         | 생성/삭제          → post_count (작성자)
+- Comment      | 생성/삭제          → comment_count (작성자)
+- Scrap        | 생성/삭제          → scrap_count
+- PostLike     | 생성/삭제          → received_likes_count (게시글 작성자)
+
+3. accounts
+- User 생성 시 0으로 초기화된 카운터 행 생성
+
+[상세 고려사항]
+- mypage View(수강평/찜), courses, community View와 관리자 화면 등
+  모든 ORM 쓰기 경로를 한 곳에서 처리하기 위해 시그널 사용
+- 게시글/사용자 삭제 시 CASCADE로 함께 지워지는 댓글/좋아요/스크랩도
+  각각 post_delete가 발생하므로 연쇄적으로 카운터가 맞춰짐
+- bulk_create/update()는 시그널을 우회하므로 rebuild_activity_stats로 재계산
+"""
+
+
+def _service():
+    return get_activity_stats_service()
+
+
+# =========================
+# 1) accounts
+# =========================
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def create_activity_stats(sender, instance, created, **kwargs):
+    if created:
+        UserActivityStats.objects.get_or_create(user=instance)
+
+
+# =========================
+# 2) courses
+# =========================
+
+@receiver(post_init, sender=Enrollment)
+def remember_enrollment_status(sender, instance, **kwargs):
+    # 상태 변경(수강중 → 수강완료 등) 감지를 위해 로드 시점의 상태 보관
+    instance._original_status = instance.status
+
+
+@receiver(post_save, sender=Enrollment)
+def update_enrollment_counts_on_save(sender, instance, created, **kwargs):
+    status_fields = _service().ENROLLMENT_STATUS_FIELDS
+    deltas = {}
+
+    if created:
+        field = status_fields.get(instance.status)
+        if field:
+            deltas[field] = 1
+    elif instance._original_status != instance.status:
+        old_field = status_fields.get(instance._original_status)
+        new_field = status_fields.get(instance.status)
+        if old_field:
+            deltas[old_field] = deltas.get(old_field, 0) - 1
+        if new_field:
+            deltas[new_field] = deltas.get(new_field, 0) + 1
+
+    instance._original_status = instance.status
+    _service().increment(instance.user_id, **deltas)
+
+
+@receiver(post_delete, sender=Enrollment)
+def update_enrollment_counts_on_delete(sender, instance, **kwargs):
+    field = _service().ENROLLMENT_STATUS_FIELDS.get(instance.status)
+    if field:
+        _service().increment(instance.user_id, **{field: -1})
+
+
+# 생성/삭제만 의미가 있는 단순 카운터: (모델, 사용자 FK 속성명, 카운터 필드)
+SIMPLE_COUNTERS = (
+    (Wishlist, 'user_id', 'wishlist_count'),
+    (CourseReview, 'user_id', 'my_review_count'),
+    (Post, 'author_id', 'post_count'),
+    (Comment, 'author_id', 'comment_count'),
+    (Scrap, 'user_id', 'scrap_count'),
+)
+
+
+def _connect_simple_counter(model, user_attr, field):
+    def on_save(sender, instance, created, **kwargs):
+        if created:
+            _service().increment(getattr(instance, user_attr), **{field: 1})
+
+    def on_delete(sender, instance, **kwargs):
+        _service().increment(getattr(instance, user_attr), **{field: -1})
+
+    post_save.connect(on_save, sender=model, weak=False, dispatch_uid=f'activity_stats_{field}_save')
+    post_delete.connect(on_delete, sender=model, weak=False, dispatch_uid=f'activity_stats_{field}_delete')
+
+
+for _model, _user_attr, _field in SIMPLE_COUNTERS:
+    _connect_simple_counter(_model, _user_attr, _field)
+
+
+# =========================
+# 3) community - 받은 좋아요
+# =========================
+
+@receiver(post_save, sender=PostLike)
+def update_received_likes_on_save(sender, instance, created, **kwargs):
+    if created:
+        _service().increment_post_author(instance.post_id, received_likes_count=1)
+
+
+@receiver(post_delete, sender=PostLike)
+def update_received_likes_on_delete(sender, instance, **kwargs):
+    _service().increment_post_author(instance.post_id, received_likes_count=-1)
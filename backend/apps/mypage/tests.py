@@ -1,3 +1,264 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
 
-# Create your tests here.
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from scipy import sparse
+
+from apps.community.models import Board, Comment, Post, PostLike, Scrap
+from apps.courses.models import Course, CourseReview, Enrollment, Wishlist
+from apps.mypage.models import UserActivityStats, UserCourseRecommendation
+from apps.mypage.services.activity_stats_service import ActivityStatsService
+from apps.mypage.services.recommendation_service import CourseRecommendationService, _top_n_for_rows
+
+User = get_user_model()
+
+
+class RecommendationComputationTests(SimpleTestCase):
+    """
+    [설계 의도]
+    - 협업 필터링 Top-N 선택(이미 본 강좌 제외, 점수 내림차순, 동점은 강좌 순)과
+      함께 수강한 강좌 집계를 고정 (DB 없이 행렬만으로 검증)
+    """
+
+    def setUp(self):
+        self.service = CourseRecommendationService()
+
+    @staticmethod
+    def _csr(rows):
+        return sparse.csr_matrix(np.asarray(rows, dtype=np.float32))
+
+    def test_top_n_orders_by_score_then_course(self):
+        weights = self._csr([[1, 0, 0, 0]])
+        seen = self._csr([[1, 0, 0, 0]])
+        similarity = self._csr([
+            [0, 0.5, 0.5, 0.9],
+            [0, 0, 0, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 0],
+        ])
+
+        [(columns, scores)] = _top_n_for_rows(weights, seen, similarity, top_n=3)
+        self.assertEqual(columns.tolist(), [3, 1, 2])
+        np.testing.assert_allclose(scores, [0.9, 0.5, 0.5])
+
+        [(columns, _)] = _top_n_for_rows(weights, seen, self._csr([[0, 0.5, 0.4, 0.9]] + [[0] * 4] * 3), top_n=2)
+        self.assertEqual(columns.tolist(), [3, 1])
+
+    def test_top_n_excludes_seen_courses_even_with_zero_weight(self):
+        # 수강취소(가중치 0)도 seen에 기록 → 추천에서 제외
+        weights = self._csr([[1, 0, 0, 0]])
+        seen = self._csr([[1, 0, 0, 1]])
+        similarity = self._csr([[0, 0.5, 0.4, 0.9]] + [[0] * 4] * 3)
+
+        [(columns, _)] = _top_n_for_rows(weights, seen, similarity, top_n=5)
+        self.assertEqual(columns.tolist(), [1, 2])
+
+    def _interactions(self):
+        enrolled = self._csr([
+            [1, 1, 0],
+            [1, 1, 1],
+            [0, 1, 1],
+        ])
+        return {
+            'user_ids': np.array([1, 2, 3], dtype=np.int64),
+            'course_ids': np.array([10, 20, 30], dtype=np.int64),
+            'weights': enrolled.copy(),
+            'seen': enrolled.copy(),
+            'enrolled': enrolled,
+        }
+
+    def test_user_recommendations_skip_users_without_new_courses(self):
+        results = self.service.user_recommendations(self._interactions(), top_n=5, n_jobs=1, chunk_size=2)
+
+        self.assertEqual([(user_id, ids) for user_id, ids, _ in results], [(1, [30]), (3, [10])])
+
+    def test_also_enrolled_applies_min_support(self):
+        results = self.service.also_enrolled(self._interactions(), top_n=5, min_support=2)
+
+        self.assertEqual(results, [
+            (10, [20], [2]),
+            (20, [10, 30], [2, 2]),
+            (30, [20], [2]),
+        ])
+
+
+class RecommendationLookupTests(TestCase):
+    """저장된 추천 조회: 저장 순서 유지, 삭제/종료된 강좌 제외, limit 적용"""
+
+    @classmethod
+    def setUpTestData(cls):
+        today = timezone.localdate()
+        cls.user = User.objects.create_user(
+            username='learner', email='learner@example.com', password='pw-1234!', name='학습자'
+        )
+        cls.first = Course.objects.create(kmooc_id='RC-1', name='첫 번째', professor='A')
+        cls.finished = Course.objects.create(
+            kmooc_id='RC-2', name='종료 강좌', professor='B', study_end=today - timedelta(days=1)
+        )
+        cls.second = Course.objects.create(kmooc_id='RC-3', name='두 번째', professor='C')
+        cls.third = Course.objects.create(kmooc_id='RC-4', name='세 번째', professor='D')
+        UserCourseRecommendation.objects.create(
+            user=cls.user,
+            course_ids=[cls.first.pk, cls.finished.pk, 999999, cls.second.pk, cls.third.pk],
+            scores=[0.9, 0.8, 0.7, 0.6, 0.5],
+            generated_at=timezone.now(),
+        )
+
+    def test_finished_and_deleted_courses_are_skipped(self):
+        result = CourseRecommendationService().get_for_user(self.user, limit=2)
+
+        self.assertEqual(
+            [(item['course'].pk, item['score']) for item in result['results']],
+            [(self.first.pk, 0.9), (self.second.pk, 0.6)],
+        )
+        self.assertIsNotNone(result['generated_at'])
+
+    def test_user_without_recommendations(self):
+        other = User.objects.create_user(
+            username='newbie', email='newbie@example.com', password='pw-1234!', name='신규'
+        )
+        self.assertEqual(CourseRecommendationService().get_for_user(other), {'generated_at': None, 'results': []})
+
+
+class ActivityStatsSignalTests(TestCase):
+    """
+    [설계 의도]
+    - 생성/삭제/상태 변경 경로마다 UserActivityStats의 해당 카운터만 정확히 한 번 움직이는지 고정
+    - 재계산(rebuild_activity_stats)과 조회 시 lazy 계산이 시그널로 유지한 값과 같은지 확인
+    """
+
+    COUNTERS = ActivityStatsService.COUNTER_FIELDS
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='author', email='author@example.com', password='pw-1234!', name='작성자'
+        )
+        cls.reader = User.objects.create_user(
+            username='reader', email='reader@example.com', password='pw-1234!', name='독자'
+        )
+        cls.course = Course.objects.create(kmooc_id='AS-1', name='통계 강좌', professor='A')
+        cls.other_course = Course.objects.create(kmooc_id='AS-2', name='다른 강좌', professor='B')
+        cls.board = Board.objects.create(name='자유게시판', slug='free_talk')
+
+    def _stats(self, user):
+        stats = UserActivityStats.objects.get(pk=user.pk)
+        return {field: getattr(stats, field) for field in self.COUNTERS}
+
+    def _expect(self, **counts):
+        return {field: counts.get(field, 0) for field in self.COUNTERS}
+
+    def _post(self, author=None):
+        return Post.objects.create(author=author or self.author, board=self.board, title='제목', content='내용')
+
+    def test_user_creation_starts_from_zero(self):
+        self.assertEqual(self._stats(self.author), self._expect())
+
+    def test_enrollment_create_status_change_and_delete(self):
+        enrollment = Enrollment.objects.create(user=self.reader, course=self.course)
+        Enrollment.objects.create(user=self.reader, course=self.other_course, status=Enrollment.Status.DROPPED)
+        self.assertEqual(self._stats(self.reader), self._expect(enrolled_count=1))
+
+        enrollment.status = Enrollment.Status.COMPLETED
+        enrollment.save()
+        enrollment.save()  # 상태 변경 없는 재저장은 카운터를 건드리지 않음
+        self.assertEqual(self._stats(self.reader), self._expect(completed_count=1))
+
+        reloaded = Enrollment.objects.get(pk=enrollment.pk)
+        reloaded.status = Enrollment.Status.DROPPED
+        reloaded.save()
+        self.assertEqual(self._stats(self.reader), self._expect())
+
+        Enrollment.objects.filter(user=self.reader).delete()
+        self.assertEqual(self._stats(self.reader), self._expect())
+
+    def test_wishlist_and_review(self):
+        wish = Wishlist.objects.create(user=self.reader, course=self.course)
+        review = CourseReview.objects.create(user=self.reader, course=self.course, rating=4, review_text='좋아요')
+        self.assertEqual(self._stats(self.reader), self._expect(wishlist_count=1, my_review_count=1))
+
+        review.rating = 5
+        review.save()
+        self.assertEqual(self._stats(self.reader), self._expect(wishlist_count=1, my_review_count=1))
+
+        wish.delete()
+        review.delete()
+        self.assertEqual(self._stats(self.reader), self._expect())
+
+    def test_post_comment_scrap_and_cascade(self):
+        post = self._post()
+        Comment.objects.create(author=self.reader, post=post, content='댓글')
+        Scrap.objects.create(user=self.reader, post=post)
+        PostLike.objects.create(user=self.reader, post=post)
+        self.assertEqual(self._stats(self.author), self._expect(post_count=1, received_likes_count=1))
+        self.assertEqual(self._stats(self.reader), self._expect(comment_count=1, scrap_count=1))
+
+        # 게시글 삭제 → CASCADE로 지워지는 댓글/스크랩/좋아요도 각각 한 번씩 차감
+        post.delete()
+        self.assertEqual(self._stats(self.author), self._expect())
+        self.assertEqual(self._stats(self.reader), self._expect())
+
+    def test_double_like_and_unlike_of_non_liked_post(self):
+        post = self._post()
+
+        PostLike.objects.get_or_create(post=post, user=self.reader)
+        PostLike.objects.get_or_create(post=post, user=self.reader)  # 이미 좋아요 → 생성 없음
+        self.assertEqual(self._stats(self.author), self._expect(post_count=1, received_likes_count=1))
+
+        PostLike.objects.filter(post=post, user=self.author).delete()  # 좋아요하지 않은 사용자의 취소
+        self.assertEqual(self._stats(self.author), self._expect(post_count=1, received_likes_count=1))
+
+        PostLike.objects.filter(post=post, user=self.reader).delete()
+        PostLike.objects.filter(post=post, user=self.reader).delete()
+        self.assertEqual(self._stats(self.author), self._expect(post_count=1))
+
+    def test_post_like_view_toggles_counter_once(self):
+        post = self._post()
+        client = APIClient()
+        client.force_authenticate(user=self.reader)
+        url = reverse('community:post-like', kwargs={'post_id': post.pk})
+
+        liked = client.post(url)
+        self.assertEqual((liked.data['is_liked'], liked.data['likes_count']), (True, 1))
+        self.assertEqual(self._stats(self.author)['received_likes_count'], 1)
+
+        unliked = client.post(url)
+        self.assertEqual((unliked.data['is_liked'], unliked.data['likes_count']), (False, 0))
+        self.assertEqual(self._stats(self.author)['received_likes_count'], 0)
+
+        client.post(url)
+        self.assertEqual(self._stats(self.author)['received_likes_count'], 1)
+
+    def test_rebuild_command_matches_live_counters(self):
+        post = self._post()
+        self._post(author=self.reader)
+        Comment.objects.create(author=self.reader, post=post, content='댓글')
+        PostLike.objects.create(user=self.reader, post=post)
+        Enrollment.objects.create(user=self.reader, course=self.course)
+        Wishlist.objects.create(user=self.author, course=self.course)
+        live = {user.pk: self._stats(user) for user in (self.author, self.reader)}
+
+        UserActivityStats.objects.update(post_count=99, received_likes_count=0, enrolled_count=7)
+        call_command('rebuild_activity_stats', stdout=StringIO())
+
+        self.assertEqual({user.pk: self._stats(user) for user in (self.author, self.reader)}, live)
+
+    def test_summary_view_builds_missing_stats_row(self):
+        self._post()
+        PostLike.objects.create(user=self.reader, post=self._post())
+        UserActivityStats.objects.filter(pk=self.author.pk).delete()  # 배포 직후처럼 카운터 행 없음
+
+        client = APIClient()
+        client.force_authenticate(user=self.author)
+        response = client.get(reverse('mypage:summary'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['community']['post_count'], 2)
+        self.assertEqual(response.data['community']['received_likes_count'], 1)
+        self.assertEqual(self._stats(self.author), self._expect(post_count=2, received_likes_count=1))
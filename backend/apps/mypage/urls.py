@@ -9,6 +9,7 @@ app_name = 'mypage'
 # 아키텍쳐 구조
 """
 /api/v1/mypage/
+├── summary/                            # GET: 학습 현황 + 커뮤니티 통계 통합
 ├── dashboard/
 │   └── stats/                          # GET: 학습 현황 요약
 ├── courses/
@@ -22,6 +23,7 @@ app_name = 'mypage'
 │   ├── /                               # GET: 관심 강좌 목록
 │   └── {course_id}/                    # POST: 관심 강좌 추가
 │                                       # DELETE: 관심 강좌 삭제
+├── recommendations/                    # GET: 추천 강좌 (협업 필터링)
 ├── community/
 │   ├── stats/                          # GET: 커뮤니티 활동 통계
 │   ├── posts/                          # GET: 내가 쓴 글 목록
@@ -47,6 +49,15 @@ urlpatterns = [
         name='dashboard-stats'
     ),
 
+    # [GET]
+    # /mypage/summary/
+    # - 기능: 학습 현황 요약 + 커뮤니티 활동 통계를 한 번에 조회
+    path(
+        'summary/',
+        views.MypageSummaryView.as_view(),
+        name='summary'
+    ),
+
     # ==================================================
     # Courses (강좌 관리)
     # ==================================================
@@ -142,6 +153,19 @@ urlpatterns = [
         name='my-comments'
     ),
 
+    # ==================================================
+    # Recommendations (추천)
+    # ==================================================
+
+    # [GET]
+    # /mypage/recommendations/
+    # - 기능: 협업 필터링 추천 강좌 (build_recommendations 배치 결과)
+    path(
+        'recommendations/',
+        views.RecommendationListView.as_view(),
+        name='recommendations'
+    ),
+
     # ==================================================
     # Scraps (스크랩)
     # ==================================================
@@ -13,7 +13,8 @@ from apps.courses.models import Course, Enrollment, Wishlist, CourseReview
 from apps.community.models import Post, Comment, Scrap
 from apps.accounts.models import UserConsent
 
-from .serializers import WishlistSerializer, CourseReviewSerializer, DashboardStatsSerializer, EnrollmentDetailSerializer, EnrollmentListSerializer, CommunityStatsSerializer, MyPostSerializer, MyCommentSerializer, MyScrapSerializer, ProfileSerializer
+from .serializers import WishlistSerializer, CourseReviewSerializer, DashboardStatsSerializer, EnrollmentDetailSerializer, EnrollmentListSerializer, CommunityStatsSerializer, MyPostSerializer, MyCommentSerializer, MyScrapSerializer, ProfileSerializer, MypageSummarySerializer, RecommendedCourseSerializer
+from .services import get_activity_stats_service, get_recommendation_service
 
 User = get_user_model()
 
@@ -21,6 +22,7 @@ User = get_user_model()
 """
   1. 대시보드
   - 1. DashboardStatsView       | 학습 현황 요약 (수강/완료/찜/리뷰 수 집계)
+  - 2. MypageSummaryView        | 대시보드 + 커뮤니티 통계 통합 응답
 
   2. 학습 현황
   - 1. RecentCourseView         | 최근 학습 강좌 조회 (이어듣기 기능까지)
@@ -29,6 +31,7 @@ User = get_user_model()
   - 4. CourseReviewView         | 수강평 등록/수정/삭제
   - 5.1. WishlistListView       | 위시리스트 목록 조회
   - 5.2. WishlistToggleView     | 위시리스트 추가/삭제
+  - 6. RecommendationListView   | 추천 강좌 조회 (협업 필터링)
 
   3. 커뮤니티
   - 1. CommunityStatsView       | 커뮤니티 활동 통계 (작성 글/댓글/스크랩/받은 좋아요)
@@ -52,15 +55,17 @@ class DashboardStatsView(APIView):
 
     [설계 의도]
     - 마이페이지 최상단 대시보드에서 보여줄 "요약 통계" 제공
-    - 다음 4가지 지표를 한 번에 집계하여 반환
+    - 다음 4가지 지표를 한 번에 반환
       1) 수강 중 강좌 수
       2) 수강 완료 강좌 수
       3) 찜한 강좌 수
       4) 내가 작성한 수강평 수
 
     [상세 고려 사항]
-    - aggregate()를 활용하여 단일 쿼리로 집계
-    => Python 루프 대신 DB 레벨 집계로 성능 최적화
+    - 기존: Enrollment aggregate + Wishlist count + CourseReview count (쿼리 3회)
+    - 변경: UserActivityStats(사용자 PK = 테이블 PK) 한 건 조회 (쿼리 1회)
+      · 카운터는 각 도메인 모델의 생성/삭제 시그널로 유지 (mypage/signals.py)
+      · 불일치 시 rebuild_activity_stats 커맨드로 재계산
 
     # NOTE:
     # - 전역 permission 정책으로 IsAuthenticated가 설정되어 있으나,
@@ -72,63 +77,37 @@ class DashboardStatsView(APIView):
     # - 비로그인 사용자가 접근하면 DRF가 401 Unauthorized 응답을 반환
     permission_classes = [IsAuthenticated]
 
-    # GET 요청 처리 메서드
-    # - /mypage/dashboard/stats/ 로 GET 요청이 들어오면 이 메서드가 실행됨
     def get(self, request):
-        # 현재 사용자 객체
-        user = request.user
-
-        # Enrollment 집계
-
-        # Enrollment.objects.filter(user=user):
-        # - 현재 사용자에 해당하는 수강 기록만 대상으로 제한
-        #
-        # aggregate(...):
-        # - queryset 결과를 "한 번에" 집계해서 dict로 반환
-        # - 여기서는 '수강중 개수', '수강완료 개수'를 동시에 구함
-        enrollment_stats = Enrollment.objects.filter(user=user).aggregate(
-            # Count('id', filter=Q(...)):
-            # - 특정 조건을 만족하는 레코드만 Count 하는 방식
-            # - Django가 지원하는 조건부 집계 패턴 (DB가 조건에 맞는 행만 카운트)
-
-            # enrolled_count:
-            # - status가 ENROLLED(수강중)인 Enrollment 레코드 개수
-            enrolled_count=Count('id', filter=Q(status=Enrollment.Status.ENROLLED)),
-            # completed_count:
-            # - status가 COMPLETED(수강완료)인 Enrollment 레코드 개수
-            completed_count=Count('id', filter=Q(status=Enrollment.Status.COMPLETED))
-        )
+        # 사용자 활동 카운터 (PK 조회 1회)
+        stats = get_activity_stats_service().get_stats(request.user)
 
-        # Wishlist(찜한 강좌), CourseReview(내가 작성한 수강평) 집계
-        # 찜한 강좌 수
-        # - user 필터링 후 count()로 개수만 반환
-        # - 단순 count라 aggregate 없이도 충분히 빠르고 명확하다고 생각.
-            # - 단일 지표(개수 1개) 집계이므로
-            #   aggregate 대신 count()를 사용
-            # - DB 레벨에서 SELECT COUNT(*)만 수행하므로
-            #   성능상 차이 없고, 코드 가독성이 더 좋음
-        # ++ 추가 설명 : count()는 내부적으로 SQL의 COUNT(*)로 변환되어 DB 레벨에서 효율적으로 처리됨
-            # SELECT COUNT(*) 
-            # FROM wishlist 
-            # WHERE user_id = ?
-        wishlist_count = Wishlist.objects.filter(user=user).count()
-        my_review_count = CourseReview.objects.filter(user=user).count()
-
-        # 응답 데이터 구성
-        data = {
-            'enrolled_count': enrollment_stats['enrolled_count'],
-            'completed_count': enrollment_stats['completed_count'],
-            'wishlist_count': wishlist_count,
-            'my_review_count': my_review_count
-        }
         # 직렬화
         # NOTE:
-        # DashboardStatsSerializer는
-        # dict 데이터를 인스턴스로 전달하여, JSON 응답으로 변환하는 역할만 수행
-        # ModelSerializer가 아니며, DB 저장/검증의 목적이 아님
-        serializer = DashboardStatsSerializer(data)
-        # JSON 응답 반환
-        # - serializer.data는 최종적으로 클라이언트에게 내려갈 dict
+        # - UserActivityStats의 필드명이 응답 필드명과 같으므로 인스턴스를 그대로 전달
+        serializer = DashboardStatsSerializer(stats)
+        return Response(serializer.data)
+
+
+# 1.2 MypageSummaryView | 대시보드 + 커뮤니티 통계 통합
+class MypageSummaryView(APIView):
+    """
+    [API]
+    - GET: /api/v1/mypage/summary/
+
+    [설계 의도]
+    - 마이페이지 진입 시 프론트엔드가 대시보드 통계와 커뮤니티 통계를
+      두 번 호출하지 않고 한 번에 받도록 통합 응답 제공
+
+    [상세 고려 사항]
+    - 두 통계 모두 같은 UserActivityStats 행에서 나오므로 쿼리 1회로 처리
+    - 응답 구조는 기존 두 API의 응답을 dashboard / community 키로 감싼 형태
+      (기존 컴포넌트가 응답 형식을 그대로 재사용할 수 있도록)
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        stats = get_activity_stats_service().get_stats(request.user)
+        serializer = MypageSummarySerializer(stats)
         return Response(serializer.data)
 
 
@@ -140,6 +119,7 @@ class DashboardStatsView(APIView):
 #   - 4. CourseReviewView         | 수강평 등록/수정/삭제
 #   - 5.1. WishlistListView       | 위시리스트 목록 조회
 #   - 5.2. WishlistToggleView     | 위시리스트 추가/삭제
+#   - 6. RecommendationListView   | 추천 강좌 조회 (협업 필터링)
 # =========================
 
 # 2.1 RecentCourseView | 최근 학습 강좌 조회
@@ -572,6 +552,38 @@ class WishlistToggleView(APIView):
             )
         
 
+# 2.6 RecommendationListView | 추천 강좌 조회
+class RecommendationListView(APIView):
+    """
+    [API]
+    - GET: /api/v1/mypage/recommendations/?limit=10
+
+    [설계 의도]
+    - 수강/찜/수강평 기반 협업 필터링 추천 강좌 제공
+    - 계산은 build_recommendations 야간 배치가 수행 → 요청은 추천 행 PK 조회 + 강좌 in_bulk 조회만
+
+    [상세 고려 사항]
+    - 상호작용이 없거나 아직 계산되지 않은 사용자는 빈 목록 (generated_at: null)
+    - 종료된 강좌는 제외하고 limit개까지 반환 (기본 10, 최대 저장 개수)
+    """
+    permission_classes = [IsAuthenticated]
+
+    DEFAULT_LIMIT = 10
+
+    def get(self, request):
+        try:
+            limit = int(request.query_params.get('limit', self.DEFAULT_LIMIT))
+        except (TypeError, ValueError):
+            limit = self.DEFAULT_LIMIT
+        limit = max(1, limit)
+
+        recommendation = get_recommendation_service().get_for_user(request.user, limit=limit)
+        return Response({
+            'generated_at': recommendation['generated_at'],
+            'results': RecommendedCourseSerializer(recommendation['results'], many=True).data,
+        })
+
+
 # =========================
 # 3. 커뮤니티
 #   - 1. CommunityStatsView       | 커뮤니티 활동 통계
@@ -589,12 +601,12 @@ class CommunityStatsView(APIView):
 
     [설계 의도]
     - 마이페이지에서 커뮤니티 활동 통계를 제공하기 위함.
-    - 내가 쓴 글, 댓글, 스크랩 수와, 내 글이 받은 좋아요 수를 한 번에 집계
+    - 내가 쓴 글, 댓글, 스크랩 수와, 내 글이 받은 좋아요 수를 한 번에 반환
 
     [상세 고려 사항]
-    - aggregate()로 단일 쿼리 최적화
-    - received_likes_count는 내 글이 받은 좋아요 수
-    - 집계 데이터는 DB모델 필드가 아니므로 Serializer에서 직접 정의
+    - 기존: Post/Comment/Scrap count + Post-PostLike JOIN 집계 (쿼리 4회)
+    - 변경: UserActivityStats 한 건 조회 (쿼리 1회)
+    - received_likes_count는 내 글(댓글 미포함)이 받은 좋아요 수
     - IsAuthenticated를 명시적으로 재선언(방어적 설계))
     """
     # 인증된 사용자만 접근 가능
@@ -604,40 +616,15 @@ class CommunityStatsView(APIView):
 
 
     def get(self, request):
-        user = request.user
-
-        # 내가 쓴 글/댓글/스크랩 수 집계
-        post_count = Post.objects.filter(author=user).count() # 내가 쓴 글 수
-        comment_count = Comment.objects.filter(author=user).count() # 내가 쓴 댓글 수
-        scrap_count = Scrap.objects.filter(user=user).count() # 내가 쓴 스크랩 수
-
-        # 내 글이 받은 좋아요 수 (aggregate 활용)
-        # Post.likes는 ManyToMany 관계이므로 Count 사용
-        # 주의:
-        # - Count('likes')는 "내가 쓴 게시글들의 좋아요 개수 합"을 의미
-        # - 댓글 좋아요는 여기서 포함하지 않음
-        post_likes_stats = Post.objects.filter(author=user).aggregate(
-            total_likes=Count('likes')
-        )
-
-        # 받은 좋아요 수가 None일 수 있으므로 0으로 대체
-        received_likes_count = post_likes_stats['total_likes'] or 0
-
-        # 응답 데이터 구성
-        data = {
-            'post_count': post_count,
-            'comment_count': comment_count,
-            'scrap_count': scrap_count,
-            'received_likes_count': received_likes_count
-        }
+        stats = get_activity_stats_service().get_stats(request.user)
 
         # 직렬화
             # NOTE:
-            # - data를 인스턴스처럼 직접 전달하여 직렬화
-            # - CommunityStatsSerializer는 모델이 아닌 데이터 직렬화용!
-        serializer = CommunityStatsSerializer(data)
+            # - UserActivityStats 인스턴스를 그대로 전달 (필드명 일치)
+        serializer = CommunityStatsSerializer(stats)
         return Response(serializer.data)
-    
+
+
 # 2. MyPostListView | 내가 쓴 글 목록
 class MyPostListView(generics.ListAPIView):
     """
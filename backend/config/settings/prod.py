@@ -26,18 +26,53 @@ if not SECRET_KEY:
     raise RuntimeError("SECRET_KEY is not set")
 
 # 운영용 PostgreSQL (Docker 환경)
-DATABASES = {
-    "default": {
+# - POSTGRES_POOLER=pgbouncer: PgBouncer(트랜잭션 풀링) 경유
+#   - 트랜잭션마다 서버 연결이 바뀌므로 서버 측 커서(.iterator()의 named cursor) 비활성화
+#   - 워커 → PgBouncer 연결은 재사용(CONN_MAX_AGE), 끊긴 연결은 요청 시작 시 확인(CONN_HEALTH_CHECKS)
+# - POSTGRES_REPLICA_HOST: 읽기 전용 복제본 (apps/core/utils/db_routing.py가 조회 API 읽기만 라우팅)
+POSTGRES_POOLER = os.environ.get("POSTGRES_POOLER", "")
+
+
+def _postgres_database(host, port):
+    database = {
         "ENGINE": "django.db.backends.postgresql",
         "NAME": os.environ.get("POSTGRES_DB", "moduway"),
         "USER": os.environ.get("POSTGRES_USER", "moduway"),
         "PASSWORD": os.environ.get("POSTGRES_PASSWORD", "moduway"),
-        "HOST": os.environ.get("POSTGRES_HOST", "db"),
-        "PORT": int(os.environ.get("POSTGRES_PORT", 5432)),
+        "HOST": host,
+        "PORT": int(port),
         "CONN_MAX_AGE": 60,  # 연결 재사용
+        "CONN_HEALTH_CHECKS": True,
     }
+    if POSTGRES_POOLER == "pgbouncer":
+        database["DISABLE_SERVER_SIDE_CURSORS"] = True
+    return database
+
+
+DATABASES = {
+    "default": _postgres_database(
+        os.environ.get("POSTGRES_HOST", "db"),
+        os.environ.get("POSTGRES_PORT", 5432),
+    ),
 }
 
+if os.environ.get("POSTGRES_REPLICA_HOST"):
+    DATABASES["replica"] = _postgres_database(
+        os.environ["POSTGRES_REPLICA_HOST"],
+        os.environ.get("POSTGRES_REPLICA_PORT", os.environ.get("POSTGRES_PORT", 5432)),
+    )
+    # 테스트 DB는 따로 만들지 않고 default를 그대로 사용
+    DATABASES["replica"]["TEST"] = {"MIRROR": "default"}
+
+DATABASE_ROUTERS = ["apps.core.utils.db_routing.ReadReplicaRouter"]
+
+# 요청 단위 읽기 DB 결정 (URL 해석 후 View 실행 직전 process_view에서 판단)
+MIDDLEWARE = [
+    *MIDDLEWARE[:2],
+    "apps.core.utils.db_routing.ReplicaRoutingMiddleware",
+    *MIDDLEWARE[2:],
+]
+
 # 로그 디렉토리 생성
 LOG_DIR = BASE_DIR / "logs"
 LOG_DIR.mkdir(exist_ok=True)
@@ -5,6 +5,11 @@ export const getDashboardStats = () => {
   return api.get('/mypage/dashboard/stats/');
 };
 
+// 마이페이지 통합 요약 조회 (대시보드 + 커뮤니티 통계)
+export const getMypageSummary = () => {
+  return api.get('/mypage/summary/');
+};
+
 // 최근 학습 강좌 조회
 export const getRecentCourse = () => {
   return api.get('/mypage/courses/recent/');